@@ -14,7 +14,9 @@ import requests
 import logging
 import hashlib
 import asyncio
-from typing import Optional, Dict, Any, List
+import copy
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -256,7 +258,7 @@ Return this exact schema:
 }"""
 
 
-def calculate_fit_score_llm(
+async def calculate_fit_score_llm(
     role_title: str,
     role_level: str,
     required_years: float,
@@ -303,19 +305,17 @@ def calculate_fit_score_llm(
 {json.dumps(input_payload, indent=2)}"""
 
     try:
-        # Import here to avoid circular dependency at module load
-        from backend.services import call_claude
-
         print(f"🎯 [{analysis_id}] Calling isolated fit score LLM (max_tokens=300, no retries)")
 
         # Single call, no retries (max_retries=1), hard token cap
-        response = call_claude(
+        response = await call_claude_async(
             system_prompt=FIT_SCORE_MINIMAL_PROMPT,
             user_message=user_message,
             max_tokens=300,
             max_retries=1,  # No retries
             temperature=0,
-            model="claude-3-5-haiku-20241022"  # Cheapest, fastest model
+            model="claude-3-5-haiku-20241022",  # Cheapest, fastest model
+            cache_site="fit_score",
         )
 
         # Parse JSON response - use clean_claude_json to handle text before/after JSON
@@ -708,6 +708,11 @@ def is_valid_company_name(name: str) -> bool:
 # RESUME ANALYSIS CACHE
 # Per P0 spec: Prevent repeated LLM calls for the same resume
 # Cache lives for 7 days, refreshes last_used_at on hit
+#
+# Two tiers: a per-worker LRU (resume_analysis_local_cache) in front of the
+# resume_analysis_cache table. last_used_at refreshes are batched and written
+# behind the request. Concurrent analyses of the same hash are coalesced by
+# resume_analysis_singleflight in analyze_jd.
 # =============================================================================
 
 # Kill switch - when False, bypass cache entirely (no read, no write)
@@ -716,45 +721,115 @@ ENABLE_RESUME_CACHE = os.getenv("ENABLE_RESUME_CACHE", "true").lower() == "true"
 # Cache TTL in days
 RESUME_CACHE_TTL_DAYS = 7
 
+# Local LRU tier size (entries per worker)
+RESUME_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_LOCAL_MAX_ENTRIES", "500"))
+
+# Seconds to batch last_used_at refreshes before writing them to Supabase
+RESUME_CACHE_TOUCH_FLUSH_SECONDS = 5.0
+
+# Pending last_used_at refreshes: {resume_hash: iso_timestamp}
+_resume_cache_pending_touches: Dict[str, str] = {}
+_resume_cache_touch_task = None
+
+# In-flight resume_analysis_cache writes (held so they aren't garbage collected mid-write)
+_resume_cache_write_tasks: set = set()
+
 # Preflight flags - set to False if table access fails, prevents repeated errors
 _RESUME_CACHE_TABLE_VERIFIED = None  # None = not checked, True = exists, False = missing
 
 
-def compute_resume_hash(resume_data: dict, jd_text: str = "") -> str:
-    """
-    Compute deterministic hash for resume + JD content.
+def _take_resume_cache_touches() -> Dict[str, str]:
+    """Swap out the pending last_used_at refreshes (call on the event loop thread)."""
+    global _resume_cache_pending_touches
+    pending, _resume_cache_pending_touches = _resume_cache_pending_touches, {}
+    return pending
 
-    CRITICAL FIX: Cache key MUST include BOTH resume AND JD to prevent
-    returning stale analysis for different jobs with the same resume.
 
-    Rules:
-    - Hash changes when resume OR JD changes
-    - Ignores whitespace and formatting noise
-    - Uses SHA-256 for collision resistance
-    """
-    # Convert resume dict to string, normalize whitespace
-    resume_text = json.dumps(resume_data, sort_keys=True)
-    normalized_resume = " ".join(resume_text.lower().split())
+def _flush_resume_cache_touches(pending: Dict[str, str]):
+    """Write a batch of last_used_at refreshes to Supabase in one update."""
+    if not pending or not supabase:
+        return
 
-    # Include JD in hash to ensure different JDs get different cache entries
-    normalized_jd = " ".join(jd_text.lower().split()) if jd_text else ""
+    try:
+        supabase.table("resume_analysis_cache").update({
+            "last_used_at": max(pending.values())
+        }).in_("resume_hash", list(pending)).execute()
+    except Exception as e:
+        print(f"⚠️ Failed to update cache last_used_at: {e}")
 
-    combined = f"{normalized_resume}|||{normalized_jd}"
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
+async def _resume_cache_touch_worker():
+    """Wait out the batching window, then flush last_used_at off the event loop."""
+    global _resume_cache_touch_task
+    try:
+        await asyncio.sleep(RESUME_CACHE_TOUCH_FLUSH_SECONDS)
+        await asyncio.to_thread(_flush_resume_cache_touches, _take_resume_cache_touches())
+    finally:
+        _resume_cache_touch_task = None
+    if _resume_cache_pending_touches:
+        # Touches queued while the batch was being written
+        _resume_cache_touch_task = asyncio.get_running_loop().create_task(_resume_cache_touch_worker())
 
-def get_cached_analysis(resume_hash: str) -> Optional[Dict[str, Any]]:
+
+def _schedule_resume_cache_touch(resume_hash: str):
+    """Queue a last_used_at refresh (write-behind, never on the request path)."""
+    global _resume_cache_touch_task
+    _resume_cache_pending_touches[resume_hash] = datetime.utcnow().isoformat()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (scripts/tests) - flush inline
+        _flush_resume_cache_touches(_take_resume_cache_touches())
+        return
+
+    if _resume_cache_touch_task is None:
+        _resume_cache_touch_task = loop.create_task(_resume_cache_touch_worker())
+
+
+async def get_cached_analysis(resume_hash: str, local_only: bool = False) -> Optional[Dict[str, Any]]:
     """
     Lookup cached analysis by resume hash.
 
-    Returns cached payload if found and not expired, None otherwise.
-    Updates last_used_at on hit.
+    Checks the local LRU first, then (unless local_only) the Supabase table
+    off the event loop. Returns a copy of the cached payload if found and not
+    expired, None otherwise. Schedules a write-behind last_used_at refresh on hit.
     """
-    global _RESUME_CACHE_TABLE_VERIFIED
-
     if not ENABLE_RESUME_CACHE:
         return None
 
+    local = resume_analysis_local_cache.get(resume_hash)
+    if local is not None:
+        print(f"💾 RESUME CACHE LOCAL HIT — hash: {resume_hash[:12]}...")
+        _schedule_resume_cache_touch(resume_hash)
+        return copy.deepcopy(local)
+
+    if local_only:
+        return None
+
+    found = await asyncio.to_thread(_read_cached_analysis_row, resume_hash)
+    if found is None:
+        return None
+    payload, remaining_seconds = found
+
+    # Promote to local tier for the rest of its table lifetime
+    resume_analysis_local_cache.set(resume_hash, payload, ttl_seconds=remaining_seconds)
+
+    # Update last_used_at (write-behind)
+    _schedule_resume_cache_touch(resume_hash)
+
+    return copy.deepcopy(payload)
+
+
+def _read_cached_analysis_row(resume_hash: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    """
+    Read a cached analysis from the resume_analysis_cache table (blocking).
+
+    Returns (analysis_payload, seconds left in its table lifetime), or None on
+    miss, expiry or error.
+    """
+    global _RESUME_CACHE_TABLE_VERIFIED
+
     # Skip if table was previously verified as missing
     if _RESUME_CACHE_TABLE_VERIFIED is False:
         return None
@@ -777,21 +852,15 @@ def get_cached_analysis(resume_hash: str) -> Optional[Dict[str, Any]]:
 
         # Check TTL (7 days)
         created_at = datetime.fromisoformat(cached["created_at"].replace("Z", "+00:00"))
-        age_days = (datetime.now(created_at.tzinfo) - created_at).days
+        age = datetime.now(created_at.tzinfo) - created_at
+        age_days = age.days
 
         if age_days > RESUME_CACHE_TTL_DAYS:
             print(f"💾 RESUME CACHE EXPIRED — age: {age_days} days > {RESUME_CACHE_TTL_DAYS} TTL")
             return None
 
-        # Update last_used_at (fire and forget)
-        try:
-            supabase.table("resume_analysis_cache").update({
-                "last_used_at": datetime.utcnow().isoformat()
-            }).eq("resume_hash", resume_hash).execute()
-        except Exception as e:
-            print(f"⚠️ Failed to update cache last_used_at: {e}")
-
-        return cached["analysis_payload"]
+        remaining_seconds = timedelta(days=RESUME_CACHE_TTL_DAYS + 1).total_seconds() - age.total_seconds()
+        return cached["analysis_payload"], remaining_seconds
 
     except Exception as e:
         error_str = str(e)
@@ -804,16 +873,34 @@ def get_cached_analysis(resume_hash: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def store_cached_analysis(resume_hash: str, analysis_payload: Dict[str, Any]) -> bool:
+def store_cached_analysis(resume_hash: str, analysis_payload: Dict[str, Any]) -> None:
     """
     Store analysis result in cache.
 
     Only stores successful analyses (fit_score has valid status).
-    Returns True on success, False on failure.
+    Populates the local tier right away and writes the Supabase row behind the
+    request, from a snapshot taken now (callers keep editing the payload).
     """
     if not ENABLE_RESUME_CACHE:
-        return False
+        return
+
+    snapshot = copy.deepcopy(analysis_payload)
+    resume_analysis_local_cache.set(resume_hash, snapshot)
 
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (scripts/tests) - write inline
+        _write_cached_analysis_row(resume_hash, snapshot)
+        return
+
+    write_task = loop.create_task(asyncio.to_thread(_write_cached_analysis_row, resume_hash, snapshot))
+    _resume_cache_write_tasks.add(write_task)
+    write_task.add_done_callback(_resume_cache_write_tasks.discard)
+
+
+def _write_cached_analysis_row(resume_hash: str, analysis_payload: Dict[str, Any]) -> bool:
+    """Upsert a cached analysis into the resume_analysis_cache table (blocking). True on success."""
     global supabase
     if not supabase:
         return False
@@ -839,6 +926,11 @@ def store_cached_analysis(resume_hash: str, analysis_payload: Dict[str, Any]) ->
 # JD CACHE
 # Per P0 spec: Prevent repeated LLM calls for the same JD
 # Caches parsed JD context (role_title, role_type, leadership, etc.)
+#
+# resolve_jd_context() is the entry point: a warm per-worker memo
+# (jd_context_local_cache) answers repeat hits without Supabase, and
+# jd_context_singleflight makes concurrent analyses of the same posting
+# share one parse.
 # =============================================================================
 
 # Kill switch - when False, bypass JD cache entirely
@@ -847,6 +939,12 @@ ENABLE_JD_CACHE = os.getenv("ENABLE_JD_CACHE", "true").lower() == "true"
 # Cache TTL in days
 JD_CACHE_TTL_DAYS = 7
 
+# Local memo size (parsed JD contexts per worker)
+JD_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("JD_CACHE_LOCAL_MAX_ENTRIES", "2000"))
+
+# In-flight jd_cache writes (held so they aren't garbage collected mid-write)
+_jd_cache_write_tasks: set = set()
+
 # Preflight flag for JD cache table
 _JD_CACHE_TABLE_VERIFIED = None  # None = not checked, True = exists, False = missing
 
@@ -953,6 +1051,106 @@ def store_jd_cache(
         return False
 
 
+def _jd_context_from_cache_row(cached_jd_context: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JD context from a jd_cache table row."""
+    cached_role_level = cached_jd_context.get("role_level", "IC")
+
+    # P0 FIX: Derive is_leadership_role from role_level, not from stale cache
+    # MANAGER, DIRECTOR_OR_ABOVE roles always require people leadership
+    is_leadership_from_level = cached_role_level in ["MANAGER", "DIRECTOR_OR_ABOVE"]
+
+    return {
+        "extracted_title": cached_jd_context.get("parsed_role_title", ""),
+        "role_type": cached_jd_context.get("role_type", "general"),
+        "alignment": {"confidence": 0.8, "source": "cache", "warnings": []},  # Cached = trusted
+        "role_level_info": {
+            "role_level": cached_role_level,
+            "is_leadership_role": is_leadership_from_level,  # Derive from level, not stale cache value
+            "source": "cache"
+        },
+    }
+
+
+def _compute_jd_context(jd_text: str, analysis_id: str) -> Dict[str, Any]:
+    """Run the deterministic JD parsing stack (title, role type, alignment, leadership level)."""
+    extracted_title = extract_role_title_from_jd(jd_text, analysis_id)
+    role_type = detect_role_type_isolated(jd_text, extracted_title, analysis_id)
+    alignment = verify_role_type_alignment(role_type, extracted_title, jd_text, analysis_id)
+
+    # Detect leadership role level from title (only when computing fresh)
+    # Per fix spec: If leadership keyword detected, hard-set role_level/role_type
+    role_level_info = detect_leadership_role_level(extracted_title, jd_text, analysis_id)
+
+    return {
+        "extracted_title": extracted_title,
+        "role_type": role_type,
+        "alignment": alignment,
+        "role_level_info": role_level_info,
+    }
+
+
+async def resolve_jd_context(jd_text: str, analysis_id: str) -> Dict[str, Any]:
+    """
+    Get the parsed JD context for jd_text, computing it at most once per JD.
+
+    Lookup order: local memo -> (singleflight) -> jd_cache table -> fresh parse.
+    Fresh parses are memoized locally and written to jd_cache behind the request.
+
+    Returns:
+        Dict with extracted_title, role_type, alignment, role_level_info,
+        plus jd_hash and cache_hit ("local", "table", or None).
+    """
+    if not ENABLE_JD_CACHE:
+        context = _compute_jd_context(jd_text, analysis_id)
+        context.update({"jd_hash": None, "cache_hit": None})
+        return context
+
+    jd_hash = generate_jd_cache_key(jd_text)
+    print(f"🧠 [{analysis_id}] JD hash: {jd_hash[:12]}...")
+
+    memo = jd_context_local_cache.get(jd_hash)
+    if memo is None and jd_context_singleflight.in_flight(jd_hash):
+        # Another request is parsing this JD right now - wait for its result
+        async with jd_context_singleflight.lock(jd_hash):
+            memo = jd_context_local_cache.get(jd_hash)
+    if memo is not None:
+        print(f"🧠 JD CACHE LOCAL HIT — skipping JD parsing & role detection")
+        context = copy.deepcopy(memo)
+        context.update({"jd_hash": jd_hash, "cache_hit": "local"})
+        return context
+
+    async with jd_context_singleflight.lock(jd_hash):
+        cached_row = await asyncio.to_thread(get_cached_jd_context, jd_hash)
+        if cached_row:
+            print(f"🧠 JD CACHE HIT — skipping JD parsing & role detection")
+            context = _jd_context_from_cache_row(cached_row)
+            jd_context_local_cache.set(jd_hash, copy.deepcopy(context))
+            context.update({"jd_hash": jd_hash, "cache_hit": "table"})
+            return context
+
+        print(f"🧠 JD CACHE MISS — computing JD context")
+        context = _compute_jd_context(jd_text, analysis_id)
+        jd_context_local_cache.set(jd_hash, copy.deepcopy(context))
+
+    # Store JD context in cache for future requests (write-behind)
+    role_level_info = context["role_level_info"]
+    write_task = asyncio.create_task(asyncio.to_thread(
+        store_jd_cache,
+        jd_hash=jd_hash,
+        parsed_role_title=context["extracted_title"],
+        role_type=context["role_type"],
+        role_level=role_level_info.get("role_level", "IC"),
+        leadership_required=role_level_info.get("is_leadership_role", False),
+        required_years=0.0,  # Will be extracted later
+        domain_tags=[]  # Will be populated later if available
+    ))
+    _jd_cache_write_tasks.add(write_task)
+    write_task.add_done_callback(_jd_cache_write_tasks.discard)
+
+    context.update({"jd_hash": jd_hash, "cache_hit": None})
+    return context
+
+
 # =============================================================================
 # CANONICAL LEADERSHIP CONTEXT
 # Per P0 fix: Single source of truth for leadership gating
@@ -1176,6 +1374,7 @@ if _current_dir not in sys.path:
 
 # Utils - Helper functions
 from utils import (
+    get_all_cache_stats,
     clean_claude_json,
     extract_pdf_text,
     extract_docx_text,
@@ -1196,8 +1395,26 @@ from utils import (
     calculate_pipeline_health,
     verify_ats_keyword_coverage,
     validate_document_quality,
+    LRUCache,
+    SingleFlight,
+    StageGraph,
+    IncrementalJSONParser,
 )
 
+# Local tier + in-flight coalescing for the resume analysis cache (see RESUME ANALYSIS CACHE)
+resume_analysis_local_cache = LRUCache(
+    max_entries=RESUME_CACHE_LOCAL_MAX_ENTRIES,
+    ttl_seconds=RESUME_CACHE_TTL_DAYS * 86400,
+)
+resume_analysis_singleflight = SingleFlight()
+
+# Warm memo + in-flight coalescing for parsed JD context (see JD CACHE)
+jd_context_local_cache = LRUCache(
+    max_entries=JD_CACHE_LOCAL_MAX_ENTRIES,
+    ttl_seconds=JD_CACHE_TTL_DAYS * 86400,
+)
+jd_context_singleflight = SingleFlight()
+
 # Storage - Data persistence helpers
 from storage import (
     save_mock_session,
@@ -1206,16 +1423,18 @@ from storage import (
     get_mock_question,
     save_mock_response,
     get_mock_responses,
-    save_mock_analysis,
     get_mock_analysis,
     update_mock_session,
-    cleanup_expired_sessions,
+    run_session_cleanup,
+    flush_mock_writes,
+    MockSessionSnapshot,
+    get_mock_session_snapshot,
+    get_mock_session_snapshot_async,
+    flush_mock_session,
+    get_mock_store_stats,
     mock_interview_sessions,
-    mock_interview_questions,
-    mock_interview_responses,
     mock_interview_analyses,
     outcomes_store,
-    SESSION_TTL_SECONDS,
     set_supabase_client,
     save_interview_response,
     save_story_performance,
@@ -1226,10 +1445,21 @@ from storage import (
 
 # Services - Core business logic
 from services import (
-    call_claude,
-    call_claude_streaming,
+    call_claude_async,
+    call_claude_streaming_async,
+    create_message_async,
     initialize_client as initialize_claude_client,
+    get_llm_cache_stats,
+    clear_llm_cache,
+    render_pool,
+    get_render_pool_stats,
+    RenderPoolBusy,
+    RenderTimeout,
+    SystemPrompt,
+    format_prompt,
+    get_prompt_cache_stats,
 )
+from services.http_fetch import close_http_client
 
 # Prompts - System prompts for Claude AI interactions
 from prompts import (
@@ -1260,11 +1490,19 @@ from slowapi.errors import RateLimitExceeded
 
 # Add parent directory to path for document_generator import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from document_generator import ResumeFormatter, CoverLetterFormatter
 
 # Add current directory to path for qa_validation import (needed for Railway deployment)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Document rendering/parsing jobs, run through services.render_pool
+from render_jobs import (
+    render_pdf_from_html,
+    extract_pdf_text_plain,
+    render_resume_docx,
+    render_cover_letter_docx,
+    render_text_docx_zip,
+)
+
 # QA Validation module for fabrication detection and data quality
 from qa_validation import (
     validate_documents_generation,
@@ -1276,7 +1514,9 @@ from qa_validation import (
     create_chat_fallback_response,
     add_validation_warnings_to_response,
     ValidationResult,
-    ValidationLogger
+    ValidationLogger,
+    get_validation_log_stats,
+    flush_validation_logs,
 )
 
 # Tier Configuration and Service for subscription management
@@ -1288,12 +1528,15 @@ try:
         TIER_NAMES,
         get_all_tier_info,
     )
-    from tier_service import TierService
+    from tier_service import TierService, get_profile_cache_stats
     TIER_SERVICE_AVAILABLE = True
 except ImportError:
     TIER_SERVICE_AVAILABLE = False
     print("⚠️ Tier service not available - tier features disabled")
 
+# Buffered usage counters, flushed by a lifespan task (see usage_metering.py)
+from usage_metering import usage_buffer, run_usage_flush, get_usage_metering_stats
+
 # Stripe billing integration
 try:
     from stripe_service import StripeService
@@ -1316,6 +1559,7 @@ try:
         assess_domain_transferability,
         detect_red_flags,
         calibrate_gaps,  # Control layer for gap classification
+        extract_signal_features,
     )
     CALIBRATION_AVAILABLE = True
 except ImportError:
@@ -1409,11 +1653,33 @@ except Exception as e:
 # Health check and simple endpoints are not rate limited
 limiter = Limiter(key_func=get_remote_address)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Background maintenance while serving; flush and release shared resources on shutdown."""
+    background_tasks = [
+        asyncio.create_task(run_session_cleanup()),
+        asyncio.create_task(run_usage_flush(lambda: supabase)),
+    ]
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        if supabase is not None:
+            await usage_buffer.flush_async(supabase)
+        await asyncio.to_thread(flush_mock_writes)
+        await asyncio.to_thread(flush_validation_logs)
+        await close_http_client()
+        render_pool.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Henry Job Search Engine API",
     description="Backend for resume parsing, JD analysis, and application generation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add rate limiter to app state and exception handler
@@ -1457,102 +1723,38 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 # =============================================================================
 # LEADERSHIP DETECTION CONSTANTS
-# Single source of truth for people leadership patterns.
+# Single source of truth for people leadership patterns (see gating_patterns.py).
 # Used by extract_tiered_leadership() and extract_people_leadership_years()
 # =============================================================================
-
-# Evidence patterns that indicate direct people management
-PEOPLE_LEADERSHIP_EVIDENCE = [
-    "direct report", "direct reports", "managed a team", "led a team",
-    "team of", "people manager", "managed team", "lead a team",
-    "built the team", "grew the team", "hiring manager",
-    "performance review", "promoted", "mentored", "coached team",
-    "developed team", "team lead", "engineering manager", "people management",
-    "hired", "fired", "onboarded", "trained team", "built team",
-    # Additional patterns from real resumes
-    "built and led", "led marketing team", "led team", "scaled marketing",
-    "scaled team", "scaled function", "team from", "grew from",
-    "marketing team of", "engineering team of", "led the team",
-    "managed budget", "annual budget", "led organization",
-    "built organization", "reporting to", "reports to me",
-    "oversaw team", "supervised", "led cross-functional"
-]
-
-# Title patterns that typically indicate people leadership
-PEOPLE_LEADERSHIP_TITLES = [
-    "manager", "director", "head of", "vp ", "vice president",
-    "chief", "lead", "supervisor", "team lead"
-]
-
-# Strong leadership titles that inherently imply people management at established companies
-STRONG_LEADERSHIP_TITLES = [
-    "vp ", "vice president", "vp,", "director", "head of", "chief",
-    "senior manager", "senior product marketing manager", "group manager",
-    "marketing manager", "product marketing manager"
-]
-
-# Well-known companies where VP/Director definitely means people leadership
-ESTABLISHED_COMPANIES = [
-    "google", "meta", "facebook", "amazon", "apple", "microsoft", "netflix",
-    "uber", "lyft", "airbnb", "stripe", "square", "twilio", "segment",
-    "salesforce", "adobe", "oracle", "sap", "ibm", "cisco", "intel",
-    "linkedin", "twitter", "x corp", "snap", "pinterest", "dropbox",
-    "slack", "atlassian", "asana", "notion", "figma", "canva",
-    "shopify", "hubspot", "zendesk", "datadog", "snowflake", "mongodb",
-    "new relic", "mparticle", "amplitude", "mixpanel", "braze",
-    "intercom", "drift", "gong", "outreach", "salesloft",
-    # Energy / Utilities (enterprise scale)
-    "national grid", "pg&e", "con edison", "duke energy", "southern company",
-    # Fintech / Payments
-    "venmo", "paypal", "block", "coinbase", "robinhood", "plaid",
-    # Executive Search / Recruiting (verified people management)
-    "heidrick", "heidrick & struggles", "korn ferry", "spencer stuart",
-    "egon zehnder", "russell reynolds",
-    # Additional major companies
-    "spotify", "doordash", "instacart", "grubhub",
-]
-
-# Operational-only patterns (NO leadership credit)
-OPERATIONAL_ONLY_PATTERNS = [
-    "program manager", "project manager", "technical lead",
-    "staff engineer", "principal engineer", "architect",
-    "operations lead", "process lead", "systems lead"
-]
+from gating_patterns import (
+    PEOPLE_LEADERSHIP_EVIDENCE,
+    PEOPLE_LEADERSHIP_TITLES,
+    STRONG_LEADERSHIP_TITLES,
+    ESTABLISHED_COMPANIES,
+    OPERATIONAL_ONLY_PATTERNS,
+)
+import gating_patterns
+
+# Per-request resume parse shared by gating, calibration, reality check and the
+# canonical profile (see resume_features.py)
+from resume_features import (
+    compute_resume_hash,
+    parse_experience_duration,
+    get_resume_features,
+    activate_resume_features,
+)
 
 # Initialize Anthropic client via services module
 client = initialize_claude_client()
 
 
-def call_claude_api(retries: int = 2, **kwargs):
+async def call_claude_api(retries: int = 2, **kwargs):
     """Call Claude API directly with automatic retry on overloaded/rate-limit errors.
 
-    Wraps client.messages.create() with retry logic for transient errors.
-    Pass the same kwargs you would to client.messages.create().
+    Wraps the async client's messages.create() with non-blocking retry logic
+    for transient errors. Pass the same kwargs you would to client.messages.create().
     """
-    import time as _time
-    last_error = None
-    for attempt in range(retries + 1):
-        try:
-            return client.messages.create(**kwargs)
-        except anthropic.APIStatusError as e:
-            last_error = e
-            status = getattr(e, 'status_code', None)
-            # Retry on 429 (rate limit) or 529 (overloaded)
-            if status in (429, 529) and attempt < retries:
-                wait = 2 ** attempt  # 1s, 2s backoff
-                logger.warning(f"Claude API {status} error (attempt {attempt + 1}/{retries + 1}), retrying in {wait}s...")
-                _time.sleep(wait)
-                continue
-            raise
-        except anthropic.APIConnectionError as e:
-            last_error = e
-            if attempt < retries:
-                wait = 2 ** attempt
-                logger.warning(f"Claude API connection error (attempt {attempt + 1}/{retries + 1}), retrying in {wait}s...")
-                _time.sleep(wait)
-                continue
-            raise
-    raise last_error
+    return await create_message_async(retries=retries, **kwargs)
 
 
 # OpenAI API key for TTS (optional - for natural AI voice)
@@ -1578,210 +1780,12 @@ else:
     logger.warning("SUPABASE_SERVICE_KEY not set. Using in-memory storage (data will be lost on restart).")
 
 # Note: In-memory storage now imported from storage module
-# mock_interview_sessions, mock_interview_questions, mock_interview_responses,
-# mock_interview_analyses, outcomes_store, SESSION_TTL_SECONDS are all from storage module
-
-
-# ============================================================================
-# MOCK INTERVIEW STORAGE HELPERS (Supabase with in-memory fallback)
-# ============================================================================
-
-def save_mock_session(session_id: str, session_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview session to Supabase or fallback to in-memory."""
-    if supabase_client and user_id:
-        try:
-            data = {
-                "id": session_id,
-                "user_id": user_id,
-                "resume_json": session_data.get("resume_json", {}),
-                "job_description": session_data.get("job_description"),
-                "company": session_data.get("company"),
-                "role_title": session_data.get("role_title"),
-                "interview_stage": session_data.get("interview_stage"),
-                "difficulty_level": session_data.get("difficulty_level", "medium"),
-                "current_question_number": session_data.get("current_question_number", 1),
-            }
-            supabase_client.table("mock_interview_sessions").upsert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save session to Supabase: {e}")
-    # Fallback to in-memory
-    mock_interview_sessions[session_id] = session_data
-    return True
-
-def get_mock_session(session_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview session from Supabase or fallback."""
-    if supabase_client:
-        try:
-            result = supabase_client.table("mock_interview_sessions").select("*").eq("id", session_id).single().execute()
-            if result.data:
-                return result.data
-        except Exception as e:
-            logger.warning(f"Failed to get session from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_sessions.get(session_id)
-
-def save_mock_question(question_id: str, question_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview question to Supabase or fallback."""
-    if supabase_client and user_id:
-        try:
-            data = {
-                "id": question_id,
-                "session_id": question_data.get("session_id"),
-                "question_number": question_data.get("question_number"),
-                "question_text": question_data.get("question_text"),
-                "competency_tested": question_data.get("competency_tested"),
-                "difficulty": question_data.get("difficulty", "medium"),
-            }
-            supabase_client.table("mock_interview_questions").upsert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save question to Supabase: {e}")
-    # Fallback to in-memory
-    mock_interview_questions[question_id] = question_data
-    return True
-
-def get_mock_question(question_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview question from Supabase or fallback."""
-    if supabase_client:
-        try:
-            result = supabase_client.table("mock_interview_questions").select("*").eq("id", question_id).single().execute()
-            if result.data:
-                return result.data
-        except Exception as e:
-            logger.warning(f"Failed to get question from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_questions.get(question_id)
-
-def save_mock_response(question_id: str, response_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview response to Supabase or fallback."""
-    if supabase_client and user_id:
-        try:
-            data = {
-                "question_id": question_id,
-                "session_id": response_data.get("session_id"),
-                "response_text": response_data.get("response_text"),
-                "score": response_data.get("score"),
-                "feedback": response_data.get("feedback"),
-                "strengths": response_data.get("strengths", []),
-                "improvements": response_data.get("improvements", []),
-            }
-            supabase_client.table("mock_interview_responses").insert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save response to Supabase: {e}")
-    # Fallback to in-memory
-    if question_id not in mock_interview_responses:
-        mock_interview_responses[question_id] = []
-    mock_interview_responses[question_id].append(response_data)
-    return True
-
-def get_mock_responses(question_id: str) -> List[Dict[str, Any]]:
-    """Get mock interview responses from Supabase or fallback."""
-    if supabase_client:
-        try:
-            result = supabase_client.table("mock_interview_responses").select("*").eq("question_id", question_id).execute()
-            if result.data:
-                return result.data
-        except Exception as e:
-            logger.warning(f"Failed to get responses from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_responses.get(question_id, [])
-
-def save_mock_analysis(session_id: str, analysis_data: Dict[str, Any]) -> bool:
-    """Save mock interview analysis to Supabase or fallback."""
-    if supabase_client:
-        try:
-            data = {
-                "session_id": session_id,
-                "overall_score": analysis_data.get("overall_score"),
-                "competency_scores": analysis_data.get("competency_scores"),
-                "key_strengths": analysis_data.get("key_strengths", []),
-                "areas_for_improvement": analysis_data.get("areas_for_improvement", []),
-                "recommendations": analysis_data.get("recommendations", []),
-                "detailed_feedback": analysis_data.get("detailed_feedback"),
-            }
-            supabase_client.table("mock_interview_analyses").upsert(data, on_conflict="session_id").execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save analysis to Supabase: {e}")
-    # Fallback to in-memory
-    mock_interview_analyses[session_id] = analysis_data
-    return True
-
-def get_mock_analysis(session_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview analysis from Supabase or fallback."""
-    if supabase_client:
-        try:
-            result = supabase_client.table("mock_interview_analyses").select("*").eq("session_id", session_id).single().execute()
-            if result.data:
-                return result.data
-        except Exception as e:
-            logger.warning(f"Failed to get analysis from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_analyses.get(session_id)
-
-def update_mock_session(session_id: str, updates: Dict[str, Any]) -> bool:
-    """Update mock interview session in Supabase or fallback."""
-    if supabase_client:
-        try:
-            supabase_client.table("mock_interview_sessions").update(updates).eq("id", session_id).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update session in Supabase: {e}")
-    # Fallback to in-memory
-    if session_id in mock_interview_sessions:
-        mock_interview_sessions[session_id].update(updates)
-        return True
-    return False
-
-
-def cleanup_expired_sessions() -> int:
-    """
-    Clean up expired mock interview sessions to prevent memory leaks
-    and cross-session contamination.
-
-    Returns:
-        Number of sessions cleaned up
-    """
-    import time
-    current_time = time.time()
-    expired_sessions = []
-
-    # Find expired sessions
-    for session_id, session in mock_interview_sessions.items():
-        created_at = session.get("created_at", 0)
-        if isinstance(created_at, str):
-            # Parse ISO format timestamp
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                created_at = dt.timestamp()
-            except (ValueError, TypeError):
-                created_at = 0
-
-        if current_time - created_at > SESSION_TTL_SECONDS:
-            expired_sessions.append(session_id)
-
-    # Clean up expired sessions and their associated data
-    for session_id in expired_sessions:
-        # Find and remove questions for this session
-        questions_to_remove = [
-            qid for qid, q in mock_interview_questions.items()
-            if q.get("session_id") == session_id
-        ]
-        for qid in questions_to_remove:
-            mock_interview_questions.pop(qid, None)
-            mock_interview_responses.pop(qid, None)
-
-        # Remove session
-        mock_interview_sessions.pop(session_id, None)
-        mock_interview_analyses.pop(session_id, None)
+# mock_interview_sessions, mock_interview_analyses, outcomes_store are all from storage module
 
-    if expired_sessions:
-        print(f"🧹 Cleaned up {len(expired_sessions)} expired mock interview sessions")
 
-    return len(expired_sessions)
+# Mock interview storage helpers (save_mock_session, get_mock_session, ...,
+# cleanup_expired_sessions) live in storage/mock_interview_store.py: an
+# in-memory hot tier for active sessions, written behind to Supabase.
 
 # Load question bank
 QUESTION_BANK_PATH = os.path.join(os.path.dirname(__file__), "data", "question_bank.json")
@@ -1887,18 +1891,8 @@ def normalize_experience(resume_data: dict) -> list:
     if not resume_data or not isinstance(resume_data, dict):
         return []
 
-    experience = resume_data.get("experience", [])
-
-    # Case 1: String (LinkedIn free text)
-    if isinstance(experience, str):
-        return []
-
-    # Case 2: Not a list
-    if not isinstance(experience, list):
-        return []
-
-    # Case 3: List but may contain non-dict items - filter to only dicts
-    return [exp for exp in experience if isinstance(exp, dict)]
+    # Strings, non-lists and non-dict items are dropped once, in ResumeFeatures
+    return list(get_resume_features(resume_data).experience)
 
 
 # ============================================================================
@@ -4787,33 +4781,23 @@ def calculate_weighted_score(signals: dict, role_type: str) -> float:
     return round(weighted_sum * 10, 1)
 
 
-def calculate_mock_session_average(session_id: str) -> float:
+def calculate_mock_session_average(session_id: str, snapshot: Optional[MockSessionSnapshot] = None) -> float:
     """
     Calculate average score across all completed questions in session.
-    """
-    session = get_mock_session(session_id)
-    if not session:
-        return 0.0
-
-    question_ids = session.get("question_ids", [])
-    scores = []
-
-    for qid in question_ids:
-        analysis = get_mock_analysis(qid)
-        if analysis and analysis.get("score"):
-            scores.append(analysis["score"])
 
-    if not scores:
-        return 0.0
-
-    return sum(scores) / len(scores)
+    Reads every analysis in one batched load unless a snapshot is passed in.
+    """
+    if snapshot is None or snapshot.session_id != session_id:
+        snapshot = get_mock_session_snapshot(session_id)
+    return snapshot.average_score()
 
 
-def format_responses_for_analysis(question_id: str) -> str:
+def format_responses_for_analysis(question_id: str, responses: Optional[List[Dict[str, Any]]] = None) -> str:
     """
     Format all responses to a question into text for analysis.
     """
-    responses = get_mock_responses(question_id)
+    if responses is None:
+        responses = get_mock_responses(question_id)
     formatted = []
 
     for i, response in enumerate(responses, 1):
@@ -5086,10 +5070,10 @@ async def parse_resume(
                 
                 if filename.endswith('.pdf'):
                     print("📁 Detected PDF format")
-                    text_content = extract_pdf_text(file_bytes)
+                    text_content = await run_render_job("parse_pdf", extract_pdf_text, file_bytes)
                 elif filename.endswith('.docx'):
                     print("📁 Detected DOCX format")
-                    text_content = extract_docx_text(file_bytes)
+                    text_content = await run_render_job("parse_docx", extract_docx_text, file_bytes)
                 elif filename.endswith('.txt'):
                     print("📁 Detected TXT format")
                     text_content = file_bytes.decode('utf-8')
@@ -5173,7 +5157,7 @@ Your response must be ONLY valid JSON, no additional text."""
         
         # Call Claude
         print(f"📤 Sending {len(text_content)} chars to Claude for parsing...")
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message, cache_site="resume_parse")
         print(f"📥 Received response from Claude: {len(response)} chars")
         print(f"📥 Response preview: {response[:500]}...")
         
@@ -5371,7 +5355,7 @@ Your response must be ONLY valid JSON, no additional text."""
         user_message = f"Parse this resume into structured JSON:\n\n{request.resume_text}"
         
         # Call Claude
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message, cache_site="resume_parse")
         
         # Parse JSON response - use clean_claude_json to handle text before/after JSON
         response = clean_claude_json(response)
@@ -5790,7 +5774,7 @@ HTML CONTENT:
 
 Return ONLY valid JSON, no markdown code blocks."""
 
-        extraction_response = call_claude_api(
+        extraction_response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             messages=[{"role": "user", "content": extraction_prompt}]
@@ -6059,6 +6043,9 @@ Return a JSON object with this EXACT structure:
 
 Your response must be ONLY valid JSON. No markdown formatting."""
 
+    # Static instructions are sent as a cached prompt prefix; calibration is per-request
+    system_prompt = SystemPrompt(system_prompt)
+
     # Inject candidate state calibration if available
     calibration_prompt = build_candidate_calibration_prompt(request.situation)
     if calibration_prompt:
@@ -6103,7 +6090,7 @@ Generate the tailored resume following the exact format in the system instructio
 Remember: NO fabrication - only use information from the candidate's actual resume AND the additional context provided above."""
 
     try:
-        response = call_claude(system_prompt, user_message, max_tokens=4000, model="claude-opus-4-6")
+        response = await call_claude_async(system_prompt, user_message, max_tokens=4000, model="claude-opus-4-6")
         cleaned = clean_claude_json(response)
         result = json.loads(cleaned)
 
@@ -6372,7 +6359,7 @@ Generate the cover letter following the exact format in the system instructions.
 Remember: NO fabrication, NO generic filler, NO clichés."""
 
     try:
-        response = call_claude(system_prompt, user_message, max_tokens=2000)
+        response = await call_claude_async(system_prompt, user_message, max_tokens=2000)
         cleaned = clean_claude_json(response)
         result = json.loads(cleaned)
 
@@ -7453,31 +7440,32 @@ def force_apply_experience_penalties(response_data: dict, resume_data: dict = No
             # functions (detect_red_flags, calculate_career_span, etc.) can now
             # assume they receive valid List[Dict] and won't crash on strings.
             # ==========================================================================
+            # The normalized list lives on the request's ResumeFeatures; passing
+            # its roles/summary/skills through lets calibration reuse the text
+            # already flattened for this resume.
+            resume_features = get_resume_features(resume_data)
             raw_experience = resume_data.get('experience', [])
 
             # Case 1: Experience is a string (LinkedIn free text)
             if isinstance(raw_experience, str):
                 print(f"   ⚠️ INVARIANT: Experience is string - normalizing to []")
-                raw_experience = []
 
             # Case 2: Experience is not a list at all
             elif not isinstance(raw_experience, list):
                 print(f"   ⚠️ INVARIANT: Experience is {type(raw_experience).__name__} - normalizing to []")
-                raw_experience = []
 
             # Case 3: Experience is a list but contains non-dict items
             # Filter to ONLY dict items - this catches mixed lists like [str, dict, str]
-            else:
-                filtered_experience = [exp for exp in raw_experience if isinstance(exp, dict)]
-                if len(filtered_experience) != len(raw_experience):
-                    print(f"   ⚠️ INVARIANT: Experience list contained {len(raw_experience) - len(filtered_experience)} non-dict items - filtered out")
-                raw_experience = filtered_experience
+            elif len(resume_features.experience) != len(raw_experience):
+                print(f"   ⚠️ INVARIANT: Experience list contained {len(raw_experience) - len(resume_features.experience)} non-dict items - filtered out")
+
+            raw_experience = resume_features.experience
 
             candidate_experience = {
                 'roles': raw_experience,
                 'experience': raw_experience,
-                'summary': resume_data.get('summary', ''),
-                'skills': resume_data.get('skills', []),
+                'summary': resume_features.summary,
+                'skills': resume_features.skills,
                 'domain': response_data.get('experience_analysis', {}).get('domain', ''),
                 'level': response_data.get('experience_analysis', {}).get('level', ''),
             }
@@ -9204,24 +9192,9 @@ def detect_decision_authority(experience_text: str) -> str:
         'missing' - No authority signals
     """
     try:
-        experience_lower = experience_text.lower()
-
-        # Explicit decision authority verbs
-        explicit_patterns = [
-            'decided', 'owned', 'set direction', 'determined',
-            'established', 'defined strategy', 'made decision',
-            'chose to', 'selected', 'approved', 'vetoed'
-        ]
-
-        # Implicit authority (influencer, not decider)
-        implicit_patterns = [
-            'partnered with', 'collaborated', 'supported',
-            'contributed to', 'advised', 'recommended',
-            'influenced', 'consulted', 'helped shape'
-        ]
-
-        explicit_count = sum(1 for pattern in explicit_patterns if pattern in experience_lower)
-        implicit_count = sum(1 for pattern in implicit_patterns if pattern in experience_lower)
+        signals = gating_patterns.scan_experience_authority(experience_text)
+        explicit_count = signals.count("decision_explicit")
+        implicit_count = signals.count("decision_implicit")
 
         if explicit_count >= 2:
             return 'explicit'
@@ -9244,26 +9217,11 @@ def detect_org_design_signals(experience_text: str) -> str:
         'missing' - No org design signals
     """
     try:
-        experience_lower = experience_text.lower()
+        signals = gating_patterns.scan_experience_authority(experience_text)
 
-        # Explicit org design
-        explicit_patterns = [
-            'built team', 'built org', 'designed org',
-            'restructured', 'defined roles', 'created structure',
-            'established hiring plan', 'shaped organization',
-            'org design', 'organizational structure'
-        ]
-
-        # Implicit (hiring/growth without design)
-        implicit_patterns = [
-            'grew team', 'hired', 'expanded team',
-            'increased headcount', 'team growth',
-            'added engineers', 'scaled team'
-        ]
-
-        if any(pattern in experience_lower for pattern in explicit_patterns):
+        if signals.has("org_design_explicit"):
             return 'explicit'
-        elif any(pattern in experience_lower for pattern in implicit_patterns):
+        elif signals.has("org_design_implicit"):
             return 'implicit'
         else:
             return 'missing'
@@ -10739,19 +10697,23 @@ def extract_people_leadership_years(resume_data: dict) -> float:
     if not experience or not isinstance(experience, list):
         return 0.0
 
-    # Use shared constants for people leadership (single source of truth)
-    people_leadership_evidence = PEOPLE_LEADERSHIP_EVIDENCE
-    people_leadership_titles = PEOPLE_LEADERSHIP_TITLES
-    strong_leadership_titles = STRONG_LEADERSHIP_TITLES
-    operational_only_patterns = OPERATIONAL_ONLY_PATTERNS
-    established_companies = ESTABLISHED_COMPANIES
+    # Gating, eligibility and credibility all ask for this; compute it once
+    # per resume and keep it on the request's ResumeFeatures
+    features = get_resume_features(resume_data)
+    return features.memo("people_leadership_years", lambda: _people_leadership_years(features))
 
-    total_people_years = 0.0
 
-    for exp in experience:
-        if not isinstance(exp, dict):
-            continue
+def _people_leadership_years(features) -> float:
+    """Weighted people leadership years over ResumeFeatures.experience."""
+    # Shared leadership constants, precompiled into one scanner per text kind
+    # (see gating_patterns.py - single source of truth)
+    title_scanner = gating_patterns.RESUME_TITLE_SIGNALS
+    evidence_set = gating_patterns.PEOPLE_LEADERSHIP_EVIDENCE_SET
+    established_set = gating_patterns.ESTABLISHED_COMPANY_SET
+
+    total_people_years = 0.0
 
+    for exp, years in zip(features.experience, features.tenure_years):
         title = (exp.get("title", "") or "").lower()
         description = (exp.get("description", "") or "").lower()
 
@@ -10763,25 +10725,25 @@ def extract_people_leadership_years(resume_data: dict) -> float:
             highlights_text = ""
 
         combined_text = f"{title} {description} {highlights_text}"
-        dates = (exp.get("dates", "") or "").lower()
         company = (exp.get("company", "") or "").strip()
         company_lower = company.lower()
 
-        years = parse_experience_duration(dates)
+        # One pass over each text answers every title / evidence question
+        title_signals = title_scanner.scan(title)
+        has_people_evidence = evidence_set.search(combined_text)
 
         # Skip if clearly operational-only role
-        is_operational_only = any(pattern in title for pattern in operational_only_patterns)
-        if is_operational_only and not any(ev in combined_text for ev in people_leadership_evidence):
+        is_operational_only = title_signals.has("operational_only")
+        if is_operational_only and not has_people_evidence:
             print(f"   ⏭️ Skipping operational role (no people evidence): {exp.get('title', '')} @ {company}")
             continue
 
         # Check for people leadership evidence
-        has_people_title = any(pattern in title for pattern in people_leadership_titles)
-        has_strong_title = any(pattern in title for pattern in strong_leadership_titles)
-        has_people_evidence = any(ev in combined_text for ev in people_leadership_evidence)
+        has_people_title = title_signals.has("people_titles")
+        has_strong_title = title_signals.has("strong_titles")
 
         # Check if company is established (VP/Director definitely means people leadership)
-        is_established_company = any(ec in company_lower for ec in established_companies)
+        is_established_company = established_set.search(company_lower)
         # Also check for acquisition mentions (e.g., "Segment (acquired by Twilio)")
         if "acquired by" in company_lower or "twilio" in company_lower:
             is_established_company = True
@@ -11480,7 +11442,7 @@ def verify_request_isolation(resume_data: Dict[str, Any], analysis_id: str) -> N
     The isolation is enforced by:
     1. Unique analysis_id per request (generated at request start)
     2. All data passed explicitly via request parameters (no global state)
-    3. Session cleanup mechanism (cleanup_expired_sessions)
+    3. Session cleanup mechanism (run_session_cleanup lifespan task)
     4. No caching of candidate-specific data between requests
 
     Args:
@@ -11561,77 +11523,24 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
     Returns:
         Extracted role title
     """
-    import re
+    gp = gating_patterns
 
     print(f"📋 [{analysis_id}] Extracting role title from JD...")
 
-    # Navigation/UI text to skip (common when copying from job boards)
-    skip_patterns = [
-        r'^back to',
-        r'^apply now',
-        r'^save job',
-        r'^share',
-        r'^home\s*[>/]',
-        r'^jobs\s*[>/]',
-        r'^search',
-        r'^menu',
-        r'^sign in',
-        r'^log in',
-        r'^posted',
-        r'^×',
-        r'^\d+ days? ago',
-        r'^view all jobs',
-        r'^similar jobs',
-    ]
-
-    # NON-SEMANTIC HEADERS TO IGNORE - these are section labels, not role titles
-    # Per fix spec: Must ignore headers like "About the job", "Job Description", etc.
-    non_semantic_headers = [
-        "about the job",
-        "about this job",
-        "about the role",
-        "about this role",
-        "about the position",
-        "about us",
-        "job description",
-        "position description",
-        "role description",
-        "overview",
-        "the opportunity",
-        "opportunity",
-        "the role",
-        "the position",
-        "position overview",
-        "role overview",
-        "job overview",
-        "summary",
-        "job summary",
-        "role summary",
-        "description",
-        "what you'll do",
-        "what we're looking for",
-        "who we are",
-        "who you are",
-        "responsibilities",
-        "requirements",
-        "qualifications",
-        "key responsibilities",
-        "your responsibilities",
-    ]
+    # Skip / header / metadata / marker patterns are precompiled in gating_patterns.py
 
     def is_non_semantic_header(text: str) -> bool:
         """Check if text is a non-semantic section header that should not be used as a title."""
         text_lower = text.lower().strip()
         # Remove trailing colons or dashes
-        text_lower = re.sub(r'[:\-]+$', '', text_lower).strip()
-        return text_lower in non_semantic_headers
+        text_lower = gp.HEADER_TRAILING_PUNCT_RE.sub('', text_lower).strip()
+        return text_lower in gp.NON_SEMANTIC_HEADERS
 
     def is_navigation_text(text: str) -> bool:
         """Check if text is likely navigation/UI element."""
         text_lower = text.lower().strip()
-        for pattern in skip_patterns:
-            if re.match(pattern, text_lower):
-                return True
+        if gp.NAVIGATION_SKIP_RE.match(text_lower):
+            return True
         # Also skip very short lines that are likely nav
         if len(text) < 5:
             return True
@@ -11639,29 +11548,12 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
 
     def is_metadata_line(text: str) -> bool:
         """Check if text is a metadata line (Reports to, Location, etc.) not a role title."""
-        text_lower = text.lower().strip()
-        metadata_prefixes = [
-            'reports to', 'reporting to', 'location:', 'department:',
-            'team:', 'date:', 'posted:', 'salary:', 'compensation:',
-            'type:', 'employment type:', 'experience:', 'seniority:',
-        ]
-        return any(text_lower.startswith(prefix) for prefix in metadata_prefixes)
-
-    # Strategy 1: Look for explicit markers (must be at start of line to avoid matching mid-sentence)
-    patterns = [
-        r'^(?:job title|position title):\s*([^\n]+)',  # Only match "Job Title:" or "Position Title:" at line start
-        r'^([^\n]+)(?:\s*-\s*(?:corporate|hybrid|remote|full.time))',
-        r'(?:hiring|hiring a|we\'re hiring|is hiring)\s+(?:a\s+)?([^\n\.]+)',
-    ]
+        return text.lower().strip().startswith(gp.METADATA_PREFIXES)
 
     def is_sentence_fragment(text: str) -> bool:
         """Check if text looks like a sentence fragment rather than a job title."""
         text_lower = text.lower().strip()
-        # Sentence fragments often start with conjunctions, articles, or verbs
-        fragment_starters = ['and ', 'or ', 'the ', 'a ', 'an ', 'plans', 'including',
-                            'such as', 'with ', 'for ', 'to ', 'in ', 'on ', 'at ',
-                            's ', 't ', 're ', 'll ', 've ']  # Truncated contractions
-        if any(text_lower.startswith(starter) for starter in fragment_starters):
+        if text_lower.startswith(gp.FRAGMENT_STARTERS):
             return True
         # Too many words suggests a sentence, not a title (titles rarely exceed 12 words)
         if len(text.split()) > 12:
@@ -11669,46 +11561,27 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
         # Em dashes or en dashes in text suggest recommendation/advice text, not titles
         if '—' in text or '–' in text:
             return True
-        # Recommendation-style phrases
-        recommendation_phrases = ['fine', 'but you', 'should', 'consider', 'recommend',
-                                   'suggest', 'however', 'although', 'because', 'since']
-        if any(phrase in text_lower for phrase in recommendation_phrases):
+        if gp.RECOMMENDATION_PHRASES.search(text_lower):
             return True
         # Truncated text (starts without capital or with punctuation remnant)
         if text and not text[0].isupper() and text[0].isalpha():
             return True
         return False
 
-    for pattern in patterns:
-        match = re.search(pattern, jd_text, re.IGNORECASE | re.MULTILINE)
+    # Strategy 1: Look for explicit markers (must be at start of line to avoid matching mid-sentence)
+    for pattern in gp.TITLE_MARKER_PATTERNS:
+        match = pattern.search(jd_text)
         if match:
             title = match.group(1).strip()
-            title = re.sub(
-                r'\s*-\s*(corporate|hybrid|remote|san francisco|full.time).*$',
-                '',
-                title,
-                flags=re.IGNORECASE
-            )
-            # Reject results that look like sentence continuations from "hiring" pattern
-            sentence_starters = ['a senior', 'an experienced', 'someone who', 'a seasoned',
-                                 'a talented', 'an innovative', 'a dedicated', 'a motivated',
-                                 'a skilled', 'an accomplished']
+            title = gp.TITLE_LOCATION_SUFFIX_RE.sub('', title)
             title_lower_check = title.lower().strip()
-            if any(title_lower_check.startswith(starter) for starter in sentence_starters):
+            if title_lower_check.startswith(gp.HIRING_SENTENCE_STARTERS):
                 print(f"  ⏭️  Rejected sentence fragment from hiring pattern: '{title}'")
                 continue
             if 5 < len(title) < 100 and not is_navigation_text(title) and not is_sentence_fragment(title) and not is_non_semantic_header(title):
                 print(f"  ✅ Extracted: '{title}'")
                 return title
 
-    # Job title indicators - role nouns that signify an actual job title
-    job_title_indicators = ['manager', 'director', 'engineer', 'analyst', 'lead',
-                            'coordinator', 'specialist', 'vp', 'vice president',
-                            'head of', 'senior', 'junior', 'associate', 'chief',
-                            'officer', 'developer', 'designer', 'architect',
-                            'recruiter', 'marketing', 'sales', 'product', 'operations',
-                            'program', 'project', 'tpm', 'principal', 'staff']
-
     # Strategy 2: Scan first 15 non-empty lines for a title containing role nouns
     # Per fix spec: Scan the first 15 non-empty lines for a title containing role nouns
     lines = [line.strip() for line in jd_text.split('\n') if line.strip()]
@@ -11725,20 +11598,11 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
         # If the line is too long (>100 chars), it's likely a sentence - try to extract role from it
         if len(line) > 100 and line[0].isupper():
             line_lower = line.lower()
-            if any(indicator in line_lower for indicator in job_title_indicators):
+            if gp.JOB_TITLE_INDICATORS.search(line_lower):
                 # Try to extract just the role title from the sentence
-                # Pattern: "The [Role Title] will..." or "[Role Title] is responsible..."
                 # Note: We strip "The " prefix after extraction if present
-                role_extraction_patterns = [
-                    # "We are seeking a Director of Technical Recruiting to..."
-                    r'(?:seeking|hiring|looking for)\s+(?:a\s+)?(?:[\w,\s]+?\s+)?((?:Senior\s+|Sr\.\s+)?(?:Director|Manager|Lead|Head|VP|Vice President|Recruiter|Engineer|Analyst|Specialist|Chief|Officer|Principal)(?:\s+(?:of|for)\s+[A-Za-z\s&]+)?)(?:\s+to\s|\s+who\s|\s+that\s|\s+for\s+our|\.\s)',
-                    # "The Senior Director, Talent Acquisition will set the vision..."
-                    r'^(?:The\s+)?([A-Z][A-Za-z\s,&/]+?(?:Director|Manager|Lead|Head|VP|Vice President|Engineer|Recruiter|Analyst|Specialist|Coordinator|Chief|Officer)(?:[\s,]+(?:of\s+)?[A-Za-z\s&]+)?)(?:\s+will\s|\s+is\s+responsible|\s+leads\s|\s+manages\s|\s+reports\s+to)',
-                    r'^(?:The\s+)?([A-Z][A-Za-z\s,]+?(?:of\s+)?(?:Recruiting|Engineering|Product|Sales|Marketing|Operations|HR|Finance|Data|Analytics)[A-Za-z\s,]*?)(?:\s+will|\s+is\s+responsible|\s+leads|\s+manages)',
-                    r'^(?:The\s+)?([A-Z][A-Za-z\s]+?)(?:\s+will\s+lead|\s+will\s+be\s+responsible)',
-                ]
-                for pattern in role_extraction_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
+                for pattern in gp.ROLE_EXTRACTION_PATTERNS:
+                    match = pattern.search(line)
                     if match:
                         extracted_role = match.group(1).strip()
                         # Clean up leading "The" if captured
@@ -11746,11 +11610,8 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
                             extracted_role = extracted_role[4:].strip()
                         # Clean up trailing commas, articles, prepositions
                         extracted_role = extracted_role.rstrip(',').strip()
-                        extracted_role = re.sub(r'\s+(a|an|the|and|or|for|to|with)$', '', extracted_role, flags=re.IGNORECASE).strip()
-                        # Validate: must contain a title keyword (reject sentence fragments)
-                        title_keywords_check = ['director', 'manager', 'lead', 'head', 'vp', 'vice president',
-                                                'recruiter', 'engineer', 'analyst', 'specialist', 'chief', 'officer', 'principal']
-                        if any(kw in extracted_role.lower() for kw in title_keywords_check) and 5 < len(extracted_role) < 60:
+                        extracted_role = gp.TRAILING_STOPWORD_RE.sub('', extracted_role).strip()
+                        if gp.EXTRACTED_ROLE_KEYWORDS.search(extracted_role.lower()) and 5 < len(extracted_role) < 60:
                             print(f"  ✅ Extracted role from sentence: '{extracted_role}' (from line: '{line[:60]}...')")
                             return extracted_role
                 # Couldn't extract cleanly - skip this line
@@ -11760,7 +11621,7 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
         # Standard case: reasonable length line
         if 5 < len(line) < 100 and line[0].isupper():
             line_lower = line.lower()
-            if any(indicator in line_lower for indicator in job_title_indicators):
+            if gp.JOB_TITLE_INDICATORS.search(line_lower):
                 print(f"  ✅ Extracted from content: '{line}'")
                 return line
 
@@ -11777,7 +11638,7 @@ def extract_role_title_from_jd(jd_text: str, analysis_id: str) -> str:
             if line_lower_s3.startswith("about "):
                 print(f"  ⏭️  Skipping 'About' section header: '{clean_line}'")
                 continue
-            has_title_keyword = any(indicator in line_lower_s3 for indicator in job_title_indicators)
+            has_title_keyword = gp.JOB_TITLE_INDICATORS.search(line_lower_s3)
             if has_title_keyword:
                 print(f"  ✅ Extracted from first valid line: '{clean_line}'")
                 return clean_line
@@ -11813,72 +11674,40 @@ def detect_leadership_role_level(role_title: str, jd_text: str, analysis_id: str
             "leadership_keywords_found": list
         }
     """
-    import re
-
     print(f"🎖️  [{analysis_id}] Detecting leadership role level...")
 
+    # Director+, senior manager and IC-manager families come from one pass over the title
+    title_signals = gating_patterns.scan_role_title_signals(role_title)
     title_lower = role_title.lower()
 
-    # Leadership keywords that indicate Director+ roles (always leadership)
-    director_plus_keywords = [
-        "director", "vp ", "vp,", "v.p.", "vice president",
-        "head of", "chief", "cto", "cfo", "ceo", "coo", "cmo", "cpo", "cro",
-        "svp", "evp", "gvp", "president",
-    ]
-
-    # Senior Manager is ALWAYS a people leadership role (not IC)
-    # Check this before the generic "manager" keyword
-    senior_manager_keywords = [
-        "senior manager", "sr manager", "sr. manager",
-        "senior engineering manager", "senior product manager",  # These ARE leadership despite "product manager"
-        "senior program manager", "senior project manager",  # These ARE leadership despite "project manager"
-    ]
-
-    # Manager-level keywords (may be leadership depending on context)
-    manager_keywords = [
-        "manager", "lead", "principal", "staff",
-    ]
-
-    # IC roles that contain "manager" but are NOT people leadership
-    ic_manager_roles = [
-        "product manager", "project manager", "program manager",
-        "account manager", "customer success manager", "sales manager",
-        "marketing manager", "brand manager", "campaign manager",
-        "content manager", "community manager", "social media manager",
-    ]
-
     # Check for Senior Manager keywords FIRST (always leadership, even if title contains "product manager" etc)
-    for sm_kw in senior_manager_keywords:
-        if sm_kw in title_lower:
-            print(f"  🎖️  SENIOR MANAGER ROLE DETECTED: {sm_kw}")
-            print(f"  ⚡ Setting role_level=MANAGER, role_type=LEADERSHIP, confidence=1.0")
-            return {
-                "is_leadership_role": True,
-                "role_level": "MANAGER",
-                "role_type": "LEADERSHIP",
-                "confidence": 1.0,
-                "leadership_keywords_found": [sm_kw]
-            }
+    sm_kw = title_signals.first("senior_manager")
+    if sm_kw:
+        print(f"  🎖️  SENIOR MANAGER ROLE DETECTED: {sm_kw}")
+        print(f"  ⚡ Setting role_level=MANAGER, role_type=LEADERSHIP, confidence=1.0")
+        return {
+            "is_leadership_role": True,
+            "role_level": "MANAGER",
+            "role_type": "LEADERSHIP",
+            "confidence": 1.0,
+            "leadership_keywords_found": [sm_kw]
+        }
 
     # Check for IC manager roles (exclude from leadership)
-    for ic_role in ic_manager_roles:
-        if ic_role in title_lower:
-            # Only exclude if there's no "director" or higher in the title
-            if not any(kw in title_lower for kw in director_plus_keywords):
-                print(f"  ℹ️  IC role detected: {ic_role} (not leadership)")
-                return {
-                    "is_leadership_role": False,
-                    "role_level": "IC",
-                    "role_type": "FUNCTIONAL",
-                    "confidence": 0.9,
-                    "leadership_keywords_found": []
-                }
+    ic_role = title_signals.first("ic_manager")
+    # Only exclude if there's no "director" or higher in the title
+    if ic_role and not title_signals.has("director_plus"):
+        print(f"  ℹ️  IC role detected: {ic_role} (not leadership)")
+        return {
+            "is_leadership_role": False,
+            "role_level": "IC",
+            "role_type": "FUNCTIONAL",
+            "confidence": 0.9,
+            "leadership_keywords_found": []
+        }
 
     # Check for Director+ keywords (always leadership)
-    found_keywords = []
-    for kw in director_plus_keywords:
-        if kw in title_lower:
-            found_keywords.append(kw)
+    found_keywords = title_signals.matched("director_plus")
 
     if found_keywords:
         print(f"  🎖️  DIRECTOR+ ROLE DETECTED: {found_keywords}")
@@ -11892,18 +11721,10 @@ def detect_leadership_role_level(role_title: str, jd_text: str, analysis_id: str
         }
 
     # Check for Manager-level keywords
-    for kw in manager_keywords:
-        # Use word boundary to avoid false positives like "engagement" containing "manager"
-        if re.search(rf'\b{kw}\b', title_lower):
+    for kw, kw_pattern in gating_patterns.MANAGER_KEYWORD_PATTERNS:
+        if kw_pattern.search(title_lower):
             # Check if it's a people management role by looking at JD signals
-            people_mgmt_signals = [
-                "direct reports", "manage a team", "build a team", "lead a team",
-                "people leadership", "people management", "team management",
-                "hiring", "performance reviews", "managing engineers",
-                "managing designers", "managing people"
-            ]
-            jd_lower = jd_text.lower()
-            has_people_signals = any(sig in jd_lower for sig in people_mgmt_signals)
+            has_people_signals = gating_patterns.scan_jd_signals(jd_text).has("people_management")
 
             if has_people_signals:
                 found_keywords.append(kw)
@@ -12170,36 +11991,25 @@ def detect_role_type_isolated(jd_text: str, role_title: str, analysis_id: str) -
     print(f"  Title: '{role_title}'")
 
     title_lower = role_title.lower()
-    jd_lower = jd_text.lower()
 
-    # PRIORITY 1: RECRUITING (most specific, check first)
-    recruiting_title_patterns = [
-        "recruiter", "recruiting", "talent acquisition",
-        "sourcer", "sourcing", "talent partner",
-        "recruitment", "headhunter", "technical recruiter",
-        "ta director", "ta manager", "talent lead", "head of talent",
-        "hiring", "talent management", "talent operations"
-    ]
+    # Every title family and every JD family is answered by one pass over each text
+    # (pattern lists live in gating_patterns.ROLE_TITLE_SIGNALS / JD_SIGNALS)
+    title_signals = gating_patterns.scan_role_title_signals(role_title)
+    jd_signals = gating_patterns.scan_jd_signals(jd_text)
 
-    if any(pattern in title_lower for pattern in recruiting_title_patterns):
+    # PRIORITY 1: RECRUITING (most specific, check first)
+    if title_signals.has("recruiting"):
         print(f"  ✅ RECRUITING detected from title")
         return "recruiting"
 
     # Check JD content for strong recruiting signals (immediate match)
-    if "talent acquisition" in jd_lower:
-        print(f"  ✅ RECRUITING detected from JD (strong signal: talent acquisition)")
-        return "recruiting"
-    if "full-cycle recruiting" in jd_lower:
-        print(f"  ✅ RECRUITING detected from JD (strong signal: full-cycle recruiting)")
+    strong_signal = jd_signals.first("recruiting_strong")
+    if strong_signal:
+        print(f"  ✅ RECRUITING detected from JD (strong signal: {strong_signal})")
         return "recruiting"
 
     # Check JD content for recruiting signals
-    recruiting_jd_signals = [
-        "full-cycle recruiting", "sourcing", "candidate experience",
-        "hiring manager", "recruitment funnel", "talent pipeline",
-        "offer negotiation", "interview scheduling"
-    ]
-    recruiting_signal_count = sum(1 for sig in recruiting_jd_signals if sig in jd_lower)
+    recruiting_signal_count = jd_signals.count("recruiting")
 
     if recruiting_signal_count >= 3:
         print(f"  ✅ RECRUITING detected from JD ({recruiting_signal_count} signals)")
@@ -12214,82 +12024,45 @@ def detect_role_type_isolated(jd_text: str, role_title: str, analysis_id: str) -
     # - Product Manager: Product strategy (WHAT and WHY)
 
     # TPM patterns - check first as most specific
-    tpm_patterns = [
-        "technical program manager", "tpm", "sr tpm", "senior tpm",
-        "staff tpm", "principal tpm", "lead tpm"
-    ]
-
-    if any(pattern in title_lower for pattern in tpm_patterns):
+    if title_signals.has("tpm"):
         print(f"  ✅ TPM detected from title")
         return "tpm"
 
-    # Program Manager patterns (not product, not technical)
-    program_manager_patterns = [
-        "program manager", "sr program manager", "senior program manager",
-        "program director", "head of program", "vp program"
-    ]
-
     # Check for program manager but NOT technical program manager (already handled)
     # and NOT product program manager (should be PM)
-    if any(pattern in title_lower for pattern in program_manager_patterns):
+    if title_signals.has("program_manager"):
         # Exclude if "product" is in title - those are PMs
         if "product" not in title_lower:
             print(f"  ✅ PROGRAM_MANAGER detected from title")
             return "program_manager"
 
     # Project Manager patterns - distinct from Product Manager
-    project_manager_patterns = [
-        "project manager", "sr project manager", "senior project manager",
-        "project coordinator", "project lead", "pmo", "it project manager",
-        "technical project manager"
-    ]
-
-    if any(pattern in title_lower for pattern in project_manager_patterns):
+    if title_signals.has("project_manager"):
         # Exclude if "product" is in title - those are PMs
         if "product" not in title_lower:
             print(f"  ✅ PROJECT_MANAGER detected from title")
             return "project_manager"
 
     # PRIORITY 3: PRODUCT MANAGER
-    product_patterns = [
-        "product manager", "product lead", "product owner",
-        "product director", "head of product", "vp product", "cpo"
-    ]
-
     # Be careful NOT to match "product manager, cloud and open ecosystems" for non-PM roles
-    if any(pattern in title_lower for pattern in product_patterns):
+    if title_signals.has("product"):
         # Double-check this isn't a recruiting role with PM in name
-        if not any(rp in title_lower for rp in recruiting_title_patterns):
+        if not title_signals.has("recruiting"):
             print(f"  ✅ PRODUCT detected from title")
             return "pm"
 
     # PRIORITY 4: ENGINEERING
-    engineering_patterns = [
-        "engineer", "developer", "software", "technical lead",
-        "architect", "sre", "devops", "engineering manager"
-    ]
-
-    if any(pattern in title_lower for pattern in engineering_patterns):
+    if title_signals.has("engineering"):
         print(f"  ✅ ENGINEERING detected from title")
         return "engineering"
 
     # PRIORITY 5: SALES
-    sales_patterns = [
-        "sales", "account executive", "account manager",
-        "business development", "revenue", "ae ", "sdr", "bdr"
-    ]
-
-    if any(pattern in title_lower for pattern in sales_patterns):
+    if title_signals.has("sales"):
         print(f"  ✅ SALES detected from title")
         return "sales"
 
     # PRIORITY 6: MARKETING
-    marketing_patterns = [
-        "marketing", "growth", "demand gen",
-        "brand", "marketing manager", "cmo"
-    ]
-
-    if any(pattern in title_lower for pattern in marketing_patterns):
+    if title_signals.has("marketing"):
         print(f"  ✅ MARKETING detected from title")
         return "marketing"
 
@@ -12331,7 +12104,6 @@ def verify_role_type_alignment(
     print(f"🔍 [{analysis_id}] Verifying role type alignment...")
 
     title_lower = role_title.lower()
-    jd_lower = jd_text.lower()
     warnings = []
     aligned = True
     confidence = 1.0
@@ -12359,11 +12131,8 @@ def verify_role_type_alignment(
         confidence = 0.3
 
     # Case 3: Strong recruiting signals but non-recruiting type
-    recruiting_signals = [
-        "full-cycle recruiting", "candidate experience",
-        "sourcing", "hiring manager", "talent pipeline"
-    ]
-    signal_count = sum(1 for sig in recruiting_signals if sig in jd_lower)
+    # Same memoized JD scan detect_role_type_isolated() already ran
+    signal_count = gating_patterns.scan_jd_signals(jd_text).count("alignment_recruiting")
 
     if signal_count >= 3 and role_type != "recruiting":
         print(f"⚠️ [{analysis_id}] ROLE TYPE CONFIDENCE LOW")
@@ -12407,58 +12176,10 @@ def calculate_relevant_years_isolated(
 
     print(f"📊 [{analysis_id}] Calculating {role_type.upper()} experience years...")
 
-    # Role-specific title patterns
-    role_patterns = {
-        "recruiting": [
-            "recruiter", "recruiting", "talent acquisition",
-            "sourcer", "sourcing", "talent partner", "recruitment",
-            "technical recruiter", "ta ", "talent lead", "head of talent",
-            "talent advisor", "search analyst", "executive search",
-            "headhunter", "talent consultant", "hiring"
-        ],
-        "tpm": [
-            "technical program manager", "tpm", "sr tpm", "senior tpm",
-            "staff tpm", "principal tpm", "lead tpm",
-            # Also count program management experience with technical context
-            "program manager"  # TPM roles often have "program manager" in title
-        ],
-        "program_manager": [
-            "program manager", "sr program manager", "senior program manager",
-            "program director", "head of program", "vp program",
-            "portfolio manager", "initiative lead"
-        ],
-        "project_manager": [
-            "project manager", "sr project manager", "senior project manager",
-            "project coordinator", "project lead", "pmo", "it project manager",
-            "technical project manager", "project director"
-        ],
-        "pm": [
-            "product manager", "product lead", "pm", "product owner",
-            "product director", "head of product", "vp product"
-        ],
-        "engineering": [
-            "engineer", "developer", "software", "technical lead",
-            "architect", "sre", "devops", "programmer"
-        ],
-        "sales": [
-            "sales", "account executive", "account manager",
-            "business development", "revenue", "ae ", "sdr", "bdr"
-        ],
-        "marketing": [
-            "marketing", "growth", "demand gen",
-            "brand", "marketing manager", "content"
-        ]
-    }
-
-    patterns = role_patterns.get(role_type, [])
+    # Role-specific title patterns (precompiled, see gating_patterns.ROLE_EXPERIENCE_PATTERNS)
+    patterns = gating_patterns.ROLE_EXPERIENCE_PATTERNS.get(role_type)
     total_years = 0.0
 
-    # Company-based relevance (e.g., executive search firms = recruiting experience)
-    recruiting_companies = [
-        "heidrick", "korn ferry", "spencer stuart", "egon zehnder",
-        "russell reynolds", "executive search", "staffing", "recruiting agency"
-    ]
-
     for exp in resume_data.get("experience", []):
         if not isinstance(exp, dict):
             continue
@@ -12474,11 +12195,11 @@ def calculate_relevant_years_isolated(
             print(f"  📊 {exp.get('title')} @ {exp.get('company')}: +{years:.1f} years (all experience)")
             continue
 
-        is_relevant = any(pattern in title for pattern in patterns)
+        is_relevant = patterns.search(title)
 
         # For recruiting roles, also check if company is a known recruiting/search firm
         if role_type == "recruiting" and not is_relevant:
-            is_relevant = any(rc in company for rc in recruiting_companies)
+            is_relevant = gating_patterns.RECRUITING_COMPANIES.search(company)
             if is_relevant:
                 print(f"  ✅ {exp.get('title')} @ {exp.get('company')}: +{parse_duration_to_years_isolated(dates):.1f} years (recruiting firm)")
                 total_years += parse_duration_to_years_isolated(dates)
@@ -12507,7 +12228,6 @@ def parse_duration_to_years_isolated(dates: str) -> float:
     Returns:
         Duration in years
     """
-    import re
     from datetime import datetime
 
     if not dates:
@@ -12519,7 +12239,7 @@ def parse_duration_to_years_isolated(dates: str) -> float:
     is_current = "present" in dates_str or "current" in dates_str
 
     # Extract years
-    years = re.findall(r'\b(20\d{2})\b', dates_str)
+    years = gating_patterns.YEAR_RE.findall(dates_str)
 
     if len(years) >= 2:
         start_year = int(years[0])
@@ -12534,8 +12254,8 @@ def parse_duration_to_years_isolated(dates: str) -> float:
         return 1.0
 
     # Try to parse duration format (e.g., "2 years 3 months")
-    year_match = re.search(r'(\d+)\s*year', dates_str)
-    month_match = re.search(r'(\d+)\s*month', dates_str)
+    year_match = gating_patterns.DURATION_YEARS_RE.search(dates_str)
+    month_match = gating_patterns.DURATION_MONTHS_RE.search(dates_str)
     if year_match or month_match:
         yrs = int(year_match.group(1)) if year_match else 0
         mos = int(month_match.group(1)) if month_match else 0
@@ -12861,65 +12581,6 @@ def detect_role_type_from_jd(response_data: dict) -> str:
     return "general"
 
 
-def parse_experience_duration(dates_str: str) -> float:
-    """
-    Parse a date range string to calculate years.
-    Handles formats like:
-    - "Jan 2022 - Present"
-    - "2020 - 2023"
-    - "June 2023 - Dec 2024"
-    - "1 year 3 months"
-    """
-    import re
-    from datetime import datetime
-
-    if not dates_str:
-        return 0.0
-
-    dates_str = dates_str.lower().strip()
-
-    # Check for direct duration format (e.g., "1 year 3 months")
-    year_match = re.search(r'(\d+)\s*year', dates_str)
-    month_match = re.search(r'(\d+)\s*month', dates_str)
-    if year_match or month_match:
-        years = int(year_match.group(1)) if year_match else 0
-        months = int(month_match.group(1)) if month_match else 0
-        return years + (months / 12)
-
-    # Try to parse date range
-    # Handle "present" or "current"
-    if "present" in dates_str or "current" in dates_str:
-        end_date = datetime.now()
-    else:
-        # Try to extract end year
-        years_in_str = re.findall(r'20\d{2}', dates_str)
-        if len(years_in_str) >= 2:
-            end_date = datetime(int(years_in_str[-1]), 12, 1)
-        elif len(years_in_str) == 1:
-            end_date = datetime(int(years_in_str[0]), 12, 1)
-        else:
-            return 0.5  # Default to 6 months if can't parse
-
-    # Extract start year
-    years_in_str = re.findall(r'20\d{2}', dates_str)
-    if years_in_str:
-        start_year = int(years_in_str[0])
-        # Try to get month
-        month_names = ["jan", "feb", "mar", "apr", "may", "jun",
-                       "jul", "aug", "sep", "oct", "nov", "dec"]
-        start_month = 1
-        for i, month in enumerate(month_names):
-            if month in dates_str[:20]:  # Check first part of string
-                start_month = i + 1
-                break
-
-        start_date = datetime(start_year, start_month, 1)
-        duration = (end_date - start_date).days / 365.25
-        return max(0, duration)
-
-    return 0.5  # Default
-
-
 def apply_credibility_adjustment(resume_data: dict, raw_years: float) -> float:
     """
     Apply company credibility adjustment if Claude didn't do it.
@@ -13083,187 +12744,58 @@ def _apply_render_guard(parsed_data: dict, analysis_id: str) -> dict:
             if not parsed_data.get("apply_disabled_reason"):
                 parsed_data["apply_disabled_reason"] = "Not eligible for this role"
 
-        print(f"🚨🚨🚨 RENDER GUARD CORRECTED - Decision now: {system_decision} 🚨🚨🚨\n")
-    else:
-        print(f"   ✅ No mismatch detected - Claude ({claude_recommendation}) matches System ({system_decision})")
-
-    return parsed_data
-
-
-def _final_sanitize_text(data: dict, analysis_id: str = None) -> dict:
-    """
-    Final safety-net sanitization for grammar and punctuation in API responses.
-
-    Per P0.5 Grammar & Punctuation Standards:
-    - Remove em dashes (—) and stylistic en dashes (–)
-    - Remove markdown emphasis markers (*text*, **text**, _text_)
-    - Remove JD preamble patterns from user-facing text
-
-    This catches any style artifacts that slip through the postprocessor pipeline.
-    Critical for user-facing text fields like strategic_action.
-
-    DISALLOWED CHARACTERS:
-    - Em dashes: —
-    - Stylistic en dashes: –
-    - Asterisk emphasis: *text*, **text**
-    - Underscore emphasis: _text_
-
-    ALLOWED REPLACEMENTS:
-    - Use periods instead of em dashes
-    - Use plain text (no markdown emphasis symbols)
-    """
-    import re
-
-    def sanitize_string(text: str) -> str:
-        if not text or not isinstance(text, str):
-            return text
-
-        # =====================================================================
-        # PART 1: Remove JD preamble patterns from text
-        # Patterns like "We're seeking a [Title]" shouldn't appear in Your Move
-        # =====================================================================
-        jd_preamble_patterns = [
-            r"[Ww]e'?re?\s+seeking\s+(?:a|an)\s+",
-            r"[Ww]e\s+are\s+seeking\s+(?:a|an)\s+",
-            r"[Ww]e'?re?\s+looking\s+for\s+(?:a|an)\s+",
-            r"[Ww]e\s+are\s+looking\s+for\s+(?:a|an)\s+",
-            r"[Jj]oin\s+(?:us|our\s+team)\s+as\s+(?:a|an)\s+",
-            r"[Aa]bout\s+(?:the|this)\s+[Rr]ole[:\s]+",
-            r"[Tt]he\s+[Rr]ole[:\s]+",
-        ]
-        for pattern in jd_preamble_patterns:
-            text = re.sub(pattern, "", text)
-
-        # =====================================================================
-        # PART 2: Replace em/en dashes with period + space
-        # Per P0.5: Use periods instead of em dashes
-        # =====================================================================
-        if '—' in text or '–' in text:
-            # Replace em/en dashes with period + space for sentence breaks
-            text = text.replace('—', '. ')
-            text = text.replace('–', '. ')
-            # Clean up double periods and extra spaces
-            text = text.replace('..', '.')
-            text = text.replace('.  ', '. ')
-            # Capitalize after new periods
-            text = re.sub(r'\.\s+([a-z])', lambda m: '. ' + m.group(1).upper(), text)
-            # Fix double spaces
-            text = re.sub(r'\s{2,}', ' ', text)
-
-        # =====================================================================
-        # PART 3: Remove markdown emphasis markers
-        # Per P0.5: No asterisks or underscores for emphasis in prose
-        # =====================================================================
-        # Remove bold (**text**) - keep the text, remove the markers
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        # Remove italic (*text*) - keep the text, remove the markers
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        # Remove underscore emphasis (_text_) - keep the text, remove the markers
-        text = re.sub(r'_([^_]+)_', r'\1', text)
-
-        # =====================================================================
-        # PART 4: Fix common casing inconsistencies from LLM output
-        # "aI-enabled" → "AI-enabled", "c-suite" → "C-suite", etc.
-        # =====================================================================
-        text = re.sub(r'\bai-', 'AI-', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bai\b', 'AI', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bc-suite\b', 'C-suite', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bfaang\b', 'FAANG', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bgtm\b', 'GTM', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bkpi\b', 'KPI', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bkpis\b', 'KPIs', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bats\b', 'ATS', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bhr\b', 'HR', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bde&i\b', 'DE&I', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bdei\b', 'DEI', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bsaas\b', 'SaaS', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bsec\b', 'SEC', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bipo\b', 'IPO', text, flags=re.IGNORECASE)
-
-        return text.strip()
-
-    def recurse(obj):
-        if isinstance(obj, dict):
-            return {k: recurse(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [recurse(item) for item in obj]
-        elif isinstance(obj, str):
-            return sanitize_string(obj)
-        else:
-            return obj
-
-    sanitized_data = recurse(data)
-
-    # =========================================================================
-    # GRAMMAR ASSERTION (Soft Fail): Log if disallowed chars still present
-    # Per P0.5: Do NOT crash, log only for observability
-    # =========================================================================
-    _check_grammar_compliance(sanitized_data, analysis_id)
-
-    return sanitized_data
-
+        print(f"🚨🚨🚨 RENDER GUARD CORRECTED - Decision now: {system_decision} 🚨🚨🚨\n")
+    else:
+        print(f"   ✅ No mismatch detected - Claude ({claude_recommendation}) matches System ({system_decision})")
 
-def _check_grammar_compliance(data: dict, analysis_id: str = None) -> None:
-    """
-    Check for disallowed punctuation/formatting after sanitization.
+    return parsed_data
 
-    Per P0.5 spec: Soft fail - log warning only, do not crash.
-    This is observability, not enforcement-by-failure.
 
-    Checks for:
-    - Em dashes (—)
-    - Stylistic en dashes (–)
-    - Asterisk emphasis (*text*)
-    - Underscore emphasis (_text_)
+def _final_sanitize_text(data: dict, analysis_id: str = None) -> dict:
     """
-    import re
-
-    def check_string(text: str, path: str) -> list:
-        """Check a single string for violations, return list of issues."""
-        if not text or not isinstance(text, str):
-            return []
-
-        violations = []
+    Final safety-net sanitization for grammar and punctuation in API responses.
 
-        # Check for em dashes
-        if '—' in text:
-            violations.append(f"Em dash (—) in {path}")
+    Per P0.5 Grammar & Punctuation Standards:
+    - Remove em dashes (—) and stylistic en dashes (–)
+    - Remove markdown emphasis markers (*text*, **text**, _text_)
+    - Remove JD preamble patterns from user-facing text
 
-        # Check for stylistic en dashes (not hyphen)
-        if '–' in text:
-            violations.append(f"En dash (–) in {path}")
+    This catches any style artifacts that slip through the postprocessor pipeline.
+    Critical for user-facing text fields like strategic_action.
 
-        # Check for asterisk emphasis (but not bullet points)
-        if re.search(r'\*[^*\s][^*]*\*', text):
-            violations.append(f"Asterisk emphasis (*text*) in {path}")
+    DISALLOWED CHARACTERS:
+    - Em dashes: —
+    - Stylistic en dashes: –
+    - Asterisk emphasis: *text*, **text**
+    - Underscore emphasis: _text_
 
-        # Check for underscore emphasis
-        if re.search(r'_[^_\s][^_]*_', text):
-            violations.append(f"Underscore emphasis (_text_) in {path}")
+    ALLOWED REPLACEMENTS:
+    - Use periods instead of em dashes
+    - Use plain text (no markdown emphasis symbols)
 
-        return violations
+    Sanitization and the grammar compliance check share one tree walk
+    (backend/postprocessors/text_pipeline.py).
+    """
+    from backend.postprocessors.text_pipeline import (
+        STAGE_FINAL_SANITIZE,
+        STAGE_GRAMMAR_CHECK,
+        run_text_pipeline,
+    )
 
-    def recurse_check(obj, path: str = "") -> list:
-        """Recursively check all strings in the data structure."""
-        all_violations = []
+    sanitized_data, report = run_text_pipeline(data, [STAGE_FINAL_SANITIZE, STAGE_GRAMMAR_CHECK])
 
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                new_path = f"{path}.{k}" if path else k
-                all_violations.extend(recurse_check(v, new_path))
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]"
-                all_violations.extend(recurse_check(item, new_path))
-        elif isinstance(obj, str):
-            all_violations.extend(check_string(obj, path))
+    # =========================================================================
+    # GRAMMAR ASSERTION (Soft Fail): Log if disallowed chars still present
+    # Per P0.5: Do NOT crash, log only for observability
+    # =========================================================================
+    _log_grammar_violations(report.grammar_violations, analysis_id)
 
-        return all_violations
+    return sanitized_data
 
-    violations = recurse_check(data)
 
+def _log_grammar_violations(violations: list, analysis_id: str = None) -> None:
+    """Soft-fail logging for P0.5 grammar violations."""
     if violations:
-        # Soft fail - log warning only
         aid = analysis_id or "unknown"
         logger.warning(f"STYLE_VIOLATION_DETECTED [{aid}]: {len(violations)} issues found")
         for v in violations[:5]:  # Log first 5 violations
@@ -13328,6 +12860,43 @@ def _extract_fallback_strengths_from_resume(resume_data: dict, response_data: di
     return strengths[:3]  # Cap at 3 strengths
 
 
+def _serve_cached_analysis(
+    cached_analysis: Optional[Dict[str, Any]],
+    resume_hash: str,
+    analysis_id: str
+) -> Optional[JSONResponse]:
+    """Build the cache-hit response for analyze_jd, or None if the entry is unusable."""
+    if not cached_analysis:
+        return None
+
+    # P0 FIX: Validate cached fit_score is a number, not an object
+    # Stale cache entries from buggy deployments may have fit_score as {"value": N, ...}
+    cached_fit_score = cached_analysis.get("fit_score")
+    if isinstance(cached_fit_score, dict):
+        # Extract value from object format, or invalidate cache
+        fit_value = cached_fit_score.get("value")
+        if fit_value is not None and isinstance(fit_value, (int, float)):
+            print(f"💾 RESUME CACHE HIT — fixing stale fit_score object → {fit_value}")
+            cached_analysis["fit_score"] = int(fit_value)
+        else:
+            # Invalid cache entry - skip it and re-analyze
+            print(f"💾 RESUME CACHE INVALID — fit_score is malformed object, re-analyzing")
+            return None
+
+    print(f"💾 RESUME CACHE HIT — LLM skipped")
+    print(f"   Returning cached analysis for resume hash: {resume_hash[:12]}...")
+
+    # Add cache metadata to response
+    cached_analysis["cache"] = {
+        "hit": True,
+        "resume_hash": resume_hash,
+        "cached_at": cached_analysis.get("_cached_at", datetime.utcnow().isoformat())
+    }
+    cached_analysis["analysis_id"] = analysis_id  # Fresh analysis_id for this request
+
+    return JSONResponse(content=cached_analysis)
+
+
 @app.post("/api/jd/analyze")
 @limiter.limit("20/minute")
 async def analyze_jd(request: Request, body: JDAnalyzeRequest) -> Dict[str, Any]:
@@ -13364,9 +12933,6 @@ async def analyze_jd(request: Request, body: JDAnalyzeRequest) -> Dict[str, Any]
     # ========================================================================
     log_execution_mode_banner(body, analysis_id)
 
-    # Opportunistic cleanup of expired sessions to prevent memory leaks
-    cleanup_expired_sessions()
-
     # Validate we have complete data from THIS request only
     if not body.resume or not isinstance(body.resume, dict):
         print(f"⚠️ [{analysis_id}] No valid resume data provided")
@@ -13395,113 +12961,124 @@ async def analyze_jd(request: Request, body: JDAnalyzeRequest) -> Dict[str, Any]
         resume_hash = compute_resume_hash(resume_data, jd_text)
         print(f"💾 [{analysis_id}] Resume+JD hash: {resume_hash[:12]}...")
 
-        cached_analysis = get_cached_analysis(resume_hash)
-        if cached_analysis:
-            # P0 FIX: Validate cached fit_score is a number, not an object
-            # Stale cache entries from buggy deployments may have fit_score as {"value": N, ...}
-            cached_fit_score = cached_analysis.get("fit_score")
-            if isinstance(cached_fit_score, dict):
-                # Extract value from object format, or invalidate cache
-                fit_value = cached_fit_score.get("value")
-                if fit_value is not None and isinstance(fit_value, (int, float)):
-                    print(f"💾 RESUME CACHE HIT — fixing stale fit_score object → {fit_value}")
-                    cached_analysis["fit_score"] = int(fit_value)
-                else:
-                    # Invalid cache entry - skip it and re-analyze
-                    print(f"💾 RESUME CACHE INVALID — fit_score is malformed object, re-analyzing")
-                    cached_analysis = None
-
-            if cached_analysis:
-                print(f"💾 RESUME CACHE HIT — LLM skipped")
-                print(f"   Returning cached analysis for resume hash: {resume_hash[:12]}...")
-
-                # Add cache metadata to response
-                cached_analysis["cache"] = {
-                    "hit": True,
-                    "resume_hash": resume_hash,
-                    "cached_at": cached_analysis.get("_cached_at", datetime.utcnow().isoformat())
-                }
-                cached_analysis["analysis_id"] = analysis_id  # Fresh analysis_id for this request
+        cached_response = _serve_cached_analysis(await get_cached_analysis(resume_hash), resume_hash, analysis_id)
+        if cached_response is not None:
+            return cached_response
+        print(f"💾 RESUME CACHE MISS — proceeding to analysis")
 
-                return JSONResponse(content=cached_analysis)
-        else:
-            print(f"💾 RESUME CACHE MISS — proceeding to analysis")
+        # SINGLEFLIGHT: Concurrent requests for the same resume+JD share one analysis.
+        # Waiters pick up the result the first request stored in the local tier.
+        async with resume_analysis_singleflight.lock(resume_hash):
+            cached_response = _serve_cached_analysis(
+                await get_cached_analysis(resume_hash, local_only=True), resume_hash, analysis_id
+            )
+            if cached_response is not None:
+                print(f"💾 [{analysis_id}] Coalesced with in-flight analysis for hash: {resume_hash[:12]}...")
+                return cached_response
+            return await _analyze_jd_uncached(body, analysis_id, resume_data, jd_text, resume_hash)
 
+    return await _analyze_jd_uncached(body, analysis_id, resume_data, jd_text, resume_hash)
+
+
+def _warm_calibration_signal_features(resume_data: Dict[str, Any]) -> None:
+    """
+    Compute calibration SignalFeatures for STEP 2.6 ahead of time.
+
+    Builds the same roles/summary/skills view force_apply_experience_penalties
+    passes to calibrate_gaps, so the later call is a cache hit.
+    """
+    features = get_resume_features(resume_data)
+    extract_signal_features({
+        'roles': features.experience,
+        'experience': features.experience,
+        'summary': features.summary,
+        'skills': features.skills,
+    })
+
+
+async def _analyze_jd_uncached(
+    body: JDAnalyzeRequest,
+    analysis_id: str,
+    resume_data: Dict[str, Any],
+    jd_text: str,
+    resume_hash: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Full /api/jd/analyze pipeline for a request that missed the resume cache.
+
+    Split out of analyze_jd so the resume analysis singleflight can wrap it.
+    """
     # ========================================================================
-    # P0 JD CACHE: Check for cached JD parsing context BEFORE role detection
-    # If cache hit, skip JD parsing calls entirely
+    # ANALYSIS STAGE GRAPH
+    # Every stage declares what it waits on and starts as soon as it can:
+    #
+    #   resume_features ─┬─ career_gap_penalty ─┐
+    #                    ├─ leadership_years ───┼─ gates ─┬─ llm ─── fit_score_llm ─┐
+    #   jd_context ──────┴──────────────────────┘         └─ company_intel ─────────┼─ postprocess
+    #                    ├─ employer_scales ── prompt ──── (llm)                    │
+    #                    ├─ career_gap ─────────────────────────────────────────────┤
+    #                    └─ signal_features ────────────────────────────────────────┘
+    #
+    # Resume-only work runs in threads while the JD context resolves and while
+    # Claude is generating, so the critical path is JD context -> gates -> LLM
+    # -> postprocess. Company intel (an LLM call) still waits for the gates so
+    # gated and dry-run requests stay at $0. Timings land in _debug.
     # ========================================================================
-    jd_hash = None
-    jd_cache_hit = False
-    cached_jd_context = None
+    stages = StageGraph()
 
-    if ENABLE_JD_CACHE and jd_text:
-        jd_hash = generate_jd_cache_key(jd_text)
-        print(f"🧠 [{analysis_id}] JD hash: {jd_hash[:12]}...")
+    # Parse the resume once; gating, calibration, reality check and the
+    # canonical profile all read this request's ResumeFeatures
+    stages.begin("resume_features")
+    if resume_data:
+        activate_resume_features(resume_data)
+    stages.end("resume_features")
 
-        cached_jd_context = get_cached_jd_context(jd_hash)
-        if cached_jd_context:
-            jd_cache_hit = True
-            print(f"🧠 JD CACHE HIT — skipping JD parsing & role detection")
-        else:
-            print(f"🧠 JD CACHE MISS — computing JD context")
+    if jd_text:
+        stages.add("jd_context", resolve_jd_context, jd_text, analysis_id)
+    if resume_data:
+        resume_stage = ("resume_features",)
+        stages.add("career_gap_penalty", calculate_career_gap_penalty_isolated, resume_data, analysis_id, after=resume_stage, thread=True)
+        stages.add("leadership_years", extract_people_leadership_years, resume_data, after=resume_stage, thread=True)
+        stages.add("career_gap", detect_career_gap, resume_data, after=resume_stage, thread=True)
+        if COMPANY_INTEL_AVAILABLE:
+            stages.add("employer_scales", get_candidate_employer_scales, resume_data, after=resume_stage, thread=True)
+        if CALIBRATION_AVAILABLE:
+            stages.add("signal_features", _warm_calibration_signal_features, resume_data, after=resume_stage, thread=True)
 
-    # Log combined cache status
-    resume_cache_hit = False  # Will be set to True if we hit resume cache (but we already returned in that case)
-    print(f"📊 CACHE STATUS: JD={'HIT' if jd_cache_hit else 'MISS'} | RESUME={'HIT' if resume_cache_hit else 'MISS'}")
+    # ========================================================================
+    # P0 JD CACHE: Resolve JD parsing context BEFORE role detection
+    # Local memo / jd_cache hits skip JD parsing calls entirely, and
+    # concurrent analyses of the same JD share one parse
+    # ========================================================================
+    jd_cache_hit = False
 
     # Pre-compute isolated role detection for later use
     isolated_role_detection = None
     pre_llm_leadership_gate = None  # NEW: Pre-LLM leadership gate result
 
-    # Use cached JD context if available, otherwise compute
     if jd_text:
-        if jd_cache_hit and cached_jd_context:
-            # Use cached JD parsing results
-            extracted_title = cached_jd_context.get("parsed_role_title", "")
-            isolated_role_type = cached_jd_context.get("role_type", "general")
-            alignment = {"confidence": 0.8, "source": "cache", "warnings": []}  # Cached = trusted
-            cached_role_level = cached_jd_context.get("role_level", "IC")
-
-            # P0 FIX: Derive is_leadership_role from role_level, not from stale cache
-            # MANAGER, DIRECTOR_OR_ABOVE roles always require people leadership
-            is_leadership_from_level = cached_role_level in ["MANAGER", "DIRECTOR_OR_ABOVE"]
-
-            role_level_info = {
-                "role_level": cached_role_level,
-                "is_leadership_role": is_leadership_from_level,  # Derive from level, not stale cache value
-                "source": "cache"
-            }
-            print(f"🧠 Using cached JD context: {extracted_title} / {isolated_role_type} / {role_level_info['role_level']} (leadership={is_leadership_from_level})")
-        else:
-            # Compute JD context fresh
-            extracted_title = extract_role_title_from_jd(jd_text, analysis_id)
-            isolated_role_type = detect_role_type_isolated(jd_text, extracted_title, analysis_id)
-            alignment = verify_role_type_alignment(isolated_role_type, extracted_title, jd_text, analysis_id)
+        jd_context = await stages.result("jd_context")
+        jd_cache_hit = jd_context["cache_hit"] is not None
+        extracted_title = jd_context["extracted_title"]
+        isolated_role_type = jd_context["role_type"]
+        alignment = jd_context["alignment"]
+        role_level_info = jd_context["role_level_info"]
+        if jd_cache_hit:
+            print(f"🧠 Using cached JD context: {extracted_title} / {isolated_role_type} / {role_level_info['role_level']} (leadership={role_level_info.get('is_leadership_role', False)})")
 
-            # Detect leadership role level from title (only when computing fresh)
-            # Per fix spec: If leadership keyword detected, hard-set role_level/role_type
-            role_level_info = detect_leadership_role_level(extracted_title, jd_text, analysis_id)
-
-            # Store JD context in cache for future requests
-            if ENABLE_JD_CACHE and jd_hash:
-                try:
-                    store_jd_cache(
-                        jd_hash=jd_hash,
-                        parsed_role_title=extracted_title,
-                        role_type=isolated_role_type,
-                        role_level=role_level_info.get("role_level", "IC"),
-                        leadership_required=role_level_info.get("is_leadership_role", False),
-                        required_years=0.0,  # Will be extracted later
-                        domain_tags=[]  # Will be populated later if available
-                    )
-                except Exception as cache_err:
-                    print(f"⚠️ Failed to cache JD context: {cache_err}")
+    # Log combined cache status
+    resume_cache_hit = False  # Will be set to True if we hit resume cache (but we already returned in that case)
+    print(f"📊 CACHE STATUS: JD={'HIT' if jd_cache_hit else 'MISS'} | RESUME={'HIT' if resume_cache_hit else 'MISS'}")
 
+    stages.begin("gates", after=("jd_context", "career_gap_penalty", "leadership_years"))
+    if jd_text:
         # Calculate role-specific experience using isolated function
         if resume_data:
             candidate_years = calculate_relevant_years_isolated(resume_data, isolated_role_type, analysis_id)
-            gap_info = calculate_career_gap_penalty_isolated(resume_data, analysis_id)
+            gap_info = await stages.result("career_gap_penalty")
+            # Leadership years were computed alongside the JD context; the
+            # leadership checks below read them from ResumeFeatures
+            await stages.wait("leadership_years")
 
             # Extract leadership requirements from JD before checking
             # Build a minimal response_data dict for the existing extraction function
@@ -13618,6 +13195,7 @@ async def analyze_jd(request: Request, body: JDAnalyzeRequest) -> Dict[str, Any]
     else:
         # No JD text - create unlocked leadership context
         leadership_context = LeadershipContext(analysis_id)
+    stages.end("gates")
 
     print(f"✅ [{analysis_id}] Request isolation verified - using only request data")
 
@@ -13803,8 +13381,10 @@ async def analyze_jd(request: Request, body: JDAnalyzeRequest) -> Dict[str, Any]
         }
 
         print(f"🚫🚫🚫 RETURNING GATED RESPONSE - $0 API SPEND 🚫🚫🚫\n")
+        gated_response["_debug"] = {"stage_timings": stages.summary()}
         return gated_response
 
+    stages.begin("prompt", after=("employer_scales",))
     system_prompt = """You are HenryHQ-STRUCT, a deterministic JSON-generation engine for job analysis.
 
 === STRICT JSON OUTPUT MODE (ABSOLUTE REQUIREMENT) ===
@@ -15501,6 +15081,9 @@ BAD: "Find 3 better-fit roles this week." (Useless without specifics.)
 
 === END COMPLETE FUNCTION MISMATCH COACHING ==="""
 
+    # Static instructions are sent as a cached prompt prefix; calibration is per-request
+    system_prompt = SystemPrompt(system_prompt)
+
     # Inject candidate state calibration if available
     situation = None
     if body.preferences:
@@ -15556,7 +15139,7 @@ Role: {body.role_title}
         # Add employer scale intelligence for scope/seniority evaluation
         if COMPANY_INTEL_AVAILABLE:
             try:
-                employer_scales = get_candidate_employer_scales(body.resume)
+                employer_scales = await stages.result("employer_scales")
                 if employer_scales:
                     user_message += "\n\n=== CANDIDATE EMPLOYER SCALE DATA ===\n"
                     user_message += "Use this data to accurately evaluate the 20% scope/seniority component of fit_score.\n"
@@ -15583,6 +15166,7 @@ Role: {body.role_title}
 
     # GUARD CLAUSE: Reinforce JSON-only output at end of user message
     user_message += "\n\n=== REMINDER ===\nReturn ONLY the JSON object matching the schema. No natural language. No markdown. No commentary. Start with { and end with }."
+    stages.end("prompt")
 
     # ========================================================================
     # P0 SAFETY: GUARDRAIL ASSERTION BEFORE CLAUDE CALL
@@ -15600,20 +15184,24 @@ Role: {body.role_title}
     company_name_for_intel = body.company or ""
     if COMPANY_INTEL_AVAILABLE and COMPANY_INTEL_ENABLED and is_valid_company_name(company_name_for_intel):
         print(f"🚀 [{analysis_id}] Starting company intel fetch in parallel for: {company_name_for_intel}")
-        company_intel_task = asyncio.create_task(
-            asyncio.to_thread(get_company_intelligence, company_name_for_intel)
+        company_intel_task = stages.add(
+            "company_intel", get_company_intelligence, company_name_for_intel, after=("gates",), thread=True
         )
 
     # Call Claude with higher token limit for comprehensive analysis
     # P0 FIX: max_retries=1 to prevent cost leak from retry loops
-    # PERFORMANCE: Run in thread to avoid blocking event loop, enables parallel company intel
-    response = await asyncio.to_thread(
-        call_claude, system_prompt, user_message,
-        4096,   # max_tokens
-        1,      # max_retries
-        0,      # temperature
-        "claude-opus-4-6",  # model
+    # PERFORMANCE: Async client keeps the event loop free, enables parallel company intel
+    stages.add(
+        "llm", call_claude_async,
+        system_prompt, user_message,
+        max_tokens=4096,
+        max_retries=1,
+        temperature=0,
+        model="claude-opus-4-6",
+        cache_site="jd_analyze",
+        after=("gates", "prompt"),
     )
+    response = await stages.result("llm")
 
     # Parse JSON response
     try:
@@ -15805,7 +15393,8 @@ Role: {body.role_title}
             print(f"   Candidate Years: {candidate_years}")
             print(f"   Leadership Required: {leadership_required}")
 
-            isolated_fit_result = calculate_fit_score_llm(
+            stages.begin("fit_score_llm", after=("llm",))
+            isolated_fit_result = await calculate_fit_score_llm(
                 role_title=role_title,
                 role_level=role_level,
                 required_years=required_years,
@@ -15815,6 +15404,7 @@ Role: {body.role_title}
                 leadership_required=leadership_required,
                 analysis_id=analysis_id
             )
+            stages.end("fit_score_llm")
 
             # Use isolated result if successful
             if isolated_fit_result.get("status") == "CALCULATED":
@@ -15838,6 +15428,8 @@ Role: {body.role_title}
             print(f"🔧 [{analysis_id}] FIT SCORE LLM DISABLED - using main prompt score")
             parsed_data["fit_score_source"] = "main_prompt"
 
+        stages.begin("postprocess", after=("llm", "fit_score_llm", "company_intel", "career_gap", "signal_features"))
+
         # ========================================================================
         # LEADERSHIP GATE: Signal, not blocker
         # Eligibility influences score and reasoning but never hard-stops.
@@ -15911,10 +15503,12 @@ Role: {body.role_title}
         # This ensures hard caps are enforced even if Claude ignores the prompt instructions
         # P0 FIX: Use leadership_context directly (it's always a LeadershipContext object)
         # NOTE: Do NOT use isolated_role_detection.get("leadership_context") - that's a serialized dict
+        await stages.wait("signal_features")
         parsed_data = force_apply_experience_penalties(parsed_data, body.resume, leadership_context)
 
         # POST-PROCESSING: Detect career gap (bypass unreliable prompt-based detection)
-        career_gap = detect_career_gap(body.resume)
+        # Computed from the resume alone while Claude was generating
+        career_gap = await stages.result("career_gap") if body.resume else detect_career_gap(body.resume)
         if career_gap:
             # Ensure gaps array exists
             if "gaps" not in parsed_data:
@@ -16278,7 +15872,7 @@ Role: {body.role_title}
             # Add timestamp for cache tracking
             parsed_data["_cached_at"] = datetime.utcnow().isoformat()
 
-            # Store in cache (fire and forget - don't block response)
+            # Store in cache (Supabase write is write-behind - don't block response)
             try:
                 store_cached_analysis(resume_hash, parsed_data)
             except Exception as cache_err:
@@ -16291,6 +15885,9 @@ Role: {body.role_title}
                 "cached_at": parsed_data["_cached_at"]
             }
 
+        stages.end("postprocess")
+        parsed_data["_debug"] = {"stage_timings": stages.summary()}
+
         print(f"✅ Analysis complete, returning response")
         return JSONResponse(content=parsed_data)
     except json.JSONDecodeError as e:
@@ -16450,7 +16047,6 @@ async def analyze_jd_stream(request: Request, body: JDAnalyzeRequest):
     """
     import re
     import json
-    import asyncio
     from starlette.responses import JSONResponse
 
     # ========================================================================
@@ -16470,6 +16066,8 @@ async def analyze_jd_stream(request: Request, body: JDAnalyzeRequest):
     analysis_id = str(uuid.uuid4())[:8]
     jd_text = body.job_description or ""
     resume_data = body.resume if body.resume else {}
+    if resume_data:
+        activate_resume_features(resume_data)
 
     pre_llm_leadership_gate = None
     isolated_role_detection = None
@@ -16477,10 +16075,11 @@ async def analyze_jd_stream(request: Request, body: JDAnalyzeRequest):
     role_level_info = {}
 
     if jd_text:
-        extracted_title = extract_role_title_from_jd(jd_text, analysis_id)
-        isolated_role_type = detect_role_type_isolated(jd_text, extracted_title, analysis_id)
-        alignment = verify_role_type_alignment(isolated_role_type, extracted_title, jd_text, analysis_id)
-        role_level_info = detect_leadership_role_level(extracted_title, jd_text, analysis_id)
+        jd_context = await resolve_jd_context(jd_text, analysis_id)
+        extracted_title = jd_context["extracted_title"]
+        isolated_role_type = jd_context["role_type"]
+        alignment = jd_context["alignment"]
+        role_level_info = jd_context["role_level_info"]
 
         if resume_data:
             candidate_years = calculate_relevant_years_isolated(resume_data, isolated_role_type, analysis_id)
@@ -16835,6 +16434,9 @@ BAD: "Find 3 better-fit roles this week." (Useless without specifics.)
 
 === END COMPLETE FUNCTION MISMATCH COACHING ==="""
 
+    # Static instructions are sent as a cached prompt prefix
+    system_prompt = SystemPrompt(system_prompt)
+
     # Build user message
     user_message = f"""Job Description:
 Company: {body.company}
@@ -16886,6 +16488,15 @@ Role: {body.role_title}
         applicants_sent = False
         early_insight_success = False
 
+        # Fields are picked out of the stream by an incremental JSON parser:
+        # each chunk is parsed once, a partial event goes out as soon as its
+        # value closes, and strengths stream element by element
+        stream_parser = IncrementalJSONParser()
+        strengths = []
+        gaps_preview = []
+        gaps_preview_ready = False
+        mid_insight_sent = False
+
         try:
             # PHASE 0: Emit early_insight immediately (no LLM needed)
             # Wrapped in its own try/except — early_insight is optional, must never crash the stream
@@ -16895,79 +16506,61 @@ Role: {body.role_title}
                 early_seniority = role_level_info.get("role_level", "IC") if isolated_role_detection else "IC"
                 early_function = isolated_role_detection.get("role_type", "") if isolated_role_detection else ""
                 yield f"data: {json.dumps({'type': 'early_insight', 'data': {'role_title': early_role, 'company': early_company, 'seniority': early_seniority, 'function': early_function}})}\n\n"
-                await asyncio.sleep(0)
                 early_insight_success = True
             except Exception as e:
                 print(f"[STREAM] early_insight failed (non-fatal): {e}")
 
             # Stream Claude's response
-            for chunk in call_claude_streaming(system_prompt, user_message, max_tokens=8192, model="claude-opus-4-6"):
+            async for chunk in call_claude_streaming_async(system_prompt, user_message, max_tokens=8192, model="claude-opus-4-6"):
                 buffer += chunk
 
-                # Try to extract key fields as they become available
-
-                # Extract fit_score (appears early in JSON)
-                if not fit_score_sent and '"fit_score"' in buffer:
-                    match = re.search(r'"fit_score"\s*:\s*(\d+)', buffer)
-                    if match:
-                        fit_score = int(match.group(1))
-                        yield f"data: {json.dumps({'type': 'partial', 'field': 'fit_score', 'value': fit_score})}\n\n"
-                        fit_score_sent = True
-                        await asyncio.sleep(0)  # Allow event loop to process
-
-                # Extract recommendation
-                if not recommendation_sent and '"recommendation"' in buffer:
-                    match = re.search(r'"recommendation"\s*:\s*"([^"]+)"', buffer)
-                    if match:
-                        recommendation = match.group(1)
-                        yield f"data: {json.dumps({'type': 'partial', 'field': 'recommendation', 'value': recommendation})}\n\n"
-                        recommendation_sent = True
-                        await asyncio.sleep(0)
-
-                # Extract strengths array (look for complete array)
-                if not strengths_sent and '"strengths"' in buffer:
-                    # Try to extract complete strengths array
-                    match = re.search(r'"strengths"\s*:\s*\[((?:[^][]|\[[^\]]*\])*)\]', buffer)
-                    if match:
-                        try:
-                            strengths_json = '[' + match.group(1) + ']'
-                            strengths = json.loads(strengths_json)
-                            if len(strengths) > 0:
-                                yield f"data: {json.dumps({'type': 'partial', 'field': 'strengths', 'value': strengths})}\n\n"
-                                strengths_sent = True
-                                await asyncio.sleep(0)
-                        except (json.JSONDecodeError, ValueError):
-                            pass  # Not complete yet, keep buffering
+                for path, value in stream_parser.feed(chunk):
+                    # Extract fit_score (appears early in JSON)
+                    if path == ("fit_score",):
+                        if not fit_score_sent and isinstance(value, (int, float)) and not isinstance(value, bool):
+                            yield f"data: {json.dumps({'type': 'partial', 'field': 'fit_score', 'value': int(value)})}\n\n"
+                            fit_score_sent = True
+
+                    # Extract recommendation
+                    elif path == ("recommendation",):
+                        if not recommendation_sent and isinstance(value, str) and value:
+                            yield f"data: {json.dumps({'type': 'partial', 'field': 'recommendation', 'value': value})}\n\n"
+                            recommendation_sent = True
+
+                    # Strengths: re-send the list so far as each element completes
+                    elif len(path) == 2 and path[0] == "strengths":
+                        strengths.append(value)
+                        yield f"data: {json.dumps({'type': 'partial', 'field': 'strengths', 'value': strengths})}\n\n"
+                        strengths_sent = True
+
+                    # Gaps preview: first two gaps, ready once both are in or the array closes
+                    elif path[:1] == ("gaps",) and not gaps_preview_ready:
+                        if len(path) == 1:
+                            gaps_preview_ready = True
+                        elif len(path) == 2:
+                            if isinstance(value, str):
+                                gaps_preview.append(value)
+                            elif isinstance(value, dict):
+                                gap_text = value.get("description") or value.get("gap") or _humanize_gap_type(value.get("gap_type", "")) or ""
+                                if gap_text:
+                                    gaps_preview.append(gap_text)
+                            gaps_preview_ready = len(gaps_preview) >= 2
+
+                    # Extract expected_applicants from reality_check
+                    elif path == ("reality_check", "expected_applicants"):
+                        # The schema asks for a range string like "300-500+"; send its leading number
+                        if isinstance(value, str):
+                            match = re.match(r'\s*(\d+)', value)
+                            value = int(match.group(1)) if match else None
+                        if not applicants_sent and isinstance(value, (int, float)) and not isinstance(value, bool):
+                            yield f"data: {json.dumps({'type': 'partial', 'field': 'expected_applicants', 'value': int(value)})}\n\n"
+                            applicants_sent = True
 
                 # PHASE 1: Emit mid_insight when we have score + strengths (only if early_insight succeeded)
-                if fit_score_sent and strengths_sent and not applicants_sent and early_insight_success:
-                    # Extract gaps preview if available
-                    gaps_preview = []
-                    gaps_match = re.search(r'"gaps"\s*:\s*\[((?:[^][]|\[[^\]]*\])*)\]', buffer)
-                    if gaps_match:
-                        try:
-                            raw_gaps = json.loads('[' + gaps_match.group(1) + ']')
-                            for g in raw_gaps[:2]:
-                                if isinstance(g, str):
-                                    gaps_preview.append(g)
-                                elif isinstance(g, dict):
-                                    gap_text = g.get("description") or g.get("gap") or _humanize_gap_type(g.get("gap_type", "")) or ""
-                                    if gap_text:
-                                        gaps_preview.append(gap_text)
-                        except (json.JSONDecodeError, ValueError):
-                            pass
-                    if gaps_preview:
-                        yield f"data: {json.dumps({'type': 'mid_insight', 'data': {'gaps_preview': gaps_preview}})}\n\n"
-                        await asyncio.sleep(0)
-
-                # Extract expected_applicants from reality_check
-                if not applicants_sent and '"expected_applicants"' in buffer:
-                    match = re.search(r'"expected_applicants"\s*:\s*(\d+)', buffer)
-                    if match:
-                        expected_applicants = int(match.group(1))
-                        yield f"data: {json.dumps({'type': 'partial', 'field': 'expected_applicants', 'value': expected_applicants})}\n\n"
-                        applicants_sent = True
-                        await asyncio.sleep(0)
+                if (not mid_insight_sent and gaps_preview_ready and gaps_preview and fit_score_sent
+                        and strengths_sent and not applicants_sent and early_insight_success):
+                    yield f"data: {json.dumps({'type': 'mid_insight', 'data': {'gaps_preview': gaps_preview}})}\n\n"
+                    mid_insight_sent = True
 
             # Clean and parse the complete response
             response = buffer
@@ -17557,7 +17150,7 @@ Return valid JSON only:
 }}"""
 
         try:
-            supporting_response = call_claude(
+            supporting_response = await call_claude_async(
                 "You are a career strategist generating high-impact application materials. Write like a peer, not an applicant. Be concise, direct, and confident. No cover-letter formality. No exclamation points in outreach.",
                 cover_letter_prompt,
                 max_tokens=3000
@@ -17914,7 +17507,7 @@ Generate the complete JSON response with ALL required fields populated."""
     
     # Call Claude with longer token limit for comprehensive response
     # Using Opus 4.6 for highest quality document generation
-    response = call_claude(system_prompt, user_message, max_tokens=8000, model="claude-opus-4-6")
+    response = await call_claude_async(system_prompt, user_message, max_tokens=8000, model="claude-opus-4-6")
     
     # DEBUG: Print raw Claude response to console
     print("\n" + "="*60)
@@ -18270,7 +17863,7 @@ Generate the complete JSON response with ALL required fields populated."""
                         amplified_results = await run_amplification(
                             weak_bullets=weak_bullets,
                             level=level_category,
-                            call_claude_fn=call_claude,
+                            call_claude_fn=call_claude_async,
                             target_role=target_role
                         )
 
@@ -18895,7 +18488,7 @@ async def regenerate_bullet(request: StrengthenRegenerateRequest) -> Dict[str, A
             role_context=issue.role_context,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             system_prompt="You are a resume writing expert. Only use information explicitly provided.",
             user_message=prompt,
             max_tokens=500,
@@ -19121,7 +18714,7 @@ Company Size: {resume_context.get('company_size', 'Unknown')}
             resume_context=formatted_context
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             prompt,
             "Generate clarifying questions for the flagged resume bullets."
         )
@@ -19263,7 +18856,7 @@ Function: {resume_data.get('detected_function', 'Unknown')}
             resume_context=formatted_context
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             prompt,
             "Apply enhancements to the bullets based on the candidate's answers."
         )
@@ -19371,7 +18964,7 @@ Seniority: {seniority}
 This profile will be used when no real job description is available, so it should reflect
 typical expectations for this type of role at companies like this."""
 
-    response = call_claude(
+    response = await call_claude_async(
         system_prompt.format(
             role_title=request.role_title,
             company_name=request.company_name,
@@ -19734,10 +19327,10 @@ async def analyze_rejection_email(request: RejectionAnalysisRequest):
 
     import re
 
-    def _call_claude_safe():
-        """Wrap call_claude to catch HTTPException so the fallback can run."""
+    async def _call_claude_safe():
+        """Wrap call_claude_async to catch HTTPException so the fallback can run."""
         try:
-            return call_claude(
+            return await call_claude_async(
                 system_prompt="You are an expert career coach analyzing rejection emails. Return only valid JSON.",
                 user_message=prompt,
                 max_tokens=2000,
@@ -19748,7 +19341,7 @@ async def analyze_rejection_email(request: RejectionAnalysisRequest):
             raise RuntimeError(f"Claude API error: {he}") from he
 
     try:
-        response = await asyncio.to_thread(_call_claude_safe)
+        response = await _call_claude_safe()
 
         # Parse JSON response
         json_match = re.search(r'\{[\s\S]*\}', response)
@@ -19850,8 +19443,9 @@ async def discover_jobs(request: JobDiscoverRequest):
     6. Cross-reference with network companies (LinkedIn + prior employers)
     7. Return scored, sorted results (cached 12 hours)
     """
-    from backend.services.job_discovery import job_discovery_service
-    from backend.services.job_scorer import score_and_rank_jobs
+    from services.job_discovery import job_discovery_service
+    from services.job_scorer import score_and_rank_jobs
+    from services.linkedin_network import CompanyNetworkIndex
 
     try:
         # Start with request params as fallback (from frontend resume parsing)
@@ -19861,6 +19455,7 @@ async def discover_jobs(request: JobDiscoverRequest):
         remote_only = request.remote_only or False
         excluded_companies = None
         network_companies = []
+        network_index = None
         network_enabled = False
         function_area = None
         target_industry = None
@@ -19877,7 +19472,7 @@ async def discover_jobs(request: JobDiscoverRequest):
                 profile_result = supabase_client.table('candidate_profiles') \
                     .select('function_area, city, state, country, work_arrangement, '
                             'job_search_keywords, excluded_companies, '
-                            'linkedin_network_companies, target_industry_primary, '
+                            'linkedin_network_companies, linkedin_network_index, target_industry_primary, '
                             'target_roles, employment_type_preferences, '
                             'seniority_preference, years_experience, current_level_id, '
                             'comp_min, comp_stretch') \
@@ -19891,7 +19486,7 @@ async def discover_jobs(request: JobDiscoverRequest):
                 if profile.get('target_roles') and len(profile['target_roles']) > 0:
                     target_roles = profile['target_roles']
                 elif profile.get('function_area'):
-                    from backend.services.job_discovery import FUNCTION_AREA_MAP
+                    from services.job_discovery import FUNCTION_AREA_MAP
                     mapped = FUNCTION_AREA_MAP.get(profile['function_area'], profile['function_area'])
                     target_roles = [mapped]
 
@@ -19930,6 +19525,8 @@ async def discover_jobs(request: JobDiscoverRequest):
                         if company_name:
                             network_companies.append(company_name)
                     network_enabled = True
+                    # Index built at upload time (connection counts, normalized names)
+                    network_index = CompanyNetworkIndex.from_dict(profile.get('linkedin_network_index'))
 
                 # If still no target_roles, try the default resume as fallback
                 if not target_roles:
@@ -20020,11 +19617,29 @@ async def discover_jobs(request: JobDiscoverRequest):
 
         logger.info(f"Job discovery: {len(query_params_list)} queries | target_roles={target_roles} | seniority={seniority_preference} | industry={target_industry} | location={location}")
 
+        # Fetch Indeed results as supplementary source, concurrently with JSearch
+        async def fetch_indeed_jobs():
+            try:
+                from services.indeed_discovery import indeed_discovery_service
+                primary_role = target_roles[0] if target_roles else (function_area or "jobs")
+                indeed_results = await indeed_discovery_service.search_jobs(
+                    query=primary_role,
+                    location=location or "",
+                    country_code="US",
+                )
+                return indeed_results.get("jobs", [])
+            except Exception as e:
+                logger.debug(f"Indeed integration skipped: {e}")
+                return []
+
         # Execute JSearch multi-query search with merge and dedup
-        results = job_discovery_service.search_multi_query(
-            query_params_list,
-            excluded_companies=excluded_companies,
-            max_results=20,
+        results, indeed_jobs = await asyncio.gather(
+            job_discovery_service.search_multi_query(
+                query_params_list,
+                excluded_companies=excluded_companies,
+                max_results=20,
+            ),
+            fetch_indeed_jobs(),
         )
 
         if results.get("error"):
@@ -20038,17 +19653,10 @@ async def discover_jobs(request: JobDiscoverRequest):
                 error=results["error"],
             )
 
-        # Fetch Indeed results as supplementary source
+        # Merge in Indeed results
         jobs_data = results.get("jobs", [])
         try:
-            from backend.services.indeed_discovery import indeed_discovery_service, merge_and_deduplicate
-            primary_role = target_roles[0] if target_roles else (function_area or "jobs")
-            indeed_results = indeed_discovery_service.search_jobs(
-                query=primary_role,
-                location=location or "",
-                country_code="US",
-            )
-            indeed_jobs = indeed_results.get("jobs", [])
+            from services.indeed_discovery import merge_and_deduplicate
 
             # Filter excluded companies from Indeed results
             if excluded_companies and indeed_jobs:
@@ -20081,7 +19689,14 @@ async def discover_jobs(request: JobDiscoverRequest):
 
         # Apply network matching (LinkedIn + prior employers)
         if network_companies:
-            jobs_data = job_discovery_service.flag_network_companies(jobs_data, network_companies)
+            if network_index is None:
+                network_index = CompanyNetworkIndex.from_companies(network_companies)
+            else:
+                # Prior employers aren't in the uploaded LinkedIn index
+                for company_name in network_companies:
+                    if not network_index.match(company_name):
+                        network_index.add(company_name)
+            jobs_data = job_discovery_service.flag_network_companies(jobs_data, network_index)
 
         # Strip extra fields not in DiscoveredJob model (e.g., job_highlights, job_required_skills)
         model_fields = set(DiscoveredJob.model_fields.keys())
@@ -20120,7 +19735,7 @@ async def persist_linkedin_connections(user_id: str = None, connections_data: Di
     The CSV parsing itself happens client-side (via PapaParse on outreach.html).
     This endpoint stores the extracted company data in Supabase.
     """
-    from backend.services.linkedin_network import linkedin_network_parser
+    from services.linkedin_network import linkedin_network_parser
 
     try:
         if not user_id:
@@ -20136,14 +19751,12 @@ async def persist_linkedin_connections(user_id: str = None, connections_data: Di
         connections = connections_data.get('connections', [])
         companies = linkedin_network_parser.extract_companies(connections)
         company_names = linkedin_network_parser.get_company_names(connections)
+        # Normalized company index over every connection, serialized once here
+        # so job discovery doesn't rebuild it per request
+        network_index = linkedin_network_parser.build_company_index(connections)
 
         # Persist to candidate_profiles
-        import datetime
-        supabase_client.table('candidate_profiles').update({
-            'linkedin_network_companies': companies[:200],  # Top 200 companies
-            'linkedin_connections_count': len(connections),
-            'linkedin_connections_uploaded_at': datetime.datetime.utcnow().isoformat(),
-        }).eq('id', user_id).execute()
+        _save_linkedin_network(user_id, companies, network_index, len(connections))
 
         return LinkedInConnectionsUploadResponse(
             connections_parsed=len(connections),
@@ -20162,6 +19775,86 @@ async def persist_linkedin_connections(user_id: str = None, connections_data: Di
         )
 
 
+def _save_linkedin_network(user_id: str, companies: List[Dict[str, Any]], network_index, connections_count: int):
+    """Write LinkedIn network summary + company index to candidate_profiles."""
+    import datetime
+    supabase_client.table('candidate_profiles').update({
+        'linkedin_network_companies': companies[:200],  # Top 200 companies
+        'linkedin_network_index': network_index.to_dict(),
+        'linkedin_connections_count': connections_count,
+        'linkedin_connections_uploaded_at': datetime.datetime.utcnow().isoformat(),
+    }).eq('id', user_id).execute()
+
+
+# Pending background profile writes for streamed uploads (strong refs)
+_linkedin_network_write_tasks: set = set()
+
+LINKEDIN_CSV_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+
+
+async def _save_linkedin_network_async(user_id: str, companies, network_index, connections_count: int):
+    try:
+        await asyncio.to_thread(_save_linkedin_network, user_id, companies, network_index, connections_count)
+        logger.info(f"Saved LinkedIn network for {user_id}: {connections_count} connections")
+    except Exception as e:
+        logger.error(f"LinkedIn network save failed for {user_id}: {e}")
+
+
+@app.post("/api/linkedin/connections/upload", response_model=LinkedInConnectionsUploadResponse)
+async def upload_linkedin_connections(
+    file: UploadFile = File(...),
+    user_id: str = Form(...),
+):
+    """
+    Upload a LinkedIn connections CSV export and save its company network.
+
+    Server-side alternative to client-side parsing + /api/linkedin/connections/persist
+    for large exports: the file is read in chunks and parsed incrementally, with
+    company counts and the company index aggregated as rows arrive, so memory
+    stays flat. The profile write happens in the background after responding.
+    """
+    from services.linkedin_network import linkedin_network_parser
+
+    try:
+        filename = (file.filename or "").lower()
+        if not filename.endswith('.csv'):
+            raise HTTPException(status_code=400, detail="Please upload the Connections.csv file from your LinkedIn data export.")
+
+        if not supabase_client:
+            raise HTTPException(status_code=503, detail="Database not configured")
+
+        try:
+            network = await linkedin_network_parser.ingest_upload(file, max_bytes=LINKEDIN_CSV_MAX_BYTES)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if not network.connections:
+            raise HTTPException(status_code=400, detail="No connections with a company found in this CSV.")
+
+        companies = network.companies()
+        write_task = asyncio.create_task(
+            _save_linkedin_network_async(user_id, companies, network.index, network.connections)
+        )
+        _linkedin_network_write_tasks.add(write_task)
+        write_task.add_done_callback(_linkedin_network_write_tasks.discard)
+
+        return LinkedInConnectionsUploadResponse(
+            connections_parsed=network.connections,
+            unique_companies=len(companies),
+            top_companies=companies[:20],
+            message=f"Saving {len(companies)} companies from {network.connections} connections to your profile. Job recommendations will now highlight companies in your network.",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"LinkedIn connections upload error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to process LinkedIn connections CSV."
+        )
+
+
 # ============================================================================
 # MVP+1 FEATURE ENDPOINTS
 # ============================================================================
@@ -20226,7 +19919,7 @@ Applications to analyze:
 Create a prioritized task list focusing on the highest-leverage activities."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=3000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=3000)
     
     # Parse JSON response
     try:
@@ -20333,7 +20026,7 @@ OUTCOMES:
 Provide strategic insights and recommendations to improve results."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=3000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=3000)
     
     # Parse JSON response
     try:
@@ -20420,7 +20113,7 @@ Network Contacts:
 Recommend the best contacts to reach out to and provide personalized outreach stubs."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=3000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=3000)
     
     # Parse JSON response
     try:
@@ -20529,7 +20222,7 @@ Interview Transcript:
     user_message += "\n\nExtract and classify all interview questions."
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=3000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=3000)
     
     # Parse JSON response
     try:
@@ -20649,7 +20342,7 @@ Interview Transcript:
 Provide comprehensive performance feedback focusing on what was actually said."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=4096)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=4096)
     
     # Parse JSON response
     try:
@@ -20756,7 +20449,7 @@ Interview Transcript:
     user_message += "\n\nGenerate a professional thank-you email that references actual conversation topics."
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=2000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=2000)
     
     # Parse JSON response
     try:
@@ -21000,7 +20693,7 @@ FIT ANALYSIS:
 Generate the interview prep now."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=4000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=4000)
 
     # Parse JSON response
     try:
@@ -21074,7 +20767,7 @@ JOB DESCRIPTION:
 Generate the intro sell template now."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=2000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=2000)
 
     # Parse JSON response
     try:
@@ -21214,7 +20907,7 @@ JOB DESCRIPTION (for reference):
 Analyze the intro sell attempt now."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=2000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=2000)
 
     # Parse JSON response
     try:
@@ -21350,7 +21043,7 @@ JOB DESCRIPTION:
 Analyze this interview and generate the debrief."""
 
     # Call Claude
-    response = call_claude(system_prompt, user_message, max_tokens=4000)
+    response = await call_claude_async(system_prompt, user_message, max_tokens=4000)
 
     # Parse JSON response
     try:
@@ -21522,7 +21215,7 @@ async def debrief_chat(request: DebriefChatRequest):
             })
 
     try:
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             system=system_prompt,
@@ -21688,7 +21381,7 @@ async def submit_mock_response(request: SubmitMockResponseRequest):
 
     # Call Claude to analyze cumulative response
     try:
-        response = call_claude(
+        response = await call_claude_async(
             "You are analyzing a candidate's COMPLETE interview response including all follow-ups. Score based on CUMULATIVE quality. Return only valid JSON.",
             prompt,
             max_tokens=2000
@@ -21781,22 +21474,22 @@ async def get_mock_question_feedback(question_id: str):
     print(f"📊 Getting feedback for question {question_id}")
 
     # Verify question exists
-    question = mock_interview_questions.get(question_id)
+    question = get_mock_question(question_id)
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Get session
-    session = mock_interview_sessions.get(question["session_id"])
+    session = get_mock_session(question["session_id"])
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Get all responses
-    responses = mock_interview_responses.get(question_id, [])
+    responses = get_mock_responses(question_id)
     all_responses = [r["response_text"] for r in responses]
-    all_responses_text = format_responses_for_analysis(question_id)
+    all_responses_text = format_responses_for_analysis(question_id, responses)
 
     # Get existing analysis
-    analysis = mock_interview_analyses.get(question_id, {})
+    analysis = get_mock_analysis(question_id) or {}
 
     # Format resume for prompt
     resume_text = format_resume_for_prompt(session["resume_json"])
@@ -21816,7 +21509,7 @@ async def get_mock_question_feedback(question_id: str):
 
     # Call Claude for comprehensive feedback
     try:
-        response = call_claude(
+        response = await call_claude_async(
             "You are providing coaching feedback on interview responses. Return only valid JSON.",
             prompt,
             max_tokens=2000
@@ -21879,10 +21572,11 @@ async def get_next_mock_question(request: NextQuestionRequest):
     # Get competency for next question
     competency = get_competency_for_stage(session["interview_stage"], next_question_number)
 
-    # Get list of already asked questions
+    # Get list of already asked questions (one batched read for the whole session)
+    snapshot = await get_mock_session_snapshot_async(request.session_id, session)
     asked_questions = []
-    for qid in session.get("question_ids", []):
-        q = get_mock_question(qid)
+    for qid in snapshot.question_ids:
+        q = snapshot.question(qid)
         if q:
             asked_questions.append(q["question_text"])
 
@@ -21910,7 +21604,7 @@ async def get_next_mock_question(request: NextQuestionRequest):
 
     # Call Claude to generate question
     try:
-        response = call_claude(
+        response = await call_claude_async(
             "You are generating interview questions for a mock interview practice session. Return only valid JSON.",
             prompt,
             max_tokens=1000
@@ -21945,8 +21639,8 @@ async def get_next_mock_question(request: NextQuestionRequest):
         "current_question_number": next_question_number
     })
 
-    # Calculate average score
-    average_score = calculate_mock_session_average(request.session_id)
+    # Calculate average score (the new question has no analysis yet)
+    average_score = calculate_mock_session_average(request.session_id, snapshot)
 
     print(f"✅ Next question generated: {question_id}")
 
@@ -21982,8 +21676,9 @@ async def end_mock_interview(request: EndMockInterviewRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Mock interview session not found")
 
-    # Calculate overall score
-    average_score = calculate_mock_session_average(request.session_id)
+    # Load questions and analyses in one batched read, then score from it
+    snapshot = await get_mock_session_snapshot_async(request.session_id, session)
+    average_score = snapshot.average_score()
 
     # Detect role type for this session
     role_type = detect_role_type(session.get("job_description", ""), session.get("role_title", ""))
@@ -22004,9 +21699,9 @@ async def end_mock_interview(request: EndMockInterviewRequest):
     all_signal_gaps = []
     level_counts = {"mid": 0, "senior": 0, "director": 0, "executive": 0}
 
-    for qid in session.get("question_ids", []):
-        question = get_mock_question(qid)
-        analysis = get_mock_analysis(qid) or {}
+    for qid in snapshot.question_ids:
+        question = snapshot.question(qid)
+        analysis = snapshot.analysis(qid) or {}
 
         if question:
             score = analysis.get("score", 5)
@@ -22087,7 +21782,7 @@ async def end_mock_interview(request: EndMockInterviewRequest):
 
     # Call Claude for session feedback
     try:
-        response = call_claude(
+        response = await call_claude_async(
             "You are providing comprehensive session feedback for a mock interview. Return only valid JSON.",
             prompt,
             max_tokens=2000
@@ -22107,6 +21802,9 @@ async def end_mock_interview(request: EndMockInterviewRequest):
     session["signal_gaps"] = session_gaps
     session["level_estimate"] = feedback_data.get("level_estimate", predominant_level)
 
+    # Make sure every write from this session has reached Supabase
+    await asyncio.to_thread(flush_mock_session, request.session_id)
+
     print(f"✅ Mock interview session ended: {request.session_id}")
     print(f"   Signal strengths: {session_strengths}")
     print(f"   Signal gaps: {session_gaps}")
@@ -22271,43 +21969,30 @@ async def download_package(request: PackageDownloadRequest):
     Generate and download a ZIP file containing DOCX resume and cover letter
     """
     import io
-    import zipfile
     from fastapi.responses import StreamingResponse
     
     try:
         print(f"📦 Generating download package for: {request.candidate_name}")
         
-        # Create DOCX files
-        resume_docx = create_docx_from_text(request.resume_text, f"{request.candidate_name} - Resume")
-        cover_letter_docx = create_docx_from_text(request.cover_letter_text, f"{request.candidate_name} - Cover Letter")
-        
-        # Create ZIP file in memory
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Add resume
-            resume_buffer = io.BytesIO()
-            resume_docx.save(resume_buffer)
-            resume_buffer.seek(0)
-            zip_file.writestr(f"{request.candidate_name.replace(' ', '_')}_Resume.docx", resume_buffer.getvalue())
-            
-            # Add cover letter
-            cl_buffer = io.BytesIO()
-            cover_letter_docx.save(cl_buffer)
-            cl_buffer.seek(0)
-            zip_file.writestr(f"{request.candidate_name.replace(' ', '_')}_Cover_Letter.docx", cl_buffer.getvalue())
-        
-        zip_buffer.seek(0)
+        # Build both DOCX files and the ZIP in a render worker
+        file_prefix = request.candidate_name.replace(' ', '_')
+        zip_bytes = await run_render_job("package_zip", render_text_docx_zip, [
+            (f"{file_prefix}_Resume.docx", request.resume_text, f"{request.candidate_name} - Resume"),
+            (f"{file_prefix}_Cover_Letter.docx", request.cover_letter_text, f"{request.candidate_name} - Cover Letter"),
+        ])
         
         print(f"✅ Package generated successfully")
         
         return StreamingResponse(
-            zip_buffer,
+            io.BytesIO(zip_bytes),
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename={request.candidate_name.replace(' ', '_')}_Application_Package.zip"
+                "Content-Disposition": f"attachment; filename={file_prefix}_Application_Package.zip"
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"🔥 DOWNLOAD ERROR: {e}")
         import traceback
@@ -22315,82 +22000,19 @@ async def download_package(request: PackageDownloadRequest):
         raise HTTPException(status_code=500, detail=f"Failed to generate download: {str(e)}")
 
 
-def create_docx_from_text(text: str, title: str):
+async def run_render_job(kind: str, fn, *args):
     """
-    Create an ATS-safe DOCX document from plain text.
-    
-    CRITICAL RULES:
-    - Text-only, no templates, no restructuring
-    - Exact line-by-line reproduction of preview text
-    - No heading styles, no list styles, no formatting magic
-    - ATS-safe: Calibri font, no tables, no textboxes, no images
-    - Bullets (•) treated as plain text characters, NOT Word lists
-    """
-    from docx import Document
-    from docx.shared import Pt, Inches
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-    
-    doc = Document()
-    
-    # Set ATS-safe margins (0.75 inches all around)
-    for section in doc.sections:
-        section.top_margin = Inches(0.75)
-        section.bottom_margin = Inches(0.75)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
-    
-    # Process text line by line - EXACT reproduction
-    lines = text.split('\n')
-    
-    for line in lines:
-        # Preserve the line exactly (don't strip - preserve intentional spacing)
-        # But do strip for empty line detection
-        stripped = line.strip()
-        
-        if not stripped:
-            # Empty line - add blank paragraph for spacing
-            p = doc.add_paragraph()
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
-            p.paragraph_format.line_spacing = 1.0
-            continue
-        
-        # Add paragraph with the exact line content
-        p = doc.add_paragraph()
-        
-        # CRITICAL: Use 'Normal' style only - no Heading, no ListParagraph
-        p.style = doc.styles['Normal']
-        
-        # Reset all paragraph formatting
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(0)
-        p.paragraph_format.line_spacing = 1.0
-        p.paragraph_format.left_indent = Pt(0)
-        p.paragraph_format.right_indent = Pt(0)
-        p.paragraph_format.first_line_indent = Pt(0)
-        
-        # Add the text as a single run
-        run = p.add_run(stripped)
-        
-        # ATS-safe font settings - consistent for ALL text
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
-        run.bold = False
-        run.italic = False
-        run.underline = False
-        
-        # Ensure Calibri is set for complex scripts too
-        r = run._element
-        rPr = r.get_or_add_rPr()
-        rFonts = OxmlElement('w:rFonts')
-        rFonts.set(qn('w:ascii'), 'Calibri')
-        rFonts.set(qn('w:hAnsi'), 'Calibri')
-        rFonts.set(qn('w:cs'), 'Calibri')
-        rFonts.set(qn('w:eastAsia'), 'Calibri')
-        rPr.insert(0, rFonts)
-    
-    return doc
+    Run a CPU-heavy render/parse job in the render pool (see render_jobs.py).
+
+    Maps pool back-pressure to HTTP errors: a full queue is 503 (retryable),
+    a job that overran its time budget is 504.
+    """
+    try:
+        return await render_pool.run(kind, fn, *args)
+    except RenderPoolBusy:
+        raise HTTPException(status_code=503, detail="Document service is busy. Please try again in a moment.")
+    except RenderTimeout:
+        raise HTTPException(status_code=504, detail="Document generation timed out. Please try again.")
 
 
 # ============================================================================
@@ -22447,8 +22069,6 @@ async def generate_resume_pdf(request: PDFGenerationRequest):
     This ensures WYSIWYG: what the candidate sees in the preview is what they download.
     """
     try:
-        import weasyprint
-
         # WYSIWYG: The frontend sends the exact preview HTML with all styles.
         # We pass it directly to WeasyPrint. No rebuilding, no templating.
         html_content = request.html
@@ -22458,8 +22078,8 @@ async def generate_resume_pdf(request: PDFGenerationRequest):
         html_content = html_content.replace('\ufffd', '-')  # replacement character
         html_content = html_content.replace('\u00ad', '-')  # soft hyphen
 
-        # Generate PDF from the exact preview HTML
-        pdf_doc = weasyprint.HTML(string=html_content).write_pdf()
+        # Generate PDF from the exact preview HTML (in a render worker)
+        pdf_doc = await run_render_job("resume_pdf", render_pdf_from_html, html_content)
 
         return StreamingResponse(
             io.BytesIO(pdf_doc),
@@ -22469,6 +22089,8 @@ async def generate_resume_pdf(request: PDFGenerationRequest):
             }
         )
 
+    except HTTPException:
+        raise
     except ImportError:
         raise HTTPException(
             status_code=501,
@@ -22525,68 +22147,44 @@ async def download_canonical(request: CanonicalDownloadRequest):
             # Generate resume DOCX from canonical
             resume = canonical_doc.resume
 
-            formatter = ResumeFormatter()
-
-            # Add header from canonical contact
-            formatter.add_header(
-                name=resume.contact.name,
-                tagline=resume.tagline,
-                contact_info={
+            # Render spec from canonical content (rendered in a render worker)
+            spec = {
+                "name": resume.contact.name,
+                "tagline": resume.tagline,
+                "contact_info": {
                     "phone": resume.contact.phone,
                     "email": resume.contact.email,
                     "linkedin": resume.contact.linkedin,
                     "location": resume.contact.location,
-                }
-            )
-
-            # Add summary
-            if resume.summary:
-                formatter.add_section_header("Summary")
-                formatter.add_summary(resume.summary)
-
-            # Add core competencies
-            if resume.competencies:
-                formatter.add_section_header("Core Competencies")
-                formatter.add_core_competencies(resume.competencies)
-
-            # Add experience
-            if resume.experience:
-                formatter.add_section_header("Experience")
-                for exp in resume.experience:
-                    formatter.add_experience_entry(
-                        company=exp.company,
-                        title=exp.title,
-                        location=exp.location,
-                        dates=exp.dates,
-                        overview=exp.overview,
-                        bullets=exp.bullets,
-                    )
-
-            # Add skills
-            if resume.skills:
-                formatter.add_section_header("Skills")
-                formatter.add_skills(resume.skills)
-
-            # Add education
-            if resume.education.school or resume.education.degree:
-                formatter.add_section_header("Education")
-                formatter.add_education(
-                    school=resume.education.school,
-                    degree=resume.education.degree,
-                    details=resume.education.details,
-                )
-
-            # Save to buffer
-            buffer = io.BytesIO()
-            formatter.get_document().save(buffer)
-            buffer.seek(0)
+                },
+                "summary": resume.summary,
+                "competencies": resume.competencies,
+                "experience": [
+                    {
+                        "company": exp.company,
+                        "title": exp.title,
+                        "location": exp.location,
+                        "dates": exp.dates,
+                        "overview": exp.overview,
+                        "bullets": exp.bullets,
+                    }
+                    for exp in resume.experience
+                ],
+                "skills": resume.skills,
+                "education": {
+                    "school": resume.education.school,
+                    "degree": resume.education.degree,
+                    "details": resume.education.details,
+                } if (resume.education.school or resume.education.degree) else None,
+            }
+            docx_bytes = await run_render_job("resume_docx", render_resume_docx, spec)
 
             filename = f"{resume.contact.name.replace(' ', '_')}_Resume.docx"
 
             print(f"✅ Canonical resume downloaded: {resume.contact.name}, hash={canonical_doc.metadata.content_hash}")
 
             return StreamingResponse(
-                buffer,
+                io.BytesIO(docx_bytes),
                 media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 headers={
                     "Content-Disposition": f"attachment; filename={filename}",
@@ -22598,50 +22196,34 @@ async def download_canonical(request: CanonicalDownloadRequest):
             # Generate cover letter DOCX from canonical
             cover_letter = canonical_doc.cover_letter
 
-            formatter = CoverLetterFormatter()
-
-            # Add header
-            formatter.add_header(
-                name=cover_letter.contact.name,
-                tagline=cover_letter.tagline,
-                contact_info={
-                    "phone": cover_letter.contact.phone,
-                    "email": cover_letter.contact.email,
-                    "linkedin": cover_letter.contact.linkedin,
-                    "location": cover_letter.contact.location,
-                }
-            )
-
-            # Add section label
-            formatter.add_section_label()
-
-            # Add salutation
-            formatter.add_salutation(recipient_name=cover_letter.recipient_name)
-
-            # Add body paragraphs
+            # Body paragraphs
             if cover_letter.paragraphs:
-                for paragraph in cover_letter.paragraphs:
-                    formatter.add_body_paragraph(paragraph)
+                paragraphs = list(cover_letter.paragraphs)
             elif cover_letter.full_text:
                 # Split full_text into paragraphs
                 paragraphs = [p.strip() for p in cover_letter.full_text.split("\n\n") if p.strip()]
-                for paragraph in paragraphs:
-                    formatter.add_body_paragraph(paragraph)
-
-            # Add signature
-            formatter.add_signature(cover_letter.contact.name)
+            else:
+                paragraphs = []
 
-            # Save to buffer
-            buffer = io.BytesIO()
-            formatter.get_document().save(buffer)
-            buffer.seek(0)
+            docx_bytes = await run_render_job("cover_letter_docx", render_cover_letter_docx, {
+                "name": cover_letter.contact.name,
+                "tagline": cover_letter.tagline,
+                "contact_info": {
+                    "phone": cover_letter.contact.phone,
+                    "email": cover_letter.contact.email,
+                    "linkedin": cover_letter.contact.linkedin,
+                    "location": cover_letter.contact.location,
+                },
+                "recipient_name": cover_letter.recipient_name,
+                "paragraphs": paragraphs,
+            })
 
             filename = f"{cover_letter.contact.name.replace(' ', '_')}_Cover_Letter.docx"
 
             print(f"✅ Canonical cover letter downloaded: {cover_letter.contact.name}")
 
             return StreamingResponse(
-                buffer,
+                io.BytesIO(docx_bytes),
                 media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 headers={
                     "Content-Disposition": f"attachment; filename={filename}",
@@ -22672,68 +22254,30 @@ async def download_resume(request: ResumeDownloadRequest):
     try:
         print(f"📄 Generating formatted resume for: {request.candidate_name}")
 
-        # Initialize formatter
-        formatter = ResumeFormatter()
-
-        # Add header
-        formatter.add_header(
-            name=request.candidate_name,
-            tagline=request.tagline,
-            contact_info=request.contact
-        )
-
-        # Add summary if provided
-        if request.summary:
-            formatter.add_section_header("Summary")
-            formatter.add_summary(request.summary)
-
-        # Add core competencies if provided
-        if request.competencies:
-            formatter.add_section_header("Core Competencies")
-            formatter.add_core_competencies(request.competencies)
-
-        # Add experience if provided
-        if request.experience:
-            formatter.add_section_header("Experience")
-            for job in request.experience:
-                formatter.add_experience_entry(
-                    company=job.get('company', ''),
-                    title=job.get('title', ''),
-                    location=job.get('location', ''),
-                    dates=job.get('dates', ''),
-                    overview=job.get('overview'),
-                    bullets=job.get('bullets', [])
-                )
-
-        # Add skills if provided
-        if request.skills:
-            formatter.add_section_header("Skills")
-            formatter.add_skills(request.skills)
-
-        # Add education if provided
-        if request.education and request.education.get('school'):
-            formatter.add_section_header("Education")
-            formatter.add_education(
-                school=request.education.get('school', ''),
-                degree=request.education.get('degree', ''),
-                details=request.education.get('details')
-            )
-
-        # Save to buffer
-        buffer = io.BytesIO()
-        formatter.get_document().save(buffer)
-        buffer.seek(0)
+        docx_bytes = await run_render_job("resume_docx", render_resume_docx, {
+            "name": request.candidate_name,
+            "tagline": request.tagline,
+            "contact_info": request.contact,
+            "summary": request.summary,
+            "competencies": request.competencies,
+            "experience": request.experience,
+            "skills": request.skills,
+            # Education only if a school is provided
+            "education": request.education if request.education and request.education.get('school') else None,
+        })
 
         filename = f"{request.candidate_name.replace(' ', '_')}_Resume.docx"
 
         return StreamingResponse(
-            buffer,
+            io.BytesIO(docx_bytes),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"🔥 RESUME DOWNLOAD ERROR: {e}")
         import traceback
@@ -22749,44 +22293,26 @@ async def download_cover_letter(request: CoverLetterDownloadRequest):
     try:
         print(f"📄 Generating formatted cover letter for: {request.candidate_name}")
 
-        # Initialize formatter
-        formatter = CoverLetterFormatter()
-
-        # Add header
-        formatter.add_header(
-            name=request.candidate_name,
-            tagline=request.tagline,
-            contact_info=request.contact
-        )
-
-        # Add section label
-        formatter.add_section_label()
-
-        # Add salutation
-        formatter.add_salutation(recipient_name=request.recipient_name)
-
-        # Add body paragraphs
-        for paragraph in request.paragraphs:
-            formatter.add_body_paragraph(paragraph)
-
-        # Add signature
-        formatter.add_signature(request.candidate_name)
-
-        # Save to buffer
-        buffer = io.BytesIO()
-        formatter.get_document().save(buffer)
-        buffer.seek(0)
+        docx_bytes = await run_render_job("cover_letter_docx", render_cover_letter_docx, {
+            "name": request.candidate_name,
+            "tagline": request.tagline,
+            "contact_info": request.contact,
+            "recipient_name": request.recipient_name,
+            "paragraphs": request.paragraphs,
+        })
 
         filename = f"{request.candidate_name.replace(' ', '_')}_Cover_Letter.docx"
 
         return StreamingResponse(
-            buffer,
+            io.BytesIO(docx_bytes),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"🔥 COVER LETTER DOWNLOAD ERROR: {e}")
         import traceback
@@ -22855,7 +22381,7 @@ Gaps: {', '.join(request.jd_analysis.get('gaps', [])[:3])}
 
         # Call Claude
         user_message = f"Generate strategic responses for these screening questions:\n\n{request.screening_questions}"
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message)
 
         # Parse the response
         cleaned = clean_claude_json(response)
@@ -23017,7 +22543,7 @@ Analyze gaps between candidate's current level and the target role requirements.
 
         user_message = "Analyze this resume and provide the leveling assessment."
 
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message, cache_site="resume_level")
 
         # Parse the response
         cleaned = clean_claude_json(response)
@@ -23297,7 +22823,7 @@ Experience:
 
         # Call Claude
         user_message = f"Generate clarifying questions for these gaps:\n\n{gaps_text}"
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message)
 
         # Parse the response
         cleaned = clean_claude_json(response)
@@ -23384,7 +22910,7 @@ Original resume JSON to update:
 Supplemented experience:
 {supplements_text}"""
 
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message)
 
         # Parse the response
         cleaned = clean_claude_json(response)
@@ -23427,7 +22953,6 @@ async def download_documents_legacy(
 ):
     """Legacy download endpoint using form data"""
     import io
-    import zipfile
     from fastapi.responses import StreamingResponse
     
     try:
@@ -23440,33 +22965,23 @@ async def download_documents_legacy(
         resume_text = resume_json.get('full_text', '')
         cover_letter_text = cover_letter_json.get('full_text', '')
         
-        # Create DOCX files
-        resume_docx = create_docx_from_text(resume_text, f"{candidate_name} - Resume")
-        cover_letter_docx = create_docx_from_text(cover_letter_text, f"{candidate_name} - Cover Letter")
-        
-        # Create ZIP file
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            resume_buffer = io.BytesIO()
-            resume_docx.save(resume_buffer)
-            resume_buffer.seek(0)
-            zip_file.writestr(f"{candidate_name.replace(' ', '_')}_Resume.docx", resume_buffer.getvalue())
-            
-            cl_buffer = io.BytesIO()
-            cover_letter_docx.save(cl_buffer)
-            cl_buffer.seek(0)
-            zip_file.writestr(f"{candidate_name.replace(' ', '_')}_Cover_Letter.docx", cl_buffer.getvalue())
-        
-        zip_buffer.seek(0)
+        # Build both DOCX files and the ZIP in a render worker
+        file_prefix = candidate_name.replace(' ', '_')
+        zip_bytes = await run_render_job("package_zip", render_text_docx_zip, [
+            (f"{file_prefix}_Resume.docx", resume_text, f"{candidate_name} - Resume"),
+            (f"{file_prefix}_Cover_Letter.docx", cover_letter_text, f"{candidate_name} - Cover Letter"),
+        ])
         
         return StreamingResponse(
-            zip_buffer,
+            io.BytesIO(zip_bytes),
             media_type="application/zip",
             headers={
-                "Content-Disposition": f"attachment; filename={candidate_name.replace(' ', '_')}_Application_Package.zip"
+                "Content-Disposition": f"attachment; filename={file_prefix}_Application_Package.zip"
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"🔥 LEGACY DOWNLOAD ERROR: {e}")
         import traceback
@@ -23564,7 +23079,7 @@ Return valid JSON matching this structure:
     {"'strategy_scenarios': [{'scenario': 'Scenario description', 'approach': 'How to approach it'}, ...]" if request.interview_type in ["hiring_manager", "technical"] else "'strategy_scenarios': null"}
 }}"""
 
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             messages=[{"role": "user", "content": prompt}]
@@ -23683,7 +23198,7 @@ QUALITY CHECK before output:
 
 OUTPUT ONLY THE INTRO SCRIPT. No quotes, no labels, no formatting, no explanations."""
 
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=600,
             messages=[{"role": "user", "content": prompt}]
@@ -23784,7 +23299,7 @@ The rewritten version MUST be a spoken intro (short sentences, natural flow, 120
 Return ONLY valid JSON:
 {{"score": <1-10>, "strengths": ["max 3 items"], "improvements": ["max 3 items"], "rewrittenIntro": "improved intro text"}}"""
 
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
             messages=[{"role": "user", "content": prompt}]
@@ -23867,7 +23382,7 @@ async def generate_evaluation_criteria(request: EvaluationCriteriaRequest):
             story_summaries=story_summaries,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a hiring decision analyst. Predict what interviewers evaluate and map to candidate proof. No coaching language. Be direct.",
             prompt,
             max_tokens=3000,
@@ -23952,7 +23467,7 @@ async def generate_interview_strategy(request: EvaluationCriteriaRequest):
             interview_type=request.interview_type or "hiring_manager",
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a senior recruiter giving a pre-interview briefing. Direct, tactical, no fluff.",
             prompt,
             max_tokens=2000,
@@ -23994,7 +23509,7 @@ async def select_stories_for_interview(request: StorySelectionRequest):
             role_level=request.role_level or "mid-senior",
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a hiring decision system. Select proof, don't coach. Be decisive.",
             prompt,
             max_tokens=2500,
@@ -24056,7 +23571,7 @@ async def simulate_pushback(request: PushbackRequest):
             role_level=request.role_level or "senior",
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a skeptical hiring manager. Push hard. No softballs.",
             prompt,
             max_tokens=2000,
@@ -24095,7 +23610,7 @@ async def calculate_confidence_score(request: ConfidenceScoreRequest):
             performance_history=json.dumps(request.performance_history, indent=2) if request.performance_history else "No interview history.",
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a hiring committee making a go/no-go decision. Be honest, not encouraging.",
             prompt,
             max_tokens=1500,
@@ -24163,7 +23678,7 @@ async def evaluate_delivery(request: DeliveryAnalysisRequest):
             role_level=request.role_level,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a professional speech coach. Evaluate delivery, not content. Be direct.",
             prompt,
             max_tokens=1500,
@@ -24259,7 +23774,7 @@ async def evaluate_intro_delivery(request: IntroDeliveryRequest):
             duration_seconds=duration,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are evaluating a spoken interview intro. Content + delivery. First impression matters most.",
             prompt,
             max_tokens=2000,
@@ -24361,7 +23876,7 @@ async def pushback_voice(request: PushbackVoiceRequest):
             role_level=request.role_level,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a skeptical interviewer evaluating both content and delivery. Be direct.",
             prompt,
             max_tokens=1500,
@@ -24411,7 +23926,7 @@ async def validate_story_delivery(request: StoryDeliveryRequest):
             duration_seconds=duration,
         )
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are evaluating story delivery quality. Not content — delivery. Can they TELL this story?",
             prompt,
             max_tokens=1000,
@@ -24599,7 +24114,7 @@ TONE: Calm, direct, coach-like, senior-to-senior. No hype, no pressure language.
 
 Return ONLY the JSON object, no additional text."""
 
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=3000,
             messages=[{"role": "user", "content": prompt}]
@@ -24639,14 +24154,8 @@ async def extract_linkedin_text(file: UploadFile = File(...)):
         filename = file.filename.lower()
 
         if filename.endswith('.pdf'):
-            # Extract text from PDF using PyMuPDF
-            import fitz  # PyMuPDF
-
-            pdf_doc = fitz.open(stream=content, filetype="pdf")
-            text = ""
-            for page in pdf_doc:
-                text += page.get_text()
-            pdf_doc.close()
+            # Extract text from PDF using PyMuPDF (in a render worker)
+            text = await run_render_job("linkedin_pdf_text", extract_pdf_text_plain, content)
 
             print(f"✅ Extracted {len(text)} chars from PDF")
             return {"text": text, "type": "pdf"}
@@ -24665,7 +24174,7 @@ async def extract_linkedin_text(file: UploadFile = File(...)):
                 media_type = "image/jpeg"
 
             # Use Claude to extract text from image
-            response = call_claude_api(
+            response = await call_claude_api(
                 model="claude-sonnet-4-20250514",
                 max_tokens=4000,
                 messages=[{
@@ -24702,6 +24211,8 @@ Format as plain text, preserving the structure. Be thorough - capture every piec
         else:
             raise HTTPException(status_code=400, detail="Unsupported file type. Please upload PDF or image.")
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"🔥 Text extraction error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to extract text: {str(e)}")
@@ -25317,7 +24828,9 @@ POSITIONING STRATEGY YOU DEVELOPED:
     user_name = body.context.user_name
     # Use empty string instead of "Unknown" to comply with prompt rule: "Never treat 'Unknown' as a name"
     name_note = "" if user_name else "(name not available - use warm generic greetings)"
-    system_prompt = HEY_HENRY_SYSTEM_PROMPT.format(
+    # Static coaching instructions become a cached prefix, user context the suffix
+    system_prompt = format_prompt(
+        HEY_HENRY_SYSTEM_PROMPT,
         user_name=user_name or "",
         name_note=name_note,
         current_page=body.context.current_page,
@@ -25537,7 +25050,7 @@ The user is asking about rejections, but they only have {rejected_count} rejecti
         })
 
     try:
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
             system=system_prompt,
@@ -25679,7 +25192,7 @@ async def resume_chat(request: ResumeChatRequest):
         })
 
     try:
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-3-5-haiku-20241022",
             max_tokens=1000,
             system=system_prompt,
@@ -25755,7 +25268,7 @@ async def generate_resume_from_chat(request: GenerateResumeFromChatRequest):
     )
 
     try:
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=3000,
             messages=[{
@@ -26065,7 +25578,7 @@ Important:
 - Return ONLY valid JSON, no markdown code blocks or extra text"""
 
         # Call Claude Vision API
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
             messages=[
@@ -26153,7 +25666,7 @@ async def extract_debrief_data(request: DebriefExtractionRequest):
         )
 
         # Call Claude for extraction (use haiku for speed/cost)
-        response = call_claude(
+        response = await call_claude_async(
             system_prompt="You are a JSON extraction assistant. Return ONLY valid JSON, no markdown or other text.",
             user_message=prompt,
             max_tokens=2000,
@@ -26778,7 +26291,7 @@ async def generate_stories(request: GenerateStoriesRequest):
         )
 
     try:
-        response = call_claude_api(
+        response = await call_claude_api(
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             temperature=0.7,
@@ -26812,7 +26325,7 @@ async def generate_stories(request: GenerateStoriesRequest):
                 interview_stage=request.interview_stage or "hiring_manager"
             )
 
-            cues_response = call_claude_api(
+            cues_response = await call_claude_api(
                 model="claude-sonnet-4-20250514",
                 max_tokens=500,
                 temperature=0.5,
@@ -27172,7 +26685,7 @@ Be honest. Most stories score 50-75. Only truly exceptional stories hit 85+.
 next_actions: Max 2. Specific. Tied to the weakest dimension. No generic advice.
 Return ONLY valid JSON."""
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a hiring manager scoring proof quality. Be calibrated — most stories are mediocre.",
             prompt,
             max_tokens=500,
@@ -27304,7 +26817,7 @@ INTERVIEW BRIDGE RULES:
 
 Return ONLY valid JSON."""
 
-        response = call_claude(
+        response = await call_claude_async(
             "You are a content strategist converting interview stories into portfolio case studies. Professional, concise, evidence-focused.",
             prompt,
             max_tokens=1500,
@@ -27422,7 +26935,7 @@ SCREENING QUESTIONS TO ANALYZE:
 
 Analyze each question for auto-rejection risk and provide strategic, honest recommendations."""
 
-        response_text = call_claude(system_prompt, user_message, max_tokens=8000)
+        response_text = await call_claude_async(system_prompt, user_message, max_tokens=8000)
 
         # Parse conversational summary and JSON
         conversational_summary = ""
@@ -27562,7 +27075,7 @@ ORIGINAL RESUME DATA (source of truth - cannot fabricate beyond this):
 {conversation_context}
 Refine the document based on the chat command. Return the full updated document with changes_summary."""
 
-        response_text = call_claude(system_prompt, user_message, max_tokens=8000)
+        response_text = await call_claude_async(system_prompt, user_message, max_tokens=8000)
 
         # Clean markdown code blocks if present
         json_text = response_text.strip()
@@ -27820,7 +27333,7 @@ async def upload_linkedin_profile(
             )
 
         # Extract text from PDF
-        text_content = extract_pdf_text(file_bytes)
+        text_content = await run_render_job("parse_pdf", extract_pdf_text, file_bytes)
 
         if not text_content or len(text_content.strip()) < 100:
             raise HTTPException(
@@ -27879,7 +27392,7 @@ Your response must be ONLY valid JSON, no additional text."""
 
         # Call Claude
         print("📤 Sending LinkedIn content to Claude for parsing...")
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message)
         print(f"📥 Received response from Claude: {len(response)} chars")
 
         # Clean and parse JSON response
@@ -28269,7 +27782,7 @@ Remember: Use ONLY information from the resume. Every number and claim must trac
     try:
         # Call Claude
         print("📤 Generating comprehensive LinkedIn optimization...")
-        response = call_claude(system_prompt, user_message)
+        response = await call_claude_async(system_prompt, user_message)
 
         # Clean and parse JSON response
         cleaned = clean_claude_json(response)
@@ -30426,6 +29939,77 @@ async def clear_company_intel_cache_endpoint():
     return {"status": "success", "message": "Company intelligence cache cleared"}
 
 
+@app.get("/api/caches/stats")
+async def get_shared_cache_stats():
+    """Get stats for every shared TTL cache: job discovery, Indeed, company intel (admin endpoint)."""
+    return get_all_cache_stats()
+
+
+@app.get("/api/llm-cache/stats")
+async def get_llm_cache_stats_endpoint():
+    """Get LLM response cache statistics (admin endpoint)."""
+    return get_llm_cache_stats()
+
+
+@app.post("/api/llm-cache/clear")
+async def clear_llm_cache_endpoint():
+    """Clear LLM response cache (admin endpoint)."""
+    clear_llm_cache()
+    return {"status": "success", "message": "LLM response cache cleared"}
+
+
+@app.get("/api/prompt-cache/stats")
+async def get_prompt_cache_stats_endpoint():
+    """Get Anthropic prompt cache usage statistics (admin endpoint)."""
+    return get_prompt_cache_stats()
+
+
+@app.get("/api/render-pool/stats")
+async def get_render_pool_stats_endpoint():
+    """Get document render pool statistics (admin endpoint)."""
+    return get_render_pool_stats()
+
+
+@app.get("/api/validation/log/stats")
+async def get_validation_log_stats_endpoint():
+    """Get QA validation log sink queue depth and drop counts (admin endpoint)."""
+    return get_validation_log_stats()
+
+
+@app.get("/api/mock-interview/store/stats")
+async def get_mock_store_stats_endpoint():
+    """Get mock interview hot tier hit rate and write-behind queue stats (admin endpoint)."""
+    return get_mock_store_stats()
+
+
+@app.get("/api/usage/metering/stats")
+async def get_usage_metering_stats_endpoint():
+    """Get buffered usage counter and flush stats (admin endpoint)."""
+    return get_usage_metering_stats()
+
+
+@app.get("/api/user/tier-cache/stats")
+async def get_profile_cache_stats_endpoint():
+    """Get cached profile / effective tier stats (admin endpoint)."""
+    if not TIER_SERVICE_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Tier service not available")
+    return get_profile_cache_stats()
+
+
+@app.get("/api/postprocessors/stats")
+async def get_postprocessing_stats_endpoint():
+    """Get cumulative JD analysis post-processing timings per stage (admin endpoint)."""
+    from backend.postprocessors import get_postprocessing_stats
+    return get_postprocessing_stats()
+
+
+@app.get("/api/jobs/index/stats")
+async def get_job_index_stats_endpoint():
+    """Get local job index statistics (admin endpoint)."""
+    from services.job_index import get_job_index_stats
+    return get_job_index_stats()
+
+
 # ============================================================================
 # PERFORMANCE PERSISTENCE
 # ============================================================================
@@ -30577,7 +30161,7 @@ async def start_drill(request: Request):
             company_context=company_context,
         )
 
-        response = call_claude(prompt, f"Generate a {drill_type} drill question.")
+        response = await call_claude_async(prompt, f"Generate a {drill_type} drill question.")
         cleaned = clean_claude_json(response)
         data = json.loads(cleaned) if isinstance(cleaned, str) else cleaned
 
@@ -30656,7 +30240,7 @@ async def respond_drill(request: Request):
                 answer=answer,
                 company_context=company_context,
             )
-            response = call_claude(respond_prompt, f"Evaluate this {drill_type} drill answer.")
+            response = await call_claude_async(respond_prompt, f"Evaluate this {drill_type} drill answer.")
             cleaned = clean_claude_json(response)
             data = json.loads(cleaned) if isinstance(cleaned, str) else cleaned
 
@@ -30678,7 +30262,7 @@ async def respond_drill(request: Request):
                 qa_summary=qa_lines,
                 total_questions=len(history),
             )
-            summary_response = call_claude(summary_prompt, "Summarize this drill session.")
+            summary_response = await call_claude_async(summary_prompt, "Summarize this drill session.")
             summary_cleaned = clean_claude_json(summary_response)
             summary_data = json.loads(summary_cleaned) if isinstance(summary_cleaned, str) else summary_cleaned
 
@@ -30707,7 +30291,7 @@ async def respond_drill(request: Request):
                 answer=answer,
                 company_context=company_context,
             )
-            response = call_claude(respond_prompt, f"Evaluate this {drill_type} drill answer and generate next question.")
+            response = await call_claude_async(respond_prompt, f"Evaluate this {drill_type} drill answer and generate next question.")
             cleaned = clean_claude_json(response)
             data = json.loads(cleaned) if isinstance(cleaned, str) else cleaned
 
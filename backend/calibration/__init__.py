@@ -7,6 +7,8 @@
 # ============================================================================
 
 from .signal_detectors import (
+    SignalFeatures,
+    extract_signal_features,
     extract_team_size,
     extract_scope_signals,
     detect_org_level_influence,
@@ -35,6 +37,8 @@ from .calibration_controller import calibrate_gaps
 
 __all__ = [
     # Signal detectors
+    'SignalFeatures',
+    'extract_signal_features',
     'extract_team_size',
     'extract_scope_signals',
     'detect_org_level_influence',
@@ -4,12 +4,274 @@
 #
 # These functions extract structured signals from resume/experience text
 # to enable recruiter-grade gap classification.
+#
+# Every text signal is read from one SignalFeatures object per experience:
+# the experience text is built once, all keyword families are matched in a
+# single scan, and each regex family runs once. The detectors below are thin
+# readers over that object, so calibrators, the red flag detector and the gap
+# classifier share one scan instead of re-scanning per detector.
 # ============================================================================
 
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from utils.keyword_scanner import KeywordScanner, ScanResult
+from resume_features import active_resume_features
+
+
+# ============================================================================
+# PATTERN TABLES (compiled once at import)
+# ============================================================================
+
+# Team size patterns (ordered by specificity)
+TEAM_SIZE_PATTERNS = [re.compile(p) for p in [
+    r'(?:managed|led|oversaw|supervised)\s+(?:a\s+)?(?:team\s+of\s+)?(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people|reports?|members?|ics?)',
+    r'team\s+of\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people|reports?|members?)?',
+    r'(\d+)\s*(?:\+)?\s*(?:direct\s+)?reports?',
+    r'(\d+)\s*-?\s*person\s+(?:team|org|organization)',
+    r'managed\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people)?',
+    r'led\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people)?',
+    r'org\s+of\s+(\d+)',
+    r'organization\s+of\s+(\d+)',
+]]
+
+# Geographic scope
+GEOGRAPHIC_LEVELS = {
+    'global': ['global', 'worldwide', 'international', 'multi-region', 'across regions',
+               'emea', 'apac', 'americas', 'multiple countries'],
+    'national': ['national', 'country-wide', 'us-wide', 'nationwide'],
+    'regional': ['regional', 'multi-office', 'multiple offices', 'cross-office'],
+    'local': ['local', 'single office', 'on-site', 'co-located']
+}
+
+# Organizational scope
+ORG_LEVELS = {
+    'company-wide': ['company-wide', 'org-wide', 'enterprise', 'across the company',
+                     'all teams', 'entire organization', 'company strategy'],
+    'multi-department': ['multi-department', 'cross-org', 'multiple departments',
+                         'across departments', 'cross-functional org'],
+    'department': ['department', 'division', 'business unit', 'org'],
+    'team': ['team', 'squad', 'pod', 'group']
+}
+
+# Product scope
+PRODUCT_LEVELS = {
+    'ecosystem': ['ecosystem', 'suite', 'platform of platforms', 'portfolio'],
+    'platform': ['platform', 'infrastructure', 'foundational', 'core system'],
+    'product': ['product', 'application', 'service', 'offering'],
+    'feature': ['feature', 'component', 'module', 'improvement']
+}
+
+SCOPE_DIMENSIONS = {
+    'geographic': GEOGRAPHIC_LEVELS,
+    'organizational': ORG_LEVELS,
+    'product': PRODUCT_LEVELS,
+}
+
+# Explicit org-level influence signals
+ORG_INFLUENCE_PATTERNS = [re.compile(p) for p in [
+    r'defined\s+(?:engineering|technical|product)\s+strategy\s+(?:for|across)\s+(?:the\s+)?org',
+    r'set\s+(?:technical|engineering|product)\s+direction\s+(?:company|org)',
+    r'org-?wide\s+(?:impact|influence|initiative)',
+    r'company-?wide\s+(?:strategy|direction|initiative)',
+    r'led\s+(?:engineering|technical)\s+strategy',
+    r'established\s+(?:engineering|technical)\s+standards\s+(?:for|across)',
+    r'technical\s+vision\s+(?:for|across)\s+(?:the\s+)?(?:org|company)',
+]]
+
+# Technology/tool mentions (tool obsession)
+TOOL_PATTERNS = [re.compile(p) for p in [
+    r'(?:python|java|javascript|react|node|kubernetes|docker|aws|gcp|azure)',
+    r'(?:sql|nosql|mongodb|postgresql|redis|elasticsearch)',
+    r'(?:jenkins|terraform|ansible|github|gitlab|jira)',
+]]
+TOOL_DUMP_PATTERN = re.compile(r'(?:\w+,\s*){5,}\w+')  # 5+ comma-separated items
+
+ACV_PATTERN = re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:k|K|thousand)?\s*(?:acv|deal|contract)')
+
+# Revenue/ARR patterns, then performance patterns
+METRIC_PATTERNS = [(re.compile(p, re.IGNORECASE), metric_type, unit) for p, metric_type, unit in [
+    (r'\$(\d+(?:\.\d+)?)\s*(?:m|M|million)(?:\s*(?:arr|revenue|growth))?', 'revenue', 'millions'),
+    (r'\$(\d+(?:\.\d+)?)\s*(?:b|B|billion)', 'revenue', 'billions'),
+    (r'(\d+(?:\.\d+)?)\s*%\s*(?:growth|increase|improvement)', 'growth_rate', 'percentage'),
+    (r'(\d+(?:\.\d+)?)\s*x\s*(?:growth|increase|improvement)', 'multiplier', 'times'),
+    (r'(\d+)\s*%\s*quota', 'quota_attainment', 'percentage'),
+    (r'top\s*(\d+)\s*%', 'ranking', 'percentile'),
+    (r'(\d+)\s*(?:deals?|accounts?)', 'deal_count', 'count'),
+]]
+
+# Passive voice indicators
+PASSIVE_PATTERNS = [re.compile(p) for p in [
+    r'was\s+(?:involved|responsible|tasked|assigned)',
+    r'was\s+\w+ed\s+(?:by|to|for)',
+    r'were\s+(?:developed|created|implemented)',
+    r'has\s+been\s+\w+ed',
+    r'it\s+was\s+decided',
+    r'the\s+team\s+(?:developed|built|created)',
+]]
+
+# Every keyword family the detectors ask about, matched in one scan
+KEYWORD_FAMILIES = {
+    **{f'{dim}:{level}': kws for dim, levels in SCOPE_DIMENSIONS.items() for level, kws in levels.items()},
+    'org_influence_explicit': [
+        'org-wide impact', 'company-wide strategy', 'set technical direction',
+        'engineering strategy', 'technical vision', 'org-level', 'company-level',
+        'enterprise architecture', 'chief architect', 'principal architect'
+    ],
+    'org_influence_implicit': [
+        'influenced architecture', 'cross-team', 'across teams', 'multiple teams',
+        'platform', 'infrastructure', 'shared services', 'common framework',
+        'technical standards', 'best practices', 'mentored across'
+    ],
+    # Explicit ownership signals
+    'ownership_explicit': [
+        'owned', 'led', 'built', 'designed', 'architected', 'created',
+        'launched', 'established', 'founded', 'drove', 'spearheaded',
+        'delivered', 'shipped', 'implemented', 'developed', 'executed'
+    ],
+    # Implicit (contributor) signals
+    'ownership_implicit': [
+        'contributed to', 'helped', 'supported', 'assisted', 'worked on',
+        'participated in', 'was part of', 'collaborated on', 'involved in',
+        'member of', 'joined'
+    ],
+    'scope_up_major': ['global', 'company-wide', 'org-wide'],
+    'scope_up_minor': ['platform', 'infrastructure', 'enterprise'],
+    'scope_down': ['feature', 'component', 'module'],
+    'problem_solving': [
+        'solved', 'improved', 'reduced', 'increased', 'optimized',
+        'because', 'in order to', 'to achieve', 'resulting in',
+        'led to', 'enabled', 'by implementing'
+    ],
+    'sales_enterprise': [
+        'enterprise', 'fortune 500', 'f500', 'large accounts',
+        'c-suite', 'cxo', 'executive sponsors', 'multi-stakeholder',
+        'complex deals', '6-12 month', 'year-long', '$100k+', '$1m+',
+        'strategic accounts', 'named accounts', 'territory'
+    ],
+    'sales_mid_market': [
+        'mid-market', 'smb', 'small business', 'growing companies',
+        '$25k', '$50k', '3-6 month', 'quick sales', 'department heads',
+        'vp-level buyers'
+    ],
+    'sales_transactional': [
+        'transactional', 'high-velocity', 'volume', 'inbound',
+        'self-serve', 'product-led', 'plg', 'short cycle',
+        '$5k', '$10k', 'monthly', 'instant close'
+    ],
+    'active_voice': [
+        'i led', 'i built', 'i designed', 'i owned', 'i drove',
+        'i implemented', 'i created', 'i developed', 'i managed'
+    ],
+    'passive_voice': [
+        'was responsible for', 'was involved in', 'was part of',
+        'was tasked with', 'was assigned to'
+    ],
+    'manager_of_managers': [
+        'manager of managers', 'managed managers', 'led managers',
+        'managed directors', 'director reports', 'managed leads',
+        'led leads', 'managers reporting', 'directors reporting',
+        'org of', 'organization of', 'skip-level', 'second-line',
+        'managed engineering managers', 'managed product managers'
+    ],
+    # Signs of real experience (failures, tradeoffs, specifics)
+    'reality': [
+        'failed', 'learned', 'pivoted', 'tradeoff', 'trade-off',
+        'challenge', 'difficult', 'obstacle', 'despite', 'although',
+        'limitation', 'constraint', 'balanced', 'prioritized',
+        'deprioritized', 'cut', 'reduced scope', 'phased'
+    ],
+    # Overly positive/vague language
+    'press_release': [
+        'spearheaded', 'revolutionized', 'transformed', 'pioneered',
+        'world-class', 'best-in-class', 'cutting-edge', 'state-of-the-art',
+        'innovative', 'groundbreaking', 'game-changing'
+    ],
+}
+KEYWORD_SCANNER = KeywordScanner(KEYWORD_FAMILIES, cache_size=0)
+
+
+# ============================================================================
+# SIGNAL FEATURES
+# ============================================================================
+
+@dataclass
+class SignalFeatures:
+    """Text-derived calibration signals for one experience, computed in one scan."""
+    text: str
+    keywords: ScanResult
+    team_size: int = 0
+    org_influence_pattern: bool = False
+    tool_count: int = 0
+    has_tool_dump: bool = False
+    acv: Optional[float] = None
+    metrics: List[Dict[str, Any]] = field(default_factory=list)
+    passive_pattern_count: int = 0
+
+
+def extract_signal_features(experience: Any) -> SignalFeatures:
+    """
+    Builds the SignalFeatures for an experience dict (or role dict / raw text).
+
+    Memoized on the combined experience text, so every detector called with the
+    same experience during one calibration pass shares a single scan.
+    """
+    if isinstance(experience, SignalFeatures):
+        return experience
+    return _signal_features_for_text(_build_experience_text(experience))
+
+
+@lru_cache(maxsize=256)
+def _signal_features_for_text(text: str) -> SignalFeatures:
+    lower = text.lower()
+
+    max_size = 0
+    for pattern in TEAM_SIZE_PATTERNS:
+        for match in pattern.findall(lower):
+            try:
+                size = int(match)
+                if size > max_size and size < 10000:  # Sanity check
+                    max_size = size
+            except (ValueError, TypeError):
+                continue
+
+    acv = None
+    acv_match = ACV_PATTERN.search(lower)
+    if acv_match:
+        acv = float(acv_match.group(1))
+        if 'k' in lower[acv_match.start():acv_match.end()]:
+            acv *= 1000
+
+    metrics = []
+    for pattern, metric_type, unit in METRIC_PATTERNS:
+        for match in pattern.finditer(text):
+            try:
+                value = float(match.group(1))
+                context = text[max(0, match.start()-50):match.end()+50]
+                metrics.append({
+                    'type': metric_type,
+                    'value': value,
+                    'unit': unit,
+                    'context': context.strip()
+                })
+            except (ValueError, TypeError):
+                continue
+
+    return SignalFeatures(
+        text=text,
+        keywords=KEYWORD_SCANNER.scan(lower),
+        team_size=max_size,
+        org_influence_pattern=any(p.search(lower) for p in ORG_INFLUENCE_PATTERNS),
+        tool_count=sum(len(p.findall(lower)) for p in TOOL_PATTERNS),
+        has_tool_dump=TOOL_DUMP_PATTERN.search(text) is not None,
+        acv=acv,
+        metrics=metrics,
+        passive_pattern_count=sum(len(p.findall(lower)) for p in PASSIVE_PATTERNS),
+    )
+
 
 def extract_team_size(experience: Dict[str, Any]) -> int:
     """
@@ -26,33 +288,7 @@ def extract_team_size(experience: Dict[str, Any]) -> int:
     if not experience:
         return 0
 
-    # Build combined text from experience
-    combined_text = _build_experience_text(experience).lower()
-
-    # Team size patterns (ordered by specificity)
-    patterns = [
-        r'(?:managed|led|oversaw|supervised)\s+(?:a\s+)?(?:team\s+of\s+)?(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people|reports?|members?|ics?)',
-        r'team\s+of\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people|reports?|members?)?',
-        r'(\d+)\s*(?:\+)?\s*(?:direct\s+)?reports?',
-        r'(\d+)\s*-?\s*person\s+(?:team|org|organization)',
-        r'managed\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people)?',
-        r'led\s+(\d+)\s*(?:\+)?\s*(?:engineers?|developers?|people)?',
-        r'org\s+of\s+(\d+)',
-        r'organization\s+of\s+(\d+)',
-    ]
-
-    max_size = 0
-    for pattern in patterns:
-        matches = re.findall(pattern, combined_text)
-        for match in matches:
-            try:
-                size = int(match)
-                if size > max_size and size < 10000:  # Sanity check
-                    max_size = size
-            except (ValueError, TypeError):
-                continue
-
-    return max_size
+    return extract_signal_features(experience).team_size
 
 
 def extract_scope_signals(experience: Dict[str, Any]) -> Dict[str, str]:
@@ -66,45 +302,18 @@ def extract_scope_signals(experience: Dict[str, Any]) -> Dict[str, str]:
 
     Returns: dict with scope level for each dimension
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Geographic scope
-    geographic_levels = {
-        'global': ['global', 'worldwide', 'international', 'multi-region', 'across regions',
-                   'emea', 'apac', 'americas', 'multiple countries'],
-        'national': ['national', 'country-wide', 'us-wide', 'nationwide'],
-        'regional': ['regional', 'multi-office', 'multiple offices', 'cross-office'],
-        'local': ['local', 'single office', 'on-site', 'co-located']
-    }
+    keywords = extract_signal_features(experience).keywords
 
-    # Organizational scope
-    org_levels = {
-        'company-wide': ['company-wide', 'org-wide', 'enterprise', 'across the company',
-                         'all teams', 'entire organization', 'company strategy'],
-        'multi-department': ['multi-department', 'cross-org', 'multiple departments',
-                             'across departments', 'cross-functional org'],
-        'department': ['department', 'division', 'business unit', 'org'],
-        'team': ['team', 'squad', 'pod', 'group']
-    }
-
-    # Product scope
-    product_levels = {
-        'ecosystem': ['ecosystem', 'suite', 'platform of platforms', 'portfolio'],
-        'platform': ['platform', 'infrastructure', 'foundational', 'core system'],
-        'product': ['product', 'application', 'service', 'offering'],
-        'feature': ['feature', 'component', 'module', 'improvement']
-    }
-
-    def detect_level(levels_dict: Dict[str, List[str]]) -> str:
-        for level, keywords in levels_dict.items():
-            if any(kw in combined_text for kw in keywords):
+    def detect_level(dimension: str) -> str:
+        for level in SCOPE_DIMENSIONS[dimension]:
+            if keywords.has(f'{dimension}:{level}'):
                 return level
         return 'unknown'
 
     return {
-        'geographic': detect_level(geographic_levels),
-        'organizational': detect_level(org_levels),
-        'product': detect_level(product_levels)
+        'geographic': detect_level('geographic'),
+        'organizational': detect_level('organizational'),
+        'product': detect_level('product')
     }
 
 
@@ -118,41 +327,15 @@ def detect_org_level_influence(experience: Dict[str, Any]) -> str:
     Implicit: "Influenced architecture decisions across teams"
     Missing: No evidence of cross-team/org impact
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Explicit org-level influence signals
-    explicit_patterns = [
-        r'defined\s+(?:engineering|technical|product)\s+strategy\s+(?:for|across)\s+(?:the\s+)?org',
-        r'set\s+(?:technical|engineering|product)\s+direction\s+(?:company|org)',
-        r'org-?wide\s+(?:impact|influence|initiative)',
-        r'company-?wide\s+(?:strategy|direction|initiative)',
-        r'led\s+(?:engineering|technical)\s+strategy',
-        r'established\s+(?:engineering|technical)\s+standards\s+(?:for|across)',
-        r'technical\s+vision\s+(?:for|across)\s+(?:the\s+)?(?:org|company)',
-    ]
-
-    for pattern in explicit_patterns:
-        if re.search(pattern, combined_text):
-            return 'explicit'
-
-    # Explicit keywords
-    explicit_keywords = [
-        'org-wide impact', 'company-wide strategy', 'set technical direction',
-        'engineering strategy', 'technical vision', 'org-level', 'company-level',
-        'enterprise architecture', 'chief architect', 'principal architect'
-    ]
+    features = extract_signal_features(experience)
 
-    if any(kw in combined_text for kw in explicit_keywords):
+    if features.org_influence_pattern:
         return 'explicit'
 
-    # Implicit signals
-    implicit_keywords = [
-        'influenced architecture', 'cross-team', 'across teams', 'multiple teams',
-        'platform', 'infrastructure', 'shared services', 'common framework',
-        'technical standards', 'best practices', 'mentored across'
-    ]
+    if features.keywords.has('org_influence_explicit'):
+        return 'explicit'
 
-    if any(kw in combined_text for kw in implicit_keywords):
+    if features.keywords.has('org_influence_implicit'):
         return 'implicit'
 
     return 'missing'
@@ -331,25 +514,11 @@ def detect_ownership_level(experience: Dict[str, Any]) -> str:
     Implicit: "Contributed to", "helped", "supported", "worked on"
     Missing: No ownership language at all
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Explicit ownership signals
-    explicit_keywords = [
-        'owned', 'led', 'built', 'designed', 'architected', 'created',
-        'launched', 'established', 'founded', 'drove', 'spearheaded',
-        'delivered', 'shipped', 'implemented', 'developed', 'executed'
-    ]
-
-    # Implicit (contributor) signals
-    implicit_keywords = [
-        'contributed to', 'helped', 'supported', 'assisted', 'worked on',
-        'participated in', 'was part of', 'collaborated on', 'involved in',
-        'member of', 'joined'
-    ]
+    keywords = extract_signal_features(experience).keywords
 
     # Check for explicit first
-    explicit_count = sum(1 for kw in explicit_keywords if kw in combined_text)
-    implicit_count = sum(1 for kw in implicit_keywords if kw in combined_text)
+    explicit_count = keywords.count('ownership_explicit')
+    implicit_count = keywords.count('ownership_implicit')
 
     if explicit_count >= 3:
         return 'explicit'
@@ -377,11 +546,11 @@ def analyze_scope_trajectory(experience: Dict[str, Any]) -> str:
 
     def estimate_scope(role: Dict[str, Any]) -> int:
         """Estimate scope level 1-10 based on signals."""
-        text = _build_role_text(role).lower()
+        features = extract_signal_features({'roles': [role]})
         score = 5  # Default
 
         # Team size signals
-        team_size = extract_team_size({'roles': [role]})
+        team_size = features.team_size
         if team_size >= 50:
             score += 3
         elif team_size >= 20:
@@ -390,11 +559,11 @@ def analyze_scope_trajectory(experience: Dict[str, Any]) -> str:
             score += 1
 
         # Scope keywords
-        if any(kw in text for kw in ['global', 'company-wide', 'org-wide']):
+        if features.keywords.has('scope_up_major'):
             score += 2
-        if any(kw in text for kw in ['platform', 'infrastructure', 'enterprise']):
+        if features.keywords.has('scope_up_minor'):
             score += 1
-        if any(kw in text for kw in ['feature', 'component', 'module']):
+        if features.keywords.has('scope_down'):
             score -= 1
 
         # Title signals
@@ -444,31 +613,18 @@ def detect_tool_obsession(experience: Dict[str, Any]) -> bool:
 
     Returns: bool
     """
-    combined_text = _build_experience_text(experience)
+    features = extract_signal_features(experience)
 
     # Count technology/tool mentions vs problem-solving language
-    tool_patterns = [
-        r'(?:python|java|javascript|react|node|kubernetes|docker|aws|gcp|azure)',
-        r'(?:sql|nosql|mongodb|postgresql|redis|elasticsearch)',
-        r'(?:jenkins|terraform|ansible|github|gitlab|jira)',
-    ]
-
-    problem_solving_keywords = [
-        'solved', 'improved', 'reduced', 'increased', 'optimized',
-        'because', 'in order to', 'to achieve', 'resulting in',
-        'led to', 'enabled', 'by implementing'
-    ]
-
-    tool_count = sum(len(re.findall(p, combined_text.lower())) for p in tool_patterns)
-    problem_count = sum(1 for kw in problem_solving_keywords if kw in combined_text.lower())
+    tool_count = features.tool_count
+    problem_count = features.keywords.count('problem_solving')
 
     # Red flag: many tools, few problem-solving indicators
     if tool_count >= 15 and problem_count < 3:
         return True
 
     # Check for comma-separated tool dumps
-    tool_dump_pattern = r'(?:\w+,\s*){5,}\w+'  # 5+ comma-separated items
-    if re.search(tool_dump_pattern, combined_text):
+    if features.has_tool_dump:
         # Ensure it's not just a description
         if problem_count < 5:
             return True
@@ -487,37 +643,11 @@ def detect_sales_motion(experience: Dict[str, Any]) -> str:
     - Sales cycle length
     - Stakeholder complexity (single buyer vs committee)
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Enterprise signals
-    enterprise_keywords = [
-        'enterprise', 'fortune 500', 'f500', 'large accounts',
-        'c-suite', 'cxo', 'executive sponsors', 'multi-stakeholder',
-        'complex deals', '6-12 month', 'year-long', '$100k+', '$1m+',
-        'strategic accounts', 'named accounts', 'territory'
-    ]
-
-    # Mid-market signals
-    mid_market_keywords = [
-        'mid-market', 'smb', 'small business', 'growing companies',
-        '$25k', '$50k', '3-6 month', 'quick sales', 'department heads',
-        'vp-level buyers'
-    ]
-
-    # Transactional signals
-    transactional_keywords = [
-        'transactional', 'high-velocity', 'volume', 'inbound',
-        'self-serve', 'product-led', 'plg', 'short cycle',
-        '$5k', '$10k', 'monthly', 'instant close'
-    ]
+    features = extract_signal_features(experience)
 
     # Check for ACV mentions
-    acv_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:k|K|thousand)?\s*(?:acv|deal|contract)', combined_text)
-    if acv_match:
-        acv = float(acv_match.group(1))
-        if 'k' in combined_text[acv_match.start():acv_match.end()].lower():
-            acv *= 1000
-
+    if features.acv is not None:
+        acv = features.acv
         if acv >= 100000:
             return 'Enterprise'
         elif acv >= 25000:
@@ -526,9 +656,9 @@ def detect_sales_motion(experience: Dict[str, Any]) -> str:
             return 'Transactional'
 
     # Keyword-based detection
-    enterprise_score = sum(1 for kw in enterprise_keywords if kw in combined_text)
-    mid_market_score = sum(1 for kw in mid_market_keywords if kw in combined_text)
-    transactional_score = sum(1 for kw in transactional_keywords if kw in combined_text)
+    enterprise_score = features.keywords.count('sales_enterprise')
+    mid_market_score = features.keywords.count('sales_mid_market')
+    transactional_score = features.keywords.count('sales_transactional')
 
     max_score = max(enterprise_score, mid_market_score, transactional_score)
 
@@ -548,40 +678,8 @@ def extract_metrics(experience: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     Returns: List of {metric, value, context}
     """
-    combined_text = _build_experience_text(experience)
-    metrics = []
-
-    # Revenue/ARR patterns
-    revenue_patterns = [
-        (r'\$(\d+(?:\.\d+)?)\s*(?:m|M|million)(?:\s*(?:arr|revenue|growth))?', 'revenue', 'millions'),
-        (r'\$(\d+(?:\.\d+)?)\s*(?:b|B|billion)', 'revenue', 'billions'),
-        (r'(\d+(?:\.\d+)?)\s*%\s*(?:growth|increase|improvement)', 'growth_rate', 'percentage'),
-        (r'(\d+(?:\.\d+)?)\s*x\s*(?:growth|increase|improvement)', 'multiplier', 'times'),
-    ]
-
-    # Performance patterns
-    perf_patterns = [
-        (r'(\d+)\s*%\s*quota', 'quota_attainment', 'percentage'),
-        (r'top\s*(\d+)\s*%', 'ranking', 'percentile'),
-        (r'(\d+)\s*(?:deals?|accounts?)', 'deal_count', 'count'),
-    ]
-
-    for pattern, metric_type, unit in revenue_patterns + perf_patterns:
-        matches = re.finditer(pattern, combined_text, re.IGNORECASE)
-        for match in matches:
-            try:
-                value = float(match.group(1))
-                context = combined_text[max(0, match.start()-50):match.end()+50]
-                metrics.append({
-                    'type': metric_type,
-                    'value': value,
-                    'unit': unit,
-                    'context': context.strip()
-                })
-            except (ValueError, TypeError):
-                continue
-
-    return metrics
+    # Copies, so callers can't mutate the shared features
+    return [dict(metric) for metric in extract_signal_features(experience).metrics]
 
 
 def has_metric_context(metrics: List[Dict[str, Any]]) -> bool:
@@ -619,33 +717,13 @@ def detect_passive_voice_dominance(experience: Dict[str, Any]) -> bool:
 
     Returns: bool
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Passive voice indicators
-    passive_patterns = [
-        r'was\s+(?:involved|responsible|tasked|assigned)',
-        r'was\s+\w+ed\s+(?:by|to|for)',
-        r'were\s+(?:developed|created|implemented)',
-        r'has\s+been\s+\w+ed',
-        r'it\s+was\s+decided',
-        r'the\s+team\s+(?:developed|built|created)',
-    ]
-
-    # Active voice indicators
-    active_keywords = [
-        'i led', 'i built', 'i designed', 'i owned', 'i drove',
-        'i implemented', 'i created', 'i developed', 'i managed'
-    ]
+    features = extract_signal_features(experience)
 
-    passive_count = sum(len(re.findall(p, combined_text)) for p in passive_patterns)
-    active_count = sum(1 for kw in active_keywords if kw in combined_text)
+    passive_count = features.passive_pattern_count
+    active_count = features.keywords.count('active_voice')
 
     # Also count general passive signals
-    passive_keywords = [
-        'was responsible for', 'was involved in', 'was part of',
-        'was tasked with', 'was assigned to'
-    ]
-    passive_count += sum(1 for kw in passive_keywords if kw in combined_text)
+    passive_count += features.keywords.count('passive_voice')
 
     # Red flag: passive >> active
     return passive_count > active_count * 2 and passive_count >= 3
@@ -657,17 +735,7 @@ def detect_manager_of_managers(experience: Dict[str, Any]) -> bool:
 
     Returns: bool
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    mom_keywords = [
-        'manager of managers', 'managed managers', 'led managers',
-        'managed directors', 'director reports', 'managed leads',
-        'led leads', 'managers reporting', 'directors reporting',
-        'org of', 'organization of', 'skip-level', 'second-line',
-        'managed engineering managers', 'managed product managers'
-    ]
-
-    return any(kw in combined_text for kw in mom_keywords)
+    return extract_signal_features(experience).keywords.has('manager_of_managers')
 
 
 def is_ic_to_leadership_transition(experience: Dict[str, Any]) -> bool:
@@ -712,31 +780,15 @@ def detect_press_release_pattern(experience: Dict[str, Any]) -> bool:
 
     Returns: bool
     """
-    combined_text = _build_experience_text(experience).lower()
-
-    # Signs of real experience (failures, tradeoffs, specifics)
-    reality_keywords = [
-        'failed', 'learned', 'pivoted', 'tradeoff', 'trade-off',
-        'challenge', 'difficult', 'obstacle', 'despite', 'although',
-        'limitation', 'constraint', 'balanced', 'prioritized',
-        'deprioritized', 'cut', 'reduced scope', 'phased'
-    ]
+    features = extract_signal_features(experience)
 
-    # Overly positive/vague language
-    pr_keywords = [
-        'spearheaded', 'revolutionized', 'transformed', 'pioneered',
-        'world-class', 'best-in-class', 'cutting-edge', 'state-of-the-art',
-        'innovative', 'groundbreaking', 'game-changing'
-    ]
-
-    reality_count = sum(1 for kw in reality_keywords if kw in combined_text)
-    pr_count = sum(1 for kw in pr_keywords if kw in combined_text)
+    reality_count = features.keywords.count('reality')
+    pr_count = features.keywords.count('press_release')
 
     # Also check for metric specificity
-    metrics = extract_metrics(experience)
     has_specific_metrics = any(
         m.get('context') and len(m.get('context', '')) > 30
-        for m in metrics
+        for m in features.metrics
     )
 
     # Press release pattern: lots of PR language, no reality signals
@@ -793,6 +845,15 @@ def detect_scale_inconsistency(experience: Dict[str, Any]) -> bool:
 
 def _build_experience_text(experience: Dict[str, Any]) -> str:
     """Build combined text from experience dict."""
+    # The analyze pipeline builds its experience dict from the request's
+    # ResumeFeatures; reuse the text flattened for it the first time
+    features = active_resume_features()
+    if features is not None and features.is_experience_view(experience):
+        return features.memo('calibration_experience_text', lambda: _join_experience_text(experience))
+    return _join_experience_text(experience)
+
+
+def _join_experience_text(experience: Dict[str, Any]) -> str:
     if not experience:
         return ""
 
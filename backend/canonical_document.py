@@ -152,7 +152,7 @@ class CanonicalResume:
         Build a ResumeFormatter populated with canonical data.
         Shared by to_full_text(), to_html(), and DOCX generation.
         """
-        from document_generator import ResumeFormatter
+        from document_formatters import ResumeFormatter
 
         formatter = ResumeFormatter()
 
@@ -0,0 +1,46 @@
+"""
+Document Formatters
+
+ResumeFormatter and CoverLetterFormatter from the repo-root document_generator
+package (python-docx output plus the preview HTML).
+
+backend/document_generator.py has the same module name, so a plain
+`import document_generator` returns whichever one sys.path and import order
+happen to find first. This module loads the package by path under its own name,
+once, at import time. Callers always get the repo-root formatters, and
+sys.modules["document_generator"] is never touched.
+"""
+
+import importlib.util
+import os
+import sys
+
+_PACKAGE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "document_generator"
+)
+_MODULE_NAME = "henryhq_document_generator"
+
+
+def _load_package():
+    spec = importlib.util.spec_from_file_location(
+        _MODULE_NAME,
+        os.path.join(_PACKAGE_DIR, "__init__.py"),
+        submodule_search_locations=[_PACKAGE_DIR],
+    )
+    module = importlib.util.module_from_spec(spec)
+    # The package's relative imports resolve through sys.modules
+    sys.modules[_MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[_MODULE_NAME]
+        raise
+    return module
+
+
+_package = sys.modules.get(_MODULE_NAME) or _load_package()
+
+ResumeFormatter = _package.ResumeFormatter
+CoverLetterFormatter = _package.CoverLetterFormatter
+
+__all__ = ["ResumeFormatter", "CoverLetterFormatter"]
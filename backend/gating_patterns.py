@@ -0,0 +1,437 @@
+# ============================================================================
+# GATING PATTERNS MODULE
+#
+# PURPOSE: Precompiled patterns for the deterministic pre-LLM gating stack in
+# backend.py (role title extraction, role type / leadership level detection,
+# relevant years, people leadership years, decision authority, org design).
+#
+# Pattern lists used to be rebuilt inside each detector on every call, with a
+# separate `any(p in text ...)` loop per list. Here each text kind (JD, role
+# title, resume title, experience text) gets ONE KeywordScanner holding all of
+# its signal families, so a detector stack reads every signal it needs from a
+# single pass over the text. Scans are memoized per text, so detectors called
+# back to back on the same JD share the pass.
+# ============================================================================
+
+import re
+from typing import Dict, List, Tuple
+
+from utils.keyword_scanner import KeywordScanner, KeywordSet, ScanResult
+
+
+# ============================================================================
+# LEADERSHIP DETECTION CONSTANTS
+# Single source of truth for people leadership patterns.
+# Used by extract_tiered_leadership() and extract_people_leadership_years()
+# ============================================================================
+
+# Evidence patterns that indicate direct people management
+PEOPLE_LEADERSHIP_EVIDENCE = [
+    "direct report", "direct reports", "managed a team", "led a team",
+    "team of", "people manager", "managed team", "lead a team",
+    "built the team", "grew the team", "hiring manager",
+    "performance review", "promoted", "mentored", "coached team",
+    "developed team", "team lead", "engineering manager", "people management",
+    "hired", "fired", "onboarded", "trained team", "built team",
+    # Additional patterns from real resumes
+    "built and led", "led marketing team", "led team", "scaled marketing",
+    "scaled team", "scaled function", "team from", "grew from",
+    "marketing team of", "engineering team of", "led the team",
+    "managed budget", "annual budget", "led organization",
+    "built organization", "reporting to", "reports to me",
+    "oversaw team", "supervised", "led cross-functional"
+]
+
+# Title patterns that typically indicate people leadership
+PEOPLE_LEADERSHIP_TITLES = [
+    "manager", "director", "head of", "vp ", "vice president",
+    "chief", "lead", "supervisor", "team lead"
+]
+
+# Strong leadership titles that inherently imply people management at established companies
+STRONG_LEADERSHIP_TITLES = [
+    "vp ", "vice president", "vp,", "director", "head of", "chief",
+    "senior manager", "senior product marketing manager", "group manager",
+    "marketing manager", "product marketing manager"
+]
+
+# Well-known companies where VP/Director definitely means people leadership
+ESTABLISHED_COMPANIES = [
+    "google", "meta", "facebook", "amazon", "apple", "microsoft", "netflix",
+    "uber", "lyft", "airbnb", "stripe", "square", "twilio", "segment",
+    "salesforce", "adobe", "oracle", "sap", "ibm", "cisco", "intel",
+    "linkedin", "twitter", "x corp", "snap", "pinterest", "dropbox",
+    "slack", "atlassian", "asana", "notion", "figma", "canva",
+    "shopify", "hubspot", "zendesk", "datadog", "snowflake", "mongodb",
+    "new relic", "mparticle", "amplitude", "mixpanel", "braze",
+    "intercom", "drift", "gong", "outreach", "salesloft",
+    # Energy / Utilities (enterprise scale)
+    "national grid", "pg&e", "con edison", "duke energy", "southern company",
+    # Fintech / Payments
+    "venmo", "paypal", "block", "coinbase", "robinhood", "plaid",
+    # Executive Search / Recruiting (verified people management)
+    "heidrick", "heidrick & struggles", "korn ferry", "spencer stuart",
+    "egon zehnder", "russell reynolds",
+    # Additional major companies
+    "spotify", "doordash", "instacart", "grubhub",
+]
+
+# Operational-only patterns (NO leadership credit)
+OPERATIONAL_ONLY_PATTERNS = [
+    "program manager", "project manager", "technical lead",
+    "staff engineer", "principal engineer", "architect",
+    "operations lead", "process lead", "systems lead"
+]
+
+# Resume role titles (extract_people_leadership_years)
+RESUME_TITLE_SIGNALS = KeywordScanner({
+    "operational_only": OPERATIONAL_ONLY_PATTERNS,
+    "people_titles": PEOPLE_LEADERSHIP_TITLES,
+    "strong_titles": STRONG_LEADERSHIP_TITLES,
+}, cache_size=512)
+
+PEOPLE_LEADERSHIP_EVIDENCE_SET = KeywordSet(PEOPLE_LEADERSHIP_EVIDENCE, cache_size=512)
+ESTABLISHED_COMPANY_SET = KeywordSet(ESTABLISHED_COMPANIES, cache_size=512)
+
+
+# ============================================================================
+# ROLE TITLE EXTRACTION (extract_role_title_from_jd)
+# ============================================================================
+
+# Navigation/UI text to skip (common when copying from job boards)
+NAVIGATION_SKIP_PATTERNS = [
+    r'^back to',
+    r'^apply now',
+    r'^save job',
+    r'^share',
+    r'^home\s*[>/]',
+    r'^jobs\s*[>/]',
+    r'^search',
+    r'^menu',
+    r'^sign in',
+    r'^log in',
+    r'^posted',
+    r'^×',
+    r'^\d+ days? ago',
+    r'^view all jobs',
+    r'^similar jobs',
+]
+NAVIGATION_SKIP_RE = re.compile("|".join(f"(?:{p})" for p in NAVIGATION_SKIP_PATTERNS))
+
+# NON-SEMANTIC HEADERS TO IGNORE - these are section labels, not role titles
+# Per fix spec: Must ignore headers like "About the job", "Job Description", etc.
+NON_SEMANTIC_HEADERS = frozenset([
+    "about the job",
+    "about this job",
+    "about the role",
+    "about this role",
+    "about the position",
+    "about us",
+    "job description",
+    "position description",
+    "role description",
+    "overview",
+    "the opportunity",
+    "opportunity",
+    "the role",
+    "the position",
+    "position overview",
+    "role overview",
+    "job overview",
+    "summary",
+    "job summary",
+    "role summary",
+    "description",
+    "what you'll do",
+    "what we're looking for",
+    "who we are",
+    "who you are",
+    "responsibilities",
+    "requirements",
+    "qualifications",
+    "key responsibilities",
+    "your responsibilities",
+])
+HEADER_TRAILING_PUNCT_RE = re.compile(r'[:\-]+$')
+
+METADATA_PREFIXES = (
+    'reports to', 'reporting to', 'location:', 'department:',
+    'team:', 'date:', 'posted:', 'salary:', 'compensation:',
+    'type:', 'employment type:', 'experience:', 'seniority:',
+)
+
+# Strategy 1: explicit markers (must be at start of line to avoid matching mid-sentence)
+TITLE_MARKER_PATTERNS = [
+    re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+        r'^(?:job title|position title):\s*([^\n]+)',  # Only match "Job Title:" or "Position Title:" at line start
+        r'^([^\n]+)(?:\s*-\s*(?:corporate|hybrid|remote|full.time))',
+        r'(?:hiring|hiring a|we\'re hiring|is hiring)\s+(?:a\s+)?([^\n\.]+)',
+    ]
+]
+TITLE_LOCATION_SUFFIX_RE = re.compile(
+    r'\s*-\s*(corporate|hybrid|remote|san francisco|full.time).*$', re.IGNORECASE
+)
+
+# Reject results that look like sentence continuations from "hiring" pattern
+HIRING_SENTENCE_STARTERS = (
+    'a senior', 'an experienced', 'someone who', 'a seasoned',
+    'a talented', 'an innovative', 'a dedicated', 'a motivated',
+    'a skilled', 'an accomplished',
+)
+
+# Sentence fragments often start with conjunctions, articles, or verbs
+FRAGMENT_STARTERS = (
+    'and ', 'or ', 'the ', 'a ', 'an ', 'plans', 'including',
+    'such as', 'with ', 'for ', 'to ', 'in ', 'on ', 'at ',
+    's ', 't ', 're ', 'll ', 've ',  # Truncated contractions
+)
+
+# Recommendation-style phrases
+RECOMMENDATION_PHRASES = KeywordSet([
+    'fine', 'but you', 'should', 'consider', 'recommend',
+    'suggest', 'however', 'although', 'because', 'since',
+])
+
+# Job title indicators - role nouns that signify an actual job title
+JOB_TITLE_INDICATORS = KeywordSet([
+    'manager', 'director', 'engineer', 'analyst', 'lead',
+    'coordinator', 'specialist', 'vp', 'vice president',
+    'head of', 'senior', 'junior', 'associate', 'chief',
+    'officer', 'developer', 'designer', 'architect',
+    'recruiter', 'marketing', 'sales', 'product', 'operations',
+    'program', 'project', 'tpm', 'principal', 'staff',
+])
+
+# Pattern: "The [Role Title] will..." or "[Role Title] is responsible..."
+ROLE_EXTRACTION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        # "We are seeking a Director of Technical Recruiting to..."
+        r'(?:seeking|hiring|looking for)\s+(?:a\s+)?(?:[\w,\s]+?\s+)?((?:Senior\s+|Sr\.\s+)?(?:Director|Manager|Lead|Head|VP|Vice President|Recruiter|Engineer|Analyst|Specialist|Chief|Officer|Principal)(?:\s+(?:of|for)\s+[A-Za-z\s&]+)?)(?:\s+to\s|\s+who\s|\s+that\s|\s+for\s+our|\.\s)',
+        # "The Senior Director, Talent Acquisition will set the vision..."
+        r'^(?:The\s+)?([A-Z][A-Za-z\s,&/]+?(?:Director|Manager|Lead|Head|VP|Vice President|Engineer|Recruiter|Analyst|Specialist|Coordinator|Chief|Officer)(?:[\s,]+(?:of\s+)?[A-Za-z\s&]+)?)(?:\s+will\s|\s+is\s+responsible|\s+leads\s|\s+manages\s|\s+reports\s+to)',
+        r'^(?:The\s+)?([A-Z][A-Za-z\s,]+?(?:of\s+)?(?:Recruiting|Engineering|Product|Sales|Marketing|Operations|HR|Finance|Data|Analytics)[A-Za-z\s,]*?)(?:\s+will|\s+is\s+responsible|\s+leads|\s+manages)',
+        r'^(?:The\s+)?([A-Z][A-Za-z\s]+?)(?:\s+will\s+lead|\s+will\s+be\s+responsible)',
+    ]
+]
+TRAILING_STOPWORD_RE = re.compile(r'\s+(a|an|the|and|or|for|to|with)$', re.IGNORECASE)
+
+# Validate: must contain a title keyword (reject sentence fragments)
+EXTRACTED_ROLE_KEYWORDS = KeywordSet([
+    'director', 'manager', 'lead', 'head', 'vp', 'vice president',
+    'recruiter', 'engineer', 'analyst', 'specialist', 'chief', 'officer', 'principal',
+])
+
+
+# ============================================================================
+# ROLE TITLE SIGNALS (detect_role_type_isolated, detect_leadership_role_level)
+# ============================================================================
+
+RECRUITING_TITLE_PATTERNS = [
+    "recruiter", "recruiting", "talent acquisition",
+    "sourcer", "sourcing", "talent partner",
+    "recruitment", "headhunter", "technical recruiter",
+    "ta director", "ta manager", "talent lead", "head of talent",
+    "hiring", "talent management", "talent operations"
+]
+
+ROLE_TITLE_SIGNALS = KeywordScanner({
+    # detect_role_type_isolated, in priority order
+    "recruiting": RECRUITING_TITLE_PATTERNS,
+    "tpm": [
+        "technical program manager", "tpm", "sr tpm", "senior tpm",
+        "staff tpm", "principal tpm", "lead tpm"
+    ],
+    "program_manager": [
+        "program manager", "sr program manager", "senior program manager",
+        "program director", "head of program", "vp program"
+    ],
+    "project_manager": [
+        "project manager", "sr project manager", "senior project manager",
+        "project coordinator", "project lead", "pmo", "it project manager",
+        "technical project manager"
+    ],
+    "product": [
+        "product manager", "product lead", "product owner",
+        "product director", "head of product", "vp product", "cpo"
+    ],
+    "engineering": [
+        "engineer", "developer", "software", "technical lead",
+        "architect", "sre", "devops", "engineering manager"
+    ],
+    "sales": [
+        "sales", "account executive", "account manager",
+        "business development", "revenue", "ae ", "sdr", "bdr"
+    ],
+    "marketing": [
+        "marketing", "growth", "demand gen",
+        "brand", "marketing manager", "cmo"
+    ],
+    # detect_leadership_role_level
+    # Leadership keywords that indicate Director+ roles (always leadership)
+    "director_plus": [
+        "director", "vp ", "vp,", "v.p.", "vice president",
+        "head of", "chief", "cto", "cfo", "ceo", "coo", "cmo", "cpo", "cro",
+        "svp", "evp", "gvp", "president",
+    ],
+    # Senior Manager is ALWAYS a people leadership role (not IC)
+    "senior_manager": [
+        "senior manager", "sr manager", "sr. manager",
+        "senior engineering manager", "senior product manager",  # These ARE leadership despite "product manager"
+        "senior program manager", "senior project manager",  # These ARE leadership despite "project manager"
+    ],
+    # IC roles that contain "manager" but are NOT people leadership
+    "ic_manager": [
+        "product manager", "project manager", "program manager",
+        "account manager", "customer success manager", "sales manager",
+        "marketing manager", "brand manager", "campaign manager",
+        "content manager", "community manager", "social media manager",
+    ],
+}, cache_size=512)
+
+# Manager-level keywords (may be leadership depending on context)
+# Word boundary avoids false positives like "engagement" containing "manager"
+MANAGER_KEYWORD_PATTERNS: List[Tuple[str, "re.Pattern"]] = [
+    (kw, re.compile(rf'\b{kw}\b')) for kw in ["manager", "lead", "principal", "staff"]
+]
+
+
+# ============================================================================
+# JD TEXT SIGNALS (detect_role_type_isolated, verify_role_type_alignment,
+# detect_leadership_role_level)
+# ============================================================================
+
+JD_SIGNALS = KeywordScanner({
+    # Strong recruiting signals (immediate match)
+    "recruiting_strong": ["talent acquisition", "full-cycle recruiting"],
+    "recruiting": [
+        "full-cycle recruiting", "sourcing", "candidate experience",
+        "hiring manager", "recruitment funnel", "talent pipeline",
+        "offer negotiation", "interview scheduling"
+    ],
+    "alignment_recruiting": [
+        "full-cycle recruiting", "candidate experience",
+        "sourcing", "hiring manager", "talent pipeline"
+    ],
+    "people_management": [
+        "direct reports", "manage a team", "build a team", "lead a team",
+        "people leadership", "people management", "team management",
+        "hiring", "performance reviews", "managing engineers",
+        "managing designers", "managing people"
+    ],
+}, cache_size=64)
+
+
+# ============================================================================
+# RELEVANT YEARS (calculate_relevant_years_isolated)
+# ============================================================================
+
+ROLE_EXPERIENCE_PATTERNS: Dict[str, KeywordSet] = {
+    role_type: KeywordSet(patterns, cache_size=512) for role_type, patterns in {
+        "recruiting": [
+            "recruiter", "recruiting", "talent acquisition",
+            "sourcer", "sourcing", "talent partner", "recruitment",
+            "technical recruiter", "ta ", "talent lead", "head of talent",
+            "talent advisor", "search analyst", "executive search",
+            "headhunter", "talent consultant", "hiring"
+        ],
+        "tpm": [
+            "technical program manager", "tpm", "sr tpm", "senior tpm",
+            "staff tpm", "principal tpm", "lead tpm",
+            # Also count program management experience with technical context
+            "program manager"  # TPM roles often have "program manager" in title
+        ],
+        "program_manager": [
+            "program manager", "sr program manager", "senior program manager",
+            "program director", "head of program", "vp program",
+            "portfolio manager", "initiative lead"
+        ],
+        "project_manager": [
+            "project manager", "sr project manager", "senior project manager",
+            "project coordinator", "project lead", "pmo", "it project manager",
+            "technical project manager", "project director"
+        ],
+        "pm": [
+            "product manager", "product lead", "pm", "product owner",
+            "product director", "head of product", "vp product"
+        ],
+        "engineering": [
+            "engineer", "developer", "software", "technical lead",
+            "architect", "sre", "devops", "programmer"
+        ],
+        "sales": [
+            "sales", "account executive", "account manager",
+            "business development", "revenue", "ae ", "sdr", "bdr"
+        ],
+        "marketing": [
+            "marketing", "growth", "demand gen",
+            "brand", "marketing manager", "content"
+        ],
+    }.items()
+}
+
+# Company-based relevance (e.g., executive search firms = recruiting experience)
+RECRUITING_COMPANIES = KeywordSet([
+    "heidrick", "korn ferry", "spencer stuart", "egon zehnder",
+    "russell reynolds", "executive search", "staffing", "recruiting agency"
+], cache_size=512)
+
+
+# ============================================================================
+# DATE RANGES (parse_duration_to_years_isolated)
+# ============================================================================
+
+YEAR_RE = re.compile(r'\b(20\d{2})\b')
+DURATION_YEARS_RE = re.compile(r'(\d+)\s*year')
+DURATION_MONTHS_RE = re.compile(r'(\d+)\s*month')
+
+
+# ============================================================================
+# EXPERIENCE TEXT SIGNALS (detect_decision_authority, detect_org_design_signals)
+# ============================================================================
+
+EXPERIENCE_AUTHORITY_SIGNALS = KeywordScanner({
+    # Explicit decision authority verbs
+    "decision_explicit": [
+        'decided', 'owned', 'set direction', 'determined',
+        'established', 'defined strategy', 'made decision',
+        'chose to', 'selected', 'approved', 'vetoed'
+    ],
+    # Implicit authority (influencer, not decider)
+    "decision_implicit": [
+        'partnered with', 'collaborated', 'supported',
+        'contributed to', 'advised', 'recommended',
+        'influenced', 'consulted', 'helped shape'
+    ],
+    # Explicit org design
+    "org_design_explicit": [
+        'built team', 'built org', 'designed org',
+        'restructured', 'defined roles', 'created structure',
+        'established hiring plan', 'shaped organization',
+        'org design', 'organizational structure'
+    ],
+    # Implicit (hiring/growth without design)
+    "org_design_implicit": [
+        'grew team', 'hired', 'expanded team',
+        'increased headcount', 'team growth',
+        'added engineers', 'scaled team'
+    ],
+}, cache_size=64)
+
+
+# ============================================================================
+# SCAN API
+# ============================================================================
+
+def scan_jd_signals(jd_text: str) -> ScanResult:
+    """All JD-text signal families from one pass (memoized per JD)."""
+    return JD_SIGNALS.scan(jd_text.lower())
+
+
+def scan_role_title_signals(role_title: str) -> ScanResult:
+    """All role-title signal families from one pass (memoized per title)."""
+    return ROLE_TITLE_SIGNALS.scan(role_title.lower())
+
+
+def scan_experience_authority(experience_text: str) -> ScanResult:
+    """Decision authority + org design families from one pass (memoized per text)."""
+    return EXPERIENCE_AUTHORITY_SIGNALS.scan(experience_text.lower())
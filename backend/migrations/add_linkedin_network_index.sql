@@ -0,0 +1,15 @@
+-- Migration: Store the normalized LinkedIn company index on candidate_profiles
+-- Run this in Supabase SQL Editor
+-- Date: 2026-10-16
+
+-- Built from every uploaded connection by /api/linkedin/connections/persist and
+-- loaded as-is by job discovery (CompanyNetworkIndex.to_dict()).
+DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'candidate_profiles' AND column_name = 'linkedin_network_index') THEN
+        ALTER TABLE candidate_profiles ADD COLUMN linkedin_network_index JSONB;
+    END IF;
+END $$;
+
+COMMENT ON COLUMN candidate_profiles.linkedin_network_index IS 'Normalized company index over all LinkedIn connections: {"version": 1, "companies": {normalized: {"name", "count"}}, "tokens": {token: [normalized]}}.';
+
+SELECT 'LinkedIn network index migration completed successfully!' as status;
@@ -0,0 +1,41 @@
+-- Migration: Atomic batched usage increments for the usage metering buffer
+-- Run this in Supabase SQL Editor
+-- Date: 2026-10-16
+
+-- Applies a batch of counter deltas for one user and billing period in a
+-- single statement. Creates the period row if needed; concurrent calls can't
+-- lose increments. Called by usage_metering.UsageCounterBuffer.flush() with
+-- p_deltas like {"applications_used": 3, "resumes_generated": 1}.
+CREATE OR REPLACE FUNCTION increment_usage_by(p_user_id UUID, p_period_start TIMESTAMPTZ, p_deltas JSONB)
+RETURNS usage_tracking AS $$
+DECLARE
+    v_usage usage_tracking;
+BEGIN
+    INSERT INTO usage_tracking (
+        user_id, period_start, period_end,
+        applications_used, resumes_generated, cover_letters_generated,
+        henry_conversations_used, mock_interviews_used, coaching_sessions_used
+    )
+    VALUES (
+        p_user_id, p_period_start, p_period_start + INTERVAL '1 month',
+        COALESCE((p_deltas->>'applications_used')::INTEGER, 0),
+        COALESCE((p_deltas->>'resumes_generated')::INTEGER, 0),
+        COALESCE((p_deltas->>'cover_letters_generated')::INTEGER, 0),
+        COALESCE((p_deltas->>'henry_conversations_used')::INTEGER, 0),
+        COALESCE((p_deltas->>'mock_interviews_used')::INTEGER, 0),
+        COALESCE((p_deltas->>'coaching_sessions_used')::INTEGER, 0)
+    )
+    ON CONFLICT (user_id, period_start) DO UPDATE SET
+        applications_used = usage_tracking.applications_used + EXCLUDED.applications_used,
+        resumes_generated = usage_tracking.resumes_generated + EXCLUDED.resumes_generated,
+        cover_letters_generated = usage_tracking.cover_letters_generated + EXCLUDED.cover_letters_generated,
+        henry_conversations_used = usage_tracking.henry_conversations_used + EXCLUDED.henry_conversations_used,
+        mock_interviews_used = usage_tracking.mock_interviews_used + EXCLUDED.mock_interviews_used,
+        coaching_sessions_used = usage_tracking.coaching_sessions_used + EXCLUDED.coaching_sessions_used
+    RETURNING * INTO v_usage;
+
+    RETURN v_usage;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+SELECT 'Usage increment batch RPC migration completed successfully!' as status;
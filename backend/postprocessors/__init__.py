@@ -10,14 +10,26 @@ Each processor is rule-based and deterministic (no additional LLM calls).
 Pipeline Order:
 1. Reality Check - Market truth signals (never modifies score)
 2. Strategic Redirects - Alternative role suggestions (for low-fit)
-3. Voice Guide - Tone and messaging corrections
+3. Voice Guide + Text Sanitization - One fused pass over the response
+   tree (see text_pipeline.py)
+4. Recommendation-Action Consistency
 
 All processors are ADDITIVE or CORRECTIVE, never destructive.
 """
 
+import time
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+from .text_pipeline import (
+    STAGE_SANITIZE,
+    STAGE_VOICE_GUIDE,
+    get_postprocessing_stats,
+    record_step_timing,
+    run_text_pipeline,
+    sanitize_tree,
+)
+
 
 @dataclass
 class PostProcessorConfig:
@@ -73,12 +85,14 @@ def apply_all_postprocessors(
 
     # CRITICAL: Capture fit_score before any processing
     original_fit_score = processed.get("fit_score", fit_score)
+    step_ms: Dict[str, float] = {}
 
     # =========================================================================
     # STEP 1: Reality Check (Market truth signals)
     # Per REALITY_CHECK_SPEC.md: NEVER modifies fit_score
     # =========================================================================
     if config.reality_check_enabled:
+        step_started = time.perf_counter()
         try:
             from ..reality_check import analyze_reality_checks
 
@@ -118,12 +132,14 @@ def apply_all_postprocessors(
         except Exception as e:
             print(f"⚠️ Reality Check failed (non-blocking): {str(e)}")
             processed["reality_check"] = {"error": str(e), "checks": []}
+        step_ms["reality_check"] = (time.perf_counter() - step_started) * 1000
 
     # =========================================================================
     # STEP 2: Strategic Redirects (Alternative role suggestions)
     # Per STRATEGIC_REDIRECTS_IMPLEMENTATION.md: Triggers for low-fit only
     # =========================================================================
     if config.strategic_redirects_enabled:
+        step_started = time.perf_counter()
         try:
             from ..strategic_redirects import generate_strategic_redirects
 
@@ -164,43 +180,49 @@ def apply_all_postprocessors(
 
         except Exception as e:
             print(f"⚠️ Strategic Redirects failed (non-blocking): {str(e)}")
+        step_ms["strategic_redirects"] = (time.perf_counter() - step_started) * 1000
 
     # =========================================================================
-    # STEP 3: Voice Guide (Tone and messaging corrections)
+    # STEP 3: Voice Guide + Text Sanitization (one tree walk)
     # Per HenryHQ_voice_guide.md: Light-touch corrections only
+    # Sanitization (em dash removal, cleanup) applies to every string
     # =========================================================================
-    if config.voice_guide_enabled:
-        try:
-            from ..voice_guide import apply_voice_guide
-
-            processed = apply_voice_guide(
-                processed,
-                strict_mode=config.voice_guide_strict
-            )
-
-            if config.debug_mode:
-                if processed.get("_voice_guide_applied"):
-                    summary = processed.get("_voice_guide_summary", {})
-                    print(f"✅ Voice Guide applied: {summary.get('total_corrections_applied', 0)} corrections")
+    stages = [STAGE_VOICE_GUIDE, STAGE_SANITIZE] if config.voice_guide_enabled else [STAGE_SANITIZE]
+    try:
+        processed, text_report = run_text_pipeline(
+            processed, stages, voice_strict=config.voice_guide_strict
+        )
+    except Exception as e:
+        print(f"⚠️ Voice Guide failed (non-blocking): {str(e)}")
+        processed, text_report = run_text_pipeline(processed, [STAGE_SANITIZE])
+
+    summary = text_report.voice_summary
+    if summary and (summary["total_corrections_applied"] > 0 or summary["total_issues_found"] > 0):
+        processed["_voice_guide_applied"] = True
+        processed["_voice_guide_summary"] = sanitize_tree(summary)
+    step_ms.update(text_report.stage_ms)
 
-        except Exception as e:
-            print(f"⚠️ Voice Guide failed (non-blocking): {str(e)}")
+    if config.debug_mode:
+        if processed.get("_voice_guide_applied"):
+            print(f"✅ Voice Guide applied: {summary.get('total_corrections_applied', 0)} corrections")
+        print(f"✅ Text sanitization applied (em dashes, etc.): {text_report.string_nodes} strings in {text_report.total_ms:.1f}ms")
 
     # =========================================================================
     # STEP 4: Recommendation-Action Consistency
     # Ensure timing_guidance and action fields match the recommendation
+    # (its replacement strings are already sanitized)
     # =========================================================================
+    step_started = time.perf_counter()
     processed = _enforce_action_recommendation_consistency(processed, recommendation)
+    step_ms["action_consistency"] = (time.perf_counter() - step_started) * 1000
     if config.debug_mode:
         print("✅ Action-Recommendation consistency enforced")
 
-    # =========================================================================
-    # STEP 5: Text Sanitization (Em dash removal, cleanup)
-    # Applies globally to prevent AI-generated artifacts
-    # =========================================================================
-    processed = _sanitize_text_fields(processed)
+    for step, ms in step_ms.items():
+        if step not in text_report.stage_ms:
+            record_step_timing(step, ms)
     if config.debug_mode:
-        print("✅ Text sanitization applied (em dashes, etc.)")
+        processed["_postprocessing_timing"] = {k: round(v, 3) for k, v in step_ms.items()}
 
     # =========================================================================
     # FINAL ASSERTION: Verify fit_score integrity
@@ -328,41 +350,7 @@ def _sanitize_text_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     - Double spaces
     - Orphaned punctuation
     """
-    import re
-
-    def sanitize_text(text: str) -> str:
-        if not text or not isinstance(text, str):
-            return text
-
-        # Replace em/en dashes with period + space for sentence breaks
-        if '—' in text or '–' in text:
-            text = text.replace('—', '. ')
-            text = text.replace('–', '. ')
-            # Clean up double periods and extra spaces
-            text = text.replace('..', '.')
-            text = text.replace('.  ', '. ')
-            # Capitalize after new periods
-            text = re.sub(r'\.\s+([a-z])', lambda m: '. ' + m.group(1).upper(), text)
-
-        # Fix double spaces
-        text = re.sub(r'\s{2,}', ' ', text)
-
-        # Fix orphaned punctuation (space before punctuation)
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-
-        return text.strip()
-
-    def recurse(obj):
-        if isinstance(obj, dict):
-            return {k: recurse(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [recurse(item) for item in obj]
-        elif isinstance(obj, str):
-            return sanitize_text(obj)
-        else:
-            return obj
-
-    return recurse(data)
+    return sanitize_tree(data)
 
 
 def _extract_recent_titles(resume_data: Dict[str, Any]) -> list:
@@ -395,4 +383,5 @@ def _extract_company_types(resume_data: Dict[str, Any]) -> list:
 __all__ = [
     'apply_all_postprocessors',
     'PostProcessorConfig',
+    'get_postprocessing_stats',
 ]
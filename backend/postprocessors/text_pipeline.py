@@ -0,0 +1,367 @@
+"""
+HenryHQ Fused Text Pipeline
+
+Single-pass text processing for JD analysis responses.
+
+Voice Guide corrections, post-processor sanitization, and the final grammar
+pass each used to walk the whole response tree on their own. This module
+walks the tree once and runs every enabled text stage on each string node in
+turn, so adding a stage costs one more function call per string, not one
+more traversal.
+
+Stages (run in this order when enabled):
+1. voice_guide    - Tone/jargon corrections (Voice Guide fields only)
+2. sanitize       - Em/en dashes, double spaces, orphaned punctuation
+3. final_sanitize - P0.5 grammar: JD preambles, dashes, markdown, casing
+4. grammar_check  - Soft-fail compliance check (records violations only)
+
+Each stage keeps its own regexes precompiled, and rule lists are guarded by
+one combined search so clean strings skip them entirely.
+"""
+
+import re
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    from ..voice_guide.voice_formatter import VoiceGuideFormatter, VoiceValidationResult
+except ImportError:  # loaded as a top-level package (backend/ on sys.path)
+    from voice_guide.voice_formatter import VoiceGuideFormatter, VoiceValidationResult
+
+
+STAGE_VOICE_GUIDE = "voice_guide"
+STAGE_SANITIZE = "sanitize"
+STAGE_FINAL_SANITIZE = "final_sanitize"
+STAGE_GRAMMAR_CHECK = "grammar_check"
+
+STAGE_ORDER = (STAGE_VOICE_GUIDE, STAGE_SANITIZE, STAGE_FINAL_SANITIZE, STAGE_GRAMMAR_CHECK)
+
+
+# =============================================================================
+# Stage rules
+# =============================================================================
+
+_CAPITALIZE_AFTER_PERIOD = re.compile(r'\.\s+([a-z])')
+_MULTI_SPACE = re.compile(r'\s{2,}')
+_SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,!?;:])')
+
+
+def _replace_dashes(text: str) -> str:
+    """Replace em/en dashes with period + space and capitalize the new sentence."""
+    text = text.replace('—', '. ')
+    text = text.replace('–', '. ')
+    # Clean up double periods and extra spaces
+    text = text.replace('..', '.')
+    text = text.replace('.  ', '. ')
+    return _CAPITALIZE_AFTER_PERIOD.sub(lambda m: '. ' + m.group(1).upper(), text)
+
+
+def sanitize_text(text: str) -> str:
+    """Remove em/en dashes, double spaces and orphaned punctuation."""
+    if not text or not isinstance(text, str):
+        return text
+
+    if '—' in text or '–' in text:
+        text = _replace_dashes(text)
+
+    # Fix double spaces
+    text = _MULTI_SPACE.sub(' ', text)
+
+    # Fix orphaned punctuation (space before punctuation)
+    text = _SPACE_BEFORE_PUNCT.sub(r'\1', text)
+
+    return text.strip()
+
+
+# Patterns like "We're seeking a [Title]" shouldn't appear in Your Move
+JD_PREAMBLE_PATTERNS = [
+    r"[Ww]e'?re?\s+seeking\s+(?:a|an)\s+",
+    r"[Ww]e\s+are\s+seeking\s+(?:a|an)\s+",
+    r"[Ww]e'?re?\s+looking\s+for\s+(?:a|an)\s+",
+    r"[Ww]e\s+are\s+looking\s+for\s+(?:a|an)\s+",
+    r"[Jj]oin\s+(?:us|our\s+team)\s+as\s+(?:a|an)\s+",
+    r"[Aa]bout\s+(?:the|this)\s+[Rr]ole[:\s]+",
+    r"[Tt]he\s+[Rr]ole[:\s]+",
+]
+_JD_PREAMBLE_RES = [re.compile(pattern) for pattern in JD_PREAMBLE_PATTERNS]
+_JD_PREAMBLE_GATE = re.compile("|".join(f"(?:{pattern})" for pattern in JD_PREAMBLE_PATTERNS))
+
+_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC = re.compile(r'\*([^*]+)\*')
+_UNDERSCORE_EMPHASIS = re.compile(r'_([^_]+)_')
+
+# LLM casing slips: "aI-enabled" -> "AI-enabled", "c-suite" -> "C-suite"
+CASING_FIXES = [
+    ("ai", "AI"),
+    ("c-suite", "C-suite"),
+    ("faang", "FAANG"),
+    ("gtm", "GTM"),
+    ("kpis", "KPIs"),
+    ("kpi", "KPI"),
+    ("ats", "ATS"),
+    ("hr", "HR"),
+    ("de&i", "DE&I"),
+    ("dei", "DEI"),
+    ("saas", "SaaS"),
+    ("sec", "SEC"),
+    ("ipo", "IPO"),
+]
+_CASING_RE = re.compile(
+    r'\b(?:' + "|".join(f"({re.escape(term)})" for term, _ in CASING_FIXES) + r')\b',
+    re.IGNORECASE,
+)
+
+
+def _fix_casing(match: "re.Match") -> str:
+    return CASING_FIXES[match.lastindex - 1][1]
+
+
+def final_sanitize_text(text: str) -> str:
+    """
+    P0.5 grammar and punctuation standards for one string.
+
+    Removes JD preambles, em/en dashes and markdown emphasis markers, and fixes
+    common acronym casing.
+    """
+    if not text or not isinstance(text, str):
+        return text
+
+    # JD preamble patterns (sequential when any is present, so removals
+    # compose exactly as they always have)
+    if _JD_PREAMBLE_GATE.search(text):
+        for regex in _JD_PREAMBLE_RES:
+            text = regex.sub("", text)
+
+    # Em/en dashes -> period + space
+    if '—' in text or '–' in text:
+        text = _replace_dashes(text)
+        text = _MULTI_SPACE.sub(' ', text)
+
+    # Markdown emphasis markers - keep the text, remove the markers
+    if '*' in text:
+        text = _BOLD.sub(r'\1', text)
+        text = _ITALIC.sub(r'\1', text)
+    if '_' in text:
+        text = _UNDERSCORE_EMPHASIS.sub(r'\1', text)
+
+    # Acronym casing
+    text = _CASING_RE.sub(_fix_casing, text)
+
+    return text.strip()
+
+
+_ASTERISK_EMPHASIS_CHECK = re.compile(r'\*[^*\s][^*]*\*')
+_UNDERSCORE_EMPHASIS_CHECK = re.compile(r'_[^_\s][^_]*_')
+
+
+def grammar_violations(text: str, path: str) -> List[str]:
+    """Disallowed punctuation/formatting left in a string (em/en dashes, emphasis)."""
+    if not text or not isinstance(text, str):
+        return []
+
+    violations = []
+    if '—' in text:
+        violations.append(f"Em dash (—) in {path}")
+    if '–' in text:
+        violations.append(f"En dash (–) in {path}")
+    # Asterisk emphasis (but not bullet points)
+    if '*' in text and _ASTERISK_EMPHASIS_CHECK.search(text):
+        violations.append(f"Asterisk emphasis (*text*) in {path}")
+    if '_' in text and _UNDERSCORE_EMPHASIS_CHECK.search(text):
+        violations.append(f"Underscore emphasis (_text_) in {path}")
+    return violations
+
+
+# =============================================================================
+# Single-pass walker
+# =============================================================================
+
+# Voice Guide scope for a node, mirroring VoiceGuideFormatter.process_response
+_VOICE_NONE = 0
+_VOICE_TEXT = 1     # this string gets voice corrections
+_VOICE_LIST = 2     # direct string items of this list do
+_VOICE_NESTED = 3   # strings and string lists anywhere under this dict do
+
+
+@dataclass
+class PipelineReport:
+    """What a pipeline run did and how long each stage took."""
+    stages: Tuple[str, ...]
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+    string_nodes: int = 0
+    voice_results: List[VoiceValidationResult] = field(default_factory=list)
+    voice_summary: Dict[str, Any] = field(default_factory=dict)
+    grammar_violations: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": list(self.stages),
+            "stage_ms": {name: round(ms, 3) for name, ms in self.stage_ms.items()},
+            "total_ms": round(self.total_ms, 3),
+            "string_nodes": self.string_nodes,
+            "grammar_violations": len(self.grammar_violations),
+        }
+
+
+def run_text_pipeline(
+    data: Any,
+    stages: Sequence[str],
+    voice_strict: bool = False,
+) -> Tuple[Any, PipelineReport]:
+    """
+    Walk data once, applying every enabled stage to each string node.
+
+    Returns a new tree (dicts and lists are rebuilt, other values shared) and
+    a PipelineReport. The voice stage only touches the fields the Voice Guide
+    owns; the other stages touch every string.
+    """
+    stages = tuple(name for name in STAGE_ORDER if name in stages)
+    report = PipelineReport(stages=stages, stage_ms={name: 0.0 for name in stages})
+    stage_ms = report.stage_ms
+    perf_counter = time.perf_counter
+
+    voice_on = STAGE_VOICE_GUIDE in stages
+    sanitize_on = STAGE_SANITIZE in stages
+    final_on = STAGE_FINAL_SANITIZE in stages
+    check_on = STAGE_GRAMMAR_CHECK in stages
+
+    formatter = VoiceGuideFormatter(strict_mode=voice_strict) if voice_on else None
+    text_fields = set(VoiceGuideFormatter.TEXT_FIELDS)
+    list_fields = set(VoiceGuideFormatter.LIST_FIELDS)
+    nested_fields = set(VoiceGuideFormatter.NESTED_FIELDS)
+    top_level_results: Dict[str, VoiceValidationResult] = {}
+
+    def process_string(text: str, path: str, voice: bool) -> str:
+        report.string_nodes += 1
+        if voice:
+            started = perf_counter()
+            result = formatter.process_text(text, path)
+            text = result.corrected_text
+            if path in text_fields and result.corrections_applied:
+                top_level_results[path] = result
+            if path == "your_move":
+                text = formatter.ensure_next_step(text, "your_move")
+            stage_ms[STAGE_VOICE_GUIDE] += (perf_counter() - started) * 1000
+        if sanitize_on:
+            started = perf_counter()
+            text = sanitize_text(text)
+            stage_ms[STAGE_SANITIZE] += (perf_counter() - started) * 1000
+        if final_on:
+            started = perf_counter()
+            text = final_sanitize_text(text)
+            stage_ms[STAGE_FINAL_SANITIZE] += (perf_counter() - started) * 1000
+        if check_on:
+            started = perf_counter()
+            report.grammar_violations.extend(grammar_violations(text, path))
+            stage_ms[STAGE_GRAMMAR_CHECK] += (perf_counter() - started) * 1000
+        return text
+
+    def child_scope(scope: int, key: str, value: Any, top_level: bool) -> int:
+        if not voice_on:
+            return _VOICE_NONE
+        if scope == _VOICE_NESTED:
+            if isinstance(value, str):
+                return _VOICE_TEXT
+            if isinstance(value, list):
+                return _VOICE_LIST
+            if isinstance(value, dict):
+                return _VOICE_NESTED
+            return _VOICE_NONE
+        if top_level:
+            if key in text_fields and isinstance(value, str):
+                return _VOICE_TEXT
+            if key in list_fields and isinstance(value, list):
+                return _VOICE_LIST
+            if key in nested_fields and isinstance(value, dict):
+                return _VOICE_NESTED
+        return _VOICE_NONE
+
+    def walk(obj: Any, path: str, scope: int) -> Any:
+        if isinstance(obj, str):
+            return process_string(obj, path, scope == _VOICE_TEXT)
+        if isinstance(obj, dict):
+            top_level = not path
+            return {
+                k: walk(v, f"{path}.{k}" if path else k, child_scope(scope, k, v, top_level))
+                for k, v in obj.items()
+            }
+        if isinstance(obj, list):
+            item_scope = _VOICE_TEXT if scope == _VOICE_LIST else _VOICE_NONE
+            return [
+                walk(item, f"{path}[{i}]", item_scope if isinstance(item, str) else _VOICE_NONE)
+                for i, item in enumerate(obj)
+            ]
+        return obj
+
+    started = perf_counter()
+    processed = walk(data, "", _VOICE_NONE)
+    report.total_ms = (perf_counter() - started) * 1000
+
+    if voice_on:
+        # Same order the Voice Guide has always logged top-level fields in
+        report.voice_results = [
+            top_level_results[name] for name in VoiceGuideFormatter.TEXT_FIELDS
+            if name in top_level_results
+        ]
+        formatter.validation_log.extend(report.voice_results)
+        report.voice_summary = formatter.get_validation_summary()
+
+    _record_run(report)
+    return processed, report
+
+
+def sanitize_tree(data: Any) -> Any:
+    """Apply sanitize_text to every string in a small structure (e.g. metadata)."""
+    if isinstance(data, dict):
+        return {k: sanitize_tree(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [sanitize_tree(item) for item in data]
+    if isinstance(data, str):
+        return sanitize_text(data)
+    return data
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {
+    "runs": 0,
+    "string_nodes": 0,
+    "total_ms": 0.0,
+    "stage_ms": {},
+    "step_ms": {},
+}
+
+
+def _record_run(report: PipelineReport) -> None:
+    with _stats_lock:
+        _stats["runs"] += 1
+        _stats["string_nodes"] += report.string_nodes
+        _stats["total_ms"] += report.total_ms
+        for name, ms in report.stage_ms.items():
+            _stats["stage_ms"][name] = _stats["stage_ms"].get(name, 0.0) + ms
+
+
+def record_step_timing(step: str, ms: float) -> None:
+    """Accumulate timing for a non-text post-processing step (e.g. reality_check)."""
+    with _stats_lock:
+        _stats["step_ms"][step] = _stats["step_ms"].get(step, 0.0) + ms
+
+
+def get_postprocessing_stats() -> Dict[str, Any]:
+    """Get cumulative post-processing timings for monitoring."""
+    with _stats_lock:
+        runs = _stats["runs"]
+        return {
+            "text_pipeline_runs": runs,
+            "string_nodes": _stats["string_nodes"],
+            "total_ms": round(_stats["total_ms"], 3),
+            "avg_ms": round(_stats["total_ms"] / runs, 3) if runs else 0.0,
+            "stage_ms": {name: round(ms, 3) for name, ms in _stats["stage_ms"].items()},
+            "step_ms": {name: round(ms, 3) for name, ms in _stats["step_ms"].items()},
+        }
@@ -11,13 +11,21 @@ Priority 3: JSON output validation (no undefined/null values)
 import os
 import re
 import json
+import time
+import queue
+import atexit
+import hashlib
 import logging
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from difflib import SequenceMatcher
 
+from utils.cache import LRUCache
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -141,6 +149,7 @@ def get_validation_config() -> Dict[str, Any]:
         },
         "known_companies_count": len(ValidationConfig.KNOWN_COMPANIES),
         "log_dir": ValidationConfig.LOG_DIR,
+        "resume_fact_cache": get_resume_fact_index_stats(),
     }
 
 
@@ -248,32 +257,215 @@ class ValidationResult:
 
 
 # =============================================================================
-# Resume Grounding Validator
+# Resume Fact Index - Precompiled, cacheable resume facts
 # =============================================================================
 
-class ResumeGroundingValidator:
+RESUME_FACT_CACHE_SIZE = int(os.getenv("RESUME_FACT_CACHE_SIZE", "256"))
+
+# Title words kept as standalone facts so "senior" or "director" claims ground
+TITLE_KEYWORDS = frozenset([
+    "senior", "lead", "principal", "staff", "manager",
+    "director", "vp", "head", "chief", "engineer",
+    "developer", "designer", "analyst", "pm", "product",
+])
+
+COMMON_TECH_TERMS = (
+    "python", "java", "javascript", "typescript", "react", "node",
+    "aws", "gcp", "azure", "docker", "kubernetes", "sql", "nosql",
+    "mongodb", "postgresql", "mysql", "redis", "elasticsearch",
+    "machine learning", "ml", "ai", "data science", "analytics",
+    "api", "rest", "graphql", "microservices", "agile", "scrum",
+)
+
+METRIC_PATTERNS = [
+    re.compile(r'\$[\d,.]+[KMB]?', re.IGNORECASE),          # Dollar amounts
+    re.compile(r'[\d,.]+%', re.IGNORECASE),                  # Percentages
+    re.compile(r'[\d,.]+x', re.IGNORECASE),                  # Multipliers
+    re.compile(r'\d+\+?\s*(users|customers|clients|employees|team members)', re.IGNORECASE),
+    re.compile(r'[\d,.]+\s*(ARR|MRR|revenue)', re.IGNORECASE),
+]
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the re module's \\w."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Equivalent of a regex \\b assertion at pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class AhoCorasick:
     """
-    Validates that AI-generated content is grounded in actual resume data.
-    Extracts verifiable facts from resume and checks claims against them.
+    Multi-pattern substring matcher.
+
+    Finds every occurrence of every pattern in a single pass over the text,
+    so checking an output against N facts costs O(len(text) + matches)
+    instead of N separate scans.
     """
 
-    def __init__(self, resume_data: Dict[str, Any]):
-        """Initialize with parsed resume data."""
-        self.resume_data = resume_data
-        self.companies = self._extract_companies()
-        self.skills = self._extract_skills()
-        self.metrics = self._extract_metrics()
-        self.achievements = self._extract_achievements()
-        self.titles = self._extract_titles()
-        self.education = self._extract_education()
-        self.resume_text = self._build_resume_text()
-
-    def _extract_companies(self) -> Set[str]:
+    __slots__ = ("patterns", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns):
+        self.patterns = frozenset(p for p in patterns if p)
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[str]] = [[]]
+
+        for pattern in sorted(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pattern)
+
+        # Breadth-first so every failure target is finished before it is used
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                target = fail[state]
+                while target and ch not in goto[target]:
+                    target = fail[target]
+                fail[nxt] = goto[target].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in out]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str, whole_words: bool = False):
+        """Yield (start, pattern) for each occurrence, ordered by end position."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern in out[state]:
+                start = i + 1 - len(pattern)
+                if whole_words and not (_at_word_boundary(text, start)
+                                        and _at_word_boundary(text, i + 1)):
+                    continue
+                yield start, pattern
+
+    def find_all(self, text: str, whole_words: bool = False) -> Set[str]:
+        """Distinct patterns that occur in text."""
+        return {pattern for _, pattern in self.iter_matches(text, whole_words)}
+
+    def first(self, text: str, whole_words: bool = False) -> Optional[str]:
+        """The first pattern to complete while scanning text, or None."""
+        for _, pattern in self.iter_matches(text, whole_words):
+            return pattern
+        return None
+
+
+_known_company_matcher: Optional[Tuple[frozenset, AhoCorasick]] = None
+
+
+def get_known_company_matcher() -> AhoCorasick:
+    """
+    Word-boundary matcher over KNOWN_COMPANIES (names under 4 chars skipped).
+
+    Rebuilt whenever the known-company set changes, e.g. after add_known_companies().
+    """
+    global _known_company_matcher
+    cached = _known_company_matcher
+    known = ValidationConfig.KNOWN_COMPANIES
+    if cached is None or len(cached[0]) != len(known) or cached[0] != known:
+        snapshot = frozenset(known)
+        cached = (snapshot, AhoCorasick(c for c in snapshot if len(c) >= 4))
+        _known_company_matcher = cached
+    return cached[1]
+
+
+def resume_fingerprint(resume_data: Dict[str, Any]) -> str:
+    """Stable content hash of a parsed resume, used as the fact index cache key."""
+    payload = json.dumps(resume_data or {}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ResumeFactIndex:
+    """
+    Verifiable facts extracted once from a parsed resume.
+
+    Sets are frozen so one index can be shared by every validator built for the
+    same resume. Claim grounding uses a single automaton over all companies,
+    skills and titles instead of one substring scan per element.
+    """
+    resume_hash: str
+    companies: frozenset
+    skills: frozenset
+    metrics: frozenset
+    achievements: Tuple[str, ...]
+    titles: frozenset
+    education: frozenset
+    resume_text: str
+    achievements_lower: Tuple[str, ...] = ()
+    element_weights: Dict[str, int] = field(default_factory=dict)
+    element_total: int = 0
+    element_matcher: Optional[AhoCorasick] = None
+
+    @classmethod
+    def build(cls, resume_data: Dict[str, Any],
+              resume_hash: Optional[str] = None) -> "ResumeFactIndex":
+        """Extract and precompile all facts from resume_data."""
+        resume_data = resume_data or {}
+        companies = frozenset(cls._extract_companies(resume_data))
+        skills = frozenset(cls._extract_skills(resume_data))
+        titles = frozenset(cls._extract_titles(resume_data))
+        achievements = tuple(cls._extract_achievements(resume_data))
+
+        # An element listed in several fact sets counts once per set, as the
+        # per-set loops in validate_claim always did
+        element_weights: Dict[str, int] = {}
+        for facts in (companies, skills, titles):
+            for element in facts:
+                if len(element) > 3:
+                    element_weights[element] = element_weights.get(element, 0) + 1
+
+        return cls(
+            resume_hash=resume_hash or resume_fingerprint(resume_data),
+            companies=companies,
+            skills=skills,
+            metrics=frozenset(cls._extract_metrics(resume_data)),
+            achievements=achievements,
+            titles=titles,
+            education=frozenset(cls._extract_education(resume_data)),
+            resume_text=cls._build_resume_text(resume_data),
+            achievements_lower=tuple(str(a).lower() for a in achievements),
+            element_weights=element_weights,
+            element_total=sum(element_weights.values()),
+            element_matcher=AhoCorasick(element_weights),
+        )
+
+    def count_elements(self, text_lower: str) -> Tuple[int, int]:
+        """Return (elements_found, total_elements) for a lowercased claim."""
+        if not self.element_total:
+            return 0, 0
+        found = sum(self.element_weights[e] for e in self.element_matcher.find_all(text_lower))
+        return found, self.element_total
+
+    @staticmethod
+    def _extract_companies(resume_data: Dict[str, Any]) -> Set[str]:
         """Extract all company names from resume."""
         companies = set()
 
         # From experience entries
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             if company := exp.get("company"):
                 companies.add(company.lower().strip())
                 # Also add variations
@@ -282,7 +474,7 @@ class ResumeGroundingValidator:
                         companies.add(part.lower().strip())
 
         # From education entries (handle both list of dicts and string format)
-        education = self.resume_data.get("education", [])
+        education = resume_data.get("education", [])
         if isinstance(education, list):
             for edu in education:
                 if isinstance(edu, dict):
@@ -299,12 +491,13 @@ class ResumeGroundingValidator:
 
         return companies
 
-    def _extract_skills(self) -> Set[str]:
+    @classmethod
+    def _extract_skills(cls, resume_data: Dict[str, Any]) -> Set[str]:
         """Extract all skills from resume."""
         skills = set()
 
         # Direct skills array
-        for skill in self.resume_data.get("skills", []):
+        for skill in resume_data.get("skills", []):
             if isinstance(skill, str):
                 skills.add(skill.lower().strip())
             elif isinstance(skill, dict):
@@ -312,7 +505,7 @@ class ResumeGroundingValidator:
                     skills.add(name.lower().strip())
 
         # Technical skills
-        tech_skills = self.resume_data.get("technical_skills", {})
+        tech_skills = resume_data.get("technical_skills", {})
         if isinstance(tech_skills, dict):
             for category, skill_list in tech_skills.items():
                 if isinstance(skill_list, list):
@@ -323,59 +516,42 @@ class ResumeGroundingValidator:
                 skills.add(skill.lower().strip())
 
         # Skills from experience bullets (extract common tech terms)
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             for bullet in exp.get("bullets", []):
                 # Extract known tech terms
-                skills.update(self._extract_tech_terms(bullet))
+                skills.update(cls._extract_tech_terms(bullet))
 
         return skills
 
-    def _extract_tech_terms(self, text: str) -> Set[str]:
+    @staticmethod
+    def _extract_tech_terms(text: str) -> Set[str]:
         """Extract technology terms from text."""
-        tech_terms = set()
-        common_tech = [
-            "python", "java", "javascript", "typescript", "react", "node",
-            "aws", "gcp", "azure", "docker", "kubernetes", "sql", "nosql",
-            "mongodb", "postgresql", "mysql", "redis", "elasticsearch",
-            "machine learning", "ml", "ai", "data science", "analytics",
-            "api", "rest", "graphql", "microservices", "agile", "scrum"
-        ]
         text_lower = text.lower()
-        for term in common_tech:
-            if term in text_lower:
-                tech_terms.add(term)
-        return tech_terms
+        return {term for term in COMMON_TECH_TERMS if term in text_lower}
 
-    def _extract_metrics(self) -> Set[str]:
+    @staticmethod
+    def _extract_metrics(resume_data: Dict[str, Any]) -> Set[str]:
         """Extract quantifiable metrics from resume."""
         metrics = set()
 
-        # Pattern for numbers with context
-        patterns = [
-            r'\$[\d,.]+[KMB]?',           # Dollar amounts
-            r'[\d,.]+%',                   # Percentages
-            r'[\d,.]+x',                   # Multipliers
-            r'\d+\+?\s*(users|customers|clients|employees|team members)',
-            r'[\d,.]+\s*(ARR|MRR|revenue)',
-        ]
-
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             for bullet in exp.get("bullets", []):
-                for pattern in patterns:
-                    matches = re.findall(pattern, bullet, re.IGNORECASE)
+                for pattern in METRIC_PATTERNS:
+                    matches = pattern.findall(bullet)
                     metrics.update(m.lower() for m in matches)
 
         return metrics
 
-    def _extract_achievements(self) -> List[str]:
+    @staticmethod
+    def _extract_achievements(resume_data: Dict[str, Any]) -> List[str]:
         """Extract achievement statements from resume."""
         achievements = []
 
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             achievements.extend(exp.get("bullets", []))
 
         # Also include summary points
-        if summary := self.resume_data.get("summary"):
+        if summary := resume_data.get("summary"):
             if isinstance(summary, str):
                 achievements.append(summary)
             elif isinstance(summary, list):
@@ -383,27 +559,27 @@ class ResumeGroundingValidator:
 
         return achievements
 
-    def _extract_titles(self) -> Set[str]:
+    @staticmethod
+    def _extract_titles(resume_data: Dict[str, Any]) -> Set[str]:
         """Extract job titles from resume."""
         titles = set()
 
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             if title := exp.get("title"):
                 titles.add(title.lower().strip())
                 # Also extract key words from titles
                 for word in title.lower().split():
-                    if word in ["senior", "lead", "principal", "staff", "manager",
-                               "director", "vp", "head", "chief", "engineer",
-                               "developer", "designer", "analyst", "pm", "product"]:
+                    if word in TITLE_KEYWORDS:
                         titles.add(word)
 
         return titles
 
-    def _extract_education(self) -> Set[str]:
+    @staticmethod
+    def _extract_education(resume_data: Dict[str, Any]) -> Set[str]:
         """Extract education details from resume."""
         education_set = set()
 
-        edu_data = self.resume_data.get("education", [])
+        edu_data = resume_data.get("education", [])
 
         # Handle string education (e.g., "MBA Stanford University")
         if isinstance(edu_data, str):
@@ -416,8 +592,8 @@ class ResumeGroundingValidator:
                 if isinstance(edu, dict):
                     if degree := edu.get("degree"):
                         education_set.add(degree.lower().strip())
-                    if field := edu.get("field"):
-                        education_set.add(field.lower().strip())
+                    if field_name := edu.get("field"):
+                        education_set.add(field_name.lower().strip())
                     if school := edu.get("school"):
                         education_set.add(school.lower().strip())
                 elif isinstance(edu, str):
@@ -425,26 +601,27 @@ class ResumeGroundingValidator:
 
         return education_set
 
-    def _build_resume_text(self) -> str:
+    @staticmethod
+    def _build_resume_text(resume_data: Dict[str, Any]) -> str:
         """Build full-text representation for fuzzy matching."""
         parts = []
 
         # Name
-        if name := self.resume_data.get("full_name"):
+        if name := resume_data.get("full_name"):
             parts.append(name)
 
         # Summary
-        if summary := self.resume_data.get("summary"):
+        if summary := resume_data.get("summary"):
             parts.append(summary if isinstance(summary, str) else " ".join(summary))
 
         # Experience
-        for exp in self.resume_data.get("experience", []):
+        for exp in resume_data.get("experience", []):
             parts.append(exp.get("company", ""))
             parts.append(exp.get("title", ""))
             parts.extend(exp.get("bullets", []))
 
         # Education
-        for edu in self.resume_data.get("education", []):
+        for edu in resume_data.get("education", []):
             if isinstance(edu, dict):
                 parts.append(edu.get("school", ""))
                 parts.append(edu.get("degree", ""))
@@ -452,12 +629,54 @@ class ResumeGroundingValidator:
                 parts.append(edu)
 
         # Skills
-        skills = self.resume_data.get("skills", [])
+        skills = resume_data.get("skills", [])
         if isinstance(skills, list):
             parts.extend(str(s) for s in skills)
 
         return " ".join(str(p) for p in parts).lower()
 
+
+_resume_fact_cache = LRUCache(max_entries=RESUME_FACT_CACHE_SIZE)
+
+
+def get_resume_fact_index(resume_data: Dict[str, Any]) -> ResumeFactIndex:
+    """Return the fact index for resume_data, building it only on first sight of that content."""
+    resume_hash = resume_fingerprint(resume_data)
+    index = _resume_fact_cache.get(resume_hash)
+    if index is None:
+        index = ResumeFactIndex.build(resume_data, resume_hash)
+        _resume_fact_cache.set(resume_hash, index)
+    return index
+
+
+def get_resume_fact_index_stats() -> Dict[str, Any]:
+    """Get resume fact index cache statistics for monitoring."""
+    return _resume_fact_cache.stats()
+
+
+# =============================================================================
+# Resume Grounding Validator
+# =============================================================================
+
+class ResumeGroundingValidator:
+    """
+    Validates that AI-generated content is grounded in actual resume data.
+    Checks claims against a cached ResumeFactIndex for the resume.
+    """
+
+    def __init__(self, resume_data: Dict[str, Any],
+                 fact_index: Optional[ResumeFactIndex] = None):
+        """Initialize with parsed resume data (or a prebuilt fact index)."""
+        self.resume_data = resume_data
+        self.fact_index = fact_index or get_resume_fact_index(resume_data)
+        self.companies = self.fact_index.companies
+        self.skills = self.fact_index.skills
+        self.metrics = self.fact_index.metrics
+        self.achievements = self.fact_index.achievements
+        self.titles = self.fact_index.titles
+        self.education = self.fact_index.education
+        self.resume_text = self.fact_index.resume_text
+
     def _fuzzy_match(self, text1: str, text2: str, threshold: float) -> bool:
         """Check if two strings are similar enough."""
         # Quick exact match
@@ -468,9 +687,12 @@ class ResumeGroundingValidator:
         if text1 in text2 or text2 in text1:
             return True
 
-        # Sequence matching
-        ratio = SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-        return ratio >= threshold
+        # Sequence matching; the cheap upper bounds rule out most pairs
+        # before the quadratic ratio() is computed
+        matcher = SequenceMatcher(None, text1.lower(), text2.lower())
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            return False
+        return matcher.ratio() >= threshold
 
     def validate_company_mention(self, company_name: str) -> Tuple[bool, str]:
         """
@@ -553,35 +775,15 @@ class ResumeGroundingValidator:
             return True, 1.0, "Direct match in resume"
 
         # Check fuzzy match against achievements with configurable threshold
-        for achievement in self.achievements:
-            if self._fuzzy_match(claim_lower, achievement.lower(),
+        for achievement, achievement_lower in zip(self.achievements,
+                                                  self.fact_index.achievements_lower):
+            if self._fuzzy_match(claim_lower, achievement_lower,
                                 ValidationConfig.CLAIM_MATCH_THRESHOLD):
                 return True, 0.9, f"Matches achievement: {achievement[:100]}..."
 
-        # Check if claim contains resume elements (more lenient)
-        elements_found = 0
-        total_elements = 0
-
-        # Check companies
-        for company in self.companies:
-            if len(company) > 3:  # Skip short names
-                total_elements += 1
-                if company in claim_lower:
-                    elements_found += 1
-
-        # Check skills
-        for skill in self.skills:
-            if len(skill) > 3:
-                total_elements += 1
-                if skill in claim_lower:
-                    elements_found += 1
-
-        # Check titles
-        for title in self.titles:
-            if len(title) > 3:
-                total_elements += 1
-                if title in claim_lower:
-                    elements_found += 1
+        # Check if claim contains resume elements (more lenient): companies,
+        # skills and titles longer than 3 chars, matched in one pass
+        elements_found, total_elements = self.fact_index.count_elements(claim_lower)
 
         if total_elements > 0:
             confidence = elements_found / min(total_elements, 5)  # Cap denominator
@@ -834,15 +1036,9 @@ class OutputValidator:
     def _extract_company_mention(self, text: str) -> Optional[str]:
         """Extract company name from text."""
         # Check against known companies with word boundary matching
-        text_lower = text.lower()
-        for company in ValidationConfig.KNOWN_COMPANIES:
-            # Skip companies that are too short to avoid false positives
-            if len(company) < 4:
-                continue
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(company) + r'\b'
-            if re.search(pattern, text_lower):
-                return company
+        company = get_known_company_matcher().first(text.lower(), whole_words=True)
+        if company:
+            return company
 
         # Pattern: "at [Company]" or "with [Company]"
         patterns = [
@@ -925,33 +1121,27 @@ class ChatResponseValidator:
         response_lower = response.lower()
 
         # First pass: Check for company names in response that aren't in resume
-        # Skip very short company names to avoid false positives on substrings
-        for company in ValidationConfig.KNOWN_COMPANIES:
-            # Skip companies that are too short (likely to cause false positives)
-            if len(company) < 4:
-                continue
+        # Word boundary matching (names under 4 chars skipped) avoids substring
+        # false positives: "Google" matches but "key" doesn't match "keyboard"
+        mentioned = get_known_company_matcher().find_all(response_lower, whole_words=True)
+        for company in sorted(mentioned):
+            # Check if this company is in the candidate's resume
+            if company not in self.grounding_validator.companies:
+                # Verify it's not a partial match with a resume company
+                is_partial_match = False
+                for resume_company in self.grounding_validator.companies:
+                    if company in resume_company or resume_company in company:
+                        is_partial_match = True
+                        break
 
-            # Use word boundary matching to avoid substring false positives
-            # This ensures "Google" matches but "key" doesn't match "keyboard"
-            pattern = r'\b' + re.escape(company) + r'\b'
-            if re.search(pattern, response_lower):
-                # Check if this company is in the candidate's resume
-                if company not in self.grounding_validator.companies:
-                    # Verify it's not a partial match with a resume company
-                    is_partial_match = False
-                    for resume_company in self.grounding_validator.companies:
-                        if company in resume_company or resume_company in company:
-                            is_partial_match = True
-                            break
-
-                    if not is_partial_match and ValidationConfig.BLOCK_UNKNOWN_COMPANIES:
-                        issues.append(ValidationIssue(
-                            category=ValidationCategory.FABRICATED_COMPANY,
-                            severity=ValidationSeverity.CRITICAL,
-                            field_path="chat_response",
-                            message=f"Chat response mentions '{company}' which is not in the candidate's resume",
-                            claim=f"Reference to {company}..."
-                        ))
+                if not is_partial_match and ValidationConfig.BLOCK_UNKNOWN_COMPANIES:
+                    issues.append(ValidationIssue(
+                        category=ValidationCategory.FABRICATED_COMPANY,
+                        severity=ValidationSeverity.CRITICAL,
+                        field_path="chat_response",
+                        message=f"Chat response mentions '{company}' which is not in the candidate's resume",
+                        claim=f"Reference to {company}..."
+                    ))
 
         # Second pass: Extract and validate claims
         sentences = re.split(r'[.!?]+', response)
@@ -1008,25 +1198,11 @@ class ChatResponseValidator:
 
     def _mentions_company(self, text: str) -> bool:
         """Check if text mentions any known company."""
-        text_lower = text.lower()
-        for company in ValidationConfig.KNOWN_COMPANIES:
-            if len(company) < 4:
-                continue
-            pattern = r'\b' + re.escape(company) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return self._extract_company_from_sentence(text) is not None
 
     def _extract_company_from_sentence(self, sentence: str) -> Optional[str]:
         """Extract company name from a sentence."""
-        sentence_lower = sentence.lower()
-        for company in ValidationConfig.KNOWN_COMPANIES:
-            if len(company) < 4:
-                continue
-            pattern = r'\b' + re.escape(company) + r'\b'
-            if re.search(pattern, sentence_lower):
-                return company
-        return None
+        return get_known_company_matcher().first(sentence.lower(), whole_words=True)
 
 
 # =============================================================================
@@ -1262,14 +1438,224 @@ class JSONOutputValidator:
 # Validation Logger - For review and tuning
 # =============================================================================
 
+ASYNC_VALIDATION_LOG = os.getenv("ASYNC_VALIDATION_LOG", "true").lower() == "true"
+VALIDATION_LOG_QUEUE_SIZE = int(os.getenv("VALIDATION_LOG_QUEUE_SIZE", "10000"))
+VALIDATION_LOG_BATCH_SIZE = int(os.getenv("VALIDATION_LOG_BATCH_SIZE", "200"))
+VALIDATION_LOG_MAX_BYTES = int(os.getenv("VALIDATION_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+
+
+class ValidationLogSink:
+    """
+    Background writer for the validation JSONL logs.
+
+    Callers only enqueue; a daemon thread drains the queue in batches, appends
+    each batch with one open() per file, and rotates a file once it passes
+    max_bytes (blocked_2025-01-31.jsonl -> blocked_2025-01-31.1.jsonl). Daily
+    rotation comes from the date in the file name. When the queue is full new
+    entries are dropped and counted rather than blocking the request.
+    """
+
+    def __init__(self, max_queue: int = VALIDATION_LOG_QUEUE_SIZE,
+                 batch_size: int = VALIDATION_LOG_BATCH_SIZE,
+                 max_bytes: int = VALIDATION_LOG_MAX_BYTES,
+                 background: bool = ASYNC_VALIDATION_LOG):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.background = background
+        self._queue: "queue.Queue[Tuple[str, str, Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ready_dirs: Set[str] = set()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+        self.batches = 0
+        self.rotations = 0
+
+    def submit(self, log_dir: str, filename: str, entry: Dict[str, Any]) -> bool:
+        """Queue an entry for append to log_dir/filename. Returns False if dropped."""
+        item = (log_dir, filename, entry)
+        if not self.background:
+            self._write_batch([item])
+            return True
+
+        self._ensure_started()
+        with self._lock:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending += 1
+            self.enqueued += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued entry is on disk. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread_alive():
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush outstanding entries and stop the writer thread."""
+        self.flush(timeout)
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            self._thread = None
+        self._stop.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get sink statistics for monitoring."""
+        return {
+            "background": self.background,
+            "running": self._thread_alive(),
+            "queue_depth": self._queue.qsize(),
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+            "batches": self.batches,
+            "rotations": self.rotations,
+        }
+
+    def _thread_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_started(self):
+        if self._thread_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="validation-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._idle:
+                    self._pending -= len(batch)
+                    self._idle.notify_all()
+
+    def _write_batch(self, batch: List[Tuple[str, str, Dict[str, Any]]]):
+        """Append a batch, grouped so each target file is opened once."""
+        grouped: Dict[Tuple[str, str], List[str]] = {}
+        for log_dir, filename, entry in batch:
+            try:
+                line = json.dumps(entry, default=str) + "\n"
+            except (TypeError, ValueError) as e:
+                self.write_errors += 1
+                logger.warning(f"Unserializable validation log entry for {filename}: {e}")
+                continue
+            grouped.setdefault((log_dir, filename), []).append(line)
+
+        for (log_dir, filename), lines in grouped.items():
+            try:
+                if log_dir not in self._ready_dirs:
+                    os.makedirs(log_dir, exist_ok=True)
+                    self._ready_dirs.add(log_dir)
+                path = os.path.join(log_dir, filename)
+                self._rotate_if_full(path)
+                with open(path, "a") as f:
+                    f.write("".join(lines))
+                self.written += len(lines)
+            except OSError as e:
+                self._ready_dirs.discard(log_dir)
+                self.write_errors += len(lines)
+                logger.warning(f"Failed to write {len(lines)} validation log entries to {filename}: {e}")
+        self.batches += 1
+
+    def _rotate_if_full(self, path: str):
+        try:
+            if os.path.getsize(path) < self.max_bytes:
+                return
+        except OSError:
+            return
+        stem, ext = os.path.splitext(path)
+        part = 1
+        while os.path.exists(f"{stem}.{part}{ext}"):
+            part += 1
+        os.replace(path, f"{stem}.{part}{ext}")
+        self.rotations += 1
+
+
+def _log_parts(log_dir: str, filename: str) -> List[str]:
+    """A log file's rotated parts plus the live file, oldest first."""
+    stem, ext = os.path.splitext(filename)
+    parts = []
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return parts
+    for name in names:
+        if name.startswith(stem + ".") and name.endswith(ext):
+            number = name[len(stem) + 1:-len(ext)]
+            if number.isdigit():
+                parts.append((int(number), name))
+    files = [os.path.join(log_dir, name) for _, name in sorted(parts)]
+    if filename in names:
+        files.append(os.path.join(log_dir, filename))
+    return files
+
+
+_validation_log_sink = ValidationLogSink()
+atexit.register(_validation_log_sink.close)
+
+
+def get_validation_log_sink() -> ValidationLogSink:
+    """Process-wide sink shared by ValidationLogger."""
+    return _validation_log_sink
+
+
+def flush_validation_logs(timeout: float = 5.0) -> bool:
+    """Block until queued validation log entries are written (shutdown hook)."""
+    return _validation_log_sink.flush(timeout)
+
+
+def get_validation_log_stats() -> Dict[str, Any]:
+    """Get validation log sink statistics for monitoring."""
+    return _validation_log_sink.stats()
+
+
 class ValidationLogger:
-    """Logs blocked outputs for manual review and tuning."""
+    """
+    Logs blocked outputs for manual review and tuning.
+
+    Writes go through the background ValidationLogSink, so logging never adds
+    disk latency to the request that was blocked.
+    """
 
     @staticmethod
     def _ensure_log_dir():
         """Create log directory if it doesn't exist."""
-        if not os.path.exists(ValidationConfig.LOG_DIR):
-            os.makedirs(ValidationConfig.LOG_DIR, exist_ok=True)
+        os.makedirs(ValidationConfig.LOG_DIR, exist_ok=True)
 
     @classmethod
     def log_blocked_output(cls, endpoint: str, result: ValidationResult,
@@ -1282,8 +1668,6 @@ class ValidationLogger:
         if not ValidationConfig.LOG_BLOCKED_OUTPUTS:
             return ""
 
-        cls._ensure_log_dir()
-
         timestamp = datetime.now()
         entry_id = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{id(output) % 1000000:06d}"
 
@@ -1293,55 +1677,53 @@ class ValidationLogger:
             "endpoint": endpoint,
             "validation_result": result.to_dict(),
             "output_preview": cls._truncate_output(output),
-            "resume_companies": list(ResumeGroundingValidator(resume_data).companies)[:10],
+            "resume_companies": list(get_resume_fact_index(resume_data).companies)[:10],
             "request_context": request_context or {},
         }
 
-        # Write to daily log file
-        log_file = os.path.join(
-            ValidationConfig.LOG_DIR,
-            f"blocked_{timestamp.strftime('%Y-%m-%d')}.jsonl"
-        )
-
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
-
-        logger.info(f"Logged blocked output: {entry_id}")
+        # Queue for the daily log file
+        if _validation_log_sink.submit(ValidationConfig.LOG_DIR,
+                                       f"blocked_{timestamp.strftime('%Y-%m-%d')}.jsonl",
+                                       log_entry):
+            logger.info(f"Logged blocked output: {entry_id}")
+        else:
+            logger.warning(f"Validation log queue full, dropped blocked output: {entry_id}")
         return entry_id
 
     @classmethod
     def log_override(cls, entry_id: str, reason: str) -> None:
         """Log when a blocked output is manually approved (for learning)."""
-        cls._ensure_log_dir()
-
         override_entry = {
             "entry_id": entry_id,
             "timestamp": datetime.now().isoformat(),
             "reason": reason,
         }
 
-        override_file = os.path.join(ValidationConfig.LOG_DIR, "overrides.jsonl")
-
-        with open(override_file, "a") as f:
-            f.write(json.dumps(override_entry) + "\n")
-
-        logger.info(f"Logged override for {entry_id}: {reason}")
+        if _validation_log_sink.submit(ValidationConfig.LOG_DIR, "overrides.jsonl", override_entry):
+            logger.info(f"Logged override for {entry_id}: {reason}")
+        else:
+            logger.warning(f"Validation log queue full, dropped override for {entry_id}")
 
     @classmethod
     def get_blocked_logs(cls, date: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Retrieve blocked output logs for review."""
+        _validation_log_sink.flush(timeout=1.0)
         cls._ensure_log_dir()
 
         if date:
-            log_file = os.path.join(ValidationConfig.LOG_DIR, f"blocked_{date}.jsonl")
-            files = [log_file] if os.path.exists(log_file) else []
+            dates = [date]
         else:
-            # Get all log files
-            files = sorted([
-                os.path.join(ValidationConfig.LOG_DIR, f)
+            # Every day with a live or rotated log file, newest first
+            dates = sorted({
+                f[len("blocked_"):].split(".")[0]
                 for f in os.listdir(ValidationConfig.LOG_DIR)
                 if f.startswith("blocked_") and f.endswith(".jsonl")
-            ], reverse=True)
+            }, reverse=True)
+
+        files = []
+        for day in dates:
+            # Live file first, then rotated parts from newest to oldest
+            files.extend(reversed(_log_parts(ValidationConfig.LOG_DIR, f"blocked_{day}.jsonl")))
 
         logs = []
         for log_file in files:
@@ -1362,20 +1744,22 @@ class ValidationLogger:
     @classmethod
     def get_override_stats(cls) -> Dict[str, Any]:
         """Get statistics about overrides (false positives)."""
+        _validation_log_sink.flush(timeout=1.0)
         cls._ensure_log_dir()
 
-        override_file = os.path.join(ValidationConfig.LOG_DIR, "overrides.jsonl")
-        if not os.path.exists(override_file):
+        override_files = _log_parts(ValidationConfig.LOG_DIR, "overrides.jsonl")
+        if not override_files:
             return {"total_overrides": 0, "reasons": {}}
 
         overrides = []
-        try:
-            with open(override_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        overrides.append(json.loads(line))
-        except (IOError, json.JSONDecodeError):
-            pass
+        for override_file in override_files:
+            try:
+                with open(override_file, "r") as f:
+                    for line in f:
+                        if line.strip():
+                            overrides.append(json.loads(line))
+            except (IOError, json.JSONDecodeError):
+                continue
 
         reason_counts: Dict[str, int] = {}
         for override in overrides:
@@ -10,6 +10,7 @@ CRITICAL: Market Bias and Market Climate signals NEVER modify fit_score.
 import re
 from typing import Dict, Any, List, Optional
 from .models import RealityCheck, SignalClass, Severity
+from resume_features import get_resume_features
 
 
 def detect_eligibility_signals(
@@ -907,41 +908,7 @@ def detect_company_health_signals(
 
 def _extract_resume_text(resume_data: Dict[str, Any]) -> str:
     """Extract all text from resume data for pattern matching."""
-    parts = []
-
-    # Summary/About
-    if resume_data.get("summary"):
-        parts.append(resume_data["summary"])
-
-    # Experience
-    experience = resume_data.get("experience", []) or resume_data.get("roles", [])
-    for exp in experience:
-        if isinstance(exp, dict):
-            parts.append(exp.get("title", ""))
-            parts.append(exp.get("company", ""))
-            parts.append(exp.get("description", ""))
-            highlights = exp.get("highlights", [])
-            if isinstance(highlights, list):
-                parts.extend([h for h in highlights if isinstance(h, str)])
-
-    # Skills
-    skills = resume_data.get("skills", [])
-    if isinstance(skills, list):
-        parts.extend([s for s in skills if isinstance(s, str)])
-    elif isinstance(skills, dict):
-        for category, skill_list in skills.items():
-            if isinstance(skill_list, list):
-                parts.extend([s for s in skill_list if isinstance(s, str)])
-
-    # Education
-    education = resume_data.get("education", [])
-    for edu in education:
-        if isinstance(edu, dict):
-            parts.append(edu.get("institution", ""))
-            parts.append(edu.get("degree", ""))
-            parts.append(edu.get("field", ""))
-
-    return " ".join(str(p) for p in parts if p)
+    return get_resume_features(resume_data).text
 
 
 # ============================================================================
@@ -0,0 +1,217 @@
+"""
+Render Jobs
+
+CPU-heavy document work that runs in the render pool's worker processes
+(see services/render_pool.py): WeasyPrint PDF rendering, DOCX building with the
+document_generator formatters, and PDF/DOCX text extraction.
+
+Every job takes and returns plain picklable data (dicts, str, bytes), so the
+same functions also run inline when the pool is disabled. Heavy libraries are
+imported inside the jobs, so importing this module stays cheap.
+"""
+
+import io
+import zipfile
+from typing import Any, Dict, List, Tuple
+
+
+# =============================================================================
+# PDF
+# =============================================================================
+
+def render_pdf_from_html(html_content: str) -> bytes:
+    """Render preview HTML to PDF bytes with WeasyPrint."""
+    import weasyprint
+
+    return weasyprint.HTML(string=html_content).write_pdf()
+
+
+def extract_pdf_text_plain(file_bytes: bytes) -> str:
+    """Concatenated page text of a PDF via PyMuPDF (no cleanup)."""
+    import fitz  # PyMuPDF
+
+    pdf_doc = fitz.open(stream=file_bytes, filetype="pdf")
+    text = ""
+    for page in pdf_doc:
+        text += page.get_text()
+    pdf_doc.close()
+    return text
+
+
+# =============================================================================
+# DOCX
+# =============================================================================
+
+def _docx_bytes(doc) -> bytes:
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def render_resume_docx(spec: Dict[str, Any]) -> bytes:
+    """
+    Build a formatted resume DOCX.
+
+    spec keys: name, tagline, contact_info, summary, competencies,
+    experience (list of dicts with company, title, location, dates, overview,
+    bullets), skills, education (dict with school, degree, details, or None).
+    """
+    from document_formatters import ResumeFormatter
+
+    formatter = ResumeFormatter()
+
+    formatter.add_header(
+        name=spec.get("name", ""),
+        tagline=spec.get("tagline", ""),
+        contact_info=spec.get("contact_info", {})
+    )
+
+    if spec.get("summary"):
+        formatter.add_section_header("Summary")
+        formatter.add_summary(spec["summary"])
+
+    if spec.get("competencies"):
+        formatter.add_section_header("Core Competencies")
+        formatter.add_core_competencies(spec["competencies"])
+
+    if spec.get("experience"):
+        formatter.add_section_header("Experience")
+        for job in spec["experience"]:
+            formatter.add_experience_entry(
+                company=job.get("company", ""),
+                title=job.get("title", ""),
+                location=job.get("location", ""),
+                dates=job.get("dates", ""),
+                overview=job.get("overview"),
+                bullets=job.get("bullets", [])
+            )
+
+    if spec.get("skills"):
+        formatter.add_section_header("Skills")
+        formatter.add_skills(spec["skills"])
+
+    education = spec.get("education")
+    if education:
+        formatter.add_section_header("Education")
+        formatter.add_education(
+            school=education.get("school", ""),
+            degree=education.get("degree", ""),
+            details=education.get("details")
+        )
+
+    return _docx_bytes(formatter.get_document())
+
+
+def render_cover_letter_docx(spec: Dict[str, Any]) -> bytes:
+    """
+    Build a formatted cover letter DOCX.
+
+    spec keys: name, tagline, contact_info, recipient_name, paragraphs.
+    """
+    from document_formatters import CoverLetterFormatter
+
+    formatter = CoverLetterFormatter()
+
+    formatter.add_header(
+        name=spec.get("name", ""),
+        tagline=spec.get("tagline", ""),
+        contact_info=spec.get("contact_info", {})
+    )
+    formatter.add_section_label()
+    formatter.add_salutation(recipient_name=spec.get("recipient_name"))
+    for paragraph in spec.get("paragraphs", []):
+        formatter.add_body_paragraph(paragraph)
+    formatter.add_signature(spec.get("name", ""))
+
+    return _docx_bytes(formatter.get_document())
+
+
+def create_docx_from_text(text: str, title: str):
+    """
+    Create an ATS-safe DOCX document from plain text.
+
+    CRITICAL RULES:
+    - Text-only, no templates, no restructuring
+    - Exact line-by-line reproduction of preview text
+    - No heading styles, no list styles, no formatting magic
+    - ATS-safe: Calibri font, no tables, no textboxes, no images
+    - Bullets (•) treated as plain text characters, NOT Word lists
+    """
+    from docx import Document
+    from docx.shared import Pt, Inches
+    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
+
+    doc = Document()
+
+    # Set ATS-safe margins (0.75 inches all around)
+    for section in doc.sections:
+        section.top_margin = Inches(0.75)
+        section.bottom_margin = Inches(0.75)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+
+    # Process text line by line - EXACT reproduction
+    lines = text.split('\n')
+
+    for line in lines:
+        # Preserve the line exactly (don't strip - preserve intentional spacing)
+        # But do strip for empty line detection
+        stripped = line.strip()
+
+        if not stripped:
+            # Empty line - add blank paragraph for spacing
+            p = doc.add_paragraph()
+            p.paragraph_format.space_before = Pt(0)
+            p.paragraph_format.space_after = Pt(0)
+            p.paragraph_format.line_spacing = 1.0
+            continue
+
+        # Add paragraph with the exact line content
+        p = doc.add_paragraph()
+
+        # CRITICAL: Use 'Normal' style only - no Heading, no ListParagraph
+        p.style = doc.styles['Normal']
+
+        # Reset all paragraph formatting
+        p.paragraph_format.space_before = Pt(0)
+        p.paragraph_format.space_after = Pt(0)
+        p.paragraph_format.line_spacing = 1.0
+        p.paragraph_format.left_indent = Pt(0)
+        p.paragraph_format.right_indent = Pt(0)
+        p.paragraph_format.first_line_indent = Pt(0)
+
+        # Add the text as a single run
+        run = p.add_run(stripped)
+
+        # ATS-safe font settings - consistent for ALL text
+        run.font.name = 'Calibri'
+        run.font.size = Pt(11)
+        run.bold = False
+        run.italic = False
+        run.underline = False
+
+        # Ensure Calibri is set for complex scripts too
+        r = run._element
+        rPr = r.get_or_add_rPr()
+        rFonts = OxmlElement('w:rFonts')
+        rFonts.set(qn('w:ascii'), 'Calibri')
+        rFonts.set(qn('w:hAnsi'), 'Calibri')
+        rFonts.set(qn('w:cs'), 'Calibri')
+        rFonts.set(qn('w:eastAsia'), 'Calibri')
+        rPr.insert(0, rFonts)
+
+    return doc
+
+
+def render_text_docx_zip(entries: List[Tuple[str, str, str]]) -> bytes:
+    """
+    ZIP of ATS-safe plain-text DOCX files.
+
+    entries: (arcname, text, title) per document.
+    """
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for arcname, text, title in entries:
+            zip_file.writestr(arcname, _docx_bytes(create_docx_from_text(text, title)))
+    return zip_buffer.getvalue()
@@ -135,7 +135,7 @@ async def run_amplification(
     Args:
         weak_bullets: List of weak bullet dicts
         level: Candidate level
-        call_claude_fn: Function to call Claude API
+        call_claude_fn: Async function to call Claude API
         target_role: Target role for context
         company_context: Company context for tailoring
         max_tokens: Max tokens for response
@@ -154,7 +154,7 @@ async def run_amplification(
     )
 
     try:
-        response = call_claude_fn(
+        response = await call_claude_fn(
             system_prompt=AMPLIFICATION_SYSTEM_PROMPT,
             user_message=user_prompt,
             max_tokens=max_tokens
@@ -254,7 +254,7 @@ async def amplify_with_user_input(
         original_bullet: The original bullet text
         user_context: User's answer to the Phase 2 question
         level: Candidate level
-        call_claude_fn: Function to call Claude API
+        call_claude_fn: Async function to call Claude API
 
     Returns:
         Amplification result dict
@@ -266,7 +266,7 @@ async def amplify_with_user_input(
     )
 
     try:
-        response = call_claude_fn(
+        response = await call_claude_fn(
             system_prompt="You are a resume writing expert. Return only valid JSON.",
             user_message=prompt,
             max_tokens=500
@@ -328,7 +328,7 @@ async def process_amplification_batch(
     Args:
         weak_bullets: List of weak bullet dicts
         level: Candidate level
-        call_claude_fn: Function to call Claude API
+        call_claude_fn: Async function to call Claude API
         target_role: Target role for context
 
     Returns:
@@ -0,0 +1,300 @@
+"""
+Resume Features
+
+One parse of a resume per request. The analyze pipeline used to re-flatten and
+re-parse the same resume dict in every subsystem (reality check text, the
+calibration experience text, the canonical profile, normalize_experience,
+leadership years). ResumeFeatures holds those views, computed once and keyed
+by compute_resume_hash, and every subsystem reads from it.
+
+Lookup order in get_resume_features():
+1. The request's active features (set by activate_resume_features) when the
+   caller passes the same resume dict - no hashing at all
+2. A small in-process LRU keyed by compute_resume_hash(resume_data)
+3. Build from scratch
+
+Resume dicts are treated as read-only for the lifetime of a request.
+"""
+
+import re
+import json
+import hashlib
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.cache import LRUCache
+
+
+# Features for up to this many distinct resumes stay warm across requests
+RESUME_FEATURES_CACHE_SIZE = 256
+RESUME_FEATURES_TTL_SECONDS = 900
+
+_YEAR_RE = re.compile(r'20\d{2}')
+_DURATION_YEARS_RE = re.compile(r'(\d+)\s*year')
+_DURATION_MONTHS_RE = re.compile(r'(\d+)\s*month')
+_MONTH_NAMES = ["jan", "feb", "mar", "apr", "may", "jun",
+                "jul", "aug", "sep", "oct", "nov", "dec"]
+
+
+def compute_resume_hash(resume_data: dict, jd_text: str = "") -> str:
+    """
+    Compute deterministic hash for resume + JD content.
+
+    CRITICAL FIX: Cache key MUST include BOTH resume AND JD to prevent
+    returning stale analysis for different jobs with the same resume.
+
+    Rules:
+    - Hash changes when resume OR JD changes
+    - Ignores whitespace and formatting noise
+    - Uses SHA-256 for collision resistance
+    """
+    # Convert resume dict to string, normalize whitespace
+    resume_text = json.dumps(resume_data, sort_keys=True)
+    normalized_resume = " ".join(resume_text.lower().split())
+
+    # Include JD in hash to ensure different JDs get different cache entries
+    normalized_jd = " ".join(jd_text.lower().split()) if jd_text else ""
+
+    combined = f"{normalized_resume}|||{normalized_jd}"
+    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+def parse_experience_duration(dates_str: str) -> float:
+    """
+    Parse a date range string to calculate years.
+    Handles formats like:
+    - "Jan 2022 - Present"
+    - "2020 - 2023"
+    - "June 2023 - Dec 2024"
+    - "1 year 3 months"
+    """
+    if not dates_str:
+        return 0.0
+
+    dates_str = dates_str.lower().strip()
+
+    # Check for direct duration format (e.g., "1 year 3 months")
+    year_match = _DURATION_YEARS_RE.search(dates_str)
+    month_match = _DURATION_MONTHS_RE.search(dates_str)
+    if year_match or month_match:
+        years = int(year_match.group(1)) if year_match else 0
+        months = int(month_match.group(1)) if month_match else 0
+        return years + (months / 12)
+
+    # Try to parse date range
+    # Handle "present" or "current"
+    if "present" in dates_str or "current" in dates_str:
+        end_date = datetime.now()
+    else:
+        # Try to extract end year
+        years_in_str = _YEAR_RE.findall(dates_str)
+        if len(years_in_str) >= 2:
+            end_date = datetime(int(years_in_str[-1]), 12, 1)
+        elif len(years_in_str) == 1:
+            end_date = datetime(int(years_in_str[0]), 12, 1)
+        else:
+            return 0.5  # Default to 6 months if can't parse
+
+    # Extract start year
+    years_in_str = _YEAR_RE.findall(dates_str)
+    if years_in_str:
+        start_year = int(years_in_str[0])
+        # Try to get month
+        start_month = 1
+        for i, month in enumerate(_MONTH_NAMES):
+            if month in dates_str[:20]:  # Check first part of string
+                start_month = i + 1
+                break
+
+        start_date = datetime(start_year, start_month, 1)
+        duration = (end_date - start_date).days / 365.25
+        return max(0, duration)
+
+    return 0.5  # Default
+
+
+def _parse_date_range(dates: Any) -> Dict[str, Any]:
+    """Start/end years and current flag for one role's dates string."""
+    dates_str = str(dates or "").lower()
+    years = [int(y) for y in _YEAR_RE.findall(dates_str)]
+    is_current = "present" in dates_str or "current" in dates_str
+    return {
+        "dates": dates or "",
+        "start_year": years[0] if years else None,
+        "end_year": None if is_current or not years else years[-1],
+        "is_current": is_current,
+    }
+
+
+def _normalize_experience(resume_data: Any) -> List[Dict[str, Any]]:
+    """Experience as guaranteed List[Dict] (see normalize_experience in backend.py)."""
+    if not resume_data or not isinstance(resume_data, dict):
+        return []
+
+    experience = resume_data.get("experience", [])
+
+    # String (LinkedIn free text) or anything else that isn't a list
+    if not isinstance(experience, list):
+        return []
+
+    # List but may contain non-dict items - filter to only dicts
+    return [exp for exp in experience if isinstance(exp, dict)]
+
+
+def _flatten_resume_text(resume_data: Dict[str, Any]) -> str:
+    """Extract all text from resume data for pattern matching."""
+    parts = []
+
+    # Summary/About
+    if resume_data.get("summary"):
+        parts.append(resume_data["summary"])
+
+    # Experience
+    experience = resume_data.get("experience", []) or resume_data.get("roles", [])
+    for exp in experience:
+        if isinstance(exp, dict):
+            parts.append(exp.get("title", ""))
+            parts.append(exp.get("company", ""))
+            parts.append(exp.get("description", ""))
+            highlights = exp.get("highlights", [])
+            if isinstance(highlights, list):
+                parts.extend([h for h in highlights if isinstance(h, str)])
+
+    # Skills
+    skills = resume_data.get("skills", [])
+    if isinstance(skills, list):
+        parts.extend([s for s in skills if isinstance(s, str)])
+    elif isinstance(skills, dict):
+        for category, skill_list in skills.items():
+            if isinstance(skill_list, list):
+                parts.extend([s for s in skill_list if isinstance(s, str)])
+
+    # Education
+    education = resume_data.get("education", [])
+    for edu in education:
+        if isinstance(edu, dict):
+            parts.append(edu.get("institution", ""))
+            parts.append(edu.get("degree", ""))
+            parts.append(edu.get("field", ""))
+
+    return " ".join(str(p) for p in parts if p)
+
+
+@dataclass
+class ResumeFeatures:
+    """Everything the analyze pipeline derives from a resume, parsed once."""
+    resume_hash: Optional[str]
+    experience: List[Dict[str, Any]]        # normalized List[Dict]
+    titles: List[str]
+    summary: Any
+    skills: Any
+    text: str                               # flattened full-resume text (reality check)
+    canonical_text: str                     # summary + bullets (canonical profile)
+    date_ranges: List[Dict[str, Any]]       # per role, aligned with experience
+    tenure_years: List[float]               # per role, aligned with experience
+    total_years: float
+    source: Any = field(default=None, repr=False, compare=False)
+    _memo: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def leadership_years(self) -> Optional[float]:
+        """Weighted people leadership years, once extract_people_leadership_years has run."""
+        return self._memo.get("people_leadership_years")
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Per-resume cache for values derived by other subsystems."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def is_experience_view(self, experience: Any) -> bool:
+        """True if experience is a calibration {'roles', 'summary', 'skills'} dict built from these features."""
+        return (
+            isinstance(experience, dict)
+            and experience.get("roles") is self.experience
+            and experience.get("experience", self.experience) is self.experience
+            and experience.get("summary") is self.summary
+            and experience.get("skills") is self.skills
+        )
+
+
+def build_resume_features(resume_data: Dict[str, Any], resume_hash: Optional[str] = None) -> ResumeFeatures:
+    """Parse a resume dict into ResumeFeatures (no caching)."""
+    if not isinstance(resume_data, dict):
+        resume_data = {}
+
+    experience = _normalize_experience(resume_data)
+
+    titles = []
+    bullets_text = ""
+    for role in experience:
+        if role.get("title"):
+            titles.append(role["title"])
+        bullets = role.get("bullets", []) or []
+        if isinstance(bullets, list):
+            bullets_text += " ".join(b for b in bullets if isinstance(b, str))
+
+    summary = resume_data.get("summary", "")
+    date_ranges = [_parse_date_range(role.get("dates", "")) for role in experience]
+    tenure_years = [parse_experience_duration(str(role.get("dates", "") or "")) for role in experience]
+
+    return ResumeFeatures(
+        resume_hash=resume_hash,
+        experience=experience,
+        titles=titles,
+        summary=summary,
+        skills=resume_data.get("skills", []),
+        text=_flatten_resume_text(resume_data),
+        canonical_text=f"{summary} {bullets_text}",
+        date_ranges=date_ranges,
+        tenure_years=tenure_years,
+        total_years=sum(tenure_years),
+        source=resume_data,
+    )
+
+
+_features_cache = LRUCache(max_entries=RESUME_FEATURES_CACHE_SIZE, ttl_seconds=RESUME_FEATURES_TTL_SECONDS)
+_active_features: ContextVar[Optional[ResumeFeatures]] = ContextVar("resume_features", default=None)
+
+
+def get_resume_features(resume_data: Dict[str, Any]) -> ResumeFeatures:
+    """ResumeFeatures for resume_data: the request's active features, the LRU, or a fresh parse."""
+    active = _active_features.get()
+    if active is not None and active.source is resume_data:
+        return active
+
+    try:
+        resume_hash = compute_resume_hash(resume_data)
+    except (TypeError, ValueError):
+        # Not JSON-serializable - parse without caching
+        return build_resume_features(resume_data)
+
+    features = _features_cache.get(resume_hash)
+    if features is None:
+        features = build_resume_features(resume_data, resume_hash)
+        _features_cache.set(resume_hash, features)
+    elif features.source is not resume_data:
+        # Same content, new dict (next request for this resume): share the
+        # parse and memo, re-point source so the active fast path applies
+        features = replace(features, source=resume_data)
+        _features_cache.set(resume_hash, features)
+    return features
+
+
+def activate_resume_features(resume_data: Dict[str, Any]) -> ResumeFeatures:
+    """Make resume_data's features the active ones for the rest of the current request."""
+    features = get_resume_features(resume_data)
+    _active_features.set(features)
+    return features
+
+
+def active_resume_features() -> Optional[ResumeFeatures]:
+    """Features activated for the current request, if any."""
+    return _active_features.get()
+
+
+def get_resume_features_stats() -> Dict[str, Any]:
+    """Get cache statistics for monitoring."""
+    return _features_cache.stats()
@@ -3,10 +3,34 @@
 from .claude_client import (
     call_claude,
     call_claude_streaming,
+    call_claude_async,
+    call_claude_streaming_async,
+    create_message_async,
     get_client,
+    get_async_client,
     initialize_client,
 )
 
+from .llm_cache import (
+    llm_response_cache,
+    get_llm_cache_stats,
+    clear_llm_cache,
+    CALL_SITE_TTLS,
+)
+
+from .prompt_cache import (
+    SystemPrompt,
+    format_prompt,
+    get_prompt_cache_stats,
+)
+
+from .render_pool import (
+    render_pool,
+    get_render_pool_stats,
+    RenderPoolBusy,
+    RenderTimeout,
+)
+
 from .company_intel import (
     get_company_intelligence,
     CompanyIntelligence,
@@ -2,14 +2,31 @@
 
 import os
 import time
+import random
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 import anthropic
 from fastapi import HTTPException
 
+from .llm_cache import llm_response_cache, make_cache_key, is_cacheable
+from .prompt_cache import system_param, system_text, record_prompt_cache_usage
+
 logger = logging.getLogger("henryhq")
 
-# Module-level client instance
+# Module-level client instances
 _client = None
+_async_client = None
+
+# Upper bound on concurrent in-flight Claude requests per worker process.
+# Async calls wait for a slot instead of piling onto the API (and our rate limit).
+CLAUDE_MAX_CONCURRENCY = int(os.getenv("CLAUDE_MAX_CONCURRENCY", "256"))
+
+# Status codes worth retrying: 429 (rate limit) and 529 (overloaded)
+RETRYABLE_STATUS_CODES = (429, 529)
+
+_semaphore = None
+_semaphore_loop = None
 
 
 def initialize_client(api_key: str = None, timeout: float = 120.0):
@@ -23,10 +40,24 @@ def initialize_client(api_key: str = None, timeout: float = 120.0):
         logger.warning("ANTHROPIC_API_KEY not set - Claude API calls will fail")
         return None
     _client = anthropic.Anthropic(api_key=key, timeout=timeout)
+    initialize_async_client(api_key=key, timeout=timeout)
     logger.info("Anthropic client initialized successfully")
     return _client
 
 
+def initialize_async_client(api_key: str = None, timeout: float = 120.0):
+    """Initialize the AsyncAnthropic client used by async endpoints.
+
+    Returns None if API key is not available (graceful degradation).
+    """
+    global _async_client
+    key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    if not key:
+        return None
+    _async_client = anthropic.AsyncAnthropic(api_key=key, timeout=timeout)
+    return _async_client
+
+
 def get_client() -> anthropic.Anthropic:
     """Get the initialized Anthropic client.
 
@@ -44,27 +75,108 @@ def get_client() -> anthropic.Anthropic:
     return _client
 
 
+def get_async_client() -> anthropic.AsyncAnthropic:
+    """Get the initialized AsyncAnthropic client.
+
+    Raises HTTPException if client is not initialized.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = initialize_async_client()
+    if _async_client is None:
+        raise HTTPException(
+            status_code=503,
+            detail="AI service temporarily unavailable. Please try again."
+        )
+    return _async_client
+
+
+def _backoff_delay(attempt: int, base: float = 2.0, cap: float = 30.0) -> float:
+    """Exponential backoff with jitter so retrying callers don't stampede together."""
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the concurrency semaphore for the running event loop."""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(CLAUDE_MAX_CONCURRENCY)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+@asynccontextmanager
+async def _claude_slot():
+    """Hold one of the CLAUDE_MAX_CONCURRENCY in-flight request slots."""
+    async with _get_semaphore():
+        yield
+
+
+def _record_stream_usage(stream):
+    """Record prompt-cache usage for a finished stream (best effort)."""
+    get_final_message = getattr(stream, "get_final_message", None)
+    if get_final_message is None:
+        return
+    try:
+        record_prompt_cache_usage(getattr(get_final_message(), "usage", None))
+    except Exception:
+        pass
+
+
+async def _record_stream_usage_async(stream):
+    """Async version of _record_stream_usage()."""
+    get_final_message = getattr(stream, "get_final_message", None)
+    if get_final_message is None:
+        return
+    try:
+        record_prompt_cache_usage(getattr(await get_final_message(), "usage", None))
+    except Exception:
+        pass
+
+
+def _text_cache_key(system_prompt: str, user_message: str, max_tokens: int, temperature: float, model: str) -> str:
+    return make_cache_key(
+        model=model,
+        system=system_text(system_prompt),
+        messages=[{"role": "user", "content": user_message}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
+
 def call_claude(
     system_prompt: str,
     user_message: str,
     max_tokens: int = 4096,
     max_retries: int = 3,
     temperature: float = 0,
-    model: str = "claude-sonnet-4-20250514"
+    model: str = "claude-sonnet-4-20250514",
+    cache_site: str = None
 ) -> str:
     """Call Claude API with given prompts and automatic retry for overload errors.
 
     Args:
-        system_prompt: The system prompt to use
+        system_prompt: The system prompt to use (str, or SystemPrompt to cache its static prefix)
         user_message: The user message to send
         max_tokens: Maximum tokens in response
         max_retries: Number of retry attempts for overload errors
         temperature: Controls randomness. Use 0 for deterministic scoring, higher for creative tasks.
         model: The Claude model to use
+        cache_site: Call-site name for the LLM response cache (temperature 0 only)
 
     Returns:
         The text response from Claude
     """
+    cache_key = None
+    if is_cacheable(cache_site, temperature):
+        cache_key = _text_cache_key(system_prompt, user_message, max_tokens, temperature, model)
+        cached = llm_response_cache.get(cache_key, cache_site)
+        if cached is not None:
+            print(f"⚡ LLM cache hit ({cache_site})")
+            return cached
+
     client = get_client()
 
     for attempt in range(max_retries):
@@ -74,18 +186,21 @@ def call_claude(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_prompt,
+                system=system_param(system_prompt),
                 messages=[{"role": "user", "content": user_message}]
             )
+            record_prompt_cache_usage(getattr(message, "usage", None))
             response_text = message.content[0].text
             print(f"🤖 Claude responded with {len(response_text)} chars")
+            if cache_key:
+                llm_response_cache.set(cache_key, response_text, cache_site)
             return response_text
         except anthropic.APIStatusError as e:
             # Check for overload error (529)
             if e.status_code == 529:
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 2  # 2s, 4s, 8s exponential backoff
-                    print(f"⏳ API overloaded, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                    wait_time = _backoff_delay(attempt)  # ~2s, 4s, 8s exponential backoff
+                    print(f"⏳ API overloaded, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -115,7 +230,7 @@ def call_claude_streaming(
     """Call Claude API with streaming support - yields chunks of text, with retry for overload.
 
     Args:
-        system_prompt: The system prompt to use
+        system_prompt: The system prompt to use (str, or SystemPrompt to cache its static prefix)
         user_message: The user message to send
         max_tokens: Maximum tokens in response
         max_retries: Number of retry attempts for overload errors
@@ -134,17 +249,18 @@ def call_claude_streaming(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_prompt,
+                system=system_param(system_prompt),
                 messages=[{"role": "user", "content": user_message}]
             ) as stream:
                 for text in stream.text_stream:
                     yield text
+                _record_stream_usage(stream)
             return  # Success, exit the retry loop
         except anthropic.APIStatusError as e:
             if e.status_code == 529:
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 2
-                    print(f"⏳ API overloaded, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                    wait_time = _backoff_delay(attempt)
+                    print(f"⏳ API overloaded, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -161,3 +277,178 @@ def call_claude_streaming(
             import traceback
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=f"Claude API error: {str(e)}")
+
+
+# =============================================================================
+# ASYNC CLIENT
+# Non-blocking equivalents for use inside async endpoints. Backoff uses
+# asyncio.sleep so a retrying call never stalls the rest of the worker.
+# =============================================================================
+
+async def create_message_async(retries: int = 2, cache_site: str = None, **kwargs):
+    """Call client.messages.create() on the async client with retry on transient errors.
+
+    Pass the same kwargs you would to client.messages.create(); `system` may
+    also be a SystemPrompt. Retries on 429/529 and connection errors; any
+    other API error is raised unchanged.
+
+    Args:
+        retries: Number of retries after the first attempt
+        cache_site: Call-site name for the LLM response cache (temperature 0 only)
+
+    Returns:
+        The anthropic Message object
+    """
+    cache_key = None
+    if is_cacheable(cache_site, kwargs.get("temperature")):
+        cache_key = make_cache_key(
+            model=kwargs.get("model"),
+            system=system_text(kwargs.get("system")),
+            messages=kwargs.get("messages"),
+            temperature=kwargs.get("temperature"),
+            max_tokens=kwargs.get("max_tokens"),
+        )
+        cached = await llm_response_cache.get_async(cache_key, cache_site)
+        if cached is not None:
+            return anthropic.types.Message.model_validate(cached)
+
+    if "system" in kwargs:
+        kwargs["system"] = system_param(kwargs["system"])
+
+    client = get_async_client()
+    last_error = None
+    for attempt in range(retries + 1):
+        try:
+            async with _claude_slot():
+                message = await client.messages.create(**kwargs)
+            record_prompt_cache_usage(getattr(message, "usage", None))
+            if cache_key:
+                await llm_response_cache.set_async(cache_key, message.model_dump(mode="json"), cache_site)
+            return message
+        except anthropic.APIStatusError as e:
+            last_error = e
+            status = getattr(e, "status_code", None)
+            if status in RETRYABLE_STATUS_CODES and attempt < retries:
+                wait = _backoff_delay(attempt, base=1.0)
+                logger.warning(f"Claude API {status} error (attempt {attempt + 1}/{retries + 1}), retrying in {wait:.1f}s...")
+                await asyncio.sleep(wait)
+                continue
+            raise
+        except anthropic.APIConnectionError as e:
+            last_error = e
+            if attempt < retries:
+                wait = _backoff_delay(attempt, base=1.0)
+                logger.warning(f"Claude API connection error (attempt {attempt + 1}/{retries + 1}), retrying in {wait:.1f}s...")
+                await asyncio.sleep(wait)
+                continue
+            raise
+    raise last_error
+
+
+async def call_claude_async(
+    system_prompt: str,
+    user_message: str,
+    max_tokens: int = 4096,
+    max_retries: int = 3,
+    temperature: float = 0,
+    model: str = "claude-sonnet-4-20250514",
+    cache_site: str = None
+) -> str:
+    """Async version of call_claude() - same arguments, same error contract.
+
+    Returns:
+        The text response from Claude
+    """
+    cache_key = None
+    if is_cacheable(cache_site, temperature):
+        cache_key = _text_cache_key(system_prompt, user_message, max_tokens, temperature, model)
+        cached = await llm_response_cache.get_async(cache_key, cache_site)
+        if cached is not None:
+            print(f"⚡ LLM cache hit ({cache_site})")
+            return cached
+
+    print(f"🤖 Calling Claude API... (message length: {len(user_message)} chars, max_retries={max_retries}, temp={temperature})")
+    try:
+        message = await create_message_async(
+            retries=max(max_retries - 1, 0),
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}]
+        )
+    except HTTPException:
+        raise
+    except anthropic.APIStatusError as e:
+        if e.status_code in RETRYABLE_STATUS_CODES:
+            print(f"🔥 API still overloaded after {max_retries} attempts")
+            raise HTTPException(
+                status_code=503,
+                detail="Our AI is temporarily busy. Please try again in a moment."
+            )
+        print(f"🔥 CLAUDE API ERROR: {e}")
+        raise HTTPException(status_code=500, detail=f"Claude API error: {str(e)}")
+    except Exception as e:
+        print(f"🔥 CLAUDE API ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Claude API error: {str(e)}")
+
+    response_text = message.content[0].text
+    print(f"🤖 Claude responded with {len(response_text)} chars")
+    if cache_key:
+        await llm_response_cache.set_async(cache_key, response_text, cache_site)
+    return response_text
+
+
+async def call_claude_streaming_async(
+    system_prompt: str,
+    user_message: str,
+    max_tokens: int = 4096,
+    max_retries: int = 3,
+    temperature: float = 0,
+    model: str = "claude-sonnet-4-20250514"
+):
+    """Async version of call_claude_streaming() - yields chunks of text.
+
+    Retries only happen before the first chunk is yielded; once text has been
+    sent downstream a failure is raised rather than replaying the response.
+    """
+    client = get_async_client()
+
+    for attempt in range(max_retries):
+        started = False
+        try:
+            print(f"🤖 Calling Claude API (streaming)... (message length: {len(user_message)} chars, attempt {attempt + 1}/{max_retries}, temp={temperature})")
+            async with _claude_slot():
+                async with client.messages.stream(
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system_param(system_prompt),
+                    messages=[{"role": "user", "content": user_message}]
+                ) as stream:
+                    async for text in stream.text_stream:
+                        started = True
+                        yield text
+                    await _record_stream_usage_async(stream)
+            return  # Success, exit the retry loop
+        except anthropic.APIStatusError as e:
+            if e.status_code in RETRYABLE_STATUS_CODES and not started:
+                if attempt < max_retries - 1:
+                    wait_time = _backoff_delay(attempt)
+                    print(f"⏳ API overloaded, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                print(f"🔥 API still overloaded after {max_retries} attempts")
+                raise HTTPException(
+                    status_code=503,
+                    detail="Our AI is temporarily busy. Please try again in a moment."
+                )
+            print(f"🔥 CLAUDE API ERROR: {e}")
+            raise HTTPException(status_code=500, detail=f"Claude API error: {str(e)}")
+        except Exception as e:
+            print(f"🔥 CLAUDE API ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=f"Claude API error: {str(e)}")
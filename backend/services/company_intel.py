@@ -24,11 +24,17 @@ from enum import Enum
 import anthropic
 from fastapi import HTTPException
 
+from utils.cache import TTLCache
+
 logger = logging.getLogger("henryhq.company_intel")
 
 # In-memory cache for company intelligence (24-hour TTL)
-_company_intel_cache: Dict[str, tuple] = {}  # {cache_key: (CompanyIntelligence, expiry_datetime)}
 CACHE_TTL_HOURS = 24
+_company_intel_cache = TTLCache(
+    "company_intel",
+    max_entries=int(os.getenv("COMPANY_INTEL_CACHE_MAX_ENTRIES", "2000")),
+    ttl_seconds=CACHE_TTL_HOURS * 3600,
+)
 
 
 class HealthSignal(str, Enum):
@@ -137,26 +143,16 @@ def _get_cache_key(company_name: str) -> str:
 
 def _get_cached_intel(company_name: str) -> Optional[CompanyIntelligence]:
     """Get cached company intelligence if not expired."""
-    cache_key = _get_cache_key(company_name)
-
-    if cache_key in _company_intel_cache:
-        intel, expiry = _company_intel_cache[cache_key]
-        if datetime.now() < expiry:
-            logger.info(f"Cache hit for company: {company_name}")
-            return intel
-        else:
-            # Expired, remove from cache
-            del _company_intel_cache[cache_key]
-            logger.info(f"Cache expired for company: {company_name}")
-
-    return None
+    intel = _company_intel_cache.get(_get_cache_key(company_name))
+    if intel is not None:
+        logger.info(f"Cache hit for company: {company_name}")
+    return intel
 
 
 def _cache_intel(company_name: str, intel: CompanyIntelligence):
     """Cache company intelligence with TTL."""
-    cache_key = _get_cache_key(company_name)
+    _company_intel_cache.set(_get_cache_key(company_name), intel)
     expiry = datetime.now() + timedelta(hours=CACHE_TTL_HOURS)
-    _company_intel_cache[cache_key] = (intel, expiry)
     logger.info(f"Cached company intel for: {company_name}, expires: {expiry}")
 
 
@@ -543,22 +539,23 @@ def _create_error_intel(company_name: str, error_message: str) -> CompanyIntelli
 
 def clear_company_intel_cache():
     """Clear all cached company intelligence. Useful for testing."""
-    global _company_intel_cache
-    _company_intel_cache = {}
+    _company_intel_cache.clear()
     logger.info("Company intelligence cache cleared")
 
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics for monitoring."""
-    now = datetime.now()
-    active_entries = sum(1 for _, (_, expiry) in _company_intel_cache.items() if now < expiry)
-    expired_entries = len(_company_intel_cache) - active_entries
-
+    stats = _company_intel_cache.stats()
     return {
-        "total_entries": len(_company_intel_cache),
-        "active_entries": active_entries,
-        "expired_entries": expired_entries,
+        "total_entries": stats["entries"],
+        "active_entries": stats["entries"] - stats["expired_entries"],
+        "expired_entries": stats["expired_entries"],
         "cache_ttl_hours": CACHE_TTL_HOURS,
+        "max_entries": stats["max_entries"],
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "evictions": stats["evictions"],
+        "hit_rate": stats["hit_rate"],
     }
 
 
@@ -567,8 +564,12 @@ def get_cache_stats() -> Dict[str, Any]:
 # =============================================================================
 
 # Cache for company scale lookups (separate from full intel cache)
-_company_scale_cache: Dict[str, tuple] = {}  # {company_name: (scale_info, expiry_datetime)}
 SCALE_CACHE_TTL_HOURS = 168  # 7 days - scale doesn't change often
+_company_scale_cache = TTLCache(
+    "company_scale",
+    max_entries=int(os.getenv("COMPANY_SCALE_CACHE_MAX_ENTRIES", "5000")),
+    ttl_seconds=SCALE_CACHE_TTL_HOURS * 3600,
+)
 
 
 @dataclass
@@ -782,19 +783,17 @@ def get_company_scale(company_name: str) -> CompanyScale:
 
     # Check cache
     cache_key = hashlib.md5(normalized.encode()).hexdigest()
-    if cache_key in _company_scale_cache:
-        scale_info, expiry = _company_scale_cache[cache_key]
-        if datetime.now() < expiry:
-            logger.info(f"Company scale lookup (cached): {company_name} -> {scale_info.scale}")
-            return scale_info
+    scale_info = _company_scale_cache.get(cache_key)
+    if scale_info is not None:
+        logger.info(f"Company scale lookup (cached): {company_name} -> {scale_info.scale}")
+        return scale_info
 
     # Heuristic-based detection for unknown companies
     # This avoids expensive API calls for every company
     scale_info = _infer_company_scale_heuristic(company_name)
 
     # Cache the result
-    expiry = datetime.now() + timedelta(hours=SCALE_CACHE_TTL_HOURS)
-    _company_scale_cache[cache_key] = (scale_info, expiry)
+    _company_scale_cache.set(cache_key, scale_info)
 
     logger.info(f"Company scale lookup (heuristic): {company_name} -> {scale_info.scale}")
     return scale_info
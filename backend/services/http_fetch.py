@@ -0,0 +1,133 @@
+"""Pooled async HTTP fetching for third-party job APIs
+
+Job discovery used blocking requests.get() calls, each on a new connection,
+run one after another from an async endpoint. fetch_json() goes through one
+shared httpx.AsyncClient (keep-alive pool, so repeat calls to the same host
+skip the TCP/TLS handshake) and a token bucket per provider, so callers can
+fire every query at once with asyncio.gather() and still stay inside each
+provider's rate limit: requests run concurrently up to the bucket's burst
+and are spaced at its refill rate after that.
+
+Provider limits (requests/second and burst) come from env:
+  JSEARCH_RATE_PER_SEC / JSEARCH_BURST   (default 5 / 5)
+  INDEED_RATE_PER_SEC  / INDEED_BURST    (default 2 / 2)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger("henryhq")
+
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "20"))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "10"))
+HTTP_DEFAULT_TIMEOUT = 15.0
+
+PROVIDER_RATE_LIMITS = {
+    "jsearch": (
+        float(os.getenv("JSEARCH_RATE_PER_SEC", "5")),
+        int(os.getenv("JSEARCH_BURST", "5")),
+    ),
+    "indeed": (
+        float(os.getenv("INDEED_RATE_PER_SEC", "2")),
+        int(os.getenv("INDEED_BURST", "2")),
+    ),
+}
+
+
+class TokenBucket:
+    """Async token bucket: `capacity` requests at once, refilled at `rate` per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._get_lock():
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_client: Optional[httpx.AsyncClient] = None
+_client_loop = None
+
+
+def get_rate_limiter(provider: str) -> TokenBucket:
+    """Get the shared token bucket for a provider."""
+    bucket = _buckets.get(provider)
+    if bucket is None:
+        rate, burst = PROVIDER_RATE_LIMITS.get(provider, (5.0, 5))
+        bucket = _buckets[provider] = TokenBucket(rate, burst)
+    return bucket
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=HTTP_DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client (app shutdown)."""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+async def fetch_json(
+    provider: str,
+    url: str,
+    headers: Dict[str, str] = None,
+    params: Dict[str, Any] = None,
+    timeout: float = HTTP_DEFAULT_TIMEOUT,
+) -> Any:
+    """
+    GET a JSON endpoint through the shared pool, within the provider's rate limit.
+
+    Raises:
+        httpx.TimeoutException: request timed out
+        httpx.HTTPStatusError: non-2xx response
+        httpx.RequestError: connection failure
+    """
+    await get_rate_limiter(provider).acquire()
+    response = await get_http_client().get(url, headers=headers, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
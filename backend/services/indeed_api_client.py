@@ -11,9 +11,12 @@ Environment variables:
 import os
 import re
 import logging
-import requests
 from typing import Optional, List, Dict, Any
 
+import httpx
+
+from .http_fetch import fetch_json
+
 logger = logging.getLogger("henryhq.indeed_api_client")
 
 # Indeed API on RapidAPI
@@ -26,7 +29,7 @@ def get_api_key() -> Optional[str]:
     return os.getenv("RAPIDAPI_KEY_INDEED") or os.getenv("RAPIDAPI_KEY_JSEARCH") or os.getenv("RAPIDAPI_KEY")
 
 
-def search_indeed_jobs(
+async def search_indeed_jobs(
     query: str,
     location: str = "",
     country_code: str = "US",
@@ -64,14 +67,13 @@ def search_indeed_jobs(
     logger.info(f"Indeed API search: query='{query}', location='{location}'")
 
     try:
-        response = requests.get(
+        data = await fetch_json(
+            "indeed",
             INDEED_SEARCH_URL,
             headers=headers,
             params=params,
             timeout=15,
         )
-        response.raise_for_status()
-        data = response.json()
 
         # The Indeed12 API returns results in various formats
         # Try to extract the jobs array
@@ -94,10 +96,10 @@ def search_indeed_jobs(
 
         return normalized[:15]
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         logger.error("Indeed API timeout")
         raise
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         logger.error(f"Indeed API HTTP error: {e}")
         # If 403/429, the key might not have Indeed access — fail gracefully
         if e.response.status_code in (403, 429):
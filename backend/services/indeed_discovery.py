@@ -4,13 +4,18 @@ Fetches job listings from Indeed via the Indeed MCP search_jobs endpoint.
 Normalizes results to the same format as JSearch for unified scoring.
 """
 
+import asyncio
 import re
 import time
 import hashlib
 import logging
-import requests
+from functools import partial
 from typing import Optional, List, Dict, Any
 
+from utils.cache import TTLCache, STALE
+from .job_discovery import JOB_CACHE_MAX_ENTRIES, JOB_CACHE_MAX_BYTES, JOB_CACHE_STALE_SECONDS
+from .job_index import get_job_index
+
 logger = logging.getLogger("henryhq.indeed_discovery")
 
 # Cache TTL: 12 hours (same as JSearch)
@@ -21,14 +26,21 @@ class IndeedDiscoveryService:
     """Fetches and caches job listings from Indeed API (via MCP search_jobs endpoint)."""
 
     def __init__(self):
-        self._cache: Dict[str, tuple] = {}  # {cache_key: (timestamp, results)}
-
-    def search_jobs(
+        self._cache = TTLCache(
+            "indeed_discovery",
+            max_entries=JOB_CACHE_MAX_ENTRIES,
+            max_bytes=JOB_CACHE_MAX_BYTES,
+            ttl_seconds=CACHE_TTL_SECONDS,
+            stale_seconds=JOB_CACHE_STALE_SECONDS,
+        )
+
+    async def search_jobs(
         self,
         query: str,
         location: str = "",
         country_code: str = "US",
         job_type: str = None,
+        bypass_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Search for jobs via Indeed search_jobs MCP endpoint.
@@ -36,7 +48,8 @@ class IndeedDiscoveryService:
         This calls the local MCP-based Indeed tool. In production,
         this would be an HTTP call to the Indeed API wrapper.
 
-        Returns normalized results matching JSearch format.
+        Returns normalized results matching JSearch format. A stale cached
+        result is returned immediately and refreshed in the background.
         """
         cache_key = self._get_cache_key({
             "query": query,
@@ -45,19 +58,24 @@ class IndeedDiscoveryService:
             "job_type": job_type or "",
         })
 
-        cached = self._get_cached(cache_key)
-        if cached:
-            logger.info(f"Indeed cache hit for key {cache_key[:8]}")
-            cached["cached"] = True
-            return cached
+        if not bypass_cache:
+            cached, state = self._cache.lookup(cache_key)
+            if cached:
+                logger.info(f"Indeed cache hit for key {cache_key[:8]} ({state})")
+                if state == STALE:
+                    self._cache.refresh(cache_key, partial(
+                        self._refresh_jobs, query, location, country_code, job_type
+                    ))
+                cached["cached"] = True
+                return cached
 
         try:
             # Call Indeed API via the available endpoint
             # The Indeed integration uses a wrapper that returns markdown-formatted results
             logger.info(f"Searching Indeed: query='{query}', location='{location}'")
 
-            from backend.services.indeed_api_client import search_indeed_jobs
-            raw_results = search_indeed_jobs(
+            from .indeed_api_client import search_indeed_jobs
+            raw_results = await search_indeed_jobs(
                 query=query,
                 location=location,
                 country_code=country_code,
@@ -66,6 +84,13 @@ class IndeedDiscoveryService:
 
             jobs = self._normalize_results(raw_results)
 
+            index = get_job_index()
+            if index is not None:
+                try:
+                    await asyncio.to_thread(index.upsert_jobs, jobs, "indeed")
+                except Exception as e:
+                    logger.warning(f"Job index update failed: {e}")
+
             result = {
                 "jobs": jobs,
                 "total_found": len(jobs),
@@ -75,7 +100,7 @@ class IndeedDiscoveryService:
                 "source": "indeed",
             }
 
-            self._set_cache(cache_key, result)
+            self._cache.set(cache_key, result)
             return result
 
         except ImportError:
@@ -99,6 +124,11 @@ class IndeedDiscoveryService:
                 "error": f"Indeed search failed: {str(e)}",
             }
 
+    async def _refresh_jobs(self, query: str, location: str, country_code: str, job_type: str) -> Optional[Dict]:
+        """Background reload for a stale entry (None keeps the stale result on error)."""
+        result = await self.search_jobs(query, location, country_code, job_type, bypass_cache=True)
+        return None if result.get("error") else result
+
     def _normalize_results(self, raw_results: List[Dict]) -> List[Dict[str, Any]]:
         """
         Normalize Indeed API response to match JSearch standard format.
@@ -244,20 +274,6 @@ class IndeedDiscoveryService:
         param_str = str(sorted(params.items()))
         return hashlib.md5(param_str.encode()).hexdigest()
 
-    def _get_cached(self, cache_key: str) -> Optional[Dict]:
-        """Return cached results if valid, None otherwise."""
-        if cache_key in self._cache:
-            timestamp, results = self._cache[cache_key]
-            if time.time() - timestamp < CACHE_TTL_SECONDS:
-                return results
-            else:
-                del self._cache[cache_key]
-        return None
-
-    def _set_cache(self, cache_key: str, results: Dict):
-        """Store results in cache."""
-        self._cache[cache_key] = (time.time(), results)
-
 
 def merge_and_deduplicate(
     jsearch_jobs: List[Dict],
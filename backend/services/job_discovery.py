@@ -7,17 +7,33 @@ Supports multi-query strategy for better alignment.
 
 import os
 import time
+import asyncio
 import hashlib
 import logging
-import requests
-from typing import Optional, List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Optional, List, Dict, Any, Union
+
+import httpx
+
+from utils.cache import TTLCache, STALE
+from .http_fetch import fetch_json
+from .linkedin_network import CompanyNetworkIndex
+from .job_index import (
+    get_job_index, job_fingerprint, split_query, delta_date_posted,
+    JOB_INDEX_FRESH_SECONDS, JOB_INDEX_MIN_RESULTS,
+)
 
 logger = logging.getLogger("henryhq.job_discovery")
 
 # Cache TTL: 12 hours (jobs go stale quickly)
 CACHE_TTL_SECONDS = 43200
 
+# Cache bounds; expired results are served for up to JOB_CACHE_STALE_SECONDS
+# while a background refresh runs
+JOB_CACHE_MAX_ENTRIES = int(os.getenv("JOB_CACHE_MAX_ENTRIES", "500"))
+JOB_CACHE_MAX_BYTES = int(os.getenv("JOB_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+JOB_CACHE_STALE_SECONDS = int(os.getenv("JOB_CACHE_STALE_SECONDS", "3600"))
+
 # Function area to readable search term mapping
 FUNCTION_AREA_MAP = {
     'product_management': 'Product Manager',
@@ -41,7 +57,13 @@ class JobDiscoveryService:
 
     def __init__(self):
         self.api_key = os.getenv("RAPIDAPI_KEY_JSEARCH") or os.getenv("RAPIDAPI_KEY")
-        self._cache: Dict[str, tuple] = {}  # {cache_key: (timestamp, results)}
+        self._cache = TTLCache(
+            "job_discovery",
+            max_entries=JOB_CACHE_MAX_ENTRIES,
+            max_bytes=JOB_CACHE_MAX_BYTES,
+            ttl_seconds=CACHE_TTL_SECONDS,
+            stale_seconds=JOB_CACHE_STALE_SECONDS,
+        )
 
     @property
     def is_configured(self) -> bool:
@@ -238,7 +260,7 @@ class JobDiscoveryService:
         logger.info(f"Built {len(queries)} search queries: {[q['query'] for q in queries]}")
         return queries
 
-    def search_multi_query(
+    async def search_multi_query(
         self,
         query_params_list: List[Dict[str, Any]],
         excluded_companies: List[str] = None,
@@ -247,6 +269,9 @@ class JobDiscoveryService:
         """
         Execute multiple search queries and merge/deduplicate results.
 
+        Queries run concurrently (paced by the JSearch rate limiter) and are
+        merged in query order, so the primary query's jobs come first.
+
         Returns a single result dict with merged, deduplicated jobs.
         """
         if not self.is_configured:
@@ -260,20 +285,38 @@ class JobDiscoveryService:
 
         # Check if we have a cached result for the combined query set
         combined_key = self._get_cache_key({"queries": str(query_params_list)})
-        cached = self._get_cached(combined_key)
+        cached, state = self._cache.lookup(combined_key)
         if cached:
-            logger.info(f"Multi-query cache hit for key {combined_key[:8]}")
+            logger.info(f"Multi-query cache hit for key {combined_key[:8]} ({state})")
+            if state == STALE:
+                self._cache.refresh(combined_key, partial(
+                    self._run_multi_query, query_params_list, excluded_companies, max_results, bypass_cache=True
+                ))
             cached["cached"] = True
             return cached
 
+        result = await self._run_multi_query(query_params_list, excluded_companies, max_results)
+        self._cache.set(combined_key, result)
+        return result
+
+    async def _run_multi_query(
+        self,
+        query_params_list: List[Dict[str, Any]],
+        excluded_companies: List[str],
+        max_results: int,
+        bypass_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Run the queries and merge their results (no combined-result caching)."""
         all_jobs = []
         seen_job_ids = set()
         queries_executed = []
         total_found = 0
 
-        # Execute queries sequentially (JSearch rate limits are tight)
-        for params in query_params_list:
-            result = self.search_jobs(params, excluded_companies)
+        results = await asyncio.gather(
+            *(self.search_jobs(params, excluded_companies, bypass_cache=bypass_cache) for params in query_params_list)
+        )
+
+        for params, result in zip(query_params_list, results):
             queries_executed.append(params.get("query", ""))
 
             if result.get("error"):
@@ -291,7 +334,7 @@ class JobDiscoveryService:
         # Limit total results
         all_jobs = all_jobs[:max_results]
 
-        result = {
+        return {
             "jobs": all_jobs,
             "total_found": total_found,
             "search_queries": queries_executed,
@@ -301,37 +344,25 @@ class JobDiscoveryService:
             "queries_executed": len(queries_executed),
         }
 
-        self._set_cache(combined_key, result)
-        return result
-
     def _get_cache_key(self, params: Dict[str, Any]) -> str:
         """Generate a deterministic cache key from search params."""
         param_str = str(sorted(params.items()))
         return hashlib.md5(param_str.encode()).hexdigest()
 
-    def _get_cached(self, cache_key: str) -> Optional[Dict]:
-        """Return cached results if valid, None otherwise."""
-        if cache_key in self._cache:
-            timestamp, results = self._cache[cache_key]
-            if time.time() - timestamp < CACHE_TTL_SECONDS:
-                return results
-            else:
-                del self._cache[cache_key]
-        return None
-
-    def _set_cache(self, cache_key: str, results: Dict):
-        """Store results in cache."""
-        self._cache[cache_key] = (time.time(), results)
-
-    def search_jobs(
+    async def search_jobs(
         self,
         params: Dict[str, Any],
         excluded_companies: List[str] = None,
+        bypass_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Search for jobs via JSearch API.
 
-        Returns normalized results with caching.
+        Returns normalized results with caching. A stale cached result is
+        returned immediately and refreshed in the background.
+
+        Queries fetched recently are answered from the local job index; older
+        ones fetch only listings posted since the last fetch (see job_index).
         """
         if not self.is_configured:
             logger.warning("RAPIDAPI_KEY_JSEARCH not configured - job discovery unavailable")
@@ -344,11 +375,37 @@ class JobDiscoveryService:
             }
 
         cache_key = self._get_cache_key(params)
-        cached = self._get_cached(cache_key)
-        if cached:
-            logger.info(f"Job discovery cache hit for key {cache_key[:8]}")
-            cached["cached"] = True
-            return cached
+        if not bypass_cache:
+            cached, state = self._cache.lookup(cache_key)
+            if cached:
+                logger.info(f"Job discovery cache hit for key {cache_key[:8]} ({state})")
+                if state == STALE:
+                    self._cache.refresh(cache_key, partial(self._refresh_jobs, params, excluded_companies))
+                cached["cached"] = True
+                return cached
+
+        index = get_job_index()
+        fetched_at = await asyncio.to_thread(index.last_fetched, cache_key) if index is not None else None
+        if fetched_at and not bypass_cache and time.time() - fetched_at < JOB_INDEX_FRESH_SECONDS:
+            local_jobs = await self._search_index(params, cache_key, excluded_companies)
+            if len(local_jobs) >= JOB_INDEX_MIN_RESULTS:
+                logger.info(f"Job index answered '{params.get('query')}' locally ({len(local_jobs)} jobs)")
+                index.record("local_answers")
+                result = {
+                    "jobs": local_jobs,
+                    "total_found": len(local_jobs),
+                    "search_query": params.get("query", ""),
+                    "cached": True,
+                    "cache_expires_at": time.time() + CACHE_TTL_SECONDS,
+                }
+                self._cache.set(cache_key, result)
+                return result
+
+        # Only ask the provider for listings posted since the last fetch
+        fetch_params = params
+        delta_window = delta_date_posted(time.time() - fetched_at) if fetched_at else None
+        if delta_window and delta_window != params.get("date_posted") and params.get("date_posted", "all") in ("all", "month"):
+            fetch_params = {**params, "date_posted": delta_window}
 
         try:
             headers = {
@@ -357,30 +414,43 @@ class JobDiscoveryService:
             }
 
             logger.info(f"Fetching jobs from JSearch: query='{params.get('query')}'")
-            response = requests.get(
+            data = await fetch_json(
+                "jsearch",
                 self.JSEARCH_BASE_URL,
                 headers=headers,
-                params=params,
+                params=fetch_params,
                 timeout=15,
             )
-            response.raise_for_status()
-            data = response.json()
 
             # Normalize results
             jobs = self._normalize_results(data, excluded_companies)
+            total_found = data.get("total", len(jobs))
+
+            if index is not None:
+                try:
+                    await asyncio.to_thread(index.upsert_jobs, jobs, "jsearch", cache_key)
+                    await asyncio.to_thread(index.mark_fetched, cache_key)
+                    if fetch_params is not params:
+                        # Delta fetch: new listings first, then what we already had
+                        index.record("delta_fetches")
+                        indexed = await self._search_index(params, cache_key, excluded_companies)
+                        jobs = self._merge_indexed(jobs, indexed)
+                        total_found = len(jobs)
+                except Exception as e:
+                    logger.warning(f"Job index update failed: {e}")
 
             result = {
                 "jobs": jobs,
-                "total_found": data.get("total", len(jobs)),
+                "total_found": total_found,
                 "search_query": params.get("query", ""),
                 "cached": False,
                 "cache_expires_at": time.time() + CACHE_TTL_SECONDS,
             }
 
-            self._set_cache(cache_key, result)
+            self._cache.set(cache_key, result)
             return result
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error("JSearch API timeout")
             return {
                 "jobs": [],
@@ -389,7 +459,7 @@ class JobDiscoveryService:
                 "cached": False,
                 "error": "Job search timed out. Please try again.",
             }
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"JSearch API HTTP error: {e}")
             return {
                 "jobs": [],
@@ -408,6 +478,40 @@ class JobDiscoveryService:
                 "error": "Job search temporarily unavailable.",
             }
 
+    async def _search_index(
+        self, params: Dict[str, Any], cache_key: str, excluded_companies: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Look up a JSearch query in the local job index (among the listings it fetched)."""
+        role, location = split_query(params.get("query", ""))
+        try:
+            return await asyncio.to_thread(
+                get_job_index().search,
+                role,
+                location=location,
+                remote_only=params.get("remote_jobs_only") == "true",
+                excluded_companies=excluded_companies,
+                query_key=cache_key,
+            )
+        except Exception as e:
+            logger.warning(f"Job index search failed: {e}")
+            return []
+
+    @staticmethod
+    def _merge_indexed(new_jobs: List[Dict], indexed_jobs: List[Dict], limit: int = 15) -> List[Dict]:
+        seen = {job_fingerprint(job) for job in new_jobs}
+        merged = list(new_jobs)
+        for job in indexed_jobs:
+            fingerprint = job_fingerprint(job)
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                merged.append(job)
+        return merged[:limit]
+
+    async def _refresh_jobs(self, params: Dict[str, Any], excluded_companies: List[str]) -> Optional[Dict]:
+        """Background reload for a stale entry (None keeps the stale result on error)."""
+        result = await self.search_jobs(params, excluded_companies, bypass_cache=True)
+        return None if result.get("error") else result
+
     def _normalize_results(
         self, raw_data: Dict, excluded_companies: List[str] = None
     ) -> List[Dict[str, Any]]:
@@ -499,33 +603,28 @@ class JobDiscoveryService:
         return clean[:max_len].rsplit(" ", 1)[0] + "..."
 
     def flag_network_companies(
-        self, jobs: List[Dict], network_companies: List[str]
+        self, jobs: List[Dict], network_companies: Union[List[str], CompanyNetworkIndex]
     ) -> List[Dict]:
         """
         Cross-reference job results with the candidate's LinkedIn network.
         Flags jobs where the candidate has connections at the company.
+
+        network_companies is a list of company names or a prebuilt
+        CompanyNetworkIndex (exact or whole-word match in either direction).
         """
         if not network_companies:
             return jobs
 
-        # Normalize network company names for matching
-        network_lower = {}
-        for company in network_companies:
-            normalized = company.lower().strip()
-            network_lower[normalized] = network_lower.get(normalized, 0) + 1
+        if isinstance(network_companies, CompanyNetworkIndex):
+            network_index = network_companies
+        else:
+            network_index = CompanyNetworkIndex.from_companies(network_companies)
 
         for job in jobs:
-            company_lower = job["company"].lower().strip()
-            # Check for exact match or substring match
-            for net_company, count in network_lower.items():
-                if (
-                    net_company == company_lower
-                    or net_company in company_lower
-                    or company_lower in net_company
-                ):
-                    job["network_connection"] = True
-                    job["network_connection_count"] = count
-                    break
+            match = network_index.best_match(job["company"])
+            if match:
+                job["network_connection"] = True
+                job["network_connection_count"] = match["count"]
 
         # Sort: network connections first, then by posted date
         jobs.sort(
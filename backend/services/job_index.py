@@ -0,0 +1,353 @@
+"""Local full-text index of discovered job listings
+
+Every normalized listing that comes back from JSearch or Indeed is upserted into
+an embedded SQLite database with an FTS5 index over title, company, location
+and description. Listings are keyed by a fingerprint of (company, title, city),
+so the same posting seen by both providers, or by several queries, is one row.
+
+Discovery uses the index two ways:
+- A query fetched from the provider within JOB_INDEX_FRESH_SECONDS is answered
+  locally (milliseconds, no API call) when the index has enough matches.
+  Local answers only come from the listings that query itself fetched
+  (query_jobs), so provider-side filters such as employment type, experience
+  or posting date still hold and other queries' or providers' rows don't
+  leak in.
+- An older query only fetches the delta: the provider's date_posted filter is
+  narrowed to the time since the last fetch, and the new listings are merged
+  with the indexed ones.
+
+Listings whose posting date (from days_since_posted, or first-seen when the
+provider gives none) is older than JOB_INDEX_MAX_AGE_DAYS are aged out.
+
+Set JOB_INDEX_PATH to a file to share the index across workers and restarts;
+the default is a per-process in-memory database. ENABLE_JOB_INDEX=false turns
+it off.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("henryhq.job_index")
+
+ENABLE_JOB_INDEX = os.getenv("ENABLE_JOB_INDEX", "true").lower() == "true"
+JOB_INDEX_PATH = os.getenv("JOB_INDEX_PATH", ":memory:")
+JOB_INDEX_FRESH_SECONDS = int(os.getenv("JOB_INDEX_FRESH_SECONDS", str(6 * 3600)))
+JOB_INDEX_MAX_AGE_DAYS = int(os.getenv("JOB_INDEX_MAX_AGE_DAYS", "30"))
+JOB_INDEX_MIN_RESULTS = int(os.getenv("JOB_INDEX_MIN_RESULTS", "5"))
+JOB_INDEX_PRUNE_INTERVAL_SECONDS = 3600
+
+DAY_SECONDS = 86400
+
+# Words in a provider query that say nothing about the role
+_QUERY_STOPWORDS = {"the", "a", "an", "of", "in", "at", "for", "and", "or", "to", "with", "jobs", "job"}
+_TOKEN_RE = re.compile(r"\w+")
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    " fingerprint TEXT PRIMARY KEY,"
+    " source TEXT,"
+    " title TEXT NOT NULL,"
+    " company TEXT NOT NULL,"
+    " location TEXT,"
+    " description TEXT,"
+    " is_remote INTEGER NOT NULL DEFAULT 0,"
+    " posted_at REAL,"
+    " first_seen REAL NOT NULL,"
+    " last_seen REAL NOT NULL,"
+    " data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS jobs_age ON jobs (coalesce(posted_at, first_seen))",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    " title, company, location, description, content='jobs', tokenize='unicode61')",
+    # Keep the external-content FTS table in step with jobs
+    "CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN"
+    " INSERT INTO jobs_fts (rowid, title, company, location, description)"
+    " VALUES (new.rowid, new.title, new.company, new.location, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)"
+    " VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)"
+    " VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);"
+    " INSERT INTO jobs_fts (rowid, title, company, location, description)"
+    " VALUES (new.rowid, new.title, new.company, new.location, new.description); END",
+    "CREATE TABLE IF NOT EXISTS query_log ("
+    " query_key TEXT PRIMARY KEY,"
+    " fetched_at REAL NOT NULL)",
+    # Which listings each provider query returned
+    "CREATE TABLE IF NOT EXISTS query_jobs ("
+    " query_key TEXT NOT NULL,"
+    " fingerprint TEXT NOT NULL,"
+    " PRIMARY KEY (query_key, fingerprint)) WITHOUT ROWID",
+]
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join(_TOKEN_RE.findall((text or "").lower()))
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """Stable key for a listing across providers and queries: company, title and city."""
+    city = (job.get("location") or "").split(",")[0].replace("(Remote)", "")
+    key = "|".join((_normalize(job.get("company")), _normalize(job.get("title")), _normalize(city)))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def split_query(query: str) -> Tuple[str, str]:
+    """Split a provider query like "Senior PM in Austin, TX" into (role text, location)."""
+    role, sep, location = (query or "").rpartition(" in ")
+    if not sep:
+        return query or "", ""
+    return role, location.strip()
+
+
+def delta_date_posted(seconds_since_fetch: float) -> Optional[str]:
+    """Narrowest JSearch date_posted window covering the time since the last fetch.
+
+    "week" is skipped: JSearch's week filter is unreliable (see job_discovery).
+    """
+    if seconds_since_fetch <= DAY_SECONDS:
+        return "today"
+    if seconds_since_fetch <= 3 * DAY_SECONDS:
+        return "3days"
+    if seconds_since_fetch <= 30 * DAY_SECONDS:
+        return "month"
+    return None
+
+
+class JobIndex:
+    """SQLite + FTS5 store of normalized job listings with incremental upserts."""
+
+    def __init__(self, path: str = JOB_INDEX_PATH, max_age_days: int = JOB_INDEX_MAX_AGE_DAYS):
+        self.path = path
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._stats = {
+            "upserted": 0,
+            "inserted": 0,
+            "searches": 0,
+            "local_answers": 0,
+            "delta_fetches": 0,
+            "pruned": 0,
+        }
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def upsert_jobs(self, jobs: List[Dict[str, Any]], source: str = "", query_key: Optional[str] = None) -> int:
+        """Insert or refresh listings (as results of query_key, if given). Returns how many were new to the index."""
+        if not jobs:
+            return 0
+        now = time.time()
+        rows = []
+        for job in jobs:
+            days = job.get("days_since_posted")
+            posted_at = now - days * DAY_SECONDS if isinstance(days, (int, float)) else None
+            rows.append((
+                job_fingerprint(job),
+                job.get("source") or source,
+                job.get("title") or "",
+                job.get("company") or "",
+                job.get("location") or "",
+                job.get("description_snippet") or "",
+                1 if job.get("is_remote") else 0,
+                posted_at,
+                now,
+                now,
+                json.dumps(job, default=str),
+            ))
+
+        with self._lock:
+            before = self._db.execute("SELECT count(*) FROM jobs").fetchone()[0]
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT INTO jobs (fingerprint, source, title, company, location, description,"
+                    " is_remote, posted_at, first_seen, last_seen, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (fingerprint) DO UPDATE SET"
+                    " source = excluded.source, title = excluded.title, company = excluded.company,"
+                    " location = excluded.location, description = excluded.description,"
+                    " is_remote = excluded.is_remote,"
+                    " posted_at = coalesce(excluded.posted_at, jobs.posted_at),"
+                    " last_seen = excluded.last_seen, data = excluded.data",
+                    rows,
+                )
+                if query_key:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO query_jobs (query_key, fingerprint) VALUES (?, ?)",
+                        [(query_key, row[0]) for row in rows],
+                    )
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                raise
+            inserted = self._db.execute("SELECT count(*) FROM jobs").fetchone()[0] - before
+            self._stats["upserted"] += len(rows)
+            self._stats["inserted"] += inserted
+
+        if now - self._last_prune > JOB_INDEX_PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        return inserted
+
+    def mark_fetched(self, query_key: str, fetched_at: Optional[float] = None):
+        """Record that a provider query was just fetched in full (or as a delta)."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO query_log (query_key, fetched_at) VALUES (?, ?)",
+                (query_key, fetched_at if fetched_at is not None else time.time()),
+            )
+
+    def last_fetched(self, query_key: str) -> Optional[float]:
+        """When a provider query was last fetched, if it is still within the aging window."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at FROM query_log WHERE query_key = ?", (query_key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.max_age_days * DAY_SECONDS:
+            return None
+        return row[0]
+
+    def prune(self) -> int:
+        """Age out listings posted (or first seen) more than max_age_days ago."""
+        cutoff = time.time() - self.max_age_days * DAY_SECONDS
+        with self._lock:
+            removed = self._db.execute(
+                "DELETE FROM jobs WHERE coalesce(posted_at, first_seen) < ?", (cutoff,)
+            ).rowcount
+            self._db.execute(
+                "DELETE FROM query_jobs WHERE query_key IN (SELECT query_key FROM query_log WHERE fetched_at < ?)"
+                " OR fingerprint NOT IN (SELECT fingerprint FROM jobs)",
+                (cutoff,),
+            )
+            self._db.execute("DELETE FROM query_log WHERE fetched_at < ?", (cutoff,))
+            self._stats["pruned"] += removed
+            self._last_prune = time.time()
+        if removed:
+            logger.info(f"Job index: aged out {removed} listings older than {self.max_age_days} days")
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM jobs")
+            self._db.execute("DELETE FROM query_log")
+            self._db.execute("DELETE FROM query_jobs")
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        location: str = "",
+        remote_only: bool = False,
+        excluded_companies: List[str] = None,
+        limit: int = 15,
+        query_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over indexed listings, best match first.
+
+        Every role term must appear in the title or description. A location
+        matches listings whose location contains its city, plus remote ones.
+        With query_key, only listings that provider query returned match.
+        """
+        terms = [t for t in _TOKEN_RE.findall(query.lower()) if t not in _QUERY_STOPWORDS]
+        if not terms:
+            return []
+        match = "{title description} : (" + " ".join(f'"{t}"' for t in terms) + ")"
+
+        sql = (
+            "SELECT jobs.data, jobs.posted_at FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid"
+            " WHERE jobs_fts MATCH ? AND coalesce(jobs.posted_at, jobs.first_seen) >= ?"
+        )
+        args: List[Any] = [match, time.time() - self.max_age_days * DAY_SECONDS]
+        if query_key:
+            sql += " AND jobs.fingerprint IN (SELECT fingerprint FROM query_jobs WHERE query_key = ?)"
+            args.append(query_key)
+        if remote_only:
+            sql += " AND jobs.is_remote = 1"
+        elif location:
+            city = location.split(",")[0].strip().lower()
+            sql += " AND (instr(lower(jobs.location), ?) > 0 OR jobs.is_remote = 1)"
+            args.append(city)
+        if excluded_companies:
+            sql += f" AND lower(jobs.company) NOT IN ({', '.join('?' * len(excluded_companies))})"
+            args.extend(c.lower() for c in excluded_companies)
+        sql += " ORDER BY bm25(jobs_fts, 10.0, 2.0, 1.0, 1.0), jobs.posted_at DESC LIMIT ?"
+        args.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+            self._stats["searches"] += 1
+
+        now = time.time()
+        jobs = []
+        for data, posted_at in rows:
+            job = json.loads(data)
+            if posted_at is not None:
+                # Ages were relative to when the listing was fetched
+                job["days_since_posted"] = max(0, int((now - posted_at) / DAY_SECONDS))
+            jobs.append(job)
+        return jobs
+
+    def record(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get index statistics for monitoring."""
+        with self._lock:
+            listings = self._db.execute("SELECT count(*) FROM jobs").fetchone()[0]
+            by_source = dict(self._db.execute("SELECT source, count(*) FROM jobs GROUP BY source").fetchall())
+            queries = self._db.execute("SELECT count(*) FROM query_log").fetchone()[0]
+            return {
+                "enabled": True,
+                "path": self.path,
+                "listings": listings,
+                "by_source": by_source,
+                "tracked_queries": queries,
+                "fresh_seconds": JOB_INDEX_FRESH_SECONDS,
+                "max_age_days": self.max_age_days,
+                **self._stats,
+            }
+
+
+def _open_index() -> Optional[JobIndex]:
+    if not ENABLE_JOB_INDEX:
+        return None
+    try:
+        return JobIndex(JOB_INDEX_PATH)
+    except sqlite3.Error as e:
+        # e.g. SQLite built without FTS5
+        logger.warning(f"Job index disabled ({e})")
+        return None
+
+
+# Process-wide index (None when disabled)
+job_index = _open_index()
+
+
+def get_job_index() -> Optional[JobIndex]:
+    return job_index
+
+
+def get_job_index_stats() -> Dict[str, Any]:
+    """Get job index statistics (admin endpoint)."""
+    if job_index is None:
+        return {"enabled": False}
+    return job_index.stats()
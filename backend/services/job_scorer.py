@@ -5,8 +5,11 @@ Rules-based (no LLM call) for speed and cost efficiency.
 """
 
 import re
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple
 
 logger = logging.getLogger("henryhq.job_scorer")
 
@@ -87,158 +90,156 @@ def infer_seniority_from_title(title: str) -> str:
     return "mid"
 
 
-def _seniority_distance(level_a: str, level_b: str) -> int:
-    """Calculate distance between two seniority levels. 0 = exact match."""
-    try:
-        idx_a = SENIORITY_LEVELS.index(level_a)
-        idx_b = SENIORITY_LEVELS.index(level_b)
-        return abs(idx_a - idx_b)
-    except ValueError:
-        return 2  # Default moderate distance for unknown levels
+# Common filler words ignored when comparing titles
+TITLE_FILLER_WORDS = frozenset({"the", "a", "an", "of", "in", "at", "for", "and", "or", "to", "with", "is"})
 
+_WORD_RE = re.compile(r'\b\w+\b')
 
-def _title_keyword_overlap(title: str, target_roles: List[str]) -> float:
-    """Calculate keyword overlap between job title and target roles. Returns 0.0-1.0."""
-    if not target_roles or not title:
-        return 0.0
 
-    title_words = set(re.findall(r'\b\w+\b', title.lower()))
-    # Remove common filler words
-    filler = {"the", "a", "an", "of", "in", "at", "for", "and", "or", "to", "with", "is"}
-    title_words -= filler
+def _title_words(title: str) -> FrozenSet[str]:
+    """Lowercased words of a title, minus filler words."""
+    return frozenset(_WORD_RE.findall(title.lower())) - TITLE_FILLER_WORDS
 
+
+@lru_cache(maxsize=4096)
+def _title_features(title: str) -> Tuple[FrozenSet[str], str]:
+    """(title words, inferred seniority) for a job title. Listings repeat titles a lot."""
+    return _title_words(title), infer_seniority_from_title(title)
+
+
+def _best_overlap(title_words: FrozenSet[str], role_word_sets: Tuple[FrozenSet[str], ...]) -> float:
     best_overlap = 0.0
-    for role in target_roles:
-        role_words = set(re.findall(r'\b\w+\b', role.lower())) - filler
-        if not role_words:
-            continue
+    for role_words in role_word_sets:
         overlap = len(title_words & role_words) / len(role_words)
-        best_overlap = max(best_overlap, overlap)
-
+        if overlap > best_overlap:
+            best_overlap = overlap
     return best_overlap
 
 
+_TITLE_FUNCTIONS_BY_LENGTH = sorted(TITLE_FUNCTION_MAP.items(), key=lambda x: -len(x[0]))
+
+
 def _infer_function_from_title(title: str) -> Optional[str]:
     """Infer the function area from a title string using TITLE_FUNCTION_MAP."""
     title_lower = title.lower()
     # Check multi-word keys first (longer = more specific)
-    for keyword, function in sorted(TITLE_FUNCTION_MAP.items(), key=lambda x: -len(x[0])):
+    for keyword, function in _TITLE_FUNCTIONS_BY_LENGTH:
         if keyword in title_lower:
             return function
     return None
 
 
-def _has_function_mismatch(job_title: str, target_roles: List[str]) -> int:
-    """
-    Detect if a job title indicates a different function area than the target roles.
-    Returns a penalty: -15 if mismatch detected, 0 otherwise.
+# =============================================================================
+# COMPILED CANDIDATE PROFILE
+# =============================================================================
 
-    Example: target "Product Manager" (product_management) vs job "Product Marketing Manager"
-    → job title contains "marketing" which is a differentiator for product_management → penalty.
+@dataclass(frozen=True)
+class ScoringProfile:
     """
-    if not target_roles or not job_title:
-        return 0
-
-    # Determine function area implied by target roles
-    target_functions = set()
-    for role in target_roles:
-        fn = _infer_function_from_title(role)
-        if fn:
-            target_functions.add(fn)
-
-    if not target_functions:
-        return 0
-
-    # Check if job title contains differentiator words for any target function
-    job_title_lower = job_title.lower()
-    job_words = set(re.findall(r'\b\w+\b', job_title_lower))
-
-    for target_fn in target_functions:
-        differentiators = FUNCTION_DIFFERENTIATORS.get(target_fn, set())
-        mismatch_words = job_words & differentiators
-        if mismatch_words:
-            logger.debug(
-                f"Function mismatch: target function '{target_fn}', "
-                f"job '{job_title}' contains differentiators: {mismatch_words}"
-            )
-            return -15
+    Candidate profile precompiled for scoring many jobs.
 
-    return 0
+    Everything that depends only on the candidate (target-role word sets, the
+    function differentiators implied by the target roles, seniority index,
+    location parts, skills, industry keywords) is computed once here instead of
+    once per job listing.
+    """
+    target_roles: Tuple[str, ...]
+    has_target_roles: bool
+    role_word_sets: Tuple[FrozenSet[str], ...]
+    differentiators: FrozenSet[str]
+    candidate_seniority: str
+    seniority_index: Optional[int]
+    location_parts: Optional[List[str]]
+    remote_preferred: bool
+    comp_min: Optional[int]
+    comp_max: Optional[int]
+    industry_keywords: Tuple[str, ...]
+    years_experience: Optional[int]
+    skills: Optional[FrozenSet[str]]
+
+    @classmethod
+    def compile(
+        cls,
+        target_roles: List[str],
+        candidate_seniority: str = "mid",
+        candidate_location: Optional[str] = None,
+        candidate_remote_preferred: bool = False,
+        comp_min: Optional[int] = None,
+        comp_max: Optional[int] = None,
+        target_industry: Optional[str] = None,
+        years_experience: Optional[int] = None,
+        candidate_skills: Optional[List[str]] = None,
+    ) -> "ScoringProfile":
+        target_roles = target_roles or []
+        target_functions = {fn for fn in map(_infer_function_from_title, target_roles) if fn}
+        differentiators = frozenset().union(
+            *(FUNCTION_DIFFERENTIATORS.get(fn, set()) for fn in target_functions)
+        )
+        return cls(
+            target_roles=tuple(target_roles),
+            has_target_roles=bool(target_roles),
+            role_word_sets=tuple(words for words in map(_title_words, target_roles) if words),
+            differentiators=differentiators,
+            candidate_seniority=candidate_seniority,
+            seniority_index=(
+                SENIORITY_LEVELS.index(candidate_seniority) if candidate_seniority in SENIORITY_LEVELS else None
+            ),
+            location_parts=(
+                [p.strip() for p in candidate_location.lower().split(",")] if candidate_location else None
+            ),
+            remote_preferred=candidate_remote_preferred,
+            comp_min=comp_min,
+            comp_max=comp_max,
+            industry_keywords=tuple(INDUSTRY_KEYWORDS.get(target_industry, [])) if target_industry else (),
+            years_experience=years_experience,
+            skills=frozenset(s.lower().strip() for s in candidate_skills if s) if candidate_skills else None,
+        )
 
+    def seniority_distance(self, job_seniority: str) -> int:
+        if self.seniority_index is None:
+            return 2  # Default moderate distance for unknown levels
+        return abs(self.seniority_index - SENIORITY_LEVELS.index(job_seniority))
 
-def _should_disqualify(
-    job: Dict[str, Any],
-    target_roles: List[str],
-    candidate_seniority: str,
-    comp_min: Optional[int],
-) -> bool:
-    """
-    Hard disqualification check — rejects jobs that are fundamentally misaligned
-    BEFORE scoring. Returns True if job should be rejected outright.
 
-    Disqualification rules:
-    1. Seniority gap >= 3 levels (e.g., candidate "senior" but job is "entry")
-    2. Salary ceiling < 70% of comp_min (e.g., comp_min=$150K but job max=$95K)
-    3. Zero title keyword overlap when target_roles are provided
-    """
+def _profile_disqualifies(job: Dict[str, Any], profile: ScoringProfile) -> bool:
     job_title = job.get("title", "")
 
     # Rule 1: Seniority too far apart
-    if candidate_seniority and job_title:
-        job_seniority = infer_seniority_from_title(job_title)
-        dist = _seniority_distance(candidate_seniority, job_seniority)
+    if profile.candidate_seniority and job_title:
+        _, job_seniority = _title_features(job_title)
+        dist = profile.seniority_distance(job_seniority)
         if dist >= 3:
             logger.debug(
                 f"DISQUALIFIED (seniority): '{job_title}' is '{job_seniority}', "
-                f"candidate is '{candidate_seniority}' (distance={dist})"
+                f"candidate is '{profile.candidate_seniority}' (distance={dist})"
             )
             return True
 
     # Rule 2: Salary ceiling way below comp_min
-    if comp_min:
-        job_salary_max = job.get("salary_max")
-        job_salary_min = job.get("salary_min")
+    if profile.comp_min:
         # Use job_salary_max if available, otherwise job_salary_min as a proxy
-        salary_ceiling = job_salary_max or job_salary_min
-        if salary_ceiling and salary_ceiling < comp_min * 0.70:
+        salary_ceiling = job.get("salary_max") or job.get("salary_min")
+        if salary_ceiling and salary_ceiling < profile.comp_min * 0.70:
             logger.debug(
                 f"DISQUALIFIED (salary): '{job_title}' ceiling ${salary_ceiling:,.0f} "
-                f"< 70% of comp_min ${comp_min:,.0f}"
+                f"< 70% of comp_min ${profile.comp_min:,.0f}"
             )
             return True
 
     # Rule 3: Zero title keyword overlap
-    if target_roles and job_title:
-        overlap = _title_keyword_overlap(job_title, target_roles)
-        if overlap == 0.0:
+    if profile.has_target_roles and job_title:
+        title_words, _ = _title_features(job_title)
+        if _best_overlap(title_words, profile.role_word_sets) == 0.0:
             logger.debug(
                 f"DISQUALIFIED (title): '{job_title}' has zero keyword overlap "
-                f"with target roles {target_roles}"
+                f"with target roles {list(profile.target_roles)}"
             )
             return True
 
     return False
 
 
-def score_job(
-    job: Dict[str, Any],
-    target_roles: List[str],
-    candidate_seniority: str = "mid",
-    candidate_location: Optional[str] = None,
-    candidate_remote_preferred: bool = False,
-    comp_min: Optional[int] = None,
-    comp_max: Optional[int] = None,
-    target_industry: Optional[str] = None,
-    years_experience: Optional[int] = None,
-    candidate_skills: Optional[List[str]] = None,
-) -> Dict[str, Any]:
-    """
-    Score a single job listing against candidate profile.
-
-    Returns the job dict with added fields:
-    - relevance_score (0-100)
-    - relevance_reasons (list of strings explaining the score)
-    """
+def _score_with_profile(job: Dict[str, Any], profile: ScoringProfile) -> Dict[str, Any]:
     score = 0
     reasons = []
 
@@ -249,12 +250,21 @@ def score_job(
     job_description = job.get("description_snippet", "")
     job_is_remote = job.get("is_remote", False)
     days_since_posted = job.get("days_since_posted")
+    title_words, job_seniority = _title_features(job_title)
 
     # =================================================================
     # FACTOR 1: Title Match (0-30 points, with function mismatch penalty)
     # =================================================================
-    title_overlap = _title_keyword_overlap(job_title, target_roles)
-    function_penalty = _has_function_mismatch(job_title, target_roles)
+    if profile.has_target_roles and job_title:
+        title_overlap = _best_overlap(title_words, profile.role_word_sets)
+        # Job title contains differentiator words for a target function
+        mismatch_words = title_words & profile.differentiators
+        function_penalty = -15 if mismatch_words else 0
+        if mismatch_words:
+            logger.debug(f"Function mismatch: job '{job_title}' contains differentiators: {set(mismatch_words)}")
+    else:
+        title_overlap = 0.0
+        function_penalty = 0
 
     if title_overlap >= 0.8 and function_penalty == 0:
         score += 30
@@ -281,8 +291,7 @@ def score_job(
     # =================================================================
     # FACTOR 2: Seniority Match (0-20 points)
     # =================================================================
-    job_seniority = infer_seniority_from_title(job_title)
-    seniority_dist = _seniority_distance(candidate_seniority, job_seniority)
+    seniority_dist = profile.seniority_distance(job_seniority)
 
     if seniority_dist == 0:
         score += 20
@@ -290,26 +299,22 @@ def score_job(
     elif seniority_dist == 1:
         score += 12
         reasons.append("Close seniority")
-    elif seniority_dist == 2:
-        # 2 levels off — no points (was +5 before, too lenient)
-        pass
-    # else: 0 points (too far apart — should have been disqualified)
+    # else: 0 points (2+ levels off; 3+ should have been disqualified)
 
     # =================================================================
     # FACTOR 3: Location Match (0-15 points)
     # =================================================================
-    if candidate_remote_preferred and job_is_remote:
+    cand_parts = profile.location_parts
+    if profile.remote_preferred and job_is_remote:
         score += 15
         reasons.append("Remote")
-    elif candidate_location and job_location:
+    elif cand_parts and job_location:
         loc_lower = job_location.lower()
-        cand_loc_lower = candidate_location.lower()
         # Check city match
-        cand_parts = [p.strip() for p in cand_loc_lower.split(",")]
         if cand_parts[0] in loc_lower:
             score += 15
             reasons.append("Location match")
-        elif len(cand_parts) > 1 and cand_parts[1].strip() in loc_lower:
+        elif len(cand_parts) > 1 and cand_parts[1] in loc_lower:
             score += 10
             reasons.append("Same state")
         elif job_is_remote:
@@ -322,10 +327,11 @@ def score_job(
     # =================================================================
     # FACTOR 4: Salary Match (0-15 points)
     # =================================================================
+    comp_min = profile.comp_min
     if comp_min and (job_salary_min or job_salary_max):
         job_min = job_salary_min or 0
         job_max = job_salary_max or job_min * 1.3
-        comp_max_val = comp_max or comp_min * 1.3
+        comp_max_val = profile.comp_max or comp_min * 1.3
 
         # Check for overlap between [comp_min, comp_max] and [job_min, job_max]
         if job_min <= comp_max_val and job_max >= comp_min:
@@ -341,18 +347,14 @@ def score_job(
     # FACTOR 5: Industry Match (0-10 points)
     # Uses job_highlights (Qualifications + Responsibilities) for richer matching
     # =================================================================
-    if target_industry and job_description:
-        industry_kws = INDUSTRY_KEYWORDS.get(target_industry, [])
-        desc_lower = job_description.lower()
-        company_lower = job.get("company", "").lower()
-
+    if profile.industry_keywords and job_description:
         # Include highlights for richer text matching
         highlights = job.get("job_highlights") or {}
         quals = " ".join(highlights.get("Qualifications", []))
         resps = " ".join(highlights.get("Responsibilities", []))
-        combined = f"{desc_lower} {company_lower} {job_title.lower()} {quals.lower()} {resps.lower()}"
+        combined = f"{job_description} {job.get('company', '')} {job_title} {quals} {resps}".lower()
 
-        matches = sum(1 for kw in industry_kws if kw in combined)
+        matches = sum(1 for kw in profile.industry_keywords if kw in combined)
         if matches >= 2:
             score += 10
             reasons.append("Industry match")
@@ -379,15 +381,15 @@ def score_job(
     # FACTOR 7: Years of Experience Cross-Check (-5 to 0 points)
     # Uses job_required_experience.required_experience_in_months from JSearch
     # =================================================================
-    if years_experience is not None:
+    if profile.years_experience is not None:
         job_req_exp = job.get("job_required_experience") or {}
         required_months = job_req_exp.get("required_experience_in_months")
         if required_months and isinstance(required_months, (int, float)) and required_months > 0:
-            candidate_months = years_experience * 12
+            candidate_months = profile.years_experience * 12
             if candidate_months < required_months * 0.5:
                 score -= 5
                 reasons.append("May be under-experienced")
-            elif required_months > 0 and candidate_months > required_months * 2.5:
+            elif candidate_months > required_months * 2.5:
                 score -= 3
                 reasons.append("May be over-experienced")
 
@@ -395,12 +397,11 @@ def score_job(
     # FACTOR 8: Skills Overlap Bonus (0-5 points)
     # Cross-reference candidate skills with job_required_skills from JSearch
     # =================================================================
-    if candidate_skills:
+    if profile.skills is not None:
         job_skills = job.get("job_required_skills") or []
         if job_skills:
-            candidate_skills_lower = {s.lower().strip() for s in candidate_skills if s}
             job_skills_lower = {s.lower().strip() for s in job_skills if s}
-            overlap_count = len(candidate_skills_lower & job_skills_lower)
+            overlap_count = len(profile.skills & job_skills_lower)
             if overlap_count >= 3:
                 score += 5
                 reasons.append("Skills match")
@@ -415,8 +416,31 @@ def score_job(
     return job
 
 
-def score_and_rank_jobs(
-    jobs: List[Dict[str, Any]],
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def _should_disqualify(
+    job: Dict[str, Any],
+    target_roles: List[str],
+    candidate_seniority: str,
+    comp_min: Optional[int],
+) -> bool:
+    """
+    Hard disqualification check — rejects jobs that are fundamentally misaligned
+    BEFORE scoring. Returns True if job should be rejected outright.
+
+    Disqualification rules:
+    1. Seniority gap >= 3 levels (e.g., candidate "senior" but job is "entry")
+    2. Salary ceiling < 70% of comp_min (e.g., comp_min=$150K but job max=$95K)
+    3. Zero title keyword overlap when target_roles are provided
+    """
+    profile = ScoringProfile.compile(target_roles, candidate_seniority, comp_min=comp_min)
+    return _profile_disqualifies(job, profile)
+
+
+def score_job(
+    job: Dict[str, Any],
     target_roles: List[str],
     candidate_seniority: str = "mid",
     candidate_location: Optional[str] = None,
@@ -424,49 +448,104 @@ def score_and_rank_jobs(
     comp_min: Optional[int] = None,
     comp_max: Optional[int] = None,
     target_industry: Optional[str] = None,
-    min_score: int = 40,
     years_experience: Optional[int] = None,
     candidate_skills: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Score a single job listing against candidate profile.
+
+    Returns the job dict with added fields:
+    - relevance_score (0-100)
+    - relevance_reasons (list of strings explaining the score)
+    """
+    profile = ScoringProfile.compile(
+        target_roles,
+        candidate_seniority=candidate_seniority,
+        candidate_location=candidate_location,
+        candidate_remote_preferred=candidate_remote_preferred,
+        comp_min=comp_min,
+        comp_max=comp_max,
+        target_industry=target_industry,
+        years_experience=years_experience,
+        candidate_skills=candidate_skills,
+    )
+    return _score_with_profile(job, profile)
+
+
+def _rank_key(job: Dict[str, Any]) -> tuple:
+    # relevance_score descending, then network connection, then recency
+    return (
+        -job.get("relevance_score", 0),
+        not job.get("network_connection", False),
+        job.get("days_since_posted") or 999,
+    )
+
+
+def score_jobs_batch(
+    jobs: List[Dict[str, Any]],
+    profile: ScoringProfile,
+    min_score: int = 40,
+    top_k: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Score all jobs and return sorted by relevance_score descending.
-    Jobs that fail hard disqualification checks are rejected outright.
-    Remaining jobs below min_score are filtered out.
+    Score a batch of jobs against a compiled profile in one pass.
+
+    Jobs that fail hard disqualification checks are rejected outright and the
+    rest below min_score are dropped. With top_k, only the best k are kept via
+    a heap (O(n log k)) instead of sorting every listing; ties keep input order,
+    so the result equals the first k of the full ranking.
     """
-    scored = []
+    passed = []
     disqualified_count = 0
 
     for job in jobs:
         # Hard disqualification check — reject fundamentally misaligned jobs
-        if _should_disqualify(job, target_roles, candidate_seniority, comp_min):
+        if _profile_disqualifies(job, profile):
             disqualified_count += 1
             continue
-
-        scored_job = score_job(
-            job=job,
-            target_roles=target_roles,
-            candidate_seniority=candidate_seniority,
-            candidate_location=candidate_location,
-            candidate_remote_preferred=candidate_remote_preferred,
-            comp_min=comp_min,
-            comp_max=comp_max,
-            target_industry=target_industry,
-            years_experience=years_experience,
-            candidate_skills=candidate_skills,
-        )
-        if scored_job["relevance_score"] >= min_score:
-            scored.append(scored_job)
+        if _score_with_profile(job, profile)["relevance_score"] >= min_score:
+            passed.append(job)
 
     if disqualified_count > 0:
         logger.info(f"Hard-filtered {disqualified_count} jobs (seniority/salary/title mismatch)")
 
-    # Sort by relevance_score descending, then by network connection, then recency
-    scored.sort(
-        key=lambda j: (
-            -j.get("relevance_score", 0),
-            not j.get("network_connection", False),
-            j.get("days_since_posted") or 999,
-        )
-    )
+    if top_k is not None and top_k < len(passed):
+        ranked = heapq.nsmallest(top_k, enumerate(passed), key=lambda item: (_rank_key(item[1]), item[0]))
+        return [job for _, job in ranked]
+
+    passed.sort(key=_rank_key)
+    return passed
+
 
-    return scored
+def score_and_rank_jobs(
+    jobs: List[Dict[str, Any]],
+    target_roles: List[str],
+    candidate_seniority: str = "mid",
+    candidate_location: Optional[str] = None,
+    candidate_remote_preferred: bool = False,
+    comp_min: Optional[int] = None,
+    comp_max: Optional[int] = None,
+    target_industry: Optional[str] = None,
+    min_score: int = 40,
+    years_experience: Optional[int] = None,
+    candidate_skills: Optional[List[str]] = None,
+    top_k: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score all jobs and return sorted by relevance_score descending.
+    Jobs that fail hard disqualification checks are rejected outright.
+    Remaining jobs below min_score are filtered out. Pass top_k to keep only
+    the best k.
+    """
+    profile = ScoringProfile.compile(
+        target_roles,
+        candidate_seniority=candidate_seniority,
+        candidate_location=candidate_location,
+        candidate_remote_preferred=candidate_remote_preferred,
+        comp_min=comp_min,
+        comp_max=comp_max,
+        target_industry=target_industry,
+        years_experience=years_experience,
+        candidate_skills=candidate_skills,
+    )
+    return score_jobs_batch(jobs, profile, min_score=min_score, top_k=top_k)
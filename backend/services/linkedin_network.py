@@ -9,12 +9,261 @@ First Name,Last Name,URL,Email Address,Company,Position,Connected On
 
 import csv
 import io
+import re
+import codecs
 import logging
-from typing import List, Dict, Optional
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Set, Union
 from collections import Counter
 
 logger = logging.getLogger("henryhq.linkedin_network")
 
+# Trailing legal-entity words dropped when normalizing company names
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "lp", "pllc", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "ag", "sa", "srl", "bv", "pte",
+}
+
+# Normalized name -> canonical normalized name for companies known by several names
+COMPANY_ALIASES = {
+    "facebook": "meta",
+    "meta platforms": "meta",
+    "alphabet": "google",
+    "amazon web services": "amazon",
+    "aws": "amazon",
+    "amazon com": "amazon",
+    "international business machines": "ibm",
+}
+
+_COMPANY_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def normalize_company(name: str) -> str:
+    """
+    Normalize a company name for matching: lowercase words only, "&" -> "and",
+    leading "the" and trailing legal suffixes removed, known aliases folded.
+
+    "The Walt Disney Company" -> "walt disney", "Stripe, Inc." -> "stripe",
+    "Facebook" -> "meta"
+    """
+    tokens = _COMPANY_TOKEN_RE.findall((name or "").lower().replace("&", " and "))
+    if len(tokens) > 1 and tokens[0] == "the":
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens = tokens[:-1]
+    normalized = " ".join(tokens)
+    return COMPANY_ALIASES.get(normalized, normalized)
+
+
+class CompanyNetworkIndex:
+    """
+    Normalized company index over a candidate's LinkedIn network.
+
+    - Exact lookups are a dict hit on the normalized name.
+    - Fuzzy lookups match whole-word phrases in either direction
+      ("stripe" ~ "stripe payments"), using a token -> companies posting list
+      instead of scanning every company: a network company contained in the
+      query is found by checking each of the query's word n-grams; a network
+      company containing the query comes from the rarest query word's postings.
+
+    to_dict()/from_dict() round-trip through JSON so the index is built once
+    when connections are uploaded and loaded as-is afterwards.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self.companies: Dict[str, Dict[str, Any]] = {}  # {normalized: {"name": display, "count": n}}
+        self.tokens: Dict[str, Set[str]] = {}  # {token: {normalized, ...}}
+        self.rows: Dict[str, List[int]] = {}  # {normalized: [connection positions]} (not serialized)
+
+    def add(self, company: str, count: int = 1, row: Optional[int] = None) -> Optional[str]:
+        """Add connections at a company. Returns its normalized key (None for blank names)."""
+        key = normalize_company(company)
+        if not key:
+            return None
+        entry = self.companies.get(key)
+        if entry is None:
+            self.companies[key] = {"name": company.strip(), "count": count}
+            for token in key.split():
+                self.tokens.setdefault(token, set()).add(key)
+        else:
+            entry["count"] += count
+        if row is not None:
+            self.rows.setdefault(key, []).append(row)
+        return key
+
+    @classmethod
+    def from_connections(cls, connections: List[Dict[str, str]]) -> "CompanyNetworkIndex":
+        index = cls()
+        for position, conn in enumerate(connections):
+            index.add(conn.get("company") or "", row=position)
+        return index
+
+    @classmethod
+    def from_companies(cls, companies: Iterable[Union[str, Dict[str, Any]]]) -> "CompanyNetworkIndex":
+        """Build from company names or {"company": ..., "count": ...} summaries."""
+        index = cls()
+        for item in companies:
+            if isinstance(item, dict):
+                index.add(item.get("company") or "", count=item.get("count") or 1)
+            else:
+                index.add(str(item))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def match(self, company: str, reverse: bool = True) -> List[str]:
+        """
+        Normalized keys of network companies matching `company`.
+
+        The exact match (if any) comes first, then companies whose name
+        contains the query as whole words and, with reverse=True, companies
+        whose whole name appears inside the query.
+        """
+        query = normalize_company(company)
+        if not query:
+            return []
+
+        words = query.split()
+        matches: List[str] = [query] if query in self.companies else []
+
+        # Network companies containing the query
+        postings = [self.tokens.get(word) for word in words]
+        if all(postings):
+            padded = f" {query} "
+            for key in sorted(min(postings, key=len)):
+                if key != query and padded in f" {key} ":
+                    matches.append(key)
+
+        # Network companies contained in the query
+        if reverse:
+            for size in range(len(words) - 1, 0, -1):
+                for start in range(len(words) - size + 1):
+                    key = " ".join(words[start:start + size])
+                    if key in self.companies and key not in matches:
+                        matches.append(key)
+
+        return matches
+
+    def best_match(self, company: str) -> Optional[Dict[str, Any]]:
+        """The exact network company, else the matching one with the most connections."""
+        keys = self.match(company)
+        if not keys:
+            return None
+        if keys[0] == normalize_company(company):
+            return self.companies[keys[0]]
+        return max((self.companies[key] for key in keys), key=lambda entry: entry["count"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.VERSION,
+            "companies": self.companies,
+            "tokens": {token: sorted(keys) for token, keys in self.tokens.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["CompanyNetworkIndex"]:
+        """Load a serialized index (None if missing or from another version)."""
+        if not data or data.get("version") != cls.VERSION:
+            return None
+        index = cls()
+        index.companies = {key: dict(entry) for key, entry in data.get("companies", {}).items()}
+        index.tokens = {token: set(keys) for token, keys in data.get("tokens", {}).items()}
+        return index
+
+
+# Uploads are read in chunks of this size
+CSV_CHUNK_SIZE = 64 * 1024
+
+# LinkedIn exports start with a few "Notes:" lines before the header row
+MAX_PREAMBLE_ROWS = 10
+
+
+class ConnectionRowParser:
+    """
+    Incremental LinkedIn CSV parser: feed it lines, get connection dicts back.
+
+    Lines are buffered only until a record is complete (quoted fields may span
+    lines), so memory stays flat however large the export is. The header row
+    is the first row with a Company/Organization column.
+    """
+
+    def __init__(self):
+        self._pending: List[str] = []
+        self._quotes = 0
+        self._columns: Optional[Dict[str, int]] = None
+        self._preamble_rows = 0
+        self.missing_company_column = False
+
+    def feed_line(self, line: str) -> Optional[Dict[str, str]]:
+        """Consume one line; returns a connection when it completes a data row."""
+        self._pending.append(line)
+        self._quotes += line.count('"')
+        if self._quotes % 2:
+            return None  # inside a quoted field
+        lines, self._pending, self._quotes = self._pending, [], 0
+
+        row = next(csv.reader(lines), None)
+        if not row or self.missing_company_column:
+            return None
+        if self._columns is None:
+            self._read_header(row)
+            return None
+        return self._to_connection(row)
+
+    def _read_header(self, row: List[str]):
+        columns = {}
+        for position, field in enumerate(row):
+            columns.setdefault(field.lower().strip(), position)
+        for key in ("company", "organization"):
+            if key in columns:
+                columns["company"] = columns[key]
+                self._columns = columns
+                return
+        self._preamble_rows += 1
+        if self._preamble_rows > MAX_PREAMBLE_ROWS:
+            logger.warning("CSV missing 'Company' column")
+            self.missing_company_column = True
+
+    def _to_connection(self, row: List[str]) -> Optional[Dict[str, str]]:
+        def field(name: str) -> str:
+            position = self._columns.get(name)
+            return (row[position] if position is not None and position < len(row) else "").strip()
+
+        company = field("company")
+        if not company:
+            return None
+        return {
+            "first_name": field("first name"),
+            "last_name": field("last name"),
+            "company": company,
+            "position": field("position"),
+            "connected_on": field("connected on"),
+        }
+
+
+class NetworkAggregate:
+    """Company counts and index accumulated while connections stream in."""
+
+    def __init__(self):
+        self.connections = 0
+        self.company_counts: Counter = Counter()
+        self.index = CompanyNetworkIndex()
+
+    def add(self, connection: Dict[str, str]):
+        self.connections += 1
+        company = connection["company"]
+        self.company_counts[company] += 1
+        self.index.add(company)
+
+    def companies(self) -> List[Dict[str, Any]]:
+        """[{"company": "Stripe", "count": 3}, ...] sorted by count descending."""
+        return [
+            {"company": company, "count": count}
+            for company, count in self.company_counts.most_common()
+        ]
+
 
 class LinkedInNetworkParser:
     """Parses LinkedIn connections CSV to extract company network data."""
@@ -36,45 +285,8 @@ class LinkedInNetworkParser:
             List of connection dicts with keys:
             first_name, last_name, company, position, connected_on
         """
-        connections = []
-
         try:
-            reader = csv.DictReader(io.StringIO(csv_content))
-
-            if not reader.fieldnames:
-                logger.warning("CSV has no headers")
-                return []
-
-            # Normalize headers to lowercase for matching
-            header_map = {}
-            for field in reader.fieldnames:
-                header_map[field.lower().strip()] = field
-
-            # Check for required 'company' column
-            company_key = None
-            for key in ("company", "organization"):
-                if key in header_map:
-                    company_key = header_map[key]
-                    break
-
-            if not company_key:
-                logger.warning("CSV missing 'Company' column")
-                return []
-
-            for row in reader:
-                company = (row.get(company_key) or "").strip()
-                if not company:
-                    continue
-
-                connection = {
-                    "first_name": (row.get(header_map.get("first name", "First Name")) or "").strip(),
-                    "last_name": (row.get(header_map.get("last name", "Last Name")) or "").strip(),
-                    "company": company,
-                    "position": (row.get(header_map.get("position", "Position")) or "").strip(),
-                    "connected_on": (row.get(header_map.get("connected on", "Connected On")) or "").strip(),
-                }
-                connections.append(connection)
-
+            connections = list(self.iter_connections(io.StringIO(csv_content)))
         except csv.Error as e:
             logger.error(f"CSV parsing error: {e}")
             return []
@@ -85,6 +297,54 @@ class LinkedInNetworkParser:
         logger.info(f"Parsed {len(connections)} connections from LinkedIn CSV")
         return connections
 
+    def iter_connections(self, lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+        """Yield connections from an iterable of CSV lines without materializing the file."""
+        parser = ConnectionRowParser()
+        for line in lines:
+            connection = parser.feed_line(line)
+            if connection:
+                yield connection
+
+    async def ingest_upload(self, upload, max_bytes: Optional[int] = None) -> NetworkAggregate:
+        """
+        Stream a connections CSV upload (FastAPI UploadFile) in chunks,
+        aggregating company counts and the company index as rows arrive.
+
+        Only the current chunk and any unfinished record are held in memory.
+        Raises ValueError if the upload exceeds max_bytes.
+        """
+        parser = ConnectionRowParser()
+        aggregate = NetworkAggregate()
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        buffered = ""
+        total_bytes = 0
+
+        while True:
+            chunk = await upload.read(CSV_CHUNK_SIZE)
+            total_bytes += len(chunk)
+            if max_bytes is not None and total_bytes > max_bytes:
+                raise ValueError(f"Upload exceeds {max_bytes // (1024 * 1024)}MB limit")
+
+            buffered += decoder.decode(chunk, final=not chunk)
+            # Hold back a trailing partial line until the next chunk
+            *lines, buffered = buffered.split("\n")
+            lines = [line + "\n" for line in lines]
+            if not chunk and buffered:
+                lines.append(buffered)
+            for line in lines:
+                connection = parser.feed_line(line)
+                if connection:
+                    aggregate.add(connection)
+
+            if not chunk:
+                break
+
+        logger.info(
+            f"Streamed {aggregate.connections} connections ({len(aggregate.company_counts)} companies) "
+            f"from LinkedIn CSV upload ({total_bytes} bytes)"
+        )
+        return aggregate
+
     def extract_companies(self, connections: List[Dict[str, str]]) -> List[Dict[str, int]]:
         """
         Extract unique companies with connection counts.
@@ -122,19 +382,33 @@ class LinkedInNetworkParser:
                 companies.add(company)
         return sorted(companies)
 
+    def build_company_index(self, connections: List[Dict[str, str]]) -> CompanyNetworkIndex:
+        """Build the normalized company index for a parsed connection list."""
+        index = CompanyNetworkIndex.from_connections(connections)
+        logger.info(f"Indexed {len(index)} normalized companies from {len(connections)} connections")
+        return index
+
     def get_connections_at_company(
-        self, connections: List[Dict[str, str]], company_name: str
+        self,
+        connections: List[Dict[str, str]],
+        company_name: str,
+        index: Optional[CompanyNetworkIndex] = None,
     ) -> List[Dict[str, str]]:
         """
         Get all connections at a specific company.
         Useful for showing "You know X people at this company".
+
+        Pass the index from build_company_index() when looking up several
+        companies against the same connections.
         """
-        company_lower = company_name.lower().strip()
-        return [
-            conn for conn in connections
-            if conn.get("company", "").lower().strip() == company_lower
-            or company_lower in conn.get("company", "").lower().strip()
-        ]
+        if index is None or not index.rows:
+            index = CompanyNetworkIndex.from_connections(connections)
+        positions = sorted(
+            position
+            for key in index.match(company_name, reverse=False)
+            for position in index.rows.get(key, [])
+        )
+        return [connections[position] for position in positions]
 
 
 # Singleton instance
@@ -0,0 +1,261 @@
+"""Content-addressed response cache for deterministic Claude calls
+
+Temperature-0 calls with identical (model, system prompt, messages, temperature,
+max_tokens) produce the same answer, so the same resume + JD pushed through the
+analysis endpoints a few minutes apart should not pay for a second LLM call.
+
+Two tiers:
+- In-memory LRU (size-bounded, per worker process)
+- Optional SQLite file shared by every worker on the host (LLM_CACHE_SQLITE_PATH)
+
+Async callers use get_async()/set_async(): memory hits are answered on the
+event loop, SQLite reads run in a worker thread and SQLite writes happen in
+the background.
+
+Caching is opt-in per call site: callers pass a `cache_site` name, which selects
+the TTL from CALL_SITE_TTLS and is used for per-site hit/miss counters.
+"""
+
+import os
+import json
+import asyncio
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("henryhq")
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+LLM_CACHE_SQLITE_PATH = os.getenv("LLM_CACHE_SQLITE_PATH", "")
+
+DEFAULT_TTL_SECONDS = 3600
+
+# TTL per call site, in seconds
+CALL_SITE_TTLS: Dict[str, int] = {
+    "jd_analyze": 6 * 3600,
+    "fit_score": 6 * 3600,
+    "resume_parse": 24 * 3600,
+    "resume_level": 24 * 3600,
+}
+
+
+def make_cache_key(
+    model: str,
+    system: Any,
+    messages: List[Dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Hash the request fields that determine a deterministic response."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(cache_site: Optional[str], temperature: Optional[float]) -> bool:
+    """Only opted-in call sites running at temperature 0 are cached."""
+    return LLM_CACHE_ENABLED and bool(cache_site) and temperature == 0
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + optional SQLite) cache of JSON-serializable LLM responses."""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, sqlite_path: str = LLM_CACHE_SQLITE_PATH):
+        self.max_entries = max_entries
+        self.sqlite_path = sqlite_path
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()  # {key: (value, expires_at)}
+        self._lock = threading.Lock()  # memory tier and stats
+        self._db_lock = threading.Lock()  # SQLite connection (never held with _lock across I/O)
+        self._db: Optional[sqlite3.Connection] = None
+        self._pending_writes: set = set()  # background SQLite writes from set_async()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+        self._site_stats: Dict[str, Dict[str, int]] = {}
+        if sqlite_path:
+            self._open_db()
+
+    def _open_db(self):
+        try:
+            self._db = sqlite3.connect(self.sqlite_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " call_site TEXT)"
+            )
+            logger.info(f"LLM response cache: SQLite tier enabled at {self.sqlite_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache: SQLite tier disabled ({e})")
+            self._db = None
+
+    def _count(self, cache_site: Optional[str], field: str):
+        site = self._site_stats.setdefault(cache_site or "unknown", {"hits": 0, "misses": 0})
+        site[field] += 1
+
+    def get(self, key: str, cache_site: Optional[str] = None) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/expiry."""
+        value = self._get_memory(key, cache_site)
+        if value is not None:
+            return value
+        return self._get_disk(key, cache_site)
+
+    async def get_async(self, key: str, cache_site: Optional[str] = None) -> Optional[Any]:
+        """get() for the event loop: the SQLite lookup runs in a worker thread."""
+        value = self._get_memory(key, cache_site)
+        if value is not None:
+            return value
+        if self._db is None:
+            return self._get_disk(key, cache_site)  # No I/O - just records the miss
+        return await asyncio.to_thread(self._get_disk, key, cache_site)
+
+    def _get_memory(self, key: str, cache_site: Optional[str]) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                self._count(cache_site, "hits")
+                return value
+            del self._memory[key]
+            self._stats["expired"] += 1
+            return None
+
+    def _get_disk(self, key: str, cache_site: Optional[str]) -> Optional[Any]:
+        """SQLite tier lookup (blocking); records the miss if there is no hit."""
+        now = time.time()
+        row = None
+        if self._db is not None:
+            with self._db_lock:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and row[1] <= now:
+                        self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache read failed: {e}")
+                    row = None
+
+        with self._lock:
+            if row is not None:
+                raw, expires_at = row
+                if expires_at > now:
+                    value = json.loads(raw)
+                    self._put_memory(key, value, expires_at)
+                    self._stats["disk_hits"] += 1
+                    self._count(cache_site, "hits")
+                    return value
+                self._stats["expired"] += 1
+
+            self._stats["misses"] += 1
+            self._count(cache_site, "misses")
+            return None
+
+    def set(self, key: str, value: Any, cache_site: Optional[str] = None, ttl: Optional[int] = None):
+        """Store a JSON-serializable value under key."""
+        expires_at = self._set_memory(key, value, cache_site, ttl)
+        if self._db is not None:
+            self._write_disk(key, json.dumps(value), expires_at, cache_site)
+
+    async def set_async(self, key: str, value: Any, cache_site: Optional[str] = None, ttl: Optional[int] = None):
+        """set() for the event loop: the memory tier is updated now, SQLite in the background."""
+        expires_at = self._set_memory(key, value, cache_site, ttl)
+        if self._db is None:
+            return
+        write = asyncio.get_running_loop().create_task(asyncio.to_thread(
+            self._write_disk, key, json.dumps(value), expires_at, cache_site
+        ))
+        self._pending_writes.add(write)
+        write.add_done_callback(self._pending_writes.discard)
+
+    def _set_memory(self, key: str, value: Any, cache_site: Optional[str], ttl: Optional[int]) -> float:
+        if ttl is None:
+            ttl = CALL_SITE_TTLS.get(cache_site, DEFAULT_TTL_SECONDS)
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._put_memory(key, value, expires_at)
+            self._stats["stores"] += 1
+        return expires_at
+
+    def _write_disk(self, key: str, raw: str, expires_at: float, cache_site: Optional[str]):
+        with self._db_lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, call_site) VALUES (?, ?, ?, ?)",
+                    (key, raw, expires_at, cache_site),
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache write failed: {e}")
+
+    def _put_memory(self, key: str, value: Any, expires_at: float):
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached response from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        with self._lock:
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                "enabled": LLM_CACHE_ENABLED,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "sqlite_enabled": self._db is not None,
+                **self._stats,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "by_call_site": {site: dict(counts) for site, counts in self._site_stats.items()},
+                "call_site_ttls": dict(CALL_SITE_TTLS),
+            }
+
+
+# Process-wide cache instance
+llm_response_cache = LLMResponseCache()
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Get LLM response cache statistics."""
+    return llm_response_cache.stats()
+
+
+def clear_llm_cache():
+    """Clear the LLM response cache. Useful for testing."""
+    llm_response_cache.clear()
+    logger.info("LLM response cache cleared")
@@ -0,0 +1,142 @@
+"""Anthropic prompt caching for large, mostly static system prompts
+
+The JD analysis prompt (HenryHQ-STRUCT), the Hey Henry coaching prompt and the
+resume strategist prompt are thousands of tokens that are identical on every
+request, followed by a short per-request tail (candidate calibration, user
+context). Sending them as one string makes the API re-read the whole thing
+every time.
+
+SystemPrompt keeps the two parts apart:
+
+    system_prompt = SystemPrompt(STATIC_PROMPT)
+    system_prompt += calibration_prompt          # appended to the suffix
+    await call_claude_async(system_prompt, user_message)
+
+    system_prompt = format_prompt(HEY_HENRY_SYSTEM_PROMPT, user_name=..., ...)
+
+The Claude client sends the prefix as its own text block marked with
+cache_control, so repeat requests read it from Anthropic's prompt cache (lower
+input-token cost and time-to-first-token). The prefix must stay byte-for-byte
+identical across requests for that to hit: keep anything request-specific in
+the suffix.
+
+str(system_prompt) is exactly the old single string, so response-cache keys
+and logs don't change. Set ENABLE_PROMPT_CACHING=false to send plain strings.
+"""
+
+import os
+import re
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Union
+
+logger = logging.getLogger("henryhq")
+
+ENABLE_PROMPT_CACHING = os.getenv("ENABLE_PROMPT_CACHING", "true").lower() == "true"
+
+# The API ignores cache_control on prefixes under 1024 tokens (Sonnet/Opus);
+# ~4 chars per token, so don't spend a breakpoint on anything shorter.
+PROMPT_CACHE_MIN_CHARS = int(os.getenv("PROMPT_CACHE_MIN_CHARS", "4000"))
+
+# Template text up to the first replacement field ({{ and }} are escapes)
+_TEMPLATE_HEAD = re.compile(r"(?:[^{}]|\{\{|\}\})*")
+
+
+@dataclass(frozen=True)
+class SystemPrompt:
+    """A system prompt split into a cacheable static prefix and a per-request suffix."""
+    prefix: str
+    suffix: str = ""
+
+    def __str__(self) -> str:
+        return self.prefix + self.suffix
+
+    def __len__(self) -> int:
+        return len(self.prefix) + len(self.suffix)
+
+    def __add__(self, other: str) -> "SystemPrompt":
+        # `system_prompt += extra` keeps extending the per-request part
+        return SystemPrompt(self.prefix, self.suffix + other)
+
+    @property
+    def cacheable(self) -> bool:
+        return ENABLE_PROMPT_CACHING and len(self.prefix) >= PROMPT_CACHE_MIN_CHARS
+
+    def to_api(self) -> Union[str, List[Dict[str, Any]]]:
+        """The `system` value for messages.create()."""
+        if not self.cacheable:
+            return str(self)
+        blocks = [{"type": "text", "text": self.prefix, "cache_control": {"type": "ephemeral"}}]
+        if self.suffix:
+            blocks.append({"type": "text", "text": self.suffix})
+        return blocks
+
+
+def format_prompt(template: str, **fields) -> SystemPrompt:
+    """
+    str.format() a prompt template, splitting it at the first replacement field.
+
+    Everything before the first {field} becomes the cached prefix, so templates
+    should keep their static instructions first and per-request context last.
+    """
+    head = _TEMPLATE_HEAD.match(template).group()
+    return SystemPrompt(head.format(), template[len(head):].format(**fields))
+
+
+def system_param(system):
+    """Convert a system prompt (str, blocks or SystemPrompt) to the API value."""
+    if isinstance(system, SystemPrompt):
+        return system.to_api()
+    return system
+
+
+def system_text(system):
+    """Plain-text form of a system prompt (for cache keys and logging)."""
+    if isinstance(system, SystemPrompt):
+        return str(system)
+    return system
+
+
+# =============================================================================
+# USAGE METRICS
+# =============================================================================
+
+_stats_lock = threading.Lock()
+_stats = {
+    "requests": 0,
+    "cache_hits": 0,
+    "cache_writes": 0,
+    "input_tokens": 0,
+    "cache_read_input_tokens": 0,
+    "cache_creation_input_tokens": 0,
+}
+
+
+def record_prompt_cache_usage(usage) -> None:
+    """Accumulate token usage from a Claude response (no-op without usage data)."""
+    if usage is None:
+        return
+    read = getattr(usage, "cache_read_input_tokens", None) or 0
+    created = getattr(usage, "cache_creation_input_tokens", None) or 0
+    uncached = getattr(usage, "input_tokens", None) or 0
+    with _stats_lock:
+        _stats["requests"] += 1
+        _stats["cache_hits"] += 1 if read else 0
+        _stats["cache_writes"] += 1 if created else 0
+        _stats["input_tokens"] += uncached
+        _stats["cache_read_input_tokens"] += read
+        _stats["cache_creation_input_tokens"] += created
+
+
+def get_prompt_cache_stats() -> Dict[str, Any]:
+    """Get prompt cache statistics (share of input tokens served from cache)."""
+    with _stats_lock:
+        stats = dict(_stats)
+    total_input = stats["input_tokens"] + stats["cache_read_input_tokens"] + stats["cache_creation_input_tokens"]
+    return {
+        "enabled": ENABLE_PROMPT_CACHING,
+        "min_prefix_chars": PROMPT_CACHE_MIN_CHARS,
+        **stats,
+        "cached_input_share": round(stats["cache_read_input_tokens"] / total_input, 4) if total_input else 0.0,
+    }
@@ -0,0 +1,239 @@
+"""Bounded process pool for CPU-heavy document rendering and parsing
+
+WeasyPrint, python-docx and PyMuPDF hold the GIL for the whole render, so a
+3-second PDF run inline (or in a thread) stalls every other request on the
+worker. RenderPool runs those jobs (see render_jobs.py) in separate processes:
+
+- At most RENDER_POOL_WORKERS jobs execute at once; up to RENDER_POOL_MAX_QUEUE
+  more wait their turn, and anything beyond that is rejected (RenderPoolBusy,
+  surfaced as 503) instead of piling up unbounded
+- Each job gets RENDER_JOB_TIMEOUT_SECONDS of execution time. A job that overruns
+  raises RenderTimeout and its worker processes are replaced, so a wedged
+  render can't hold a slot forever
+- Per-kind counters and latencies are exposed through stats()
+
+Set ENABLE_RENDER_POOL=false to run jobs in a thread instead (same API).
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("henryhq")
+
+ENABLE_RENDER_POOL = os.getenv("ENABLE_RENDER_POOL", "true").lower() == "true"
+RENDER_POOL_WORKERS = int(os.getenv("RENDER_POOL_WORKERS", "2"))
+RENDER_POOL_MAX_QUEUE = int(os.getenv("RENDER_POOL_MAX_QUEUE", "32"))
+RENDER_JOB_TIMEOUT_SECONDS = float(os.getenv("RENDER_JOB_TIMEOUT_SECONDS", "30"))
+
+
+def _init_render_worker():
+    """
+    Worker process initializer.
+
+    Spawned workers inherit the app's sys.path, which has backend/ first.
+    Put the repo root back in front so imports resolve as they do for the app.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if not sys.path or sys.path[0] != root:
+        sys.path.insert(0, root)
+
+
+class RenderPoolBusy(Exception):
+    """The render queue is full."""
+
+
+class RenderTimeout(Exception):
+    """A render job exceeded its time budget."""
+
+
+class RenderPool:
+    """Process pool with a bounded wait queue, per-job timeouts and metrics."""
+
+    def __init__(
+        self,
+        max_workers: int = RENDER_POOL_WORKERS,
+        max_queue: int = RENDER_POOL_MAX_QUEUE,
+        timeout_seconds: float = RENDER_JOB_TIMEOUT_SECONDS,
+        initializer: Optional[Callable] = _init_render_worker,
+        enabled: bool = ENABLE_RENDER_POOL,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout_seconds = timeout_seconds
+        self.enabled = enabled
+        self._initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+
+        # Metrics
+        self.queued = 0
+        self.running = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.recycles = 0
+        self.max_queue_depth = 0
+        self._kinds: Dict[str, Dict[str, float]] = {}
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: workers start clean instead of forking a threaded server
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self._initializer,
+                )
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Replace the executor, killing its workers (used after a timeout or crash)."""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return  # another job already replaced it
+            self._executor = None
+            self.recycles += 1
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    async def run(self, kind: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process and return its result.
+
+        Raises:
+            RenderPoolBusy: the wait queue is full
+            RenderTimeout: the job ran longer than its timeout
+            Any exception raised by fn itself
+        """
+        stats = self._kinds.setdefault(kind, {
+            "completed": 0, "failed": 0, "timeouts": 0,
+            "total_ms": 0.0, "max_ms": 0.0, "total_wait_ms": 0.0,
+        })
+
+        if self.queued >= self.max_queue and self.running >= self.max_workers:
+            self.rejected += 1
+            logger.warning(f"Render pool busy, rejecting {kind} job ({self.queued} queued)")
+            raise RenderPoolBusy(f"Render queue full ({self.queued} waiting)")
+
+        timeout = self.timeout_seconds if timeout is None else timeout
+        enqueued_at = time.perf_counter()
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        slots = self._get_slots()
+        try:
+            await slots.acquire()
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        started_at = time.perf_counter()
+        stats["total_wait_ms"] += (started_at - enqueued_at) * 1000
+        try:
+            result = await self._execute(fn, args, timeout)
+        except RenderTimeout:
+            self.timeouts += 1
+            stats["timeouts"] += 1
+            raise
+        except Exception:
+            stats["failed"] += 1
+            raise
+        finally:
+            self.running -= 1
+            slots.release()
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+        stats["completed"] += 1
+        return result
+
+    async def _execute(self, fn: Callable, args: tuple, timeout: float) -> Any:
+        if not self.enabled:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(fn, *args), timeout)
+            except asyncio.TimeoutError:
+                raise RenderTimeout(f"Render job exceeded {timeout:.0f}s")
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                return await asyncio.wait_for(loop.run_in_executor(executor, fn, *args), timeout)
+            except asyncio.TimeoutError:
+                self._recycle(executor)
+                raise RenderTimeout(f"Render job exceeded {timeout:.0f}s")
+            except BrokenProcessPool:
+                # Killed by another job's timeout recycle (or a worker crash): retry once
+                self._recycle(executor)
+                if attempt:
+                    raise
+
+    def shutdown(self):
+        """Stop the worker processes (pending jobs are cancelled)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics for monitoring."""
+        kinds = {}
+        for kind, s in self._kinds.items():
+            finished = s["completed"] + s["failed"] + s["timeouts"]
+            kinds[kind] = {
+                "completed": s["completed"],
+                "failed": s["failed"],
+                "timeouts": s["timeouts"],
+                "avg_ms": round(s["total_ms"] / finished, 1) if finished else 0.0,
+                "max_ms": round(s["max_ms"], 1),
+                "avg_wait_ms": round(s["total_wait_ms"] / finished, 1) if finished else 0.0,
+            }
+        return {
+            "enabled": self.enabled,
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "timeout_seconds": self.timeout_seconds,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queue_depth": self.max_queue_depth,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "recycles": self.recycles,
+            "jobs": kinds,
+        }
+
+
+# Process-wide pool instance (workers start on first use)
+render_pool = RenderPool()
+
+
+def get_render_pool_stats() -> Dict[str, Any]:
+    """Get render pool statistics."""
+    return render_pool.stats()
@@ -11,7 +11,17 @@ from .mock_interview_store import (
     get_mock_analysis,
     update_mock_session,
     cleanup_expired_sessions,
+    run_session_cleanup,
     set_supabase_client,
+    # Batched session reads
+    MockSessionSnapshot,
+    load_mock_session_snapshot,
+    get_mock_session_snapshot,
+    get_mock_session_snapshot_async,
+    # Hot tier / write-behind
+    flush_mock_session,
+    flush_mock_writes,
+    get_mock_store_stats,
     # In-memory storage (fallback)
     mock_interview_sessions,
     mock_interview_questions,
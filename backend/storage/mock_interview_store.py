@@ -1,14 +1,39 @@
-"""Mock interview storage helpers - Supabase with in-memory fallback"""
+"""Mock interview storage helpers - in-memory hot tier with write-behind to Supabase"""
 
+import asyncio
+import atexit
+import heapq
 import logging
-from typing import Optional, Dict, Any, List
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
+
+from .write_behind import INSERT, UPDATE, UPSERT, SupabaseWriteBehind, WriteOp
 
 logger = logging.getLogger("henryhq")
 
 # Session TTL in seconds (24 hours)
 SESSION_TTL_SECONDS = 24 * 60 * 60
 
-# In-memory storage fallback (used when Supabase is not available)
+# Expired sessions are swept by a background task at this interval, at most
+# MOCK_SESSION_CLEANUP_BATCH per pass
+MOCK_SESSION_CLEANUP_INTERVAL_SECONDS = float(os.getenv("MOCK_SESSION_CLEANUP_INTERVAL_SECONDS", "60"))
+MOCK_SESSION_CLEANUP_BATCH = int(os.getenv("MOCK_SESSION_CLEANUP_BATCH", "1000"))
+
+# Hot tier: active sessions are served from memory and written behind to Supabase
+MOCK_HOT_SESSIONS_MAX = int(os.getenv("MOCK_HOT_SESSIONS_MAX", "500"))
+MOCK_WRITE_BEHIND = os.getenv("MOCK_WRITE_BEHIND", "true").lower() == "true"
+MOCK_WRITE_BATCH_SIZE = int(os.getenv("MOCK_WRITE_BATCH_SIZE", "100"))
+MOCK_WRITE_LINGER_SECONDS = float(os.getenv("MOCK_WRITE_LINGER_SECONDS", "0.25"))
+
+# In-memory storage. With Supabase configured this is the hot tier (bounded to
+# MOCK_HOT_SESSIONS_MAX sessions); without it, it is the only copy.
 # WARNING: Data is lost on server restart when using fallback
 outcomes_store: List[Dict[str, Any]] = []
 mock_interview_sessions: Dict[str, Dict[str, Any]] = {}
@@ -19,6 +44,12 @@ mock_interview_analyses: Dict[str, Dict[str, Any]] = {}
 # Supabase client reference - will be set by main app
 _supabase_client = None
 
+# Snapshot loads fan their per-table queries out on this pool
+SNAPSHOT_QUERY_WORKERS = 6
+_snapshot_executor = ThreadPoolExecutor(
+    max_workers=SNAPSHOT_QUERY_WORKERS, thread_name_prefix="mock-snapshot"
+)
+
 
 def set_supabase_client(client):
     """Set the Supabase client for storage operations."""
@@ -26,208 +57,597 @@ def set_supabase_client(client):
     _supabase_client = client
 
 
-def save_mock_session(session_id: str, session_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview session to Supabase or fallback to in-memory."""
-    if _supabase_client and user_id:
+# =============================================================================
+# HOT TIER + WRITE-BEHIND
+# =============================================================================
+
+def _session_created_ts(session: Dict[str, Any]) -> float:
+    """Creation time of a session record as a Unix timestamp (now if it has none)."""
+    created_at = session.get("created_at") or session.get("started_at")
+    if isinstance(created_at, (int, float)):
+        return float(created_at)
+    if isinstance(created_at, str):
+        # Parse ISO format timestamp
         try:
-            data = {
-                "id": session_id,
-                "user_id": user_id,
-                "resume_json": session_data.get("resume_json", {}),
-                "job_description": session_data.get("job_description"),
-                "company": session_data.get("company"),
-                "role_title": session_data.get("role_title"),
-                "interview_stage": session_data.get("interview_stage"),
-                "difficulty_level": session_data.get("difficulty_level", "medium"),
-                "current_question_number": session_data.get("current_question_number", 1),
+            return datetime.fromisoformat(created_at.replace('Z', '+00:00')).timestamp()
+        except (ValueError, TypeError):
+            pass
+    return time.time()
+
+
+class MockSessionHotTier:
+    """
+    Bookkeeping for the sessions held in the in-memory dicts.
+
+    - LRU: every read or write admits its session (and the question it
+      touches). Past max_sessions the least recently used session is
+      evicted: dropped from memory at once if none of its writes are in
+      flight, otherwise as soon as the write-behind queue reports it clean.
+      Admitting an evicting session keeps it.
+    - Pinned sessions are never evicted (nor counted against max_sessions)
+      because memory holds their only copy: saved without a user_id,
+      holding analyses that are never written to Supabase, or with writes
+      the write-behind queue gave up on. They leave memory only on expiry.
+    - Session -> question reverse index, so dropping a session never scans
+      the question dicts.
+    - Expiry heap of (expires_at, session_id); pop_expired() costs
+      O(expired log n). Entries superseded or forgotten are skipped lazily.
+
+    Assumes a single worker process owns a session's hot copy.
+    """
+
+    def __init__(self, max_sessions: int = MOCK_HOT_SESSIONS_MAX):
+        self.max_sessions = max_sessions
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        self._questions: Dict[str, Set[str]] = {}
+        self._evicting: Set[str] = set()
+        self._pinned: Set[str] = set()
+        self._durable_analyses: Set[str] = set()
+        self._expiry: List[Tuple[float, str]] = []
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def admit(self, session_id: Optional[str], question_id: Optional[str] = None) -> None:
+        """Mark session_id most recently used, evicting the oldest sessions past the bound."""
+        if not session_id:
+            return
+        victims = []
+        with self._lock:
+            if question_id:
+                self._questions.setdefault(session_id, set()).add(question_id)
+            if session_id in self._pinned:
+                return
+            self._evicting.discard(session_id)
+            self._lru[session_id] = None
+            self._lru.move_to_end(session_id)
+            if _supabase_client is not None:
+                while len(self._lru) > self.max_sessions:
+                    victim, _ = self._lru.popitem(last=False)
+                    if self._memory_only_analyses(victim):
+                        self._pinned.add(victim)
+                        continue
+                    self._evicting.add(victim)
+                    victims.append(victim)
+        for victim in victims:
+            self._drop_if_clean(victim)
+
+    def pin(self, session_id: Optional[str]) -> None:
+        """Keep session_id in memory until it expires (memory holds its only copy)."""
+        if not session_id:
+            return
+        with self._lock:
+            self._lru.pop(session_id, None)
+            self._evicting.discard(session_id)
+            self._pinned.add(session_id)
+
+    def mark_durable_analysis(self, key: str) -> None:
+        """Note that the analysis stored under key has a copy in Supabase."""
+        with self._lock:
+            self._durable_analyses.add(key)
+
+    def _memory_only_analyses(self, session_id: str) -> bool:
+        session = mock_interview_sessions.get(session_id) or {}
+        keys = self._questions.get(session_id, set()) | set(session.get("question_ids") or []) | {session_id}
+        return any(key in mock_interview_analyses and key not in self._durable_analyses for key in keys)
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def on_clean(self, session_ids: Iterable[str]) -> None:
+        """Write-behind callback: finish evicting sessions whose writes have landed."""
+        for session_id in session_ids:
+            if session_id in self._evicting:
+                self._drop_if_clean(session_id)
+
+    def on_failed(self, session_ids: Iterable[str]) -> None:
+        """Write-behind callback: writes were dropped, so memory is the only copy."""
+        for session_id in session_ids:
+            self.pin(session_id)
+
+    def track_expiry(self, session_id: str, created_ts: float) -> None:
+        """Schedule session_id to expire SESSION_TTL_SECONDS after created_ts."""
+        expires_at = created_ts + SESSION_TTL_SECONDS
+        with self._lock:
+            if self._expires_at.get(session_id) == expires_at:
+                return
+            self._expires_at[session_id] = expires_at
+            heapq.heappush(self._expiry, (expires_at, session_id))
+
+    def pop_expired(self, now: float, limit: Optional[int] = None) -> List[str]:
+        """Sessions whose expiry has passed, oldest first (at most limit of them)."""
+        expired = []
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                if limit is not None and len(expired) >= limit:
+                    break
+                expires_at, session_id = heapq.heappop(self._expiry)
+                if self._expires_at.get(session_id) != expires_at:
+                    continue  # superseded or already dropped
+                del self._expires_at[session_id]
+                expired.append(session_id)
+        return expired
+
+    def release(self, session_id: str) -> Set[str]:
+        """Stop tracking session_id; returns its indexed question IDs."""
+        with self._lock:
+            self._lru.pop(session_id, None)
+            self._evicting.discard(session_id)
+            self._pinned.discard(session_id)
+            self._expires_at.pop(session_id, None)
+            question_ids = self._questions.pop(session_id, set())
+            self._durable_analyses.difference_update(question_ids | {session_id})
+        _write_behind.forget(session_id)
+        return question_ids
+
+    def _drop_if_clean(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id not in self._evicting or _write_behind.pending(session_id):
+                return False
+            if _write_behind.has_failed(session_id) or self._memory_only_analyses(session_id):
+                self.pin(session_id)
+                return False
+            _discard_session(session_id, self.release(session_id))
+            self.evictions += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hot tier statistics for monitoring."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            return {
+                "sessions": len(self._lru) + len(self._pinned),
+                "max_sessions": self.max_sessions,
+                "evicting": len(self._evicting),
+                "pinned": len(self._pinned),
+                "durable_backend": _supabase_client is not None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "expiry_heap": len(self._expiry),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
             }
-            _supabase_client.table("mock_interview_sessions").upsert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save session to Supabase: {e}")
-    # Fallback to in-memory
+
+
+def _discard_session(session_id: str, question_ids: Set[str]) -> None:
+    """Remove a session and its questions, responses and analyses from memory."""
+    session = mock_interview_sessions.pop(session_id, None)
+    if session:
+        question_ids = question_ids | set(session.get("question_ids") or [])
+    for qid in question_ids:
+        mock_interview_questions.pop(qid, None)
+        mock_interview_responses.pop(qid, None)
+        mock_interview_analyses.pop(qid, None)
+    mock_interview_analyses.pop(session_id, None)
+
+
+_hot_tier = MockSessionHotTier()
+_write_behind = SupabaseWriteBehind(
+    lambda: _supabase_client,
+    batch_size=MOCK_WRITE_BATCH_SIZE,
+    linger_seconds=MOCK_WRITE_LINGER_SECONDS,
+    background=MOCK_WRITE_BEHIND,
+    on_clean=_hot_tier.on_clean,
+    on_failed=_hot_tier.on_failed,
+    name="mock-interview-writer",
+)
+atexit.register(_write_behind.close)
+
+
+def _write(session_id: Optional[str], table: str, kind: str, row: Dict[str, Any],
+           key: Optional[str] = None, on_conflict: Optional[str] = None) -> None:
+    _write_behind.submit(WriteOp(session_id or "", table, kind, row, key, on_conflict))
+
+
+def _session_for_key(key: str) -> Optional[str]:
+    """Session owning a session-or-question key already held in memory."""
+    if key in mock_interview_sessions:
+        return key
+    question = mock_interview_questions.get(key)
+    return question.get("session_id") if question else None
+
+
+def flush_mock_session(session_id: str, timeout: float = 5.0) -> bool:
+    """Block until a session's queued writes are in Supabase. Returns False on timeout."""
+    return _write_behind.flush(session_id, timeout)
+
+
+def flush_mock_writes(timeout: float = 5.0) -> bool:
+    """Block until every queued mock interview write is in Supabase (shutdown hook)."""
+    return _write_behind.flush(timeout=timeout)
+
+
+def get_mock_store_stats() -> Dict[str, Any]:
+    """Get hot tier and write-behind statistics for monitoring."""
+    return {"hot_tier": _hot_tier.stats(), "write_behind": _write_behind.stats()}
+
+
+# =============================================================================
+# SESSION / QUESTION / RESPONSE / ANALYSIS HELPERS
+# =============================================================================
+
+def save_mock_session(session_id: str, session_data: Dict[str, Any], user_id: str = None) -> bool:
+    """Save mock interview session to the hot tier; Supabase is written behind (needs user_id)."""
+    _hot_tier.admit(session_id)
+    _hot_tier.track_expiry(session_id, _session_created_ts(session_data))
     mock_interview_sessions[session_id] = session_data
+    if _supabase_client and user_id:
+        data = {
+            "id": session_id,
+            "user_id": user_id,
+            "resume_json": session_data.get("resume_json", {}),
+            "job_description": session_data.get("job_description"),
+            "company": session_data.get("company"),
+            "role_title": session_data.get("role_title"),
+            "interview_stage": session_data.get("interview_stage"),
+            "difficulty_level": session_data.get("difficulty_level", "medium"),
+            "current_question_number": session_data.get("current_question_number", 1),
+        }
+        _write(session_id, "mock_interview_sessions", UPSERT, data, key=session_id)
+    else:
+        _hot_tier.pin(session_id)
     return True
 
 
 def get_mock_session(session_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview session from Supabase or fallback."""
+    """Get mock interview session from the hot tier, reading through to Supabase."""
+    session = mock_interview_sessions.get(session_id)
+    _hot_tier.record(session is not None)
+    if session is not None:
+        _hot_tier.admit(session_id)
+        return session
     if _supabase_client:
         try:
             result = _supabase_client.table("mock_interview_sessions").select("*").eq("id", session_id).single().execute()
             if result.data:
-                return result.data
+                _hot_tier.admit(session_id)
+                _hot_tier.track_expiry(session_id, _session_created_ts(result.data))
+                return mock_interview_sessions.setdefault(session_id, result.data)
         except Exception as e:
             logger.warning(f"Failed to get session from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_sessions.get(session_id)
+    return None
 
 
 def save_mock_question(question_id: str, question_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview question to Supabase or fallback."""
-    if _supabase_client and user_id:
-        try:
-            data = {
-                "id": question_id,
-                "session_id": question_data.get("session_id"),
-                "question_number": question_data.get("question_number"),
-                "question_text": question_data.get("question_text"),
-                "competency_tested": question_data.get("competency_tested"),
-                "difficulty": question_data.get("difficulty", "medium"),
-            }
-            _supabase_client.table("mock_interview_questions").upsert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save question to Supabase: {e}")
-    # Fallback to in-memory
+    """Save mock interview question to the hot tier; Supabase is written behind (needs user_id)."""
+    session_id = question_data.get("session_id")
+    _hot_tier.admit(session_id, question_id)
     mock_interview_questions[question_id] = question_data
+    # A new question has no responses yet - don't read through for them later
+    mock_interview_responses.setdefault(question_id, [])
+    if _supabase_client and user_id:
+        data = {
+            "id": question_id,
+            "session_id": session_id,
+            "question_number": question_data.get("question_number"),
+            "question_text": question_data.get("question_text"),
+            "competency_tested": question_data.get("competency_tested"),
+            "difficulty": question_data.get("difficulty", "medium"),
+        }
+        _write(session_id, "mock_interview_questions", UPSERT, data, key=question_id)
+    else:
+        _hot_tier.pin(session_id)
     return True
 
 
 def get_mock_question(question_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview question from Supabase or fallback."""
+    """Get mock interview question from the hot tier, reading through to Supabase."""
+    question = mock_interview_questions.get(question_id)
+    _hot_tier.record(question is not None)
+    if question is not None:
+        _hot_tier.admit(question.get("session_id"), question_id)
+        return question
     if _supabase_client:
         try:
             result = _supabase_client.table("mock_interview_questions").select("*").eq("id", question_id).single().execute()
             if result.data:
-                return result.data
+                _hot_tier.admit(result.data.get("session_id"), question_id)
+                return mock_interview_questions.setdefault(question_id, result.data)
         except Exception as e:
             logger.warning(f"Failed to get question from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_questions.get(question_id)
+    return None
 
 
 def save_mock_response(question_id: str, response_data: Dict[str, Any], user_id: str = None) -> bool:
-    """Save mock interview response to Supabase or fallback."""
-    if _supabase_client and user_id:
-        try:
-            data = {
-                "question_id": question_id,
-                "session_id": response_data.get("session_id"),
-                "response_text": response_data.get("response_text"),
-                "score": response_data.get("score"),
-                "feedback": response_data.get("feedback"),
-                "strengths": response_data.get("strengths", []),
-                "improvements": response_data.get("improvements", []),
-            }
-            _supabase_client.table("mock_interview_responses").insert(data).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save response to Supabase: {e}")
-    # Fallback to in-memory
+    """Append a mock interview response in the hot tier; Supabase is written behind (needs user_id)."""
+    session_id = response_data.get("session_id")
+    _hot_tier.admit(session_id, question_id)
     if question_id not in mock_interview_responses:
-        mock_interview_responses[question_id] = []
-    mock_interview_responses[question_id].append(response_data)
+        # Cold question: load earlier turns first so the new one doesn't shadow them
+        get_mock_responses(question_id)
+    mock_interview_responses.setdefault(question_id, []).append(response_data)
+    if _supabase_client and user_id:
+        data = {
+            "question_id": question_id,
+            "session_id": session_id,
+            "response_text": response_data.get("response_text"),
+            "score": response_data.get("score"),
+            "feedback": response_data.get("feedback"),
+            "strengths": response_data.get("strengths", []),
+            "improvements": response_data.get("improvements", []),
+        }
+        _write(session_id, "mock_interview_responses", INSERT, data)
+    else:
+        _hot_tier.pin(session_id)
     return True
 
 
 def get_mock_responses(question_id: str) -> List[Dict[str, Any]]:
-    """Get mock interview responses from Supabase or fallback."""
+    """Get mock interview responses from the hot tier, reading through to Supabase."""
+    responses = mock_interview_responses.get(question_id)
+    _hot_tier.record(responses is not None)
+    if responses is not None:
+        return responses
     if _supabase_client:
         try:
             result = _supabase_client.table("mock_interview_responses").select("*").eq("question_id", question_id).execute()
-            if result.data:
-                return result.data
+            rows = result.data or []
+            session_id = rows[0].get("session_id") if rows else _session_for_key(question_id)
+            if session_id:
+                _hot_tier.admit(session_id, question_id)
+                return mock_interview_responses.setdefault(question_id, rows)
+            return rows
         except Exception as e:
             logger.warning(f"Failed to get responses from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_responses.get(question_id, [])
+    return []
 
 
 def save_mock_analysis(session_id: str, analysis_data: Dict[str, Any]) -> bool:
-    """Save mock interview analysis to Supabase or fallback."""
-    if _supabase_client:
-        try:
-            data = {
-                "session_id": session_id,
-                "overall_score": analysis_data.get("overall_score"),
-                "competency_scores": analysis_data.get("competency_scores"),
-                "key_strengths": analysis_data.get("key_strengths", []),
-                "areas_for_improvement": analysis_data.get("areas_for_improvement", []),
-                "recommendations": analysis_data.get("recommendations", []),
-                "detailed_feedback": analysis_data.get("detailed_feedback"),
-            }
-            _supabase_client.table("mock_interview_analyses").upsert(data, on_conflict="session_id").execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save analysis to Supabase: {e}")
-    # Fallback to in-memory
+    """Save mock interview analysis to the hot tier; Supabase is written behind."""
+    owner = _session_for_key(session_id)
+    _hot_tier.admit(owner)
     mock_interview_analyses[session_id] = analysis_data
+    if _supabase_client:
+        data = {
+            "session_id": session_id,
+            "overall_score": analysis_data.get("overall_score"),
+            "competency_scores": analysis_data.get("competency_scores"),
+            "key_strengths": analysis_data.get("key_strengths", []),
+            "areas_for_improvement": analysis_data.get("areas_for_improvement", []),
+            "recommendations": analysis_data.get("recommendations", []),
+            "detailed_feedback": analysis_data.get("detailed_feedback"),
+        }
+        _write(owner or session_id, "mock_interview_analyses", UPSERT, data,
+               key=session_id, on_conflict="session_id")
+        _hot_tier.mark_durable_analysis(session_id)
     return True
 
 
 def get_mock_analysis(session_id: str) -> Optional[Dict[str, Any]]:
-    """Get mock interview analysis from Supabase or fallback."""
+    """Get mock interview analysis from the hot tier, reading through to Supabase."""
+    analysis = mock_interview_analyses.get(session_id)
+    _hot_tier.record(analysis is not None)
+    if analysis is not None:
+        return analysis
     if _supabase_client:
         try:
             result = _supabase_client.table("mock_interview_analyses").select("*").eq("session_id", session_id).single().execute()
             if result.data:
+                owner = _session_for_key(session_id)
+                if owner:
+                    _hot_tier.mark_durable_analysis(session_id)
+                    _hot_tier.admit(owner)
+                    return mock_interview_analyses.setdefault(session_id, result.data)
                 return result.data
         except Exception as e:
             logger.warning(f"Failed to get analysis from Supabase: {e}")
-    # Fallback to in-memory
-    return mock_interview_analyses.get(session_id)
+    return None
 
 
 def update_mock_session(session_id: str, updates: Dict[str, Any]) -> bool:
-    """Update mock interview session in Supabase or fallback."""
+    """Update mock interview session in the hot tier; Supabase is written behind."""
+    session = get_mock_session(session_id)
+    if session is not None:
+        session.update(updates)
     if _supabase_client:
-        try:
-            _supabase_client.table("mock_interview_sessions").update(updates).eq("id", session_id).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update session in Supabase: {e}")
-    # Fallback to in-memory
-    if session_id in mock_interview_sessions:
-        mock_interview_sessions[session_id].update(updates)
+        _write(session_id, "mock_interview_sessions", UPDATE, dict(updates), key=session_id)
         return True
-    return False
+    return session is not None
+
+
+# =============================================================================
+# SESSION SNAPSHOT (one in_() query per table instead of per-question reads)
+# =============================================================================
+
+@dataclass
+class MockSessionSnapshot:
+    """A session with all of its questions, responses and analyses, read in one pass."""
+    session_id: str
+    session: Optional[Dict[str, Any]]
+    question_ids: List[str] = field(default_factory=list)
+    questions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    responses: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    analyses: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        return self.questions.get(question_id)
+
+    def responses_for(self, question_id: str) -> List[Dict[str, Any]]:
+        return self.responses.get(question_id, [])
+
+    def analysis(self, question_id: str) -> Optional[Dict[str, Any]]:
+        return self.analyses.get(question_id)
+
+    def average_score(self) -> float:
+        """Average analysis score across the session's scored questions."""
+        if not self.session:
+            return 0.0
+        scores = []
+        for qid in self.question_ids:
+            analysis = self.analyses.get(qid)
+            if analysis and analysis.get("score"):
+                scores.append(analysis["score"])
+        if not scores:
+            return 0.0
+        return sum(scores) / len(scores)
+
+
+def _fetch_rows_in(table: str, column: str, values: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """All rows of table whose column is in values, or None if Supabase is unavailable."""
+    if not _supabase_client or not values:
+        return None
+    try:
+        result = _supabase_client.table(table).select("*").in_(column, values).execute()
+        return result.data or []
+    except Exception as e:
+        logger.warning(f"Failed to batch-load {table} from Supabase: {e}")
+        return None
+
+
+def load_mock_session_snapshot(session_id: str, session: Optional[Dict[str, Any]] = None) -> MockSessionSnapshot:
+    """
+    Load a session and everything hanging off its question_ids.
+
+    Whatever the hot tier already holds is used as is. The rest is read with
+    a single in_() query per table, run concurrently, and admitted to the hot
+    tier - so a live session costs no database reads at all.
 
+    Args:
+        session_id: Mock interview session ID
+        session: Session record if the caller already has it
 
-def cleanup_expired_sessions() -> int:
+    Returns:
+        MockSessionSnapshot (session is None if the session doesn't exist)
+    """
+    if session is None:
+        session = get_mock_session(session_id)
+    if not session:
+        return MockSessionSnapshot(session_id=session_id, session=None)
+
+    question_ids = list(session.get("question_ids") or [])
+    cold_questions = [qid for qid in question_ids if qid not in mock_interview_questions]
+    cold_responses = [qid for qid in question_ids if qid not in mock_interview_responses]
+    cold_analyses = [qid for qid in question_ids if qid not in mock_interview_analyses]
+
+    questions_future = _snapshot_executor.submit(
+        _fetch_rows_in, "mock_interview_questions", "id", cold_questions
+    )
+    responses_future = _snapshot_executor.submit(
+        _fetch_rows_in, "mock_interview_responses", "question_id", cold_responses
+    )
+    # Per-question analyses are stored under the question ID
+    analyses_future = _snapshot_executor.submit(
+        _fetch_rows_in, "mock_interview_analyses", "session_id", cold_analyses
+    )
+
+    for row in questions_future.result() or []:
+        if row.get("id"):
+            mock_interview_questions.setdefault(row["id"], row)
+    response_rows = responses_future.result()
+    if response_rows is not None:
+        loaded: Dict[str, List[Dict[str, Any]]] = {qid: [] for qid in cold_responses}
+        for row in response_rows:
+            loaded.setdefault(row.get("question_id"), []).append(row)
+        for qid, rows in loaded.items():
+            mock_interview_responses.setdefault(qid, rows)
+    for row in analyses_future.result() or []:
+        if row.get("session_id") and row["session_id"] not in mock_interview_analyses:
+            _hot_tier.mark_durable_analysis(row["session_id"])
+            mock_interview_analyses[row["session_id"]] = row
+
+    for qid in question_ids:
+        _hot_tier.admit(session_id, qid)
+
+    return MockSessionSnapshot(
+        session_id=session_id,
+        session=session,
+        question_ids=question_ids,
+        questions={qid: mock_interview_questions[qid] for qid in question_ids if qid in mock_interview_questions},
+        responses={qid: mock_interview_responses.get(qid, []) for qid in question_ids},
+        analyses={qid: mock_interview_analyses[qid] for qid in question_ids if qid in mock_interview_analyses},
+    )
+
+
+_active_snapshot: ContextVar[Optional[MockSessionSnapshot]] = ContextVar("mock_session_snapshot", default=None)
+
+
+def get_mock_session_snapshot(
+    session_id: str,
+    session: Optional[Dict[str, Any]] = None,
+    refresh: bool = False,
+) -> MockSessionSnapshot:
+    """Snapshot for session_id, reusing the one already loaded in this request."""
+    active = _active_snapshot.get()
+    if not refresh and active is not None and active.session_id == session_id:
+        return active
+    snapshot = load_mock_session_snapshot(session_id, session)
+    _active_snapshot.set(snapshot)
+    return snapshot
+
+
+async def get_mock_session_snapshot_async(
+    session_id: str,
+    session: Optional[Dict[str, Any]] = None,
+    refresh: bool = False,
+) -> MockSessionSnapshot:
+    """get_mock_session_snapshot without blocking the event loop."""
+    active = _active_snapshot.get()
+    if not refresh and active is not None and active.session_id == session_id:
+        return active
+    snapshot = await asyncio.to_thread(load_mock_session_snapshot, session_id, session)
+    _active_snapshot.set(snapshot)
+    return snapshot
+
+
+def cleanup_expired_sessions(now: Optional[float] = None, limit: Optional[int] = MOCK_SESSION_CLEANUP_BATCH) -> int:
     """
     Clean up expired mock interview sessions to prevent memory leaks
     and cross-session contamination.
 
+    Pops due sessions off the expiry heap and drops each one's questions
+    through the reverse index, so a pass costs O(expired), not
+    O(sessions x questions).
+
+    Args:
+        now: Current Unix time (defaults to time.time())
+        limit: Most sessions to drop in this pass (None for all)
+
     Returns:
         Number of sessions cleaned up
     """
-    import time
-    from datetime import datetime
-
-    current_time = time.time()
-    expired_sessions = []
-
-    # Find expired sessions
-    for session_id, session in mock_interview_sessions.items():
-        created_at = session.get("created_at", 0)
-        if isinstance(created_at, str):
-            # Parse ISO format timestamp
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                created_at = dt.timestamp()
-            except (ValueError, TypeError):
-                created_at = 0
-
-        if current_time - created_at > SESSION_TTL_SECONDS:
-            expired_sessions.append(session_id)
-
-    # Clean up expired sessions and their associated data
+    expired_sessions = _hot_tier.pop_expired(time.time() if now is None else now, limit)
     for session_id in expired_sessions:
-        # Find and remove questions for this session
-        questions_to_remove = [
-            qid for qid, q in mock_interview_questions.items()
-            if q.get("session_id") == session_id
-        ]
-        for qid in questions_to_remove:
-            mock_interview_questions.pop(qid, None)
-            mock_interview_responses.pop(qid, None)
-
-        # Remove session
-        mock_interview_sessions.pop(session_id, None)
-        mock_interview_analyses.pop(session_id, None)
+        _discard_session(session_id, _hot_tier.release(session_id))
+    _hot_tier.expirations += len(expired_sessions)
 
     if expired_sessions:
         print(f"🧹 Cleaned up {len(expired_sessions)} expired mock interview sessions")
 
     return len(expired_sessions)
+
+
+async def run_session_cleanup(interval_seconds: float = MOCK_SESSION_CLEANUP_INTERVAL_SECONDS) -> None:
+    """Sweep expired sessions every interval_seconds until cancelled (app lifespan task)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            cleanup_expired_sessions()
+        except Exception as e:
+            logger.warning(f"Mock session cleanup failed: {e}")
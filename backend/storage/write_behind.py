@@ -0,0 +1,305 @@
+"""Batched write-behind queue for Supabase tables"""
+
+import logging
+import threading
+import time
+from collections import deque, Counter
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger("henryhq")
+
+# Write kinds
+UPSERT = "upsert"
+INSERT = "insert"
+UPDATE = "update"
+
+
+class WriteOp(NamedTuple):
+    owner: str                      # e.g. the mock interview session the row belongs to
+    table: str
+    kind: str                       # UPSERT, INSERT or UPDATE
+    row: Dict[str, Any]
+    key: Optional[str] = None       # Row identity for coalescing (UPSERT / UPDATE)
+    on_conflict: Optional[str] = None
+    attempts: int = 0               # Failed writes so far
+
+
+class SupabaseWriteBehind:
+    """
+    Queues Supabase writes and applies them from a daemon thread in batches.
+
+    Ops are written in submission order. Consecutive ops for the same table and
+    kind share one round trip: upserts and inserts go out as a single bulk call
+    (upserts of the same key collapse to the latest row) and consecutive
+    updates of one row are merged. Each op carries an owner so callers can
+    flush() just their own writes, and on_clean(owners) fires once an owner
+    has nothing left in flight.
+
+    A failed round trip stops the batch there: the failed ops and everything
+    after them go back to the head of the queue and are retried with
+    exponential backoff, so their owners stay pending (and are never reported
+    clean). Ops still failing after max_retries attempts, or when closing,
+    are dropped and their owners reported to on_failed(owners) instead of
+    on_clean - has_failed(owner) stays True for them until forget(owner).
+
+    With background=False writes happen inline on submit (same batching code,
+    batch of one).
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        batch_size: int = 100,
+        linger_seconds: float = 0.5,
+        background: bool = True,
+        on_clean: Optional[Callable[[Iterable[str]], None]] = None,
+        on_failed: Optional[Callable[[Iterable[str]], None]] = None,
+        name: str = "supabase-write-behind",
+        max_retries: int = 5,
+        retry_backoff_seconds: float = 0.5,
+        retry_backoff_max_seconds: float = 30.0,
+    ):
+        self.client_getter = client_getter
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.background = background
+        self.on_clean = on_clean
+        self.on_failed = on_failed
+        self.name = name
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds
+        self._ops: Deque[WriteOp] = deque()
+        self._pending: Counter = Counter()
+        self._failed_owners: Set[str] = set()
+        self._retry_at = 0.0
+        self._cond = threading.Condition()
+        self._urgent = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.batches = 0
+        self.round_trips = 0
+
+    def submit(self, op: WriteOp) -> None:
+        """Queue op for writing (or write it now when not running in the background)."""
+        if not self.background:
+            self.submitted += 1
+            if self._write_batch([op]):
+                self.dropped += 1
+                self._mark_failed([op.owner])
+            return
+
+        self._ensure_started()
+        with self._cond:
+            self._ops.append(op)
+            self._pending[op.owner] += 1
+            self.submitted += 1
+            if len(self._ops) == 1 or len(self._ops) >= self.batch_size:
+                self._cond.notify_all()
+
+    def pending(self, owner: Optional[str] = None) -> int:
+        """Ops queued or being written, for one owner or overall."""
+        with self._cond:
+            if owner is None:
+                return sum(self._pending.values())
+            return self._pending.get(owner, 0)
+
+    def has_failed(self, owner: str) -> bool:
+        """True if some of owner's writes were dropped after failing."""
+        with self._cond:
+            return owner in self._failed_owners
+
+    def forget(self, owner: str) -> None:
+        """Clear owner's failed state (its in-memory data is gone too)."""
+        with self._cond:
+            self._failed_owners.discard(owner)
+
+    def flush(self, owner: Optional[str] = None, timeout: float = 5.0) -> bool:
+        """Write queued ops now and wait for them (one owner's or all). Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            while (self._pending.get(owner, 0) if owner is not None else self._pending):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread_alive():
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush outstanding writes and stop the writer thread."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._thread = None
+            self._closed = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Get write-behind statistics for monitoring."""
+        with self._cond:
+            queued = len(self._ops)
+            owners = len(self._pending)
+        return {
+            "background": self.background,
+            "running": self._thread_alive(),
+            "queued": queued,
+            "owners_pending": owners,
+            "submitted": self.submitted,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "owners_failed": len(self._failed_owners),
+            "batches": self.batches,
+            "round_trips": self.round_trips,
+        }
+
+    def _thread_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_started(self):
+        if self._thread_alive():
+            return
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._ops and not self._closed:
+                    self._urgent = False
+                    self._cond.wait()
+                if not self._ops:
+                    return
+                # Back off after a failed round trip (unless closing)
+                while not self._closed and time.monotonic() < self._retry_at:
+                    self._cond.wait(self._retry_at - time.monotonic())
+                # Linger briefly so a burst of writes shares round trips
+                deadline = time.monotonic() + self.linger_seconds
+                while not (self._urgent or self._closed) and len(self._ops) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = [self._ops.popleft() for _ in range(min(self.batch_size, len(self._ops)))]
+
+            failed = batch
+            try:
+                failed = self._write_batch(batch)
+            finally:
+                self._settle(batch, failed)
+
+    def _settle(self, batch: List[WriteOp], failed: List[WriteOp]):
+        """Re-queue failed ops (or give up on them) and release the rest."""
+        clean, dropped_owners = [], []
+        with self._cond:
+            give_up = self._closed or any(op.attempts >= self.max_retries for op in failed)
+            retry = [] if give_up else [op._replace(attempts=op.attempts + 1) for op in failed]
+            if retry:
+                self._ops.extendleft(reversed(retry))
+                self.retried += len(retry)
+                backoff = self.retry_backoff_seconds * 2 ** (retry[0].attempts - 1)
+                self._retry_at = time.monotonic() + min(backoff, self.retry_backoff_max_seconds)
+            dropped = failed if give_up else []
+            if dropped:
+                self.dropped += len(dropped)
+                dropped_owners = list({op.owner for op in dropped})
+                self._failed_owners.update(dropped_owners)
+                logger.error(f"{self.name} gave up on {len(dropped)} write(s) for {len(dropped_owners)} owner(s)")
+
+            requeued = Counter(op.owner for op in retry)
+            for owner, count in (Counter(op.owner for op in batch) - requeued).items():
+                self._pending[owner] -= count
+                if self._pending[owner] <= 0:
+                    del self._pending[owner]
+                    if owner not in self._failed_owners:
+                        clean.append(owner)
+            self._cond.notify_all()
+        if clean:
+            self._notify(self.on_clean, clean)
+        if dropped_owners:
+            self._notify(self.on_failed, dropped_owners)
+
+    def _mark_failed(self, owners: List[str]):
+        with self._cond:
+            self._failed_owners.update(owners)
+        self._notify(self.on_failed, owners)
+
+    def _notify(self, callback: Optional[Callable[[Iterable[str]], None]], owners: List[str]):
+        if callback is None:
+            return
+        try:
+            callback(owners)
+        except Exception as e:
+            logger.warning(f"{self.name} {callback.__name__} callback failed: {e}")
+
+    def _write_batch(self, batch: List[WriteOp]) -> List[WriteOp]:
+        """
+        Write a batch, one round trip per run of same-table, same-kind ops.
+
+        Stops at the first failed run so ops are never applied out of order.
+        Returns the ops not written (the failed run and everything after it).
+        """
+        client = self.client_getter()
+        runs: List[List[WriteOp]] = []
+        for op in batch:
+            if runs and (runs[-1][0].table, runs[-1][0].kind, runs[-1][0].on_conflict) == (
+                op.table, op.kind, op.on_conflict
+            ):
+                runs[-1].append(op)
+            else:
+                runs.append([op])
+
+        for i, run in enumerate(runs):
+            head = run[0]
+            try:
+                if client is None:
+                    raise RuntimeError("no Supabase client")
+                if head.kind == UPDATE:
+                    merged: Dict[str, Dict[str, Any]] = {}
+                    for op in run:
+                        merged.setdefault(op.key, {}).update(op.row)
+                    for key, row in merged.items():
+                        client.table(head.table).update(row).eq("id", key).execute()
+                        self.round_trips += 1
+                    distinct = len(merged)
+                elif head.kind == UPSERT:
+                    latest: Dict[Any, Dict[str, Any]] = {}
+                    for op in run:
+                        latest.pop(op.key, None)
+                        latest[op.key] = op.row
+                    rows = list(latest.values())
+                    if head.on_conflict:
+                        client.table(head.table).upsert(rows, on_conflict=head.on_conflict).execute()
+                    else:
+                        client.table(head.table).upsert(rows).execute()
+                    self.round_trips += 1
+                    distinct = len(rows)
+                else:
+                    client.table(head.table).insert([op.row for op in run]).execute()
+                    self.round_trips += 1
+                    distinct = len(run)
+                self.written += len(run)
+                self.coalesced += len(run) - distinct
+            except Exception as e:
+                self.failed += len(run)
+                logger.error(f"Failed to write {len(run)} {head.kind}(s) to {head.table}: {e}")
+                self.batches += 1
+                return [op for failed_run in runs[i:] for op in failed_run]
+        self.batches += 1
+        return []
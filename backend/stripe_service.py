@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional
 import stripe
 from supabase import Client
 
+from tier_service import invalidate_profile_cache
+
 logger = logging.getLogger(__name__)
 
 # Configure Stripe
@@ -157,24 +159,28 @@ class StripeService:
 
         logger.info(f"Stripe webhook received: {event_type}")
 
+        user_id = None
         if event_type == 'checkout.session.completed':
-            await self._handle_checkout_completed(data)
+            user_id = await self._handle_checkout_completed(data)
         elif event_type == 'customer.subscription.updated':
-            await self._handle_subscription_updated(data)
+            user_id = await self._handle_subscription_updated(data)
         elif event_type == 'customer.subscription.deleted':
-            await self._handle_subscription_deleted(data)
+            user_id = await self._handle_subscription_deleted(data)
         elif event_type == 'invoice.payment_failed':
-            await self._handle_payment_failed(data)
+            user_id = await self._handle_payment_failed(data)
         else:
             logger.info(f"Unhandled webhook event type: {event_type}")
 
+        # The user's tier may have changed - don't serve it from the profile cache
+        invalidate_profile_cache(user_id)
+
         return {'event_type': event_type, 'status': 'processed'}
 
     # -------------------------------------------------------------------------
     # Webhook event handlers
     # -------------------------------------------------------------------------
 
-    async def _handle_checkout_completed(self, session: Dict[str, Any]) -> None:
+    async def _handle_checkout_completed(self, session: Dict[str, Any]) -> Optional[str]:
         """Handle checkout.session.completed — activate the subscription."""
         user_id = session.get('metadata', {}).get('user_id')
         if not user_id:
@@ -211,8 +217,9 @@ class StripeService:
         }).eq('id', user_id).execute()
 
         logger.info(f"User {user_id} subscribed to {tier} (subscription={subscription_id})")
+        return user_id
 
-    async def _handle_subscription_updated(self, subscription: Dict[str, Any]) -> None:
+    async def _handle_subscription_updated(self, subscription: Dict[str, Any]) -> Optional[str]:
         """Handle customer.subscription.updated — upgrade, downgrade, or status change."""
         user_id = subscription.get('metadata', {}).get('user_id')
         if not user_id:
@@ -254,8 +261,9 @@ class StripeService:
         ).eq('id', user_id).execute()
 
         logger.info(f"User {user_id} subscription updated: tier={tier}, status={mapped_status}")
+        return user_id
 
-    async def _handle_subscription_deleted(self, subscription: Dict[str, Any]) -> None:
+    async def _handle_subscription_deleted(self, subscription: Dict[str, Any]) -> Optional[str]:
         """Handle customer.subscription.deleted — downgrade to Preview."""
         user_id = subscription.get('metadata', {}).get('user_id')
         if not user_id:
@@ -270,8 +278,9 @@ class StripeService:
         }).eq('id', user_id).execute()
 
         logger.info(f"User {user_id} subscription deleted — downgraded to sourcer (free tier)")
+        return user_id
 
-    async def _handle_payment_failed(self, invoice: Dict[str, Any]) -> None:
+    async def _handle_payment_failed(self, invoice: Dict[str, Any]) -> Optional[str]:
         """Handle invoice.payment_failed — mark subscription as past_due."""
         customer_id = invoice.get('customer')
         if not customer_id:
@@ -293,6 +302,7 @@ class StripeService:
         }).eq('id', user_id).execute()
 
         logger.info(f"User {user_id} payment failed — marked as past_due")
+        return user_id
 
     # -------------------------------------------------------------------------
     # Helper methods
@@ -316,6 +326,7 @@ class StripeService:
         self.supabase.table('user_profiles').update({
             'stripe_customer_id': customer.id,
         }).eq('id', user_id).execute()
+        invalidate_profile_cache(user_id)
 
         return customer.id
 
@@ -21,6 +21,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 import re
 
+from resume_features import get_resume_features
+
 # Import function mismatch module for enhanced detection
 try:
     from function_mismatch import (
@@ -456,22 +458,15 @@ def build_canonical_profile(
     This function runs ONCE. All downstream modules consume its output.
     No module is allowed to independently re-evaluate function or level.
     """
-    # Extract resume text and titles
-    titles = []
-    bullets_text = ""
-
-    for role in resume_data.get("experience", []):
-        if role.get("title"):
-            titles.append(role["title"])
-        bullets_text += " ".join(role.get("bullets", []))
-
-    summary = resume_data.get("summary", "")
-    full_text = f"{summary} {bullets_text}"
+    # Resume text and titles come from the request's shared ResumeFeatures
+    features = get_resume_features(resume_data)
+    titles = features.titles
+    full_text = features.canonical_text
 
     # Calculate years of experience (EXCLUDING internships)
     # CRITICAL: Internships do NOT count toward professional experience
     years_exp = None
-    experience_list = resume_data.get("experience", [])
+    experience_list = features.experience
     if experience_list:
         # Count only non-internship roles
         internship_patterns = [r'\bintern\b', r'\binternship\b', r'\bco-?op\b', r'\bfellow\b', r'\btrainee\b', r'\bstudent\b']
@@ -0,0 +1,141 @@
+"""
+In-process cache primitive tests (utils/cache.py).
+
+Covers:
+1. LRUCache eviction order and TTL expiry
+2. SingleFlight coalescing of concurrent identical work
+3. TTLCache byte bounds, stale-while-revalidate refresh and expiry sweeps
+4. The registry keeps every live instance, even under a duplicate name
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import FRESH, MISS, STALE, LRUCache, SingleFlight, TTLCache, get_all_cache_stats
+
+
+class TestLRUCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(max_entries=10, ttl_seconds=60)
+        cache.set("fresh", 1)
+        cache.set("stale", 2, ttl_seconds=-1)
+        assert cache.get("fresh") == 1
+        assert cache.get("stale") is None
+        assert len(cache) == 1
+
+
+class TestSingleFlight:
+
+    async def test_concurrent_callers_share_one_computation(self):
+        flight = SingleFlight()
+        cache = LRUCache(max_entries=10)
+        calls = 0
+
+        async def compute(key):
+            nonlocal calls
+            async with flight.lock(key):
+                value = cache.get(key)
+                if value is None:
+                    calls += 1
+                    await asyncio.sleep(0.01)
+                    value = f"result-{key}"
+                    cache.set(key, value)
+                return value
+
+        results = await asyncio.gather(*[compute("jd") for _ in range(5)], compute("other"))
+        assert results[:5] == ["result-jd"] * 5
+        assert results[5] == "result-other"
+        assert calls == 2
+        assert flight.stats()["coalesced"] == 4
+        assert flight.stats()["in_flight"] == 0
+
+    async def test_lock_released_on_error(self):
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            async with flight.lock("k"):
+                raise ValueError("boom")
+        assert not flight.in_flight("k")
+
+
+class TestTTLCache:
+
+    def test_evicts_by_bytes_and_skips_oversize(self):
+        cache = TTLCache("test_bytes", max_entries=100, max_bytes=3000)
+        for key in ("a", "b", "c"):
+            cache.set(key, "x" * 900)
+        cache.get("a")
+        cache.set("d", "x" * 900)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["bytes"] <= 3000
+
+        cache.set("huge", "x" * 10000)
+        assert cache.get("huge") is None
+        assert len(cache) == 3
+
+    async def test_stale_value_served_while_refreshing(self):
+        cache = TTLCache("test_swr", ttl_seconds=60, stale_seconds=60)
+        cache.set("jobs", ["old"], ttl_seconds=-1)
+        calls = []
+
+        async def reload():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return ["new"]
+
+        value, state = cache.lookup("jobs")
+        assert (value, state) == (["old"], STALE)
+        cache.refresh("jobs", reload)
+        cache.refresh("jobs", reload)  # already in flight
+        assert cache.lookup("jobs") == (["old"], STALE)
+
+        await asyncio.sleep(0.1)
+        assert cache.lookup("jobs") == (["new"], FRESH)
+        assert len(calls) == 1
+        assert cache.stats()["refreshes"] == 1
+
+    def test_failed_refresh_keeps_stale_value(self):
+        cache = TTLCache("test_swr_fail", ttl_seconds=60, stale_seconds=60)
+        cache.set("k", "old", ttl_seconds=-1)
+        cache.refresh("k", lambda: None)
+        deadline = time.monotonic() + 2
+        while "k" in cache._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.lookup("k") == ("old", STALE)
+
+    def test_sweep_drops_entries_past_stale_window(self):
+        cache = TTLCache("test_sweep", ttl_seconds=60, stale_seconds=0)
+        cache.set("live", 1)
+        cache.set("dead", 2, ttl_seconds=-1)
+        assert cache.sweep() == 1
+        assert cache.lookup("dead") == (None, MISS)
+        assert get_all_cache_stats()["test_sweep"]["entries"] == 1
+
+    def test_duplicate_names_both_registered(self):
+        first = TTLCache("test_dup", ttl_seconds=60)
+        second = TTLCache("test_dup", ttl_seconds=60)
+        first.set("k", 1)
+        stats = get_all_cache_stats()
+        assert stats["test_dup"]["entries"] == 1
+        assert stats["test_dup#2"]["entries"] == 0
+        del second
+        assert "test_dup#2" not in get_all_cache_stats()
@@ -0,0 +1,74 @@
+"""
+Calibration signal feature tests (calibration/signal_detectors.py).
+
+Covers:
+1. SignalFeatures computed once per experience and shared across detectors
+2. Detectors read their answers from the shared features
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calibration.signal_detectors import (
+    _signal_features_for_text,
+    detect_manager_of_managers,
+    detect_org_level_influence,
+    detect_passive_voice_dominance,
+    detect_sales_motion,
+    extract_metrics,
+    extract_scope_signals,
+    extract_signal_features,
+    extract_team_size,
+)
+
+
+EXPERIENCE = {
+    'roles': [{
+        'title': 'Director of Engineering',
+        'company': 'Acme',
+        'description': 'Managed managers across a global platform org of 80. Closed $150K ACV deals.',
+        'highlights': ['Led team of 12 engineers', 'Defined engineering strategy for the org', 'Drove 30% growth'],
+    }],
+    'summary': 'Engineering leader',
+    'skills': ['Python', 'Kubernetes'],
+}
+
+
+class TestSignalFeatures:
+
+    def test_detectors_share_one_scan(self):
+        _signal_features_for_text.cache_clear()
+        extract_team_size(EXPERIENCE)
+        extract_scope_signals(EXPERIENCE)
+        detect_org_level_influence(EXPERIENCE)
+        detect_sales_motion(EXPERIENCE)
+        detect_passive_voice_dominance(EXPERIENCE)
+        info = _signal_features_for_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    def test_detector_answers(self):
+        features = extract_signal_features(EXPERIENCE)
+        assert extract_signal_features(features) is features
+        assert extract_team_size(EXPERIENCE) == 80
+        assert extract_scope_signals(EXPERIENCE) == {
+            'geographic': 'global',
+            'organizational': 'department',
+            'product': 'platform',
+        }
+        assert detect_org_level_influence(EXPERIENCE) == 'explicit'
+        assert detect_sales_motion(EXPERIENCE) == 'Enterprise'
+        assert detect_manager_of_managers(EXPERIENCE) is True
+        assert [m['type'] for m in extract_metrics(EXPERIENCE)] == ['growth_rate']
+
+    def test_extract_metrics_returns_copies(self):
+        extract_metrics(EXPERIENCE)[0]['value'] = -1
+        assert extract_metrics(EXPERIENCE)[0]['value'] == 30.0
+
+    def test_empty_experience(self):
+        assert extract_team_size({}) == 0
+        assert detect_org_level_influence({}) == 'missing'
+        assert detect_sales_motion({}) == 'Unknown'
@@ -0,0 +1,240 @@
+"""
+Async Claude client tests.
+
+Covers the non-blocking client layer in services/claude_client.py:
+1. Retry on 529/429 with asyncio backoff
+2. Non-retryable errors surface immediately
+3. Concurrency bound via the in-flight semaphore
+4. Streaming yields chunks from the async stream
+5. Two-tier LLM response cache (LRU, TTL, SQLite, opt-in per call site)
+6. Async cache access keeps SQLite reads and writes off the event loop
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import anthropic
+import httpx
+import pytest
+from fastapi import HTTPException
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import claude_client
+from services.llm_cache import LLMResponseCache, make_cache_key
+
+
+# =============================================================================
+# FAKE ASYNC CLIENT
+# =============================================================================
+
+def _status_error(status_code: int) -> anthropic.APIStatusError:
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status_code, request=request)
+    return anthropic.APIStatusError("error", response=response, body=None)
+
+
+class _FakeContent:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeMessage:
+    def __init__(self, text):
+        self.content = [_FakeContent(text)]
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        async def gen():
+            for chunk in self._chunks:
+                yield chunk
+        return gen()
+
+
+class _FakeMessages:
+    def __init__(self, failures=None, delay: float = 0.0):
+        self.failures = list(failures or [])
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return _FakeMessage("ok")
+        finally:
+            self.in_flight -= 1
+
+    def stream(self, **kwargs):
+        self.calls += 1
+        return _FakeStream(["{", '"fit_score": 80', "}"])
+
+
+class _FakeAsyncClient:
+    def __init__(self, **kwargs):
+        self.messages = _FakeMessages(**kwargs)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    def install(**kwargs):
+        client = _FakeAsyncClient(**kwargs)
+        monkeypatch.setattr(claude_client, "_async_client", client)
+        monkeypatch.setattr(claude_client, "_backoff_delay", lambda attempt, base=2.0, cap=30.0: 0)
+        return client
+    return install
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestCallClaudeAsync:
+
+    async def test_returns_text(self, fake_client):
+        client = fake_client()
+        result = await claude_client.call_claude_async("system", "user")
+        assert result == "ok"
+        assert client.messages.calls == 1
+
+    async def test_retries_overloaded_then_succeeds(self, fake_client):
+        client = fake_client(failures=[_status_error(529), _status_error(429)])
+        result = await claude_client.call_claude_async("system", "user", max_retries=3)
+        assert result == "ok"
+        assert client.messages.calls == 3
+
+    async def test_overloaded_after_retries_is_503(self, fake_client):
+        fake_client(failures=[_status_error(529)] * 3)
+        with pytest.raises(HTTPException) as exc:
+            await claude_client.call_claude_async("system", "user", max_retries=3)
+        assert exc.value.status_code == 503
+
+    async def test_single_attempt_does_not_retry(self, fake_client):
+        client = fake_client(failures=[_status_error(529)])
+        with pytest.raises(HTTPException):
+            await claude_client.call_claude_async("system", "user", max_retries=1)
+        assert client.messages.calls == 1
+
+    async def test_non_retryable_error_is_500(self, fake_client):
+        client = fake_client(failures=[_status_error(400)])
+        with pytest.raises(HTTPException) as exc:
+            await claude_client.call_claude_async("system", "user")
+        assert exc.value.status_code == 500
+        assert client.messages.calls == 1
+
+
+class TestCreateMessageAsync:
+
+    async def test_raises_raw_api_error(self, fake_client):
+        fake_client(failures=[_status_error(400)])
+        with pytest.raises(anthropic.APIStatusError):
+            await claude_client.create_message_async(model="m", max_tokens=10, messages=[])
+
+    async def test_concurrency_is_bounded(self, fake_client, monkeypatch):
+        client = fake_client(delay=0.01)
+        monkeypatch.setattr(claude_client, "CLAUDE_MAX_CONCURRENCY", 3)
+        monkeypatch.setattr(claude_client, "_semaphore", None)
+        await asyncio.gather(*[
+            claude_client.create_message_async(model="m", max_tokens=10, messages=[])
+            for _ in range(10)
+        ])
+        assert client.messages.calls == 10
+        assert client.messages.max_in_flight == 3
+
+
+class TestStreamingAsync:
+
+    async def test_yields_chunks(self, fake_client):
+        fake_client()
+        chunks = [c async for c in claude_client.call_claude_streaming_async("system", "user")]
+        assert "".join(chunks) == '{"fit_score": 80}'
+
+
+# =============================================================================
+# LLM RESPONSE CACHE
+# =============================================================================
+
+class TestLLMResponseCache:
+
+    def test_key_is_order_independent_and_content_sensitive(self):
+        a = make_cache_key("m", "sys", [{"role": "user", "content": "hi"}], 0, 100)
+        b = make_cache_key("m", "sys", [{"content": "hi", "role": "user"}], 0, 100)
+        c = make_cache_key("m", "sys", [{"role": "user", "content": "hi!"}], 0, 100)
+        assert a == b
+        assert a != c
+
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2, sqlite_path="")
+        cache.set("a", "1", "jd_analyze")
+        cache.set("b", "2", "jd_analyze")
+        assert cache.get("a") == "1"  # a is now most recent
+        cache.set("c", "3", "jd_analyze")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(max_entries=10, sqlite_path="")
+        cache.set("a", "1", ttl=-1)
+        assert cache.get("a") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_sqlite_tier_survives_new_instance(self, tmp_path):
+        path = str(tmp_path / "llm_cache.db")
+        LLMResponseCache(max_entries=10, sqlite_path=path).set("k", {"text": "v"}, "fit_score")
+        fresh = LLMResponseCache(max_entries=10, sqlite_path=path)
+        assert fresh.get("k", "fit_score") == {"text": "v"}
+        stats = fresh.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["by_call_site"]["fit_score"]["hits"] == 1
+
+    async def test_async_sqlite_access_off_loop(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "llm_cache.db")
+        writer = LLMResponseCache(max_entries=10, sqlite_path=path)
+        await writer.set_async("k", {"text": "v"}, "fit_score")
+        assert await writer.get_async("k", "fit_score") == {"text": "v"}  # Memory tier, before the write lands
+        await asyncio.gather(*writer._pending_writes)
+
+        fresh = LLMResponseCache(max_entries=10, sqlite_path=path)
+        disk_threads = []
+        get_disk = fresh._get_disk
+        monkeypatch.setattr(fresh, "_get_disk", lambda *a: disk_threads.append(threading.get_ident()) or get_disk(*a))
+        assert await fresh.get_async("k", "fit_score") == {"text": "v"}
+        assert await fresh.get_async("k", "fit_score") == {"text": "v"}
+        assert len(disk_threads) == 1 and disk_threads[0] != threading.get_ident()
+        assert (fresh.stats()["disk_hits"], fresh.stats()["memory_hits"]) == (1, 1)
+
+    async def test_call_claude_async_hits_cache(self, fake_client, monkeypatch):
+        client = fake_client()
+        monkeypatch.setattr(claude_client, "llm_response_cache", LLMResponseCache(max_entries=10, sqlite_path=""))
+        first = await claude_client.call_claude_async("system", "user", cache_site="jd_analyze")
+        second = await claude_client.call_claude_async("system", "user", cache_site="jd_analyze")
+        assert first == second == "ok"
+        assert client.messages.calls == 1
+
+    async def test_nonzero_temperature_is_not_cached(self, fake_client, monkeypatch):
+        client = fake_client()
+        monkeypatch.setattr(claude_client, "llm_response_cache", LLMResponseCache(max_entries=10, sqlite_path=""))
+        await claude_client.call_claude_async("system", "user", temperature=0.7, cache_site="jd_analyze")
+        await claude_client.call_claude_async("system", "user", temperature=0.7, cache_site="jd_analyze")
+        assert client.messages.calls == 2
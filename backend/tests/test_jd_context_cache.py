@@ -0,0 +1,92 @@
+"""
+JD context resolution tests (backend.py resolve_jd_context).
+
+Covers:
+1. Concurrent requests for the same JD share one lookup and one parse
+2. A warm local memo hit skips the jd_cache read and the parse
+3. Memo entries expire and are then resolved again
+"""
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+
+import pytest
+
+# Set mock API key before importing backend (required for module load)
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key-for-unit-tests")
+
+# backend.py imports backend.* modules, but with backend/ on the path the
+# "backend" name resolves to backend.py - register the package explicitly
+if not hasattr(sys.modules.get("backend"), "__path__"):
+    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.modules["backend"] = importlib.util.module_from_spec(
+        importlib.machinery.PathFinder.find_spec("backend", [_repo_root])
+    )
+
+import backend.backend as app
+from utils.cache import LRUCache, SingleFlight
+
+JD_TEXT = "Senior Product Manager, Payments. Own the roadmap for our checkout platform."
+
+
+@pytest.fixture
+def jd_cache(monkeypatch):
+    calls = {"table": 0, "parse": 0, "store": 0}
+
+    def fake_table_lookup(jd_hash):
+        calls["table"] += 1
+        time.sleep(0.05)  # Round trip long enough for concurrent callers to pile up
+        return None
+
+    def fake_parse(jd_text, analysis_id):
+        calls["parse"] += 1
+        return {
+            "extracted_title": "Senior Product Manager",
+            "role_type": "product",
+            "alignment": {"confidence": 0.9, "warnings": []},
+            "role_level_info": {"role_level": "IC", "is_leadership_role": False},
+        }
+
+    def fake_store(**_):
+        calls["store"] += 1
+        return True
+
+    monkeypatch.setattr(app, "ENABLE_JD_CACHE", True)
+    monkeypatch.setattr(app, "jd_context_local_cache", LRUCache(max_entries=10, ttl_seconds=60))
+    monkeypatch.setattr(app, "jd_context_singleflight", SingleFlight())
+    monkeypatch.setattr(app, "get_cached_jd_context", fake_table_lookup)
+    monkeypatch.setattr(app, "_compute_jd_context", fake_parse)
+    monkeypatch.setattr(app, "store_jd_cache", fake_store)
+    return calls
+
+
+class TestResolveJDContext:
+
+    async def test_concurrent_requests_coalesced(self, jd_cache):
+        contexts = await asyncio.gather(*(app.resolve_jd_context(JD_TEXT, f"a{i}") for i in range(5)))
+        await asyncio.sleep(0)  # Let the write-behind task run
+        assert (jd_cache["table"], jd_cache["parse"]) == (1, 1)
+        assert sorted(c["cache_hit"] or "" for c in contexts) == ["", "local", "local", "local", "local"]
+        assert {c["extracted_title"] for c in contexts} == {"Senior Product Manager"}
+
+    async def test_memo_hit_skips_parse(self, jd_cache):
+        first = await app.resolve_jd_context(JD_TEXT, "a1")
+        first["role_level_info"]["role_level"] = "MANAGER"  # Callers get their own copy
+
+        second = await app.resolve_jd_context(JD_TEXT, "a2")
+        assert second["cache_hit"] == "local"
+        assert second["role_level_info"]["role_level"] == "IC"
+        assert (jd_cache["table"], jd_cache["parse"]) == (1, 1)
+
+    async def test_memo_expiry(self, jd_cache, monkeypatch):
+        monkeypatch.setattr(app, "jd_context_local_cache", LRUCache(max_entries=10, ttl_seconds=0.01))
+        await app.resolve_jd_context(JD_TEXT, "a1")
+        await asyncio.sleep(0.02)
+
+        again = await app.resolve_jd_context(JD_TEXT, "a2")
+        assert again["cache_hit"] is None
+        assert (jd_cache["table"], jd_cache["parse"]) == (2, 2)
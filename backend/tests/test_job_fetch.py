@@ -0,0 +1,116 @@
+"""
+Async job-board fetching tests (services/http_fetch.py, services/job_discovery.py).
+
+Covers:
+1. Token bucket allows a burst, then paces at its refill rate
+2. JSearch multi-query fan-out runs concurrently and merges in query order
+3. Failed queries are skipped without failing the search
+4. Expired results are served stale while a background refresh runs
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import job_discovery
+from services.http_fetch import TokenBucket
+from services.job_discovery import JobDiscoveryService
+from services.job_index import JobIndex
+
+
+def _jsearch_payload(query):
+    return {
+        "total": 2,
+        "data": [
+            {"job_id": f"{query}-1", "job_title": f"{query} role", "employer_name": "Acme"},
+            {"job_id": "shared", "job_title": "Shared role", "employer_name": "Globex"},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_job_index(monkeypatch):
+    index = JobIndex(":memory:")
+    monkeypatch.setattr(job_discovery, "get_job_index", lambda: index)
+    return index
+
+
+class TestTokenBucket:
+
+    async def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=20, capacity=3)
+        started = time.perf_counter()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.perf_counter() - started < 0.02
+
+        for _ in range(2):
+            await bucket.acquire()
+        # Two more tokens at 20/s take ~0.1s
+        assert 0.08 < time.perf_counter() - started < 0.2
+
+
+class TestJSearchFanOut:
+
+    async def test_queries_run_concurrently_in_order(self, monkeypatch):
+        async def fake_fetch(provider, url, headers=None, params=None, timeout=15):
+            assert provider == "jsearch"
+            await asyncio.sleep(0.1)
+            return _jsearch_payload(params["query"])
+
+        monkeypatch.setattr(job_discovery, "fetch_json", fake_fetch)
+        service = JobDiscoveryService()
+        service.api_key = "test-key"
+
+        started = time.perf_counter()
+        result = await service.search_multi_query([{"query": q} for q in ("pm", "tpm", "fintech")])
+        assert time.perf_counter() - started < 0.25
+
+        assert [job["job_id"] for job in result["jobs"]] == ["pm-1", "shared", "tpm-1", "fintech-1"]
+        assert result["search_queries"] == ["pm", "tpm", "fintech"]
+        assert result["total_found"] == 6
+
+    async def test_failed_query_skipped(self, monkeypatch):
+        async def fake_fetch(provider, url, headers=None, params=None, timeout=15):
+            if params["query"] == "tpm":
+                raise httpx.TimeoutException("timed out")
+            return _jsearch_payload(params["query"])
+
+        monkeypatch.setattr(job_discovery, "fetch_json", fake_fetch)
+        service = JobDiscoveryService()
+        service.api_key = "test-key"
+
+        result = await service.search_multi_query([{"query": "pm"}, {"query": "tpm"}])
+        assert [job["job_id"] for job in result["jobs"]] == ["pm-1", "shared"]
+        assert result["queries_executed"] == 2
+
+    async def test_stale_result_served_then_refreshed(self, monkeypatch):
+        calls = []
+
+        async def fake_fetch(provider, url, headers=None, params=None, timeout=15):
+            calls.append(params["query"])
+            return _jsearch_payload(f"{params['query']}{len(calls)}")
+
+        monkeypatch.setattr(job_discovery, "fetch_json", fake_fetch)
+        service = JobDiscoveryService()
+        service.api_key = "test-key"
+
+        first = await service.search_jobs({"query": "pm"})
+        key = service._get_cache_key({"query": "pm"})
+        service._cache.set(key, first, ttl_seconds=-1)  # expire, still inside the stale window
+
+        stale = await service.search_jobs({"query": "pm"})
+        assert stale["cached"] is True
+        assert stale["jobs"][0]["job_id"] == "pm1-1"
+
+        await asyncio.sleep(0.05)
+        fresh = await service.search_jobs({"query": "pm"})
+        assert fresh["jobs"][0]["job_id"] == "pm2-1"
+        assert len(calls) == 2
@@ -0,0 +1,146 @@
+"""
+Local job index tests (services/job_index.py).
+
+Covers:
+1. Listings from both providers dedupe on a stable fingerprint; upserts refresh them
+2. Full-text search with location, remote and excluded-company filters
+3. Listings age out by posting date
+4. Discovery answers fresh queries locally and fetches only deltas for older ones
+5. Local answers are scoped to the listings the query itself fetched
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import job_discovery
+from services.job_index import JobIndex, job_fingerprint, split_query
+from services.job_discovery import JobDiscoveryService
+
+
+def _job(job_id, title, company="Acme", location="Austin, TX", days=1, **fields):
+    job = {
+        "job_id": job_id,
+        "title": title,
+        "company": company,
+        "location": location,
+        "description_snippet": f"{title} at {company}",
+        "is_remote": False,
+        "days_since_posted": days,
+    }
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def index():
+    return JobIndex(":memory:")
+
+
+class TestJobIndex:
+
+    def test_fingerprint_dedupes_across_providers(self, index):
+        jsearch = _job("js-1", "Senior Product Manager", location="Austin, TX", source="jsearch")
+        indeed = _job("in-9", "Senior  Product Manager", company="ACME", location="Austin, Texas", source="indeed")
+        assert job_fingerprint(jsearch) == job_fingerprint(indeed)
+
+        assert index.upsert_jobs([jsearch], "jsearch") == 1
+        assert index.upsert_jobs([indeed], "indeed") == 0
+        stats = index.stats()
+        assert stats["listings"] == 1
+        assert stats["by_source"] == {"indeed": 1}
+
+    def test_search_filters(self, index):
+        index.upsert_jobs([
+            _job("1", "Senior Product Manager", location="Austin, TX"),
+            _job("2", "Product Manager, Payments", company="Stripe", location="Remote", is_remote=True),
+            _job("3", "Product Manager", location="Denver, CO"),
+            _job("4", "Software Engineer", location="Austin, TX"),
+            _job("5", "Product Manager", company="Globex", location="Austin, TX"),
+        ])
+        role, location = split_query("Product Manager in Austin, TX")
+        found = index.search(role, location=location, excluded_companies=["globex"])
+        assert {job["job_id"] for job in found} == {"1", "2"}
+
+        assert [job["job_id"] for job in index.search("product manager", remote_only=True)] == ["2"]
+        assert index.search("jobs") == []
+
+    def test_ages_out_old_listings(self, index):
+        index.upsert_jobs([_job("new", "Product Manager", days=2), _job("old", "Product Manager", days=45, company="Initech")])
+        # The first upsert runs a prune pass
+        assert index.stats()["pruned"] == 1
+        assert index.stats()["listings"] == 1
+        found = index.search("product manager")
+        assert [job["job_id"] for job in found] == ["new"]
+        assert found[0]["days_since_posted"] == 2
+
+
+class TestDiscoveryWithIndex:
+
+    @pytest.fixture
+    def service(self, index, monkeypatch):
+        monkeypatch.setattr(job_discovery, "get_job_index", lambda: index)
+        service = JobDiscoveryService()
+        service.api_key = "test-key"
+        return service
+
+    async def test_fresh_query_answered_locally_then_delta_fetched(self, service, index, monkeypatch):
+        requests = []
+
+        async def fake_fetch(provider, url, headers=None, params=None, timeout=15):
+            requests.append(dict(params))
+            batch = len(requests)
+            return {"total": 6, "data": [
+                {"job_id": f"b{batch}-{i}", "job_title": "Senior Product Manager", "employer_name": f"Co{batch}-{i}",
+                 "job_city": "Austin", "job_state": "TX", "job_posted_at_timestamp": time.time() - 3600}
+                for i in range(6)
+            ]}
+
+        monkeypatch.setattr(job_discovery, "fetch_json", fake_fetch)
+        params = {"query": "Senior Product Manager in Austin, TX", "date_posted": "month"}
+
+        first = await service.search_jobs(params)
+        assert len(first["jobs"]) == 6 and len(requests) == 1
+
+        # Bypass the response cache: the index answers without a provider call
+        service._cache.clear()
+        local = await service.search_jobs(params)
+        assert len(requests) == 1
+        assert {job["job_id"] for job in local["jobs"]} == {job["job_id"] for job in first["jobs"]}
+
+        # Past the freshness window only listings posted since the last fetch are requested
+        index.mark_fetched(service._get_cache_key(params), time.time() - 7 * 3600)
+        service._cache.clear()
+        merged = await service.search_jobs(params)
+        assert len(requests) == 2
+        assert requests[1]["date_posted"] == "today"
+        assert [job["job_id"] for job in merged["jobs"][:6]] == [f"b2-{i}" for i in range(6)]
+        assert {job["job_id"] for job in merged["jobs"][6:]} == {f"b1-{i}" for i in range(6)}
+        assert index.stats()["delta_fetches"] == 1
+
+    async def test_local_answer_scoped_to_query(self, service, index, monkeypatch):
+        async def fake_fetch(provider, url, headers=None, params=None, timeout=15):
+            kind = params.get("employment_types", "ANY")
+            return {"total": 5, "data": [
+                {"job_id": f"{kind}-{i}", "job_title": "Product Manager", "employer_name": f"{kind}Co{i}",
+                 "job_city": "Austin", "job_state": "TX", "job_employment_type": kind}
+                for i in range(5)
+            ]}
+
+        monkeypatch.setattr(job_discovery, "fetch_json", fake_fetch)
+        base = {"query": "Product Manager in Austin, TX", "date_posted": "month"}
+        contract = {**base, "employment_types": "CONTRACTOR"}
+        await service.search_jobs(base)
+        await service.search_jobs(contract)
+        index.upsert_jobs([_job(f"in-{i}", "Product Manager", company=f"Indeed{i}") for i in range(5)], "indeed")
+
+        service._cache.clear()
+        local = await service.search_jobs(contract)
+        assert local["cached"] is True
+        assert {job["employment_type"] for job in local["jobs"]} == {"CONTRACTOR"}
+        assert len(local["jobs"]) == 5
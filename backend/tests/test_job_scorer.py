@@ -0,0 +1,100 @@
+"""
+Job relevance scorer tests (services/job_scorer.py).
+
+Covers:
+1. Scoring factors and hard disqualification for a compiled profile
+2. Batch scoring matches per-job score_job()
+3. Heap top-k returns the first k of the full ranking, ties in input order
+"""
+
+import copy
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.job_scorer import ScoringProfile, score_and_rank_jobs, score_job, score_jobs_batch
+
+
+PROFILE_ARGS = dict(
+    target_roles=["Senior Product Manager"],
+    candidate_seniority="senior",
+    candidate_location="San Francisco, CA",
+    comp_min=150000,
+    comp_max=200000,
+    target_industry="fintech",
+    years_experience=8,
+    candidate_skills=["SQL", "Roadmapping", "Python"],
+)
+
+
+def _job(job_id, title, **fields):
+    job = {
+        "job_id": job_id,
+        "title": title,
+        "location": "San Francisco, CA",
+        "company": "Stripe",
+        "salary_min": 160000,
+        "salary_max": 210000,
+        "description_snippet": "Payments and banking platform",
+        "is_remote": False,
+        "days_since_posted": 2,
+    }
+    job.update(fields)
+    return job
+
+
+def _listings(n):
+    titles = ["Senior Product Manager", "Product Marketing Manager", "Junior Product Analyst",
+              "Staff Product Manager, Payments", "Lead Product Manager", "Software Engineer"]
+    return [
+        _job(str(i), titles[i % len(titles)], days_since_posted=i % 9, network_connection=i % 7 == 0,
+             job_required_skills=["sql", "python"] if i % 2 else None)
+        for i in range(n)
+    ]
+
+
+class TestScoringProfile:
+
+    def test_strong_match_scores_every_factor(self):
+        job = _job("1", "Senior Product Manager", job_required_skills=["sql", "roadmapping", "python"])
+        scored = score_job(job, **PROFILE_ARGS)
+        assert scored["relevance_score"] == 100
+        assert "Strong title match" in scored["relevance_reasons"]
+        assert "Skills match" in scored["relevance_reasons"]
+
+    def test_function_mismatch_penalized(self):
+        scored = score_job(_job("1", "Senior Product Marketing Manager"), **PROFILE_ARGS)
+        assert "Title overlap but different function" in scored["relevance_reasons"]
+        assert scored["relevance_score"] < score_job(_job("2", "Senior Product Manager"), **PROFILE_ARGS)["relevance_score"]
+
+    def test_disqualified_jobs_dropped(self):
+        profile = ScoringProfile.compile(**PROFILE_ARGS)
+        jobs = [
+            _job("seniority", "Product Manager Intern"),
+            _job("salary", "Senior Product Manager", salary_min=80000, salary_max=95000),
+            _job("title", "Warehouse Associate"),
+            _job("keep", "Senior Product Manager"),
+        ]
+        assert [job["job_id"] for job in score_jobs_batch(jobs, profile, min_score=0)] == ["keep"]
+
+
+class TestBatchScoring:
+
+    def test_batch_matches_per_job_scoring(self):
+        jobs = _listings(60)
+        ranked = score_and_rank_jobs(copy.deepcopy(jobs), min_score=0, **PROFILE_ARGS)
+        assert ranked
+        by_id = {job["job_id"]: job for job in jobs}
+        for job in ranked:
+            expected = score_job(copy.deepcopy(by_id[job["job_id"]]), **PROFILE_ARGS)
+            assert job["relevance_score"] == expected["relevance_score"]
+            assert job["relevance_reasons"] == expected["relevance_reasons"]
+
+    def test_top_k_is_prefix_of_full_ranking(self):
+        jobs = _listings(500)
+        full = score_and_rank_jobs(copy.deepcopy(jobs), **PROFILE_ARGS)
+        for k in (1, 5, 20, len(full) + 10):
+            top = score_and_rank_jobs(copy.deepcopy(jobs), top_k=k, **PROFILE_ARGS)
+            assert [job["job_id"] for job in top] == [job["job_id"] for job in full[:k]]
@@ -0,0 +1,67 @@
+"""
+Incremental JSON parser tests (utils/json_stream.py).
+
+Covers:
+1. Values reported as soon as they close, with their path
+2. Chunk boundaries anywhere (inside strings, escapes, numbers)
+3. Model output quirks: markdown fences, trailing commas
+4. Malformed input stops the parser without raising
+"""
+
+import json
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_stream import IncrementalJSONParser
+
+
+DOC = {
+    "fit_score": 72,
+    "recommendation": "Apply with \"caution\"",
+    "strengths": ["Payments depth", {"text": "Team lead", "weight": 0.5}],
+    "reality_check": {"expected_applicants": 400, "notes": None},
+    "flags": [True, False, [], {}],
+}
+
+
+def _feed_all(text, step):
+    parser = IncrementalJSONParser()
+    events = []
+    for i in range(0, len(text), step):
+        events.extend(parser.feed(text[i:i + step]))
+    return parser, events
+
+
+class TestIncrementalJSONParser:
+
+    def test_every_chunk_size_yields_the_document(self):
+        text = json.dumps(DOC, indent=2)
+        for step in (1, 2, 3, 7, len(text)):
+            parser, events = _feed_all(text, step)
+            assert parser.done and not parser.failed
+            assert events[-1] == ((), DOC)
+
+    def test_values_reported_when_they_close(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"fit_score": 7') == []
+        assert parser.feed('2, "strengths": ["a"') == [(("fit_score",), 72), (("strengths", 0), "a")]
+        assert parser.feed(', "b"]') == [(("strengths", 1), "b"), (("strengths",), ["a", "b"])]
+        assert parser.feed(', "reality_check": {"expected_applicants": 400}') == [
+            (("reality_check", "expected_applicants"), 400),
+            (("reality_check",), {"expected_applicants": 400}),
+        ]
+
+    def test_fences_and_trailing_commas(self):
+        parser = IncrementalJSONParser()
+        events = parser.feed('```json\n{"a": [1, 2,], "b": "x\ny",}\n```')
+        assert events[-1] == ((), {"a": [1, 2], "b": "x\ny"})
+        assert parser.done
+
+    def test_malformed_input_stops_quietly(self):
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"fit_score": 72, "x": tru}') == [(("fit_score",), 72)]
+        assert parser.failed
+        assert parser.feed('{"more": 1}') == []
@@ -0,0 +1,76 @@
+"""
+Precompiled gating pattern tests (utils/keyword_scanner.py, gating_patterns.py).
+
+Covers:
+1. KeywordScanner matches exactly what the `p in text` loops it replaces match
+   (overlapping keywords, prefixes of one another, empty text)
+2. Family queries keep declared order (first/matched feed log output)
+3. Gating detectors read their families from the shared scanners
+"""
+
+import os
+import random
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gating_patterns
+from utils.keyword_scanner import KeywordScanner, KeywordSet
+
+
+class TestKeywordScanner:
+
+    def test_matches_naive_substring_loops(self):
+        families = {
+            "a": ["manager", "senior manager", "man", "age"],
+            "b": ["sr tpm", "tpm", "pm", "program manager"],
+            "c": ["ae ", "a", "team of", "team"],
+        }
+        scanner = KeywordScanner(families)
+        rng = random.Random(7)
+        alphabet = "abeg mnoprst"
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            result = scanner.scan(text)
+            for name, kws in families.items():
+                assert result.matched(name) == [kw for kw in kws if kw in text]
+                assert result.has(name) == any(kw in text for kw in kws)
+                assert result.count(name) == sum(1 for kw in kws if kw in text)
+
+    def test_reports_prefix_and_overlapping_keywords(self):
+        scanner = KeywordScanner({"f": ["senior manager", "senior", "manager", "age"]})
+        assert scanner.scan("senior manager").matched("f") == ["senior manager", "senior", "manager", "age"]
+
+    def test_first_uses_declared_order(self):
+        scanner = KeywordScanner({"f": ["sr manager", "senior manager"]})
+        assert scanner.scan("senior manager, sr manager").first("f") == "sr manager"
+        assert scanner.scan("nothing here").first("f") is None
+
+    def test_keyword_set_search(self):
+        keywords = KeywordSet(["heidrick", "korn ferry"])
+        assert keywords.search("korn ferry international")
+        assert not keywords.search("")
+        assert keywords.count("heidrick & korn ferry") == 2
+
+
+class TestGatingPatterns:
+
+    def test_role_title_signals(self):
+        signals = gating_patterns.scan_role_title_signals("Senior Technical Program Manager")
+        assert signals.has("tpm")
+        assert signals.first("senior_manager") is None
+        assert signals.first("ic_manager") == "program manager"
+        assert not signals.has("director_plus")
+
+    def test_jd_signals(self):
+        jd = "Own full-cycle recruiting, sourcing and candidate experience with every hiring manager."
+        signals = gating_patterns.scan_jd_signals(jd)
+        assert signals.first("recruiting_strong") == "full-cycle recruiting"
+        assert signals.count("recruiting") == 4
+        assert signals.has("people_management")  # "hiring"
+
+    def test_navigation_skip_matches_line_start_only(self):
+        assert gating_patterns.NAVIGATION_SKIP_RE.match("back to search")
+        assert gating_patterns.NAVIGATION_SKIP_RE.match("3 days ago")
+        assert not gating_patterns.NAVIGATION_SKIP_RE.match("director - back to basics")
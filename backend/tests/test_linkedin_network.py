@@ -0,0 +1,133 @@
+"""
+LinkedIn network company index tests (services/linkedin_network.py).
+
+Covers:
+1. Company name normalization (legal suffixes, "the", "&", aliases)
+2. Exact and whole-word fuzzy lookups in both directions
+3. Serialized index round-trips without rebuilding
+4. Connection lookup and job flagging go through the index
+5. Streaming CSV ingestion in small chunks matches whole-file parsing
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import linkedin_network
+from services.job_discovery import JobDiscoveryService
+from services.linkedin_network import CompanyNetworkIndex, LinkedInNetworkParser, normalize_company
+
+
+CONNECTIONS = [
+    {"first_name": "Ana", "company": "Stripe, Inc."},
+    {"first_name": "Ben", "company": "Stripe"},
+    {"first_name": "Cy", "company": "Stripe Payments Europe Ltd"},
+    {"first_name": "Di", "company": "Facebook"},
+    {"first_name": "Ed", "company": "The Walt Disney Company"},
+    {"first_name": "Flo", "company": "Metabase"},
+    {"first_name": "Gus", "company": "Procter & Gamble"},
+]
+
+
+class TestNormalization:
+
+    def test_normalize_company(self):
+        assert normalize_company("Stripe, Inc.") == "stripe"
+        assert normalize_company("The Walt Disney Company") == "walt disney"
+        assert normalize_company("Procter & Gamble Co.") == "procter and gamble"
+        assert normalize_company("Meta Platforms, Inc.") == "meta"
+        assert normalize_company("Facebook") == "meta"
+        assert normalize_company("Inc.") == "inc"
+
+
+class TestCompanyNetworkIndex:
+
+    def test_exact_and_fuzzy_lookup(self):
+        index = CompanyNetworkIndex.from_connections(CONNECTIONS)
+        assert index.companies["stripe"]["count"] == 2
+        assert index.match("STRIPE LLC") == ["stripe", "stripe payments europe"]
+        assert index.match("Meta") == ["meta"]
+        # Whole words only: "meta" is not inside "metabase"
+        assert "metabase" not in index.match("Meta")
+        assert index.match("Payments Europe") == ["stripe payments europe"]
+        assert index.match("Walt Disney Studios") == ["walt disney"]
+        assert index.match("Initech") == []
+
+    def test_round_trip_through_json(self):
+        index = CompanyNetworkIndex.from_connections(CONNECTIONS)
+        loaded = CompanyNetworkIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+        assert loaded.companies == index.companies
+        assert loaded.match("Stripe Payments") == index.match("Stripe Payments")
+        assert CompanyNetworkIndex.from_dict({"version": 0}) is None
+
+    def test_connections_at_company(self):
+        parser = LinkedInNetworkParser()
+        index = parser.build_company_index(CONNECTIONS)
+        found = parser.get_connections_at_company(CONNECTIONS, "Stripe", index=index)
+        assert [conn["first_name"] for conn in found] == ["Ana", "Ben", "Cy"]
+        assert parser.get_connections_at_company(CONNECTIONS, "Meta") == [CONNECTIONS[3]]
+
+    def test_flag_network_companies(self):
+        index = CompanyNetworkIndex.from_companies([{"company": "Stripe", "count": 4}, "Acme Corp"])
+        jobs = [
+            {"company": "Globex", "days_since_posted": 1},
+            {"company": "Stripe, Inc.", "days_since_posted": 5},
+            {"company": "ACME", "days_since_posted": 3},
+        ]
+        flagged = JobDiscoveryService().flag_network_companies(jobs, index)
+        assert [(job["company"], job.get("network_connection_count")) for job in flagged] == [
+            ("ACME", 1), ("Stripe, Inc.", 4), ("Globex", None),
+        ]
+
+
+LINKEDIN_EXPORT = (
+    "\ufeffNotes:\n"
+    "\"When exporting your connection data, you may notice that some of the email addresses are missing.\"\n"
+    "\n"
+    "First Name,Last Name,URL,Email Address,Company,Position,Connected On\r\n"
+    "Ana,Silva,https://x/ana,,\"Stripe, Inc.\",\"PM, \"\"Payments\"\"\nplatform\",01 Jan 2024\r\n"
+    "Bo,Chen,https://x/bo,,Acme,Engineer,02 Jan 2024\r\n"
+    "Cy,Diaz,https://x/cy,,,Founder,03 Jan 2024\r\n"
+    "Dé,Éclair,https://x/de,,Société Générale,Analyst,04 Jan 2024\r\n"
+    "Ed,Fox,https://x/ed,,Acme,Designer,05 Jan 2024"
+)
+
+
+class FakeUpload:
+    """Minimal UploadFile stand-in."""
+
+    def __init__(self, data: bytes):
+        self._file = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+
+class TestStreamingIngestion:
+
+    async def test_small_chunks_match_whole_file_parse(self, monkeypatch):
+        monkeypatch.setattr(linkedin_network, "CSV_CHUNK_SIZE", 5)
+        parser = LinkedInNetworkParser()
+        network = await parser.ingest_upload(FakeUpload(LINKEDIN_EXPORT.encode("utf-8")))
+
+        connections = parser.parse_csv(LINKEDIN_EXPORT.lstrip("\ufeff"))
+        assert [conn["first_name"] for conn in connections] == ["Ana", "Bo", "Dé", "Ed"]
+        assert connections[0]["position"] == 'PM, "Payments"\nplatform'
+        assert network.connections == 4
+        assert network.companies() == parser.extract_companies(connections)
+        assert network.index.match("Acme Corp") == ["acme"]
+        assert network.index.companies["acme"]["count"] == 2
+
+    async def test_missing_company_column_and_size_limit(self):
+        parser = LinkedInNetworkParser()
+        network = await parser.ingest_upload(FakeUpload(b"Name,Email\n" + b"x,y\n" * 20))
+        assert network.connections == 0
+
+        with pytest.raises(ValueError):
+            await parser.ingest_upload(FakeUpload(LINKEDIN_EXPORT.encode("utf-8")), max_bytes=100)
@@ -0,0 +1,317 @@
+"""
+Mock interview hot tier and write-behind tests (storage/mock_interview_store.py, storage/write_behind.py).
+
+Covers:
+1. Writes land in memory at once and reach Supabase in coalesced batches
+2. flush() for one session waits only for that session's writes
+3. Reads are served from the hot tier and read through on a miss
+4. Least recently used sessions are evicted only after their writes land
+5. Without Supabase nothing is evicted
+6. Sessions whose only copy is in memory (anonymous, memory-only analyses,
+   dropped writes) are pinned instead of evicted
+7. Failed writes are retried with backoff and keep their session dirty
+8. Expiry pops only due sessions, in bounded passes, via the reverse index
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import mock_interview_store as store
+from storage.write_behind import UPDATE, UPSERT, SupabaseWriteBehind, WriteOp
+
+
+class FakeTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.action = "select"
+        self.payload = None
+        self.filters = []
+
+    def select(self, *_):
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.action, self.payload = "upsert", rows
+        return self
+
+    def insert(self, rows):
+        self.action, self.payload = "insert", rows
+        return self
+
+    def update(self, row):
+        self.action, self.payload = "update", row
+        return self
+
+    def eq(self, column, value):
+        self.filters.append((column, value))
+        return self
+
+    def single(self):
+        return self
+
+    def execute(self):
+        self.client.gate.wait(timeout=5)
+        with self.client.lock:
+            if self.action != "select" and self.client.failures:
+                self.client.failures -= 1
+                raise RuntimeError("connection reset")
+            self.client.calls.append((self.name, self.action, self.payload, list(self.filters)))
+            rows = self.client.rows.setdefault(self.name, [])
+            if self.action in ("upsert", "insert"):
+                rows.extend(self.payload)
+                return SimpleNamespace(data=self.payload)
+            if self.action == "update":
+                return SimpleNamespace(data=[])
+            matched = [r for r in rows if all(r.get(c) == v for c, v in self.filters)]
+            if self.filters and self.filters[0][0] == "id":
+                return SimpleNamespace(data=matched[0] if matched else None)
+            return SimpleNamespace(data=matched)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.rows = {}
+        self.calls = []
+        self.lock = threading.Lock()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.failures = 0
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+    def writes(self):
+        return [(table, action) for table, action, _, _ in self.calls if action != "select"]
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    client = FakeSupabase()
+    hot_tier = store.MockSessionHotTier(max_sessions=2)
+    writer = SupabaseWriteBehind(
+        lambda: store._supabase_client, batch_size=50, linger_seconds=0.05,
+        on_clean=hot_tier.on_clean, on_failed=hot_tier.on_failed, retry_backoff_seconds=0.01,
+    )
+    monkeypatch.setattr(store, "_supabase_client", client)
+    monkeypatch.setattr(store, "_hot_tier", hot_tier)
+    monkeypatch.setattr(store, "_write_behind", writer)
+    for name in ("mock_interview_sessions", "mock_interview_questions",
+                 "mock_interview_responses", "mock_interview_analyses"):
+        monkeypatch.setattr(store, name, {})
+    yield client
+    client.gate.set()
+    writer.close()
+
+
+def _start_session(session_id, user_id="u1"):
+    store.save_mock_session(session_id, {"id": session_id, "question_ids": [f"{session_id}-q1"]}, user_id)
+    store.save_mock_question(f"{session_id}-q1", {"session_id": session_id, "question_text": "Tell me"}, user_id)
+    store.save_mock_response(f"{session_id}-q1", {"session_id": session_id, "response_text": "a"}, user_id)
+    store.save_mock_response(f"{session_id}-q1", {"session_id": session_id, "response_text": "b"}, user_id)
+    store.update_mock_session(session_id, {"current_question_number": 2})
+
+
+class TestWriteBehind:
+
+    def test_memory_first_then_batched(self, supabase):
+        supabase.gate.clear()
+        _start_session("s1")
+
+        # Served from memory while Supabase hasn't seen anything
+        assert store.get_mock_session("s1")["current_question_number"] == 2
+        assert [r["response_text"] for r in store.get_mock_responses("s1-q1")] == ["a", "b"]
+
+        supabase.gate.set()
+        assert store.flush_mock_session("s1")
+        assert supabase.writes() == [
+            ("mock_interview_sessions", "upsert"),
+            ("mock_interview_questions", "upsert"),
+            ("mock_interview_responses", "insert"),
+            ("mock_interview_sessions", "update"),
+        ]
+        inserted = [call for call in supabase.calls if call[1] == "insert"][0]
+        assert [row["response_text"] for row in inserted[2]] == ["a", "b"]
+
+    def test_runs_coalesced(self):
+        client = FakeSupabase()
+        writer = SupabaseWriteBehind(lambda: client, background=False)
+        writer._write_batch([
+            WriteOp("s1", "t", UPSERT, {"id": "a", "v": 1}, key="a"),
+            WriteOp("s1", "t", UPSERT, {"id": "b", "v": 1}, key="b"),
+            WriteOp("s1", "t", UPSERT, {"id": "a", "v": 2}, key="a"),
+            WriteOp("s1", "t", UPDATE, {"x": 1}, key="a"),
+            WriteOp("s1", "t", UPDATE, {"y": 2}, key="a"),
+        ])
+        assert [(action, payload) for _, action, payload, _ in client.calls] == [
+            ("upsert", [{"id": "b", "v": 1}, {"id": "a", "v": 2}]),
+            ("update", {"x": 1, "y": 2}),
+        ]
+        assert writer.stats()["coalesced"] == 2
+
+    def test_failed_write_retried_in_order(self, supabase):
+        supabase.failures = 2
+        _start_session("s1")
+        assert store.flush_mock_session("s1")
+        assert supabase.writes() == [
+            ("mock_interview_sessions", "upsert"),
+            ("mock_interview_questions", "upsert"),
+            ("mock_interview_responses", "insert"),
+            ("mock_interview_sessions", "update"),
+        ]
+        stats = store._write_behind.stats()
+        assert (stats["failed"], stats["dropped"]) == (2, 0)
+        assert stats["retried"] >= 2
+
+    def test_flush_scoped_to_session(self, supabase):
+        store._write_behind.linger_seconds = 5
+        store.save_mock_session("s1", {"id": "s1"}, "u1")
+        store.save_mock_session("s2", {"id": "s2"}, "u1")
+        assert store.flush_mock_session("s1", timeout=2)
+        assert store._write_behind.pending("s1") == 0
+
+
+class TestHotTier:
+
+    def test_read_through_then_hit(self, supabase):
+        supabase.rows["mock_interview_sessions"] = [{"id": "cold", "question_ids": []}]
+
+        assert store.get_mock_session("cold") == {"id": "cold", "question_ids": []}
+        assert store.get_mock_session("cold") is store.mock_interview_sessions["cold"]
+        assert len(supabase.calls) == 1
+        assert store.get_mock_store_stats()["hot_tier"]["hits"] == 1
+
+    def test_cold_response_reads_earlier_turns(self, supabase):
+        supabase.rows["mock_interview_responses"] = [{"question_id": "q9", "session_id": "s9", "response_text": "old"}]
+        store.save_mock_response("q9", {"session_id": "s9", "response_text": "new"}, None)
+        assert [r["response_text"] for r in store.get_mock_responses("q9")] == ["old", "new"]
+
+    def test_evicted_after_writes_land(self, supabase):
+        supabase.gate.clear()
+        for session_id in ("s1", "s2", "s3"):
+            _start_session(session_id)
+
+        # s1 is over the bound but still has writes in flight
+        assert "s1" in store.mock_interview_sessions
+        assert store.get_mock_store_stats()["hot_tier"]["evicting"] == 1
+
+        supabase.gate.set()
+        assert store.flush_mock_session("s1")
+        assert "s1" not in store.mock_interview_sessions
+        assert "s1-q1" not in store.mock_interview_questions
+        assert "s1-q1" not in store.mock_interview_responses
+        assert {"s2", "s3"} <= set(store.mock_interview_sessions)
+
+        # Coming back reads through from Supabase
+        assert store.get_mock_question("s1-q1")["question_text"] == "Tell me"
+
+    def test_touch_cancels_eviction(self, supabase):
+        supabase.gate.clear()
+        _start_session("s1")
+        _start_session("s2")
+        _start_session("s3")
+        store.get_mock_session("s1")  # s1 back in use; s2 is now the oldest
+
+        supabase.gate.set()
+        assert store.flush_mock_writes()
+        assert "s1" in store.mock_interview_sessions
+        assert "s2" not in store.mock_interview_sessions
+
+    def test_no_eviction_without_supabase(self, supabase, monkeypatch):
+        monkeypatch.setattr(store, "_supabase_client", None)
+        for session_id in ("s1", "s2", "s3"):
+            _start_session(session_id)
+        assert {"s1", "s2", "s3"} <= set(store.mock_interview_sessions)
+        assert supabase.calls == []
+
+
+class TestPinned:
+
+    def test_anonymous_session_kept(self, supabase):
+        for session_id in ("s0", "s1", "s2"):
+            store.save_mock_session(session_id, {"id": session_id, "question_ids": []}, None)
+        assert store.flush_mock_writes()
+        assert store.get_mock_session("s0") == {"id": "s0", "question_ids": []}
+        assert store.get_mock_store_stats()["hot_tier"]["pinned"] == 3
+        assert supabase.calls == []
+
+    def test_memory_only_analysis_kept(self, supabase):
+        _start_session("s1")
+        store.mock_interview_analyses["s1-q1"] = {"score": 8}
+        for session_id in ("s2", "s3", "s4"):
+            _start_session(session_id)
+        assert store.flush_mock_writes()
+        assert store.mock_interview_analyses["s1-q1"] == {"score": 8}
+        assert "s1" in store.mock_interview_sessions
+        assert "s2" not in store.mock_interview_sessions
+
+    def test_dropped_writes_pin_session(self, supabase):
+        store._write_behind.max_retries = 1
+        supabase.failures = 100
+        for session_id in ("s1", "s2", "s3"):
+            _start_session(session_id)
+        assert store.flush_mock_writes()
+        assert {"s1", "s2", "s3"} <= set(store.mock_interview_sessions)
+        assert store._write_behind.has_failed("s1")
+        assert store.get_mock_store_stats()["hot_tier"]["pinned"] == 3
+
+
+class TestExpiry:
+
+    @pytest.fixture(autouse=True)
+    def in_memory(self, monkeypatch):
+        monkeypatch.setattr(store, "_supabase_client", None)
+        monkeypatch.setattr(store, "_hot_tier", store.MockSessionHotTier())
+        for name in ("mock_interview_sessions", "mock_interview_questions",
+                     "mock_interview_responses", "mock_interview_analyses"):
+            monkeypatch.setattr(store, name, {})
+
+    def _session(self, session_id, age_seconds):
+        started = time.time() - age_seconds
+        store.save_mock_session(session_id, {"id": session_id, "started_at": started, "question_ids": []})
+        store.save_mock_question(f"{session_id}-q", {"session_id": session_id})
+        store.mock_interview_analyses[f"{session_id}-q"] = {"score": 7}
+
+    def test_only_due_sessions_dropped(self):
+        ttl = store.SESSION_TTL_SECONDS
+        self._session("old", ttl + 60)
+        self._session("fresh", 60)
+
+        assert store.cleanup_expired_sessions() == 1
+        assert set(store.mock_interview_sessions) == {"fresh"}
+        assert set(store.mock_interview_questions) == {"fresh-q"}
+        assert set(store.mock_interview_analyses) == {"fresh-q"}
+        assert store.cleanup_expired_sessions() == 0
+        assert store.cleanup_expired_sessions(now=time.time() + ttl) == 1
+
+    def test_bounded_passes(self):
+        for i in range(5):
+            self._session(f"s{i}", store.SESSION_TTL_SECONDS + 60 - i)
+        assert store.cleanup_expired_sessions(limit=2) == 2
+        assert set(store.mock_interview_sessions) == {"s2", "s3", "s4"}
+        assert store.cleanup_expired_sessions(limit=None) == 3
+
+    def test_superseded_and_untimed(self):
+        store.save_mock_session("s1", {"id": "s1", "started_at": "2020-01-01T00:00:00"})
+        store.save_mock_session("s1", {"id": "s1", "started_at": datetime.now().isoformat()})
+        store.save_mock_session("untimed", {"id": "untimed"})
+
+        assert store.cleanup_expired_sessions() == 0
+        assert {"s1", "untimed"} <= set(store.mock_interview_sessions)
+
+    async def test_background_sweep(self):
+        self._session("old", store.SESSION_TTL_SECONDS + 60)
+        task = asyncio.create_task(store.run_session_cleanup(interval_seconds=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        assert "old" not in store.mock_interview_sessions
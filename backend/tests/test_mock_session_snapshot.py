@@ -0,0 +1,168 @@
+"""
+Mock interview session snapshot tests (storage/mock_interview_store.py).
+
+Covers:
+1. One in_() query per table regardless of question count
+2. The hot tier wins; only cold question IDs are queried, then admitted
+3. Average score matches the per-question calculation
+4. Snapshots are reused within a request and reloaded on refresh
+"""
+
+import contextvars
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import mock_interview_store as store
+from storage import (
+    MockSessionSnapshot,
+    get_mock_session_snapshot,
+    get_mock_session_snapshot_async,
+    load_mock_session_snapshot,
+)
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.filters = []
+
+    def select(self, *_):
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(("in", column, list(values)))
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(("eq", column, value))
+        return self
+
+    def single(self):
+        return self
+
+    def execute(self):
+        with self.client.lock:
+            self.client.calls.append((self.table, self.filters))
+        if self.table in self.client.failing:
+            raise RuntimeError("connection reset")
+        rows = self.client.rows.get(self.table, [])
+        for op, column, value in self.filters:
+            if op == "in":
+                rows = [row for row in rows if row.get(column) in value]
+            else:
+                rows = [row for row in rows if row.get(column) == value]
+        return SimpleNamespace(data=rows)
+
+
+class FakeSupabase:
+    def __init__(self, rows, failing=()):
+        self.rows = rows
+        self.failing = set(failing)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+@pytest.fixture
+def session():
+    return {"id": "s1", "question_ids": ["q1", "q2", "q3"]}
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    client = FakeSupabase({
+        "mock_interview_questions": [
+            {"id": "q1", "question_text": "Tell me about a launch"},
+            {"id": "q2", "question_text": "Describe a conflict"},
+            {"id": "other", "question_text": "Not in this session"},
+        ],
+        "mock_interview_responses": [
+            {"question_id": "q1", "response_text": "first"},
+            {"question_id": "q1", "response_text": "follow-up"},
+        ],
+        "mock_interview_analyses": [
+            {"session_id": "q1", "score": 8},
+        ],
+    })
+    monkeypatch.setattr(store, "_supabase_client", client)
+    monkeypatch.setattr(store, "_hot_tier", store.MockSessionHotTier())
+    monkeypatch.setattr(store, "mock_interview_questions", {"q3": {"id": "q3", "question_text": "In memory"}})
+    monkeypatch.setattr(store, "mock_interview_responses", {"q2": [{"response_text": "local"}]})
+    monkeypatch.setattr(store, "mock_interview_analyses", {"q2": {"score": 5}, "q1": {"score": 1}})
+    return client
+
+
+class TestLoadSnapshot:
+
+    def test_one_query_per_table_for_cold_ids(self, supabase, session):
+        snapshot = load_mock_session_snapshot("s1", session)
+
+        assert sorted((table, filters) for table, filters in supabase.calls) == [
+            ("mock_interview_analyses", [("in", "session_id", ["q3"])]),
+            ("mock_interview_questions", [("in", "id", ["q1", "q2"])]),
+            ("mock_interview_responses", [("in", "question_id", ["q1", "q3"])]),
+        ]
+        assert snapshot.question_ids == ["q1", "q2", "q3"]
+        assert set(snapshot.questions) == {"q1", "q2", "q3"}
+
+        # Everything loaded is now hot - a second load stays off the network
+        supabase.calls.clear()
+        load_mock_session_snapshot("s1", session)
+        assert [table for table, _ in supabase.calls] == ["mock_interview_analyses"]
+
+    def test_hot_tier_then_supabase(self, supabase, session):
+        snapshot = load_mock_session_snapshot("s1", session)
+
+        assert snapshot.question("q3")["question_text"] == "In memory"
+        assert [r["response_text"] for r in snapshot.responses_for("q1")] == ["first", "follow-up"]
+        assert snapshot.responses_for("q2") == [{"response_text": "local"}]
+        assert snapshot.responses_for("q3") == []
+        assert snapshot.analysis("q1") == {"score": 1}
+        assert snapshot.analysis("q2") == {"score": 5}
+        assert snapshot.analysis("q3") is None
+        assert snapshot.average_score() == 3.0
+        assert store.mock_interview_responses["q1"] is snapshot.responses_for("q1")
+
+    def test_query_failure_falls_back(self, supabase, session):
+        supabase.failing.add("mock_interview_questions")
+        snapshot = load_mock_session_snapshot("s1", session)
+        assert set(snapshot.questions) == {"q3"}
+        assert "q1" not in store.mock_interview_questions
+
+    def test_missing_session(self, monkeypatch):
+        monkeypatch.setattr(store, "_supabase_client", None)
+        snapshot = load_mock_session_snapshot("missing")
+        assert snapshot.session is None
+        assert snapshot.average_score() == 0.0
+
+
+class TestSnapshotCache:
+
+    def test_reused_within_request(self, supabase, session):
+        def request():
+            first = get_mock_session_snapshot("s1", session)
+            assert get_mock_session_snapshot("s1") is first
+            assert get_mock_session_snapshot("s1", session, refresh=True) is not first
+            return first
+
+        first = contextvars.copy_context().run(request)
+        # The refresh only re-queries the one analysis that was missing
+        assert len(supabase.calls) == 4
+        # A new request starts without an active snapshot
+        assert contextvars.copy_context().run(get_mock_session_snapshot, "s1", session) is not first
+
+    async def test_async_loader(self, supabase, session):
+        snapshot = await get_mock_session_snapshot_async("s1", session)
+        assert isinstance(snapshot, MockSessionSnapshot)
+        assert await get_mock_session_snapshot_async("s1") is snapshot
+        assert len(supabase.calls) == 3
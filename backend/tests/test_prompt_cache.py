@@ -0,0 +1,177 @@
+"""
+Prompt caching tests (services/prompt_cache.py).
+
+Runs the real Anthropic SDK against a local fake Messages API server and
+inspects the raw request bodies it receives.
+
+Covers:
+1. The static prefix is sent byte-for-byte identical across requests, marked
+   with cache_control; per-request text goes in a separate block
+2. format_prompt() splits templates at the first field without changing text
+3. Short prefixes and the kill switch fall back to a plain string
+4. Response-cache keys and usage metrics
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anthropic
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import claude_client, prompt_cache
+from services.prompt_cache import SystemPrompt, format_prompt
+from prompts import HEY_HENRY_SYSTEM_PROMPT
+
+
+STATIC_PROMPT = "You are HenryHQ-STRUCT, a deterministic JSON-generation engine.\n" * 100
+
+HEY_HENRY_FIELDS = dict(
+    user_name="Sam", name_note="", current_page="tracker", page_description="Application tracker",
+    company="Stripe", role="Senior PM", has_analysis="Yes", has_resume="Yes", has_pipeline="No",
+    analysis_context="", pipeline_context="", network_context="", outreach_log_context="",
+    interview_debrief_context="", pattern_analysis_context="", generated_content_context="",
+    emotional_context="", tone_guidance="", tone_guidance_detail="Be direct.", clarification_context="",
+)
+
+
+# =============================================================================
+# FAKE MESSAGES API
+# =============================================================================
+
+class FakeAnthropicServer(ThreadingHTTPServer):
+    """Local HTTP server standing in for the Messages API; records raw request bodies."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeMessagesHandler)
+        self.bodies = []
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def system_blocks(self, index):
+        return json.loads(self.bodies[index])["system"]
+
+    def prefix_bytes(self, index):
+        """Raw bytes of the first system block as sent on the wire."""
+        body = self.bodies[index]
+        start = body.index(b'"system"')
+        return body[start:body.index(b'}}', start)]
+
+
+class _FakeMessagesHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        server = self.server
+        server.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        cached = len(server.bodies) > 1
+        payload = json.dumps({
+            "id": f"msg_{len(server.bodies)}",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-sonnet-4-20250514",
+            "content": [{"type": "text", "text": "ok"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": 40,
+                "output_tokens": 1,
+                "cache_creation_input_tokens": 0 if cached else 1500,
+                "cache_read_input_tokens": 1500 if cached else 0,
+            },
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    server = FakeAnthropicServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = anthropic.AsyncAnthropic(api_key="test-key", base_url=server.base_url, max_retries=0)
+    monkeypatch.setattr(claude_client, "_async_client", client)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+async def _send(system, content="Analyze this JD"):
+    return await claude_client.create_message_async(
+        model="claude-opus-4-6",
+        max_tokens=100,
+        system=system,
+        messages=[{"role": "user", "content": content}],
+    )
+
+
+class TestPromptPrefixStability:
+
+    async def test_prefix_identical_across_requests(self, fake_server):
+        for situation in ("\n\nCALIBRATION: laid off", "\n\nCALIBRATION: employed", ""):
+            await _send(SystemPrompt(STATIC_PROMPT) + situation)
+
+        assert len(fake_server.bodies) == 3
+        assert fake_server.prefix_bytes(0) == fake_server.prefix_bytes(1) == fake_server.prefix_bytes(2)
+
+        first = fake_server.system_blocks(0)
+        assert first[0] == {"type": "text", "text": STATIC_PROMPT, "cache_control": {"type": "ephemeral"}}
+        assert first[1] == {"type": "text", "text": "\n\nCALIBRATION: laid off"}
+        assert len(fake_server.system_blocks(2)) == 1  # no empty suffix block
+
+    async def test_hey_henry_context_stays_out_of_prefix(self, fake_server):
+        for user_name, company in (("Sam", "Stripe"), ("Alex", "Airbnb")):
+            fields = dict(HEY_HENRY_FIELDS, user_name=user_name, company=company)
+            await _send(format_prompt(HEY_HENRY_SYSTEM_PROMPT, **fields), "hi")
+
+        assert fake_server.prefix_bytes(0) == fake_server.prefix_bytes(1)
+        assert "Stripe" not in fake_server.system_blocks(0)[0]["text"]
+        assert "Airbnb" in fake_server.system_blocks(1)[1]["text"]
+
+
+class TestSystemPrompt:
+
+    def test_format_prompt_matches_str_format(self):
+        template = "Static {{braces}} stay literal.\nUser: {name}\nTone: {tone}"
+        prompt = format_prompt(template, name="Sam", tone="calm")
+        assert str(prompt) == template.format(name="Sam", tone="calm")
+        assert prompt.prefix == "Static {braces} stay literal.\nUser: "
+
+        hey_henry = format_prompt(HEY_HENRY_SYSTEM_PROMPT, **HEY_HENRY_FIELDS)
+        assert str(hey_henry) == HEY_HENRY_SYSTEM_PROMPT.format(**HEY_HENRY_FIELDS)
+        assert hey_henry.cacheable
+
+    def test_short_prefix_and_kill_switch_send_plain_string(self, monkeypatch):
+        assert SystemPrompt("short", " tail").to_api() == "short tail"
+        monkeypatch.setattr(prompt_cache, "ENABLE_PROMPT_CACHING", False)
+        assert SystemPrompt(STATIC_PROMPT, "x").to_api() == STATIC_PROMPT + "x"
+
+    def test_response_cache_key_unchanged(self):
+        args = ("Analyze", 4096, 0, "claude-opus-4-6")
+        assert claude_client._text_cache_key(SystemPrompt(STATIC_PROMPT, "tail"), *args) == \
+            claude_client._text_cache_key(STATIC_PROMPT + "tail", *args)
+
+    async def test_usage_metrics(self, fake_server):
+        before = prompt_cache.get_prompt_cache_stats()
+        await _send(SystemPrompt(STATIC_PROMPT), "one")
+        await _send(SystemPrompt(STATIC_PROMPT), "two")
+        after = prompt_cache.get_prompt_cache_stats()
+        assert after["requests"] - before["requests"] == 2
+        assert after["cache_hits"] - before["cache_hits"] == 1
+        assert after["cache_read_input_tokens"] - before["cache_read_input_tokens"] == 1500
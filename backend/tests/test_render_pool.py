@@ -0,0 +1,82 @@
+"""
+Render pool tests (services/render_pool.py).
+
+Covers:
+1. Jobs run in worker processes and return their result
+2. A job over its timeout raises RenderTimeout and the pool recovers
+3. A full queue rejects with RenderPoolBusy
+4. Per-kind metrics
+5. DOCX/HTML rendering uses the repo-root formatters regardless of import order
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import render_jobs
+from canonical_document import CanonicalResume
+from services.render_pool import RenderPool, RenderPoolBusy, RenderTimeout
+
+
+class TestRenderPool:
+
+    async def test_process_job_timeout_and_recovery(self):
+        pool = RenderPool(max_workers=1, max_queue=4, timeout_seconds=30, enabled=True)
+        try:
+            assert await pool.run("pid", os.getpid) != os.getpid()
+
+            with pytest.raises(RenderTimeout):
+                await pool.run("sleep", time.sleep, 10, timeout=0.5)
+            assert pool.recycles == 1
+
+            # Fresh workers pick up the next job
+            assert await pool.run("pow", pow, 2, 10) == 1024
+        finally:
+            pool.shutdown()
+
+    async def test_full_queue_rejects(self):
+        pool = RenderPool(max_workers=1, max_queue=1, timeout_seconds=5, enabled=False)
+        running = asyncio.create_task(pool.run("sleep", time.sleep, 0.2))
+        queued = asyncio.create_task(pool.run("sleep", time.sleep, 0))
+        await asyncio.sleep(0.05)
+        assert (pool.running, pool.queued) == (1, 1)
+
+        with pytest.raises(RenderPoolBusy):
+            await pool.run("sleep", time.sleep, 0)
+        await asyncio.gather(running, queued)
+        assert pool.stats()["rejected"] == 1
+
+    async def test_stats_by_kind(self):
+        pool = RenderPool(max_workers=2, max_queue=4, timeout_seconds=5, enabled=False)
+        assert await pool.run("parse_pdf", len, b"abc") == 3
+        with pytest.raises(TypeError):
+            await pool.run("parse_pdf", len, 3)
+
+        stats = pool.stats()
+        assert stats["jobs"]["parse_pdf"]["completed"] == 1
+        assert stats["jobs"]["parse_pdf"]["failed"] == 1
+        assert stats["running"] == 0 and stats["queued"] == 0
+
+
+class TestDocumentFormatters:
+
+    def test_repo_root_formatters_despite_shadowing_module(self):
+        import document_generator  # backend/document_generator.py, first on sys.path here
+        shadowing = sys.modules["document_generator"]
+
+        resume = CanonicalResume.from_dict({
+            "contact": {"name": "Sam Lee", "email": "sam@example.com"},
+            "summary": "Payments product leader.",
+            "experience": [{"company": "Stripe", "title": "PM", "bullets": ["Shipped checkout"]}],
+        })
+        assert "SAM LEE" in resume.to_html()
+
+        docx_bytes = render_jobs.render_cover_letter_docx({"name": "Sam Lee", "paragraphs": ["Hello."]})
+        assert docx_bytes[:2] == b"PK"
+        assert sys.modules["document_generator"] is shadowing is document_generator
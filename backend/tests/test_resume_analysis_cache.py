@@ -0,0 +1,105 @@
+"""
+Resume analysis cache tests (backend.py get_cached_analysis / store_cached_analysis).
+
+Covers:
+1. A local miss reads resume_analysis_cache off the event loop and promotes the hit
+2. Stores fill the local tier at once and upsert a snapshot behind the request
+"""
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# Set mock API key before importing backend (required for module load)
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key-for-unit-tests")
+
+# backend.py imports backend.* modules, but with backend/ on the path the
+# "backend" name resolves to backend.py - register the package explicitly
+if not hasattr(sys.modules.get("backend"), "__path__"):
+    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.modules["backend"] = importlib.util.module_from_spec(
+        importlib.machinery.PathFinder.find_spec("backend", [_repo_root])
+    )
+
+import backend.backend as app
+from utils.cache import LRUCache
+
+PAYLOAD = {"fit_score": 78, "recommendation": "Apply"}
+
+
+class FakeQuery:
+    def __init__(self, client):
+        self.client = client
+        self.row = None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, *_):
+        return self
+
+    def upsert(self, row):
+        self.row = row
+        return self
+
+    def execute(self):
+        self.client.threads.append(threading.get_ident())
+        if self.row is not None:
+            self.client.upserts.append(self.row)
+            return SimpleNamespace(data=[self.row])
+        return SimpleNamespace(data=list(self.client.rows))
+
+
+class FakeSupabase:
+    def __init__(self, rows=()):
+        self.rows = rows
+        self.threads = []
+        self.upserts = []
+
+    def table(self, name):
+        assert name == "resume_analysis_cache"
+        return FakeQuery(self)
+
+
+@pytest.fixture
+def resume_cache(monkeypatch):
+    touches = []
+    monkeypatch.setattr(app, "ENABLE_RESUME_CACHE", True)
+    monkeypatch.setattr(app, "_RESUME_CACHE_TABLE_VERIFIED", None)
+    monkeypatch.setattr(app, "resume_analysis_local_cache", LRUCache(max_entries=10, ttl_seconds=60))
+    monkeypatch.setattr(app, "_schedule_resume_cache_touch", touches.append)
+    return touches
+
+
+class TestResumeAnalysisCache:
+
+    async def test_table_read_off_loop_and_promoted(self, resume_cache, monkeypatch):
+        supabase = FakeSupabase([{"analysis_payload": PAYLOAD, "created_at": datetime.utcnow().isoformat()}])
+        monkeypatch.setattr(app, "supabase", supabase)
+
+        assert await app.get_cached_analysis("h1") == PAYLOAD
+        assert supabase.threads and threading.get_ident() not in supabase.threads
+
+        assert await app.get_cached_analysis("h1", local_only=True) == PAYLOAD
+        assert len(supabase.threads) == 1
+        assert resume_cache == ["h1", "h1"]
+
+    async def test_store_writes_behind_from_snapshot(self, resume_cache, monkeypatch):
+        supabase = FakeSupabase()
+        monkeypatch.setattr(app, "supabase", supabase)
+
+        payload = dict(PAYLOAD)
+        app.store_cached_analysis("h2", payload)
+        payload["cache"] = {"hit": False}  # analyze_jd keeps editing the response
+
+        assert await app.get_cached_analysis("h2", local_only=True) == PAYLOAD
+        await asyncio.gather(*app._resume_cache_write_tasks)
+        assert [row["analysis_payload"] for row in supabase.upserts] == [PAYLOAD]
+        assert threading.get_ident() not in supabase.threads
@@ -0,0 +1,122 @@
+"""
+Resume fact index tests (qa_validation.py).
+
+Covers:
+1. Aho-Corasick finds overlapping patterns and honours word boundaries
+2. Fact indexes are cached by resume content hash and shared across validators
+3. Claim grounding counts elements exactly like the per-set substring loops
+4. Known-company matcher picks up companies added at runtime
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qa_validation
+from qa_validation import (
+    AhoCorasick,
+    ChatResponseValidator,
+    ResumeFactIndex,
+    ResumeGroundingValidator,
+    ValidationConfig,
+    add_known_companies,
+    get_known_company_matcher,
+    get_resume_fact_index,
+    resume_fingerprint,
+)
+
+
+@pytest.fixture
+def resume():
+    return {
+        "full_name": "Jane Doe",
+        "experience": [
+            {
+                "company": "Spotify Inc",
+                "title": "Senior Product Manager",
+                "bullets": ["Led Python platform rebuild for 200 customers"],
+            },
+        ],
+        "skills": ["Python", "Spotify"],
+        "education": [{"school": "Stanford University", "degree": "MBA"}],
+    }
+
+
+class TestAhoCorasick:
+
+    def test_overlapping_matches(self):
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+        matches = list(matcher.iter_matches("ushers"))
+        assert matches == [(1, "she"), (2, "he"), (2, "hers")]
+
+    def test_whole_words(self):
+        matcher = AhoCorasick(["google", "bank of america"])
+        assert matcher.find_all("googled it", whole_words=True) == set()
+        assert matcher.find_all("googled it") == {"google"}
+        assert matcher.first("at bank of america, google", whole_words=True) == "bank of america"
+
+    def test_empty(self):
+        assert AhoCorasick([]).find_all("anything") == set()
+        assert AhoCorasick([""]).first("anything") is None
+
+
+class TestResumeFactIndex:
+
+    def test_cached_by_content(self, resume):
+        first = get_resume_fact_index(resume)
+        assert get_resume_fact_index(dict(resume)) is first
+        assert ResumeGroundingValidator(resume).fact_index is first
+
+        changed = {**resume, "skills": ["Go"]}
+        assert resume_fingerprint(changed) != first.resume_hash
+        assert get_resume_fact_index(changed) is not first
+
+    def test_facts_are_frozen(self, resume):
+        validator = ResumeGroundingValidator(resume)
+        assert "spotify inc" in validator.companies
+        assert "senior" in validator.titles
+        with pytest.raises(AttributeError):
+            validator.companies.add("acme")
+
+    def test_element_counts_match_per_set_scan(self, resume):
+        index = ResumeFactIndex.build(resume)
+        claim = "built python tooling at spotify as a senior product manager"
+
+        expected_found = expected_total = 0
+        for facts in (index.companies, index.skills, index.titles):
+            for element in facts:
+                if len(element) > 3:
+                    expected_total += 1
+                    expected_found += element in claim
+
+        # "spotify" is both a company variation and a listed skill
+        assert index.element_weights["spotify"] == 2
+        assert index.count_elements(claim) == (expected_found, expected_total)
+
+    def test_empty_resume(self):
+        index = ResumeFactIndex.build({})
+        assert index.count_elements("led a team at google") == (0, 0)
+        valid, confidence, _ = ResumeGroundingValidator({}).validate_claim("led a team of 12 at google")
+        assert (valid, confidence) == (False, 0.0)
+
+
+class TestKnownCompanyMatcher:
+
+    def test_rebuilt_after_add(self, resume, monkeypatch):
+        monkeypatch.setattr(ValidationConfig, "KNOWN_COMPANIES", set(ValidationConfig.KNOWN_COMPANIES))
+        monkeypatch.setattr(qa_validation, "_known_company_matcher", None)
+        validator = ChatResponseValidator(ResumeGroundingValidator(resume))
+
+        assert not validator._mentions_company("You shipped features at Initech last year")
+        add_known_companies(["Initech"])
+        assert "initech" in get_known_company_matcher().patterns
+        assert validator._extract_company_from_sentence("You shipped features at Initech") == "initech"
+
+    def test_short_names_skipped(self):
+        patterns = get_known_company_matcher().patterns
+        assert "meta" in patterns
+        assert "aws" not in patterns
@@ -0,0 +1,82 @@
+"""
+ResumeFeatures tests (resume_features.py).
+
+Covers:
+1. One parse per resume: the active features, then the hash-keyed LRU
+2. Derived views (normalized experience, titles, text, tenure)
+3. Subsystems reading from the shared features
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_features import (
+    activate_resume_features,
+    active_resume_features,
+    compute_resume_hash,
+    get_resume_features,
+    parse_experience_duration,
+)
+from reality_check.signal_detectors import _extract_resume_text
+from terminal_state_contract import build_canonical_profile
+
+
+RESUME = {
+    'summary': 'Engineering leader',
+    'experience': [
+        {
+            'title': 'Director of Engineering',
+            'company': 'Acme',
+            'dates': '2019 - 2023',
+            'bullets': ['Led team of 12 engineers'],
+            'highlights': ['Grew revenue 30%'],
+        },
+        'free text line',
+        {'title': 'Software Engineer', 'company': 'Initech', 'dates': 'Jan 2015 - 2019'},
+    ],
+    'skills': ['Python', 'Kubernetes'],
+    'education': [{'institution': 'State University', 'degree': 'BS'}],
+}
+
+
+class TestResumeFeatures:
+
+    def test_views(self):
+        features = get_resume_features(RESUME)
+        assert features.resume_hash == compute_resume_hash(RESUME)
+        assert [r['title'] for r in features.experience] == ['Director of Engineering', 'Software Engineer']
+        assert features.titles == ['Director of Engineering', 'Software Engineer']
+        assert features.canonical_text == 'Engineering leader Led team of 12 engineers'
+        assert 'State University' in features.text and 'Grew revenue 30%' in features.text
+        assert features.date_ranges[0] == {'dates': '2019 - 2023', 'start_year': 2019, 'end_year': 2023, 'is_current': False}
+        assert features.tenure_years[0] == parse_experience_duration('2019 - 2023')
+        assert features.total_years == sum(features.tenure_years)
+
+    def test_equal_resumes_share_one_parse(self):
+        first = get_resume_features(RESUME)
+        first.memo('probe', lambda: 'computed')
+        copy = {**RESUME}
+        second = get_resume_features(copy)
+        assert second.source is copy
+        assert second.experience is first.experience
+        assert second.memo('probe', lambda: 'recomputed') == 'computed'
+
+    def test_active_features_fast_path(self):
+        resume = {**RESUME, 'summary': 'Active resume'}
+        features = activate_resume_features(resume)
+        assert active_resume_features() is features
+        assert get_resume_features(resume) is features
+
+    def test_subsystems_read_shared_features(self):
+        features = get_resume_features(RESUME)
+        assert _extract_resume_text(RESUME) == features.text
+        profile = build_canonical_profile(RESUME, target_role_title='Director of Engineering')
+        assert profile is not None
+
+    def test_unhashable_resume_is_parsed_uncached(self):
+        features = get_resume_features({'summary': 'x', 'experience': [{'title': 'PM', 'dates': {1, 2}}]})
+        assert features.resume_hash is None
+        assert features.titles == ['PM']
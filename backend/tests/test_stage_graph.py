@@ -0,0 +1,75 @@
+"""
+Stage graph tests (utils/stage_graph.py).
+
+Covers:
+1. Independent stages run concurrently; dependent stages wait
+2. Stage errors re-raise at result() and are recorded in timings
+3. Timing summary and critical path
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.stage_graph import StageGraph
+
+
+async def _sleep_return(value, seconds=0.05):
+    await asyncio.sleep(seconds)
+    return value
+
+
+class TestStageGraph:
+
+    async def test_independent_stages_overlap(self):
+        stages = StageGraph()
+        started = time.perf_counter()
+        stages.add("a", _sleep_return, "a", 0.1)
+        stages.add("b", time.sleep, 0.1, thread=True)
+        assert await stages.result("a") == "a"
+        await stages.result("b")
+        assert time.perf_counter() - started < 0.18
+
+    async def test_dependencies_order_stages(self):
+        stages = StageGraph()
+        order = []
+        stages.add("first", lambda: _sleep_return(order.append("first")))
+        stages.add("second", lambda: order.append("second"), after=("first",))
+        await stages.result("second")
+        assert order == ["first", "second"]
+
+    async def test_errors_surface_at_result(self):
+        stages = StageGraph()
+
+        def boom():
+            raise ValueError("bad resume")
+
+        stages.add("boom", boom, thread=True)
+        with pytest.raises(ValueError):
+            await stages.result("boom")
+        await stages.wait("boom", "missing")
+        assert stages.summary()["stages"]["boom"]["status"] == "error"
+
+    async def test_summary_and_critical_path(self):
+        stages = StageGraph()
+        stages.begin("features")
+        stages.end("features")
+        stages.add("jd", _sleep_return, "jd", 0.05)
+        stages.add("scales", _sleep_return, "scales", 0.0)
+        await stages.wait("jd", "scales")
+        stages.begin("gates", after=("jd", "scales"))
+        stages.end("gates")
+        stages.add("llm", _sleep_return, "llm", 0.01, after=("gates",))
+        await stages.result("llm")
+
+        summary = stages.summary()
+        assert set(summary["stages"]) == {"features", "jd", "scales", "gates", "llm"}
+        assert summary["stages"]["llm"]["after"] == ["gates"]
+        assert summary["critical_path"] == ["jd", "gates", "llm"]
+        assert summary["total_ms"] >= summary["stages"]["llm"]["duration_ms"]
@@ -0,0 +1,103 @@
+"""
+Fused post-processing text pipeline tests (postprocessors/text_pipeline.py).
+
+Covers:
+1. Voice Guide corrections only touch the fields the Voice Guide owns
+2. Sanitization, final sanitization and grammar checks run in one walk
+3. Combined casing matcher matches the per-acronym substitutions
+4. apply_all_postprocessors reports per-stage timing
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from postprocessors import PostProcessorConfig, apply_all_postprocessors, get_postprocessing_stats
+from postprocessors.text_pipeline import (
+    STAGE_FINAL_SANITIZE,
+    STAGE_GRAMMAR_CHECK,
+    STAGE_SANITIZE,
+    STAGE_VOICE_GUIDE,
+    final_sanitize_text,
+    run_text_pipeline,
+)
+
+
+class TestVoiceScope:
+
+    def test_only_voice_fields_corrected(self):
+        data = {
+            "your_move": "Leverage your network — focus on referrals",
+            "gaps": ["Really need SQL", {"note": "really nested"}],
+            "intelligence_layer": {"summary": "Great news! Focus on scope", "items": ["very close"]},
+            "notes": "Leverage stays here",
+        }
+        processed, report = run_text_pipeline(data, [STAGE_VOICE_GUIDE, STAGE_SANITIZE])
+
+        assert processed["your_move"] == "use your network. Focus on referrals"
+        assert processed["gaps"] == ["need SQL", {"note": "really nested"}]
+        assert processed["intelligence_layer"] == {
+            "summary": "Here's the key point: Focus on scope",
+            "items": ["close"],
+        }
+        assert processed["notes"] == "Leverage stays here"
+        assert data["notes"] == "Leverage stays here"  # input not mutated
+        assert report.voice_summary["total_fields_processed"] == 1
+        assert set(report.stage_ms) == {STAGE_VOICE_GUIDE, STAGE_SANITIZE}
+        assert report.string_nodes == 6
+
+
+class TestFinalSanitize:
+
+    def test_final_and_grammar_in_one_walk(self):
+        data = {"reality_check": {"strategic_action": "We're seeking a **bold** pm—with ai-enabled kpis"},
+                "list": ["snake_case_name", 3]}
+        processed, report = run_text_pipeline(data, [STAGE_FINAL_SANITIZE, STAGE_GRAMMAR_CHECK])
+
+        assert processed["reality_check"]["strategic_action"] == "bold pm. With AI-enabled KPIs"
+        assert processed["list"] == ["snakecasename", 3]
+        assert report.grammar_violations == []
+
+        _, report = run_text_pipeline({"a": ["x — *y*"]}, [STAGE_GRAMMAR_CHECK])
+        assert report.grammar_violations == [
+            "Em dash (—) in a[0]",
+            "Asterisk emphasis (*text*) in a[0]",
+        ]
+
+    def test_casing_matches_sequential_rules(self):
+        import re
+
+        sequential = [
+            (r'\bai-', 'AI-'), (r'\bai\b', 'AI'), (r'\bc-suite\b', 'C-suite'), (r'\bfaang\b', 'FAANG'),
+            (r'\bgtm\b', 'GTM'), (r'\bkpi\b', 'KPI'), (r'\bkpis\b', 'KPIs'), (r'\bats\b', 'ATS'),
+            (r'\bhr\b', 'HR'), (r'\bde&i\b', 'DE&I'), (r'\bdei\b', 'DEI'), (r'\bsaas\b', 'SaaS'),
+            (r'\bsec\b', 'SEC'), (r'\bipo\b', 'IPO'),
+        ]
+        text = "Ai-first c-Suite kpis/kpi hr,de&i dei saas sec ipo maid aid hrs kpix Faang gtm ats"
+        expected = text
+        for pattern, replacement in sequential:
+            expected = re.sub(pattern, replacement, expected, flags=re.IGNORECASE)
+        assert final_sanitize_text(text) == expected
+
+
+class TestApplyAllPostprocessors:
+
+    def test_timing_reported(self):
+        config = PostProcessorConfig(
+            reality_check_enabled=False, strategic_redirects_enabled=False, debug_mode=True,
+        )
+        before = get_postprocessing_stats()["text_pipeline_runs"]
+        processed = apply_all_postprocessors(
+            {"fit_score": 40, "timing_guidance": "Apply  today", "your_move": "Fix your resume — now"},
+            resume_data={}, jd_data={}, fit_score=40, recommendation="Skip", config=config,
+        )
+
+        assert processed["fit_score"] == 40
+        assert processed["timing_guidance"] == "Skip this one"
+        assert processed["your_move"] == "Fix your resume. Now."
+        assert set(processed["_postprocessing_timing"]) == {
+            STAGE_VOICE_GUIDE, STAGE_SANITIZE, "action_consistency",
+        }
+        assert get_postprocessing_stats()["text_pipeline_runs"] == before + 1
@@ -0,0 +1,122 @@
+"""
+Profile / effective tier cache tests (tier_service.py, stripe_service.py).
+
+Covers:
+1. Repeated feature checks for a user read user_profiles once
+2. Effective tier from the precomputed instants matches the date rules
+3. Stripe webhook events invalidate the affected user's cache entry
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stripe_service
+import tier_service
+from tier_service import ResolvedTier, TierService
+from utils.cache import LRUCache
+
+
+class FakeQuery:
+    def __init__(self, client):
+        self.client = client
+        self.updated = None
+
+    def select(self, *_):
+        return self
+
+    def update(self, row):
+        self.updated = row
+        return self
+
+    def eq(self, *_):
+        return self
+
+    def single(self):
+        return self
+
+    def execute(self):
+        if self.updated is not None:
+            self.client.profile.update(self.updated)
+            return SimpleNamespace(data=[self.client.profile])
+        self.client.selects += 1
+        return SimpleNamespace(data=dict(self.client.profile))
+
+
+class FakeSupabase:
+    def __init__(self, profile):
+        self.profile = profile
+        self.selects = 0
+
+    def table(self, name):
+        assert name == "user_profiles"
+        return FakeQuery(self)
+
+
+@pytest.fixture(autouse=True)
+def profile_cache(monkeypatch):
+    cache = LRUCache(max_entries=100, ttl_seconds=60)
+    monkeypatch.setattr(tier_service, "_profile_cache", cache)
+    return cache
+
+
+def _iso(delta):
+    return (datetime.utcnow() + delta).isoformat()
+
+
+class TestCachedResolution:
+
+    async def test_five_checks_one_select(self):
+        supabase = FakeSupabase({"id": "u1", "tier": "recruiter"})
+        for feature in ("linkedin_optimizer", "mock_interviews", "interview_prep", "resume_customization", "cover_letters"):
+            service = TierService(supabase)  # One per request, as the endpoints do
+            profile = await service.ensure_user_profile("u1")
+            service.check_feature_access(service.get_effective_tier(profile), feature)
+        assert supabase.selects == 1
+
+    async def test_cached_tier_skips_date_parsing(self, monkeypatch):
+        supabase = FakeSupabase({"id": "u1", "tier": "recruiter", "subscription_status": "canceled",
+                                 "current_period_end": _iso(timedelta(days=3))})
+        service = TierService(supabase)
+        profile = await service.get_user_profile("u1")
+        monkeypatch.setattr(tier_service, "_utc_wall_clock_ts", None)
+        assert service.get_effective_tier(profile) == "recruiter"
+
+    def test_precomputed_instants(self):
+        beta = ResolvedTier.from_profile({"tier": "preview", "is_beta_user": True, "beta_tier_override": "principal",
+                                          "beta_expires_at": _iso(timedelta(hours=1)) + "Z"})
+        assert beta.effective_tier() == "principal"
+        assert beta.effective_tier(now=time.time() + 7200) == "preview"
+
+        canceled = ResolvedTier.from_profile({"tier": "recruiter", "subscription_status": "canceled",
+                                              "current_period_end": _iso(timedelta(days=-1))})
+        assert canceled.effective_tier() == "preview"
+
+        open_beta = ResolvedTier.from_profile({"tier": "recruiter", "is_beta_user": True,
+                                               "beta_tier_override": "partner", "beta_expires_at": None})
+        assert open_beta.effective_tier(now=time.time() + 10 ** 9) == "partner"
+
+
+class TestWebhookInvalidation:
+
+    async def test_subscription_update_invalidates(self, monkeypatch):
+        supabase = FakeSupabase({"id": "u1", "tier": "recruiter", "subscription_status": "active"})
+        service = TierService(supabase)
+        profile = await service.ensure_user_profile("u1")
+        assert service.get_effective_tier(profile) == "recruiter"
+
+        event = {"type": "customer.subscription.deleted", "data": {"object": {"metadata": {"user_id": "u1"}}}}
+        monkeypatch.setattr(stripe_service.stripe.Webhook, "construct_event", lambda *_: event)
+        result = await stripe_service.StripeService(supabase).handle_webhook_event(b"{}", "sig")
+        assert result["status"] == "processed"
+
+        profile = await TierService(supabase).ensure_user_profile("u1")
+        assert profile["tier"] == "sourcer"
+        assert supabase.selects == 2
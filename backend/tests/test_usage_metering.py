@@ -0,0 +1,186 @@
+"""
+Usage metering tests (usage_metering.py, tier_service.py).
+
+Covers:
+1. Concurrent increments are buffered and flushed as one atomic RPC per user
+2. A failed flush keeps its deltas for the next one
+3. The usage row is read once per request, and re-read after a flush
+4. Limit checks add local counters and deny from them without a read
+5. Without the increment RPC (migration not applied) flushes update the row directly
+"""
+
+import asyncio
+import contextvars
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tier_service
+import usage_metering
+from tier_service import TierService
+from usage_metering import UsageCounterBuffer, current_period
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.one = False
+        self.write = None
+
+    def select(self, *_):
+        return self
+
+    def update(self, row):
+        self.write = row
+        return self
+
+    def eq(self, *_):
+        return self
+
+    def single(self):
+        self.one = True
+        return self
+
+    def execute(self):
+        if self.write is not None:
+            self.client.usage_row.update(self.write)
+            return SimpleNamespace(data=[self.client.usage_row])
+        self.client.selects.append(self.table)
+        if self.table == "user_profiles":
+            return SimpleNamespace(data={"id": "u1", "tier": "recruiter"})
+        row = dict(self.client.usage_row)
+        return SimpleNamespace(data=row if self.one else [row])
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.usage_row = {"id": "row1", "user_id": "u1", "applications_used": 2, "resumes_generated": 0}
+        self.selects = []
+        self.rpcs = []
+        self.fail_rpc = False
+        self.rpc_missing = False
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        client = self
+
+        class Call:
+            def execute(self):
+                if client.rpc_missing:
+                    raise RuntimeError("{'code': 'PGRST202', 'message': 'Could not find the function'}")
+                if client.fail_rpc:
+                    raise RuntimeError("connection reset")
+                client.rpcs.append((name, params))
+                for field, delta in params["p_deltas"].items():
+                    client.usage_row[field] = client.usage_row.get(field, 0) + delta
+                return SimpleNamespace(data=client.usage_row)
+
+        return Call()
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    buffer = UsageCounterBuffer()
+    monkeypatch.setattr(UsageCounterBuffer, "_rpc_missing", False)
+    monkeypatch.setattr(usage_metering, "usage_buffer", buffer)
+    monkeypatch.setattr(tier_service, "usage_buffer", buffer)
+    monkeypatch.setattr(TierService, "_usage_table_missing", False)
+    return FakeSupabase()
+
+
+def _in_new_request(coro_fn):
+    """Run coro_fn in a fresh context, as a separate request would."""
+    return asyncio.create_task(coro_fn(), context=contextvars.Context())
+
+
+class TestCounterBuffer:
+
+    async def test_concurrent_increments_one_rpc(self, supabase):
+        service = TierService(supabase)
+        await asyncio.gather(*(service.increment_usage("u1", "applications") for _ in range(25)))
+        await service.increment_usage("u1", "resumes")
+        await service.increment_usage("u1", "unknown_type")
+        assert supabase.selects == []
+
+        assert await usage_metering.usage_buffer.flush_async(supabase) == 1
+        assert supabase.rpcs == [("increment_usage_by", {
+            "p_user_id": "u1",
+            "p_period_start": current_period()[0].isoformat(),
+            "p_deltas": {"applications_used": 25, "resumes_generated": 1},
+        })]
+        assert supabase.usage_row["applications_used"] == 27
+
+    def test_failed_flush_retried(self, supabase):
+        buffer = usage_metering.usage_buffer
+        buffer.add("u1", "2026-10-01T00:00:00", "applications_used", 2)
+
+        supabase.fail_rpc = True
+        assert buffer.flush(supabase) == 0
+        assert buffer.local_count("u1", "2026-10-01T00:00:00", "applications_used") == 2
+
+        supabase.fail_rpc = False
+        assert buffer.flush(supabase) == 1
+        assert buffer.local_count("u1", "2026-10-01T00:00:00", "applications_used") == 0
+        assert buffer.stats()["rpc_failures"] == 1
+
+    def test_missing_rpc_falls_back_to_update(self, supabase):
+        buffer = usage_metering.usage_buffer
+        supabase.rpc_missing = True
+        buffer.add("u1", "2026-10-01T00:00:00", "applications_used", 3)
+        assert buffer.flush(supabase) == 1
+        assert supabase.usage_row["applications_used"] == 5
+
+        # Later flushes skip the RPC entirely
+        buffer.add("u1", "2026-10-01T00:00:00", "resumes_generated", 1)
+        assert buffer.flush(supabase) == 1
+        assert supabase.usage_row["resumes_generated"] == 1
+        stats = buffer.stats()
+        assert (stats["rpc_calls"], stats["rpc_failures"], stats["fallback_writes"]) == (1, 0, 2)
+        assert stats["pending_increments"] == 0
+
+
+class TestUsageRow:
+
+    async def test_summary_reads_usage_once(self, supabase):
+        summary = await _in_new_request(lambda: TierService(supabase).get_user_usage_summary("u1"))
+        assert supabase.selects.count("usage_tracking") == 1
+        assert summary["usage"]["applications"]["used"] == 2
+
+    async def test_memo_invalidated_by_flush(self, supabase):
+        async def request():
+            service = TierService(supabase)
+            await service.get_or_create_current_usage("u1")
+            await service.get_or_create_current_usage("u1")
+            await service.increment_usage("u1", "applications")
+            await usage_metering.usage_buffer.flush_async(supabase)
+            return await service.get_or_create_current_usage("u1")
+
+        row = await _in_new_request(request)
+        assert supabase.selects.count("usage_tracking") == 2
+        assert row["applications_used"] == 3
+
+
+class TestLimitChecks:
+
+    async def test_local_counts_added(self, supabase):
+        service = TierService(supabase)
+        await service.increment_usage("u1", "applications")
+        usage = await _in_new_request(lambda: service.check_usage_limit("u1", "recruiter", "applications"))
+        assert (usage["used"], usage["remaining"]) == (3, 7)
+
+    async def test_denied_from_local_counts(self, supabase):
+        service = TierService(supabase)
+        for _ in range(3):
+            await service.increment_usage("u1", "resumes")
+        usage = await _in_new_request(lambda: service.check_usage_limit("u1", "recruiter", "resumes"))
+        assert usage["allowed"] is False
+        assert usage["used"] == 3
+        assert supabase.selects == []
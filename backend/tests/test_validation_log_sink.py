@@ -0,0 +1,104 @@
+"""
+Background validation log sink tests (qa_validation.py).
+
+Covers:
+1. Entries are written in batches off the calling thread and flushed on demand
+2. Files rotate by size and readers see rotated parts newest first
+3. A full queue drops entries and counts them instead of blocking
+4. ValidationLogger round-trips blocked outputs and overrides through the sink
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qa_validation
+from qa_validation import (
+    ValidationConfig,
+    ValidationLogger,
+    ValidationLogSink,
+    ValidationResult,
+)
+
+
+def _read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestValidationLogSink:
+
+    def test_batched_background_write(self, tmp_path):
+        sink = ValidationLogSink(batch_size=50)
+        try:
+            for i in range(120):
+                assert sink.submit(str(tmp_path), "blocked_2025-01-31.jsonl", {"n": i})
+            assert sink.flush(timeout=5)
+            assert [e["n"] for e in _read_lines(tmp_path / "blocked_2025-01-31.jsonl")] == list(range(120))
+            stats = sink.stats()
+            assert stats["written"] == 120
+            assert stats["queue_depth"] == 0
+            assert stats["batches"] >= 3
+        finally:
+            sink.close()
+        assert not sink.stats()["running"]
+
+    def test_rotates_by_size(self, tmp_path):
+        sink = ValidationLogSink(batch_size=1, max_bytes=40, background=False)
+        for i in range(6):
+            sink.submit(str(tmp_path), "overrides.jsonl", {"reason": f"r{i}", "pad": "x" * 10})
+
+        parts = qa_validation._log_parts(str(tmp_path), "overrides.jsonl")
+        assert [os.path.basename(p) for p in parts][-1] == "overrides.jsonl"
+        assert sink.stats()["rotations"] == len(parts) - 1 > 0
+        replayed = [e["reason"] for p in parts for e in _read_lines(p)]
+        assert replayed == [f"r{i}" for i in range(6)]
+
+    def test_full_queue_drops(self, tmp_path, monkeypatch):
+        sink = ValidationLogSink(max_queue=2)
+        release = threading.Event()
+        original = sink._write_batch
+
+        def slow_write(batch):
+            release.wait(5)
+            original(batch)
+
+        monkeypatch.setattr(sink, "_write_batch", slow_write)
+        try:
+            results = [sink.submit(str(tmp_path), "x.jsonl", {"n": i}) for i in range(10)]
+            assert results.count(False) == sink.stats()["dropped"] > 0
+        finally:
+            release.set()
+            sink.close()
+        assert sink.stats()["written"] == results.count(True)
+
+
+class TestValidationLoggerSink:
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ValidationConfig, "LOG_DIR", str(tmp_path))
+        monkeypatch.setattr(qa_validation, "_validation_log_sink", ValidationLogSink())
+        yield tmp_path
+        qa_validation._validation_log_sink.close()
+
+    def test_blocked_and_override_round_trip(self, log_dir):
+        result = ValidationResult(is_valid=False, confidence_score=0.1)
+        entry_id = ValidationLogger.log_blocked_output(
+            endpoint="/api/hey-henry", result=result,
+            output={"text": "made up"}, resume_data={"experience": [{"company": "Stripe"}]},
+        )
+        ValidationLogger.log_override(entry_id, "false positive")
+
+        logs = ValidationLogger.get_blocked_logs(limit=5)
+        assert [log["id"] for log in logs] == [entry_id]
+        assert logs[0]["resume_companies"] == ["stripe"]
+        assert ValidationLogger.get_override_stats() == {
+            "total_overrides": 1, "reasons": {"false positive": 1},
+        }
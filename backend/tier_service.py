@@ -4,7 +4,10 @@ Tier Service for HenryHQ
 This module provides helper functions for tier access control and usage tracking.
 """
 
-from datetime import datetime
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from functools import wraps
 
@@ -23,6 +26,86 @@ from tier_config import (
     get_tier_index,
     normalize_tier,
 )
+from usage_metering import (
+    USAGE_FIELDS,
+    current_period,
+    get_memoized_usage,
+    memoize_usage,
+    usage_buffer,
+)
+from utils.cache import LRUCache
+
+
+# Profiles (with their tier resolution) are reused across requests for this long.
+# Stripe webhooks invalidate a user's entry as soon as their subscription changes.
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", "60"))
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "10000"))
+
+
+def _utc_wall_clock_ts(value: Any) -> float:
+    """Timestamp of an ISO string / datetime, read as UTC wall-clock time (as the tier checks always have)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+@dataclass(frozen=True)
+class ResolvedTier:
+    """
+    A profile with its effective-tier rules reduced to two instants.
+
+    effective_tier() is then a couple of float comparisons instead of
+    re-parsing ISO dates on every gated request.
+    """
+    profile: Dict[str, Any]
+    tier: str                           # Normalized stored tier
+    beta_tier: Optional[str] = None     # Active beta override, if any...
+    beta_until: Optional[float] = None  # ...and when it lapses (None = never)
+    canceled: bool = False
+    paid_until: Optional[float] = None  # Canceled subscription: end of paid period
+
+    @classmethod
+    def from_profile(cls, profile: Dict[str, Any]) -> "ResolvedTier":
+        beta_tier = beta_until = paid_until = None
+        if profile.get('is_beta_user') and profile.get('beta_tier_override'):
+            beta_tier = profile['beta_tier_override']
+            if profile.get('beta_expires_at') is not None:
+                beta_until = _utc_wall_clock_ts(profile['beta_expires_at'])
+        canceled = profile.get('subscription_status') == 'canceled'
+        if canceled and profile.get('current_period_end'):
+            paid_until = _utc_wall_clock_ts(profile['current_period_end'])
+        return cls(
+            profile=profile,
+            tier=normalize_tier(profile.get('tier') or 'preview'),
+            beta_tier=beta_tier,
+            beta_until=beta_until,
+            canceled=canceled,
+            paid_until=paid_until,
+        )
+
+    def effective_tier(self, now: Optional[float] = None) -> str:
+        now = time.time() if now is None else now
+        if self.beta_tier and (self.beta_until is None or self.beta_until > now):
+            return self.beta_tier
+        if self.canceled:
+            # Allow access until current_period_end, then downgrade to free tier
+            return self.tier if self.paid_until is not None and self.paid_until > now else 'preview'
+        # active, past_due, trialing all keep current tier
+        return self.tier
+
+
+_profile_cache = LRUCache(max_entries=PROFILE_CACHE_MAX_ENTRIES, ttl_seconds=PROFILE_CACHE_TTL_SECONDS)
+
+
+def invalidate_profile_cache(user_id: Optional[str]) -> None:
+    """Drop a user's cached profile/tier (call after any user_profiles write)."""
+    if user_id:
+        _profile_cache.pop(user_id)
+
+
+def get_profile_cache_stats() -> Dict[str, Any]:
+    """Get profile/tier cache statistics for monitoring."""
+    return _profile_cache.stats()
 
 
 class TierService:
@@ -34,12 +117,25 @@ class TierService:
         self.supabase = supabase_client
 
     async def get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user profile with tier information."""
+        """Get user profile with tier information (cached for PROFILE_CACHE_TTL_SECONDS)."""
+        cached = _profile_cache.get(user_id)
+        if cached is not None:
+            return cached.profile
         try:
             response = self.supabase.table('user_profiles').select('*').eq('id', user_id).single().execute()
-            return response.data
         except Exception:
             return None
+        if response.data:
+            self._cache_profile(user_id, response.data)
+        return response.data
+
+    @staticmethod
+    def _cache_profile(user_id: str, profile: Dict[str, Any]) -> None:
+        try:
+            resolved = ResolvedTier.from_profile(profile)
+        except (TypeError, ValueError, AttributeError):
+            return  # Unparseable dates - resolve per call as before
+        _profile_cache.set(user_id, resolved)
 
     async def ensure_user_profile(self, user_id: str) -> Dict[str, Any]:
         """Ensure user profile exists and return it."""
@@ -51,6 +147,8 @@ class TierService:
                 'tier': 'preview',
             }).execute()
             profile = response.data[0] if response.data else {'id': user_id, 'tier': 'preview'}
+            if response.data:
+                self._cache_profile(user_id, profile)
         return profile
 
     def get_effective_tier(self, profile: Dict[str, Any]) -> str:
@@ -63,34 +161,13 @@ class TierService:
         3. Canceled subscription with time remaining → subscription tier until period ends
         4. Canceled subscription with expired period → 'preview'
         5. Default → 'preview'
-        """
-        # Check beta override first
-        if profile.get('is_beta_user') and profile.get('beta_tier_override'):
-            beta_expires = profile.get('beta_expires_at')
-            if beta_expires is None:
-                return profile['beta_tier_override']
-            # Parse datetime if string
-            if isinstance(beta_expires, str):
-                beta_expires = datetime.fromisoformat(beta_expires.replace('Z', '+00:00'))
-            if beta_expires > datetime.utcnow().replace(tzinfo=beta_expires.tzinfo if beta_expires.tzinfo else None):
-                return profile['beta_tier_override']
-
-        # Check subscription status
-        subscription_status = profile.get('subscription_status')
-        tier = normalize_tier(profile.get('tier') or 'preview')
-
-        if subscription_status == 'canceled':
-            # Allow access until current_period_end
-            period_end = profile.get('current_period_end')
-            if period_end:
-                if isinstance(period_end, str):
-                    period_end = datetime.fromisoformat(period_end.replace('Z', '+00:00'))
-                if period_end > datetime.utcnow().replace(tzinfo=period_end.tzinfo if period_end.tzinfo else None):
-                    return tier  # Still within paid period
-            return 'preview'  # Period expired, downgrade to free tier
 
-        # active, past_due, trialing all keep current tier
-        return tier
+        Profiles served from the cache come with their dates pre-parsed.
+        """
+        cached = _profile_cache.get(profile.get('id')) if profile.get('id') else None
+        if cached is not None and cached.profile is profile:
+            return cached.effective_tier()
+        return ResolvedTier.from_profile(profile).effective_tier()
 
     def check_feature_access(self, tier: str, feature_name: str) -> Dict[str, Any]:
         """
@@ -124,20 +201,28 @@ class TierService:
     }
 
     async def get_or_create_current_usage(self, user_id: str) -> Dict[str, Any]:
-        """Get or create usage tracking for current billing period."""
+        """
+        Get or create usage tracking for current billing period.
+
+        The row is memoized for the rest of the request (see usage_metering);
+        counts still buffered in this process are not included - see
+        check_usage_limit.
+        """
         # If we already know the table doesn't exist, return defaults immediately
         if TierService._usage_table_missing:
             return {'user_id': user_id, **self._DEFAULT_USAGE}
 
-        now = datetime.utcnow()
-        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        period_start, period_end = current_period()
+        memoized = get_memoized_usage(user_id, period_start.isoformat())
+        if memoized is not None:
+            return memoized
 
-        # Calculate period end (first of next month)
-        if now.month == 12:
-            period_end = period_start.replace(year=now.year + 1, month=1)
-        else:
-            period_end = period_start.replace(month=now.month + 1)
+        usage = await self._fetch_or_create_usage(user_id, period_start, period_end)
+        if not TierService._usage_table_missing:
+            memoize_usage(user_id, period_start.isoformat(), usage)
+        return usage
 
+    async def _fetch_or_create_usage(self, user_id: str, period_start: datetime, period_end: datetime) -> Dict[str, Any]:
         # Try to get existing record
         try:
             response = self.supabase.table('usage_tracking').select('*').eq(
@@ -183,13 +268,24 @@ class TierService:
         """
         limit_key = f'{usage_type}_per_month'
         limit = TIER_LIMITS.get(tier, TIER_LIMITS['preview']).get(limit_key, 0)
+        used_key = USAGE_FIELDS.get(usage_type, f'{usage_type}_used')
+
+        # Usage recorded here but not yet flushed counts first
+        local = 0
+        if not TierService._usage_table_missing:
+            local = usage_buffer.local_count(user_id, current_period()[0].isoformat(), used_key)
+        if limit != -1 and local >= limit:
+            return {
+                'allowed': False,
+                'used': local,
+                'limit': limit,
+                'remaining': 0,
+                'is_unlimited': False,
+            }
 
         # Get current period usage
         usage = await self.get_or_create_current_usage(user_id)
-        used_key = f'{usage_type}_used' if usage_type != 'resumes' else 'resumes_generated'
-        if usage_type == 'cover_letters':
-            used_key = 'cover_letters_generated'
-        used = usage.get(used_key, 0)
+        used = (usage.get(used_key) or 0) + local
 
         if limit == -1:  # Unlimited/strategic
             return {
@@ -210,30 +306,20 @@ class TierService:
         }
 
     async def increment_usage(self, user_id: str, usage_type: str) -> None:
-        """Increment usage counter for the current billing period."""
+        """
+        Increment usage counter for the current billing period.
+
+        Buffered in-process; the periodic flush applies it with an atomic
+        increment RPC (no read-modify-write, no round trip here).
+        """
         if TierService._usage_table_missing:
             return
-        usage = await self.get_or_create_current_usage(user_id)
-
-        # Map usage type to field name
-        field_map = {
-            'applications': 'applications_used',
-            'analyses': 'applications_used',
-            'resumes': 'resumes_generated',
-            'cover_letters': 'cover_letters_generated',
-            'henry_conversations': 'henry_conversations_used',
-            'mock_interviews': 'mock_interviews_used',
-            'coaching_sessions': 'coaching_sessions_used',
-        }
 
-        field = field_map.get(usage_type)
+        field = USAGE_FIELDS.get(usage_type)
         if not field:
             return
 
-        current = usage.get(field, 0)
-        self.supabase.table('usage_tracking').update({
-            field: current + 1
-        }).eq('id', usage['id']).execute()
+        usage_buffer.add(user_id, current_period()[0].isoformat(), field)
 
     def get_upgrade_prompt(self, current_tier: str, feature_name: str = None, usage_type: str = None) -> Optional[Dict[str, Any]]:
         """
@@ -374,6 +460,7 @@ async def migrate_beta_users(supabase: Client):
                     'beta_expires_at': config['expires'],
                     'beta_discount_percent': config['discount_after'],
                 }).execute()
+                invalidate_profile_cache(user.id)
             else:
                 # Default beta config
                 expires_at = LAUNCH_DATE + timedelta(days=DEFAULT_BETA_CONFIG['expires_days_after_launch'])
@@ -384,5 +471,6 @@ async def migrate_beta_users(supabase: Client):
                     'beta_expires_at': expires_at.isoformat(),
                     'beta_discount_percent': DEFAULT_BETA_CONFIG['discount_after'],
                 }).execute()
+                invalidate_profile_cache(user.id)
 
     print(f"Migrated {len(users)} beta users")
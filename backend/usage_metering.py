@@ -0,0 +1,246 @@
+"""
+Usage metering for tier limits.
+
+Metered actions add to an in-process counter buffer instead of doing a
+read-modify-write on usage_tracking per request. A lifespan task flushes the
+buffer every USAGE_FLUSH_INTERVAL_SECONDS with one increment_usage_by RPC per
+user and billing period (an atomic INSERT ... ON CONFLICT DO UPDATE, see
+migrations/add_usage_increment_batch_rpc.sql), so concurrent requests can't
+lose increments. Until that migration is applied the flush falls back to the
+old read-modify-write update of usage_tracking.
+
+Reads go through a per-request memo of the usage row, and limit checks add
+the local (not yet flushed) counters on top of it - and deny straight from
+the local counters when those alone already reach the limit.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("henryhq")
+
+USAGE_FLUSH_INTERVAL_SECONDS = float(os.getenv("USAGE_FLUSH_INTERVAL_SECONDS", "5"))
+USAGE_INCREMENT_RPC = "increment_usage_by"
+
+# Metered usage type -> usage_tracking counter column
+USAGE_FIELDS = {
+    'applications': 'applications_used',
+    'analyses': 'applications_used',
+    'resumes': 'resumes_generated',
+    'cover_letters': 'cover_letters_generated',
+    'henry_conversations': 'henry_conversations_used',
+    'mock_interviews': 'mock_interviews_used',
+    'coaching_sessions': 'coaching_sessions_used',
+}
+
+
+def current_period(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """(period_start, period_end) of the monthly billing period containing now (UTC)."""
+    now = now or datetime.utcnow()
+    period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if now.month == 12:
+        period_end = period_start.replace(year=now.year + 1, month=1)
+    else:
+        period_end = period_start.replace(month=now.month + 1)
+    return period_start, period_end
+
+
+# (user_id, period_start ISO string)
+UsageKey = Tuple[str, str]
+
+
+class UsageCounterBuffer:
+    """
+    Thread-safe usage deltas per (user, billing period), flushed in batches.
+
+    A flush moves the pending deltas to in-flight, sends one RPC per key and
+    only then forgets them; a failed RPC puts its deltas back for the next
+    flush. Local counts include in-flight deltas, so a limit check never
+    misses usage that is on its way to the database. Each completed flush
+    bumps `generation`, which invalidates memoized usage rows read before it.
+
+    If the increment RPC doesn't exist yet (migration not applied), the buffer
+    remembers that and writes each key with a read-modify-write instead.
+    """
+
+    _rpc_missing = False  # Set once the increment_usage_by function is found missing
+
+    def __init__(self):
+        self._pending: Dict[UsageKey, Counter] = {}
+        self._inflight: Dict[UsageKey, Counter] = {}
+        self._lock = threading.Lock()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.generation = 0
+        self.increments = 0
+        self.flushes = 0
+        self.rpc_calls = 0
+        self.rpc_failures = 0
+        self.fallback_writes = 0
+
+    def add(self, user_id: str, period_start: str, field: str, amount: int = 1) -> None:
+        with self._lock:
+            self._pending.setdefault((user_id, period_start), Counter())[field] += amount
+            self.increments += amount
+
+    def local_count(self, user_id: str, period_start: str, field: str) -> int:
+        """Usage recorded in this process but not yet confirmed by the database."""
+        key = (user_id, period_start)
+        with self._lock:
+            return self._pending.get(key, Counter())[field] + self._inflight.get(key, Counter())[field]
+
+    def pending_keys(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._inflight)
+
+    def flush(self, supabase) -> int:
+        """Send pending deltas to the database (blocking). Returns the number of RPCs that succeeded."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            for key, deltas in batch.items():
+                self._inflight.setdefault(key, Counter()).update(deltas)
+        if not batch:
+            return 0
+
+        sent = 0
+        for (user_id, period_start), deltas in batch.items():
+            try:
+                self._write(supabase, user_id, period_start, deltas)
+                sent += 1
+                failed = False
+            except Exception as e:
+                self.rpc_failures += 1
+                failed = True
+                logger.warning(f"Usage flush failed for {user_id} ({dict(deltas)}), will retry: {e}")
+            with self._lock:
+                inflight = self._inflight.get((user_id, period_start))
+                if inflight is not None:
+                    inflight.subtract(deltas)
+                    if not +inflight:
+                        del self._inflight[(user_id, period_start)]
+                if failed:
+                    self._pending.setdefault((user_id, period_start), Counter()).update(deltas)
+        self.flushes += 1
+        self.generation += 1
+        return sent
+
+    def _write(self, supabase, user_id: str, period_start: str, deltas: Counter) -> None:
+        if not UsageCounterBuffer._rpc_missing:
+            self.rpc_calls += 1
+            try:
+                supabase.rpc(USAGE_INCREMENT_RPC, {
+                    'p_user_id': user_id,
+                    'p_period_start': period_start,
+                    'p_deltas': dict(deltas),
+                }).execute()
+                return
+            except Exception as e:
+                # Detect function-not-found (404 / PGRST202) and cache it
+                if not ('404' in str(e) or 'Not Found' in str(e) or 'PGRST202' in str(e)):
+                    raise
+                UsageCounterBuffer._rpc_missing = True
+                logger.warning(f"{USAGE_INCREMENT_RPC} RPC not found in Supabase - "
+                               "falling back to per-row usage updates (run migration to fix)")
+        self._write_by_update(supabase, user_id, period_start, deltas)
+        self.fallback_writes += 1
+
+    @staticmethod
+    def _write_by_update(supabase, user_id: str, period_start: str, deltas: Counter) -> None:
+        """Read-modify-write of the usage_tracking row (pre-RPC path; not atomic across processes)."""
+        rows = supabase.table('usage_tracking').select('*').eq(
+            'user_id', user_id
+        ).eq(
+            'period_start', period_start
+        ).execute().data
+        if rows:
+            row = rows[0]
+            supabase.table('usage_tracking').update({
+                field: (row.get(field) or 0) + delta for field, delta in deltas.items()
+            }).eq('id', row['id']).execute()
+            return
+
+        period_end = current_period(datetime.fromisoformat(period_start))[1]
+        supabase.table('usage_tracking').insert({
+            'user_id': user_id,
+            'period_start': period_start,
+            'period_end': period_end.isoformat(),
+            **deltas,
+        }).execute()
+
+    async def flush_async(self, supabase) -> int:
+        """flush() off the event loop; concurrent callers are serialized."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            return await asyncio.to_thread(self.flush, supabase)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get buffer statistics for monitoring."""
+        with self._lock:
+            pending = sum(sum(c.values()) for c in self._pending.values())
+            inflight = sum(sum(c.values()) for c in self._inflight.values())
+        return {
+            "pending_increments": pending,
+            "inflight_increments": inflight,
+            "increments": self.increments,
+            "flushes": self.flushes,
+            "rpc_calls": self.rpc_calls,
+            "rpc_failures": self.rpc_failures,
+            "rpc_missing": UsageCounterBuffer._rpc_missing,
+            "fallback_writes": self.fallback_writes,
+            "generation": self.generation,
+        }
+
+
+usage_buffer = UsageCounterBuffer()
+
+
+# Per-request memo: {(user_id, period_start): (buffer generation, usage row)}
+_usage_memo: ContextVar[Optional[Dict[UsageKey, Tuple[int, Dict[str, Any]]]]] = ContextVar(
+    "usage_row_memo", default=None
+)
+
+
+def get_memoized_usage(user_id: str, period_start: str) -> Optional[Dict[str, Any]]:
+    """Usage row already read in this request, unless a flush has landed since."""
+    memo = _usage_memo.get()
+    if not memo:
+        return None
+    entry = memo.get((user_id, period_start))
+    if entry is None or entry[0] != usage_buffer.generation:
+        return None
+    return entry[1]
+
+
+def memoize_usage(user_id: str, period_start: str, row: Dict[str, Any]) -> None:
+    memo = _usage_memo.get()
+    if memo is None:
+        memo = {}
+        _usage_memo.set(memo)
+    memo[(user_id, period_start)] = (usage_buffer.generation, row)
+
+
+async def run_usage_flush(
+    client_getter: Callable[[], Any],
+    interval_seconds: float = USAGE_FLUSH_INTERVAL_SECONDS,
+) -> None:
+    """Flush buffered usage every interval_seconds until cancelled (app lifespan task)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        client = client_getter()
+        if client is None or not usage_buffer.pending_keys():
+            continue
+        try:
+            await usage_buffer.flush_async(client)
+        except Exception as e:
+            logger.warning(f"Usage flush failed: {e}")
+
+
+def get_usage_metering_stats() -> Dict[str, Any]:
+    """Get usage metering statistics for monitoring."""
+    return usage_buffer.stats()
@@ -34,3 +34,24 @@ from .validation import (
     verify_ats_keyword_coverage,
     validate_document_quality,
 )
+
+from .cache import (
+    LRUCache,
+    TTLCache,
+    SingleFlight,
+    get_all_cache_stats,
+)
+
+from .keyword_scanner import (
+    KeywordScanner,
+    KeywordSet,
+    ScanResult,
+)
+
+from .stage_graph import (
+    StageGraph,
+)
+
+from .json_stream import (
+    IncrementalJSONParser,
+)
@@ -0,0 +1,421 @@
+"""In-process caching primitives: a TTL-aware LRU, a bounded shared TTL cache, and an async singleflight"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("henryhq")
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU with an optional per-entry TTL.
+
+    Sits in front of slower stores (Supabase tables) so repeat lookups within a
+    worker skip the network round trip.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # {key: (value, expires_at)}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """Store value under key, evicting the least recently used entries past max_entries."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove key and return its value (None if absent)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[0] if entry else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# =============================================================================
+# BOUNDED TTL CACHE
+# =============================================================================
+
+CACHE_SWEEP_INTERVAL_SECONDS = float(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "60"))
+
+# Lookup states
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Approximate in-memory size of a value in bytes (containers and objects walked)."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _seen) for item in value)
+    if hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), _seen)
+    return size
+
+
+class TTLCache:
+    """Named, bounded TTL cache shared by the API-backed services.
+
+    - Bounded by entry count and by estimated bytes; least recently used
+      entries are evicted first when either bound is exceeded
+    - Expired entries are dropped by a background sweeper thread (every
+      CACHE_SWEEP_INTERVAL_SECONDS), not only when their key is read again
+    - Optional stale-while-revalidate: for `stale_seconds` after expiry,
+      lookup() still returns the old value (state STALE) so the caller can
+      answer immediately and refresh() it in the background
+    - Every instance registers by name for get_all_cache_stats()
+
+    Usage:
+
+        value, state = cache.lookup(key)
+        if state == STALE:
+            cache.refresh(key, reload)      # background; keeps serving stale
+        if value is None:
+            value = load()
+            cache.set(key, value)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: float = 3600,
+        stale_seconds: float = 0,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # {key: (value, expires_at, size)}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        _register_cache(self)
+
+    # -------------------------------------------------------------------------
+    # Reads and writes
+    # -------------------------------------------------------------------------
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """Return (value, FRESH|STALE) for a cached key, or (None, MISS)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, MISS
+            value, expires_at, _ = entry
+            if now < expires_at:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value, FRESH
+            if now < expires_at + self.stale_seconds:
+                self._data.move_to_end(key)
+                self.stale_hits += 1
+                return value, STALE
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None, MISS
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the fresh value for key, or None."""
+        value, state = self.lookup(key)
+        return value if state == FRESH else None
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """Store value under key, evicting least recently used entries past the bounds."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        size = estimate_size(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(f"Cache {self.name}: entry of {size} bytes exceeds max_bytes, not cached")
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove key and return its value (None if absent)."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._remove(key)
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: Hashable):
+        # Caller holds the lock
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def sweep(self) -> int:
+        """Drop entries past their stale window. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, expires_at, _) in self._data.items()
+                       if now >= expires_at + self.stale_seconds]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    # -------------------------------------------------------------------------
+    # Stale-while-revalidate
+    # -------------------------------------------------------------------------
+
+    def refresh(self, key: Hashable, loader: Callable[[], Any], ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Reload key in the background (at most one refresh per key at a time).
+
+        loader may be a plain function (run on the cache thread pool) or an async
+        function (scheduled on the running event loop). A None result or an
+        exception keeps the stale value. Returns False if a refresh is already
+        running for key.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        if asyncio.iscoroutinefunction(loader):
+            task = asyncio.get_running_loop().create_task(self._refresh_async(key, loader, ttl_seconds))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        else:
+            _refresh_executor.submit(self._refresh_sync, key, loader, ttl_seconds)
+        return True
+
+    def _refresh_done(self, key: Hashable, value: Any, ttl_seconds: Optional[float]):
+        if value is not None:
+            self.set(key, value, ttl_seconds)
+            self.refreshes += 1
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _refresh_sync(self, key: Hashable, loader: Callable[[], Any], ttl_seconds: Optional[float]):
+        value = None
+        try:
+            value = loader()
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Cache {self.name}: background refresh failed: {e}")
+        self._refresh_done(key, value, ttl_seconds)
+
+    async def _refresh_async(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl_seconds: Optional[float]):
+        value = None
+        try:
+            value = await loader()
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Cache {self.name}: background refresh failed: {e}")
+        self._refresh_done(key, value, ttl_seconds)
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        lookups = self.hits + self.stale_hits + self.misses
+        now = time.monotonic()
+        with self._lock:
+            expired = sum(1 for _, expires_at, _ in self._data.values() if expires_at <= now)
+        return {
+            "entries": len(self._data),
+            "expired_entries": expired,
+            "max_entries": self.max_entries,
+            "bytes": self._bytes if self.max_bytes else None,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+_refresh_tasks: set = set()  # strong refs so pending async refreshes aren't garbage collected
+# Every live TTLCache, by name. A name held by a second instance (e.g. a module
+# imported under two paths) is registered as "name#2" rather than replacing it.
+_registry: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+_registry_lock = threading.Lock()
+_sweeper: Optional[threading.Thread] = None
+
+
+def _register_cache(cache: TTLCache):
+    global _sweeper
+    with _registry_lock:
+        key, n = cache.name, 1
+        while _registry.get(key) not in (None, cache):
+            n += 1
+            key = f"{cache.name}#{n}"
+        if n > 1:
+            logger.warning(f"TTLCache '{cache.name}' already registered - registering another instance as '{key}'")
+        _registry[key] = cache
+        if _sweeper is None and CACHE_SWEEP_INTERVAL_SECONDS > 0:
+            _sweeper = threading.Thread(target=_sweep_loop, name="cache-sweeper", daemon=True)
+            _sweeper.start()
+
+
+def _sweep_loop():
+    while True:
+        time.sleep(CACHE_SWEEP_INTERVAL_SECONDS)
+        sweep_all_caches()
+
+
+def sweep_all_caches() -> int:
+    """Run an expiry sweep over every registered TTLCache. Returns entries removed."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    removed = 0
+    for cache in caches:
+        try:
+            removed += cache.sweep()
+        except Exception as e:
+            logger.warning(f"Cache sweep failed for {cache.name}: {e}")
+    return removed
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every registered TTLCache, by name."""
+    with _registry_lock:
+        caches = list(_registry.items())
+    return {name: cache.stats() for name, cache in caches}
+
+
+class SingleFlight:
+    """Per-key async locks so concurrent identical work runs once.
+
+    Usage (lock + double-check):
+
+        async with flight.lock(key):
+            cached = cache.get(key)
+            if cached is None:
+                cached = await expensive(key)
+                cache.set(key, cached)
+
+    The first caller does the work; callers arriving while it is in flight wait
+    on the same lock and then find the result in the cache. Locks are dropped
+    once no caller holds or waits on them, so the registry stays bounded by the
+    number of keys currently in flight.
+    """
+
+    def __init__(self):
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._locks
+
+    @asynccontextmanager
+    async def lock(self, key: Hashable):
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+            self._waiters[key] = 0
+        elif lock.locked():
+            self.coalesced += 1
+        self._waiters[key] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._waiters[key] -= 1
+            if self._waiters[key] == 0:
+                del self._waiters[key]
+                del self._locks[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._locks), "coalesced": self.coalesced}
@@ -0,0 +1,183 @@
+"""Incremental JSON parsing for streamed LLM output
+
+Claude streams its JSON answer a few characters at a time. Re-running regexes
+over the whole accumulated buffer on every chunk makes each chunk cost
+O(buffer) and the stream O(n^2). IncrementalJSONParser keeps its position
+between chunks, so each character is looked at once. feed() returns every
+value that finished in the new text, with its path from the root:
+
+    parser = IncrementalJSONParser()
+    for path, value in parser.feed(chunk):
+        if path == ("fit_score",): ...              # top-level key closed
+        if path[:1] == ("strengths",) and len(path) == 2: ...   # one array element
+
+Values are reported innermost-first and in document order; a container is
+reported when it closes, after all of its children.
+
+Tolerates what the model tends to wrap around or sprinkle into JSON: leading
+prose or markdown fences (skipped up to the first { or [), trailing commas,
+and raw control characters inside strings. Anything else malformed stops the
+parser (failed=True) without raising; callers keep the raw text for the
+final parse and repair pass.
+"""
+
+import re
+import json
+from typing import Any, List, Tuple
+
+# Parser states
+_BEFORE_ROOT = 0    # skipping text until the first { or [
+_VALUE = 1          # expecting a value (or ] right after [ or ,)
+_KEY = 2            # expecting an object key (or } right after { or ,)
+_COLON = 3          # expecting : after a key
+_AFTER_VALUE = 4    # expecting , or a closing bracket
+_STRING = 5         # inside a string
+_LITERAL = 6        # inside a number / true / false / null
+_DONE = 7           # root value closed
+
+_WHITESPACE = " \t\r\n"
+_STRING_BODY = re.compile(r'[^"\\]+')
+_LITERAL_BODY = re.compile(r'[^\s,\]}]+')
+_DECODER = json.JSONDecoder(strict=False)
+
+JSONPath = Tuple[Any, ...]
+
+
+class IncrementalJSONParser:
+    """Single-pass, resumable JSON parser that reports values as they complete."""
+
+    def __init__(self):
+        self._state = _BEFORE_ROOT
+        self._stack: List[list] = []    # [container, path, pending_key]
+        self._token: List[str] = []
+        self._string_is_key = False
+        self._escape = False
+        self.failed = False
+
+    @property
+    def done(self) -> bool:
+        """True once the root value has closed."""
+        return self._state == _DONE
+
+    def feed(self, chunk: str) -> List[Tuple[JSONPath, Any]]:
+        """Consume the next piece of text; return (path, value) for every value it completed."""
+        events: List[Tuple[JSONPath, Any]] = []
+        i, n = 0, len(chunk)
+        try:
+            while i < n and not self.failed and self._state != _DONE:
+                state = self._state
+
+                if state == _STRING:
+                    if self._escape:
+                        self._token.append(chunk[i])
+                        self._escape = False
+                        i += 1
+                        continue
+                    m = _STRING_BODY.match(chunk, i)
+                    if m:
+                        self._token.append(m.group())
+                        i = m.end()
+                        continue
+                    c = chunk[i]
+                    i += 1
+                    if c == "\\":
+                        self._token.append(c)
+                        self._escape = True
+                    else:  # closing quote
+                        value = _DECODER.decode('"' + "".join(self._token) + '"')
+                        self._token = []
+                        if self._string_is_key:
+                            self._stack[-1][2] = value
+                            self._state = _COLON
+                        else:
+                            self._complete(value, events)
+                    continue
+
+                if state == _LITERAL:
+                    m = _LITERAL_BODY.match(chunk, i)
+                    if m:
+                        self._token.append(m.group())
+                        i = m.end()
+                    if i < n:
+                        # Delimiter reached (left for the next state to consume)
+                        value = json.loads("".join(self._token))
+                        self._token = []
+                        self._complete(value, events)
+                    continue
+
+                c = chunk[i]
+                i += 1
+                if c in _WHITESPACE:
+                    continue
+
+                if state == _BEFORE_ROOT:
+                    if c == "{" or c == "[":
+                        self._open(c)
+                elif state == _VALUE:
+                    if c == "{" or c == "[":
+                        self._open(c)
+                    elif c == '"':
+                        self._start_string(is_key=False)
+                    elif c == "]" and self._stack and isinstance(self._stack[-1][0], list):
+                        self._close(events)
+                    elif c == "-" or c.isdigit() or c in "tfn":
+                        self._token = [c]
+                        self._state = _LITERAL
+                    else:
+                        self.failed = True
+                elif state == _KEY:
+                    if c == '"':
+                        self._start_string(is_key=True)
+                    elif c == "}":
+                        self._close(events)
+                    else:
+                        self.failed = True
+                elif state == _COLON:
+                    if c == ":":
+                        self._state = _VALUE
+                    else:
+                        self.failed = True
+                elif state == _AFTER_VALUE:
+                    top = self._stack[-1][0]
+                    if c == ",":
+                        self._state = _KEY if isinstance(top, dict) else _VALUE
+                    elif (c == "}" and isinstance(top, dict)) or (c == "]" and isinstance(top, list)):
+                        self._close(events)
+                    else:
+                        self.failed = True
+        except ValueError:
+            self.failed = True
+        return events
+
+    def _start_string(self, is_key: bool):
+        self._token = []
+        self._string_is_key = is_key
+        self._escape = False
+        self._state = _STRING
+
+    def _child_path(self) -> JSONPath:
+        container, path, key = self._stack[-1]
+        return path + ((key,) if isinstance(container, dict) else (len(container),))
+
+    def _open(self, c: str):
+        path = self._child_path() if self._stack else ()
+        self._stack.append([{} if c == "{" else [], path, None])
+        self._state = _KEY if c == "{" else _VALUE
+
+    def _close(self, events: List[Tuple[JSONPath, Any]]):
+        container = self._stack.pop()[0]
+        self._complete(container, events)
+
+    def _complete(self, value: Any, events: List[Tuple[JSONPath, Any]]):
+        if not self._stack:
+            events.append(((), value))
+            self._state = _DONE
+            return
+        path = self._child_path()
+        container, _, key = self._stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container.append(value)
+        events.append((path, value))
+        self._state = _AFTER_VALUE
@@ -0,0 +1,122 @@
+"""Single-pass keyword matching for the deterministic signal detectors
+
+The gating and calibration detectors mostly ask "which of these phrases occur in
+this text?" via `any(p in text for p in patterns)` loops, one loop per signal
+family. KeywordScanner compiles every family's phrases into one trie-shaped
+alternation regex and answers all of those questions from a single scan.
+
+Matching semantics are exactly those of the `p in text` loops it replaces:
+substring containment, case-sensitive (callers lowercase first), and every
+phrase that occurs anywhere is reported - including phrases that overlap or are
+prefixes of one another.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching the longest keyword that starts at a position."""
+    trie: Dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def render(node: Dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch != ""]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        # Greedy optional group: prefer the longer keyword when both match
+        return body + "?" if terminal else body
+
+    return render(trie)
+
+
+class ScanResult:
+    """Keywords found in one text, queryable per signal family."""
+
+    __slots__ = ("found", "_families")
+
+    def __init__(self, found: FrozenSet[str], families: Dict[str, Sequence[str]]):
+        self.found = found
+        self._families = families
+
+    def has(self, family: str) -> bool:
+        """Equivalent to any(p in text for p in family_patterns)."""
+        return any(kw in self.found for kw in self._families[family])
+
+    def matched(self, family: str) -> List[str]:
+        """Family patterns present in the text, in the family's declared order."""
+        return [kw for kw in self._families[family] if kw in self.found]
+
+    def count(self, family: str) -> int:
+        """Equivalent to sum(1 for p in family_patterns if p in text)."""
+        return sum(1 for kw in self._families[family] if kw in self.found)
+
+    def first(self, family: str) -> Optional[str]:
+        """First family pattern (in declared order) present in the text."""
+        for kw in self._families[family]:
+            if kw in self.found:
+                return kw
+        return None
+
+
+class KeywordScanner:
+    """Precompiled multi-family substring matcher.
+
+    Usage:
+        SCANNER = KeywordScanner({"explicit": [...], "implicit": [...]})
+        signals = SCANNER.scan(text.lower())
+        if signals.count("explicit") >= 2: ...
+    """
+
+    def __init__(self, families: Dict[str, Sequence[str]], cache_size: int = 128):
+        self.families: Dict[str, Sequence[str]] = {name: tuple(kws) for name, kws in families.items()}
+        keywords = {kw for kws in self.families.values() for kw in kws if kw}
+        self.keywords: FrozenSet[str] = frozenset(keywords)
+
+        # For each keyword, every shorter keyword that is a prefix of it. All
+        # keywords starting at one position are prefixes of the longest one, so
+        # reporting the longest match plus its prefixes finds every occurrence.
+        self._with_prefixes: Dict[str, FrozenSet[str]] = {
+            kw: frozenset(k for k in keywords if kw.startswith(k)) for kw in keywords
+        }
+        pattern = _trie_pattern(keywords)
+        self._regex = re.compile(f"(?=({pattern}))") if pattern else None
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _scan(self, text: str) -> ScanResult:
+        found = set()
+        if self._regex is not None and text:
+            for match in self._regex.finditer(text):
+                found |= self._with_prefixes[match.group(1)]
+        return ScanResult(frozenset(found), self.families)
+
+
+class KeywordSet(KeywordScanner):
+    """Single-family KeywordScanner with `in`-style helpers."""
+
+    FAMILY = "_"
+
+    def __init__(self, keywords: Sequence[str], cache_size: int = 128):
+        super().__init__({self.FAMILY: keywords}, cache_size=cache_size)
+
+    def search(self, text: str) -> bool:
+        """Equivalent to any(p in text for p in keywords)."""
+        return self._regex is not None and self._regex.search(text) is not None
+
+    def matched(self, text: str) -> List[str]:
+        return self.scan(text).matched(self.FAMILY)
+
+    def count(self, text: str) -> int:
+        return self.scan(text).count(self.FAMILY)
+
+    def first(self, text: str) -> Optional[str]:
+        return self.scan(text).first(self.FAMILY)
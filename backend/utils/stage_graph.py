@@ -0,0 +1,132 @@
+"""Request-scoped stage graph: run independent pipeline stages concurrently, time every stage
+
+Usage:
+    stages = StageGraph()
+    stages.add("jd_context", resolve_jd_context, jd_text, analysis_id)
+    stages.add("career_gap", detect_career_gap, resume, thread=True)
+    stages.add("llm", call_llm, after=("gates",))
+
+    jd_context = await stages.result("jd_context")
+
+    stages.begin("gates", after=("jd_context",))
+    ...  # inline work that joins several stages
+    stages.end("gates")
+
+    response["_debug"] = {"stage_timings": stages.summary()}
+
+Stages start as soon as they are added (or, with after=..., once their
+dependencies finish), so adding a stage early is what takes it off the
+critical path. Dependencies only order stages; results are read with
+result(). A stage that raises re-raises at every result() await, in the
+caller that asked for it, exactly like calling the function inline there.
+"""
+
+import time
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class StageGraph:
+    """Named async/thread stages with explicit dependencies and per-stage timings."""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._after: Dict[str, tuple] = {}
+        self._timings: Dict[str, Dict[str, Any]] = {}
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def add(self, name: str, fn: Callable, *args, after: Iterable[str] = (), thread: bool = False, **kwargs) -> asyncio.Task:
+        """Schedule fn(*args, **kwargs) as stage `name` once every stage in `after` has finished.
+
+        fn is awaited if it is a coroutine function; thread=True runs a blocking
+        fn in the default executor instead of on the event loop.
+        """
+        after = tuple(after)
+        self._after[name] = after
+
+        async def run():
+            # Inline (begin/end) dependencies have already ended by the time
+            # a stage that depends on them is added
+            pending = {self._tasks[dep] for dep in after if dep in self._tasks}
+            if pending:
+                await asyncio.wait(pending)
+            self.begin(name, after)
+            try:
+                if thread:
+                    value = await asyncio.to_thread(fn, *args, **kwargs)
+                else:
+                    value = fn(*args, **kwargs)
+                    if asyncio.iscoroutine(value):
+                        value = await value
+            except BaseException as e:
+                self.end(name, status="cancelled" if isinstance(e, asyncio.CancelledError) else "error")
+                raise
+            self.end(name)
+            return value
+
+        task = asyncio.create_task(run())
+        # Failures surface through result(); don't also log them as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[name] = task
+        return task
+
+    def task(self, name: str) -> Optional[asyncio.Task]:
+        return self._tasks.get(name)
+
+    async def result(self, name: str) -> Any:
+        """Await stage `name` and return its value (re-raising its exception)."""
+        return await self._tasks[name]
+
+    async def wait(self, *names: str):
+        """Wait for stages to finish without collecting results or errors."""
+        pending = {self._tasks[n] for n in names if n in self._tasks}
+        if pending:
+            await asyncio.wait(pending)
+
+    def begin(self, name: str, after: Iterable[str] = ()):
+        """Start timing an inline stage (work done directly in the request coroutine)."""
+        self._after.setdefault(name, tuple(after))
+        self._timings[name] = {"start_ms": round(self._now_ms(), 1)}
+
+    def end(self, name: str, status: str = "ok"):
+        """Finish timing stage `name`."""
+        timing = self._timings.get(name)
+        if timing is None or "duration_ms" in timing:
+            return
+        timing["duration_ms"] = round(self._now_ms() - timing["start_ms"], 1)
+        timing["status"] = status
+
+    def _critical_path(self) -> List[str]:
+        """Chain of finished stages that determined when the last one ended."""
+        finished = {n: t for n, t in self._timings.items() if "duration_ms" in t}
+        if not finished:
+            return []
+
+        def end_ms(n):
+            return finished[n]["start_ms"] + finished[n]["duration_ms"]
+
+        path = [max(finished, key=end_ms)]
+        while True:
+            deps = [d for d in self._after.get(path[-1], ()) if d in finished]
+            if not deps:
+                break
+            path.append(max(deps, key=end_ms))
+        return list(reversed(path))
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-stage timings for the response debug block."""
+        stages = {}
+        for name, timing in self._timings.items():
+            stages[name] = {
+                **timing,
+                "status": timing.get("status", "running"),
+                "after": list(self._after.get(name, ())),
+            }
+        return {
+            "total_ms": round(self._now_ms(), 1),
+            "stages": stages,
+            "critical_path": self._critical_path(),
+        }
@@ -172,10 +172,40 @@ NEXT_STEP_INDICATORS = [
 ]
 
 
+# Precompiled forms of the lists above. Each check list is combined into one
+# alternation so a string is scanned once instead of once per pattern.
+COMPILED_TONE_CORRECTIONS: List[Tuple["re.Pattern", str, str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), replacement, category, pattern)
+    for pattern, replacement, category in TONE_CORRECTIONS
+]
+
+COMPILED_FORBIDDEN_PATTERNS: List[Tuple[str, str, "re.Pattern", str]] = [
+    (forbidden, forbidden.lower(), re.compile(re.escape(forbidden), re.IGNORECASE), replacement)
+    for forbidden, replacement in FORBIDDEN_PATTERNS.items()
+]
+
+# Matches if any tone correction or forbidden pattern could apply
+VOICE_RULE_GATE = re.compile(
+    "|".join(
+        [f"(?:{pattern})" for pattern, _, _ in TONE_CORRECTIONS]
+        + [re.escape(forbidden) for forbidden in FORBIDDEN_PATTERNS]
+    ),
+    re.IGNORECASE,
+)
+
+
+def _combine(patterns: List[str]) -> "re.Pattern":
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+_NEXT_STEP_RE = _combine(NEXT_STEP_INDICATORS)
+_FALSE_ENCOURAGEMENT_RE = _combine(FALSE_ENCOURAGEMENT_PATTERNS)
+_SHAME_RE = _combine(SHAME_PATTERNS)
+
+
 def has_next_step(text: str) -> bool:
     """Check if text contains a clear next step."""
-    text_lower = text.lower()
-    return any(re.search(pattern, text_lower) for pattern in NEXT_STEP_INDICATORS)
+    return _NEXT_STEP_RE.search(text.lower()) is not None
 
 
 def has_forbidden_pattern(text: str) -> List[str]:
@@ -190,11 +220,9 @@ def has_forbidden_pattern(text: str) -> List[str]:
 
 def has_false_encouragement(text: str) -> bool:
     """Check for false encouragement patterns."""
-    text_lower = text.lower()
-    return any(re.search(pattern, text_lower) for pattern in FALSE_ENCOURAGEMENT_PATTERNS)
+    return _FALSE_ENCOURAGEMENT_RE.search(text.lower()) is not None
 
 
 def has_shame_language(text: str) -> bool:
     """Check for shame/blame language."""
-    text_lower = text.lower()
-    return any(re.search(pattern, text_lower) for pattern in SHAME_PATTERNS)
+    return _SHAME_RE.search(text.lower()) is not None
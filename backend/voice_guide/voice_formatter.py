@@ -12,16 +12,21 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from .patterns import (
-    FORBIDDEN_PATTERNS,
     APPROVED_CLOSINGS,
     APPROVED_SUPPORT_PHRASES,
-    TONE_CORRECTIONS,
+    COMPILED_TONE_CORRECTIONS,
+    COMPILED_FORBIDDEN_PATTERNS,
+    VOICE_RULE_GATE,
     has_next_step,
     has_forbidden_pattern,
     has_false_encouragement,
     has_shame_language,
 )
 
+_WHITESPACE_RUN = re.compile(r'\s+')
+_EMPTY_SENTENCE = re.compile(r'\.\s+\.')
+_LEADING_COMMA = re.compile(r'^\s*,\s*')
+
 
 @dataclass
 class VoiceValidationResult:
@@ -70,6 +75,12 @@ class VoiceGuideFormatter:
         "positioning_rationale",
     ]
 
+    # Nested dicts whose strings (and lists of strings) are processed recursively
+    NESTED_FIELDS = [
+        "intelligence_layer",
+        "strategic_positioning",
+    ]
+
     def __init__(self, strict_mode: bool = False):
         """
         Initialize the formatter.
@@ -111,19 +122,13 @@ class VoiceGuideFormatter:
                 ]
 
         # Process nested structures
-        if "intelligence_layer" in processed:
-            processed["intelligence_layer"] = self._process_nested(
-                processed["intelligence_layer"], "intelligence_layer"
-            )
-
-        if "strategic_positioning" in processed:
-            processed["strategic_positioning"] = self._process_nested(
-                processed["strategic_positioning"], "strategic_positioning"
-            )
+        for field in self.NESTED_FIELDS:
+            if field in processed:
+                processed[field] = self._process_nested(processed[field], field)
 
         # Ensure your_move has a next step
         if "your_move" in processed:
-            processed["your_move"] = self._ensure_next_step(
+            processed["your_move"] = self.ensure_next_step(
                 processed["your_move"], "your_move"
             )
 
@@ -174,19 +179,22 @@ class VoiceGuideFormatter:
 
         corrected = text
 
-        # 1. Apply tone corrections
-        for pattern, replacement, category in TONE_CORRECTIONS:
-            if re.search(pattern, corrected, re.IGNORECASE):
-                corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
-                result.corrections_applied.append(f"Tone correction ({category}): {pattern}")
-
-        # 2. Replace forbidden patterns
-        for forbidden, replacement in FORBIDDEN_PATTERNS.items():
-            if forbidden.lower() in corrected.lower():
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(forbidden), re.IGNORECASE)
-                corrected = pattern.sub(replacement, corrected)
-                result.corrections_applied.append(f"Removed: '{forbidden}'")
+        # Steps 1-2 only run when the combined gate finds a candidate;
+        # most strings need no corrections at all
+        if VOICE_RULE_GATE.search(corrected):
+            # 1. Apply tone corrections
+            for regex, replacement, category, pattern in COMPILED_TONE_CORRECTIONS:
+                if regex.search(corrected):
+                    corrected = regex.sub(replacement, corrected)
+                    result.corrections_applied.append(f"Tone correction ({category}): {pattern}")
+
+            # 2. Replace forbidden patterns (case-insensitive)
+            corrected_lower = corrected.lower()
+            for forbidden, forbidden_lower, regex, replacement in COMPILED_FORBIDDEN_PATTERNS:
+                if forbidden_lower in corrected_lower:
+                    corrected = regex.sub(replacement, corrected)
+                    corrected_lower = corrected.lower()
+                    result.corrections_applied.append(f"Removed: '{forbidden}'")
 
         # 3. Check for false encouragement
         if has_false_encouragement(corrected):
@@ -199,11 +207,11 @@ class VoiceGuideFormatter:
             result.is_valid = False
 
         # 5. Clean up multiple spaces
-        corrected = re.sub(r'\s+', ' ', corrected).strip()
+        corrected = _WHITESPACE_RUN.sub(' ', corrected).strip()
 
         # 6. Clean up sentence starts after removals
-        corrected = re.sub(r'\.\s+\.', '.', corrected)
-        corrected = re.sub(r'^\s*,\s*', '', corrected)
+        corrected = _EMPTY_SENTENCE.sub('.', corrected)
+        corrected = _LEADING_COMMA.sub('', corrected)
 
         result.corrected_text = corrected
 
@@ -213,7 +221,7 @@ class VoiceGuideFormatter:
 
         return result
 
-    def _ensure_next_step(self, text: str, field_name: str) -> str:
+    def ensure_next_step(self, text: str, field_name: str) -> str:
         """
         Ensure text contains a clear next step.
 